@@ -70,6 +70,12 @@ async def openai_langchain(llm_config: OpenAIModelConfig, builder: Builder):
     if llm_config.max_retries is not None:
         kwargs["max_retries"] = llm_config.max_retries
 
+    # Share the connection pool of the endpoint when the LLM has a concurrency limit
+    http_async_client = builder.get_llm_http_client(llm_config, asynchronous=True)
+    if http_async_client is not None:
+        kwargs["http_async_client"] = http_async_client
+        kwargs["http_client"] = builder.get_llm_http_client(llm_config, asynchronous=False)
+
     client = ChatOpenAI(**kwargs)
 
     if isinstance(llm_config, RetryMixin):
@@ -8,10 +8,11 @@ from aiq.builder.builder import Builder
 from aiq.builder.llm import LLMProviderInfo
 from aiq.cli.register_workflow import register_llm_provider
 from aiq.data_models.llm import LLMBaseConfig
+from aiq.data_models.response_cache_mixin import ResponseCacheMixin
 from aiq.data_models.retry_mixin import RetryMixin
 
 
-class OllamaModelConfig(LLMBaseConfig, RetryMixin, name="ollama"):
+class OllamaModelConfig(LLMBaseConfig, RetryMixin, ResponseCacheMixin, name="ollama"):
     """An Ollama LLM provider to be used with an LLM client."""
 
     model_config = ConfigDict(protected_namespaces=())
@@ -54,6 +54,12 @@ async def openai_llama_index(llm_config: OpenAIModelConfig, builder: Builder):
     if ("base_url" in kwargs and kwargs["base_url"] is None):
         del kwargs["base_url"]
 
+    # Share the connection pool of the endpoint when the LLM has a concurrency limit
+    async_http_client = builder.get_llm_http_client(llm_config, asynchronous=True)
+    if async_http_client is not None:
+        kwargs["async_http_client"] = async_http_client
+        kwargs["http_client"] = builder.get_llm_http_client(llm_config, asynchronous=False)
+
     llm = OpenAI(**kwargs)
 
     if isinstance(llm_config, RetryMixin):
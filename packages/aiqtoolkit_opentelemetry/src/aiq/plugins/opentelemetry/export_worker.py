@@ -0,0 +1,152 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import logging
+import queue
+import threading
+from enum import StrEnum
+
+from opentelemetry.sdk.trace.export import SpanExporter
+
+from aiq.plugins.opentelemetry.otel_span import OtelSpan
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+# How often a submit blocked by a full queue checks for room again
+_BLOCK_POLL_INTERVAL = 0.01
+
+
+class ExportOverflowPolicy(StrEnum):
+    """What to do with a batch when the queue of the export worker is full."""
+
+    DROP = "drop"
+    """Drop the batch and log a warning."""
+
+    BLOCK = "block"
+    """Wait for room in the queue. Only the exporting task waits, the event loop is not blocked."""
+
+
+class OTLPExportWorker:
+    """Exports batches of spans from a background thread fed by a bounded queue.
+
+    The protobuf serialization and the HTTP request of the wrapped OpenTelemetry exporter
+    are blocking, running them in the worker keeps them off the event loop which serves
+    workflow requests. The batches are exported one at a time in the order they were
+    submitted. The thread is started by the first submitted batch and stopped by
+    `shutdown`, a batch submitted after `shutdown` starts a new thread.
+    """
+
+    def __init__(self,
+                 exporter: SpanExporter,
+                 max_queue_size: int = 16,
+                 overflow_policy: ExportOverflowPolicy = ExportOverflowPolicy.DROP):
+        """Initialize the export worker.
+
+        Args:
+            exporter: The OpenTelemetry exporter used to export each batch.
+            max_queue_size: Maximum number of batches waiting to be exported.
+            overflow_policy: What to do with a batch when the queue is full.
+        """
+        if max_queue_size <= 0:
+            raise ValueError(f"max_queue_size must be greater than 0, got {max_queue_size}")
+
+        self._exporter = exporter
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._overflow_policy = ExportOverflowPolicy(overflow_policy)
+        self._thread: threading.Thread | None = None
+        self._thread_lock = threading.Lock()
+        self._dropped_spans = 0
+
+    @property
+    def dropped_spans(self) -> int:
+        """The number of spans dropped because the queue was full."""
+        return self._dropped_spans
+
+    def _ensure_started(self) -> None:
+        with self._thread_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="otlp-export-worker", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            spans = self._queue.get()
+
+            try:
+                if spans is _STOP:
+                    return
+
+                self._exporter.export(spans)
+            except Exception as e:
+                logger.error("Error exporting spans: %s", e, exc_info=True)
+            finally:
+                self._queue.task_done()
+
+    async def submit(self, spans: list[OtelSpan]) -> bool:
+        """Queue a batch of spans for export.
+
+        Args:
+            spans: The batch of spans to export.
+
+        Returns:
+            bool: True if the batch was queued, False if it was dropped.
+        """
+        self._ensure_started()
+
+        while True:
+            try:
+                self._queue.put_nowait(spans)
+                return True
+            except queue.Full:
+                pass
+
+            if self._overflow_policy == ExportOverflowPolicy.DROP:
+                self._dropped_spans += len(spans)
+                logger.warning("OTLP export queue is full, dropped %d spans (%d in total)",
+                               len(spans),
+                               self._dropped_spans)
+                return False
+
+            # Poll from the event loop rather than waiting in a thread, so a cancelled submit never enqueues the batch
+            await asyncio.sleep(_BLOCK_POLL_INTERVAL)
+
+    async def shutdown(self, timeout: float = 10.0) -> None:
+        """Export the queued batches and stop the worker thread.
+
+        Args:
+            timeout: Maximum time in seconds to wait for the queued batches to be exported.
+        """
+        with self._thread_lock:
+            thread = self._thread
+            self._thread = None
+
+        if thread is None or not thread.is_alive():
+            return
+
+        def stop():
+            try:
+                self._queue.put(_STOP, timeout=timeout)
+            except queue.Full:
+                return
+
+            thread.join(timeout)
+
+        await asyncio.to_thread(stop)
+
+        if thread.is_alive():
+            logger.warning("OTLP export worker did not finish exporting within %s seconds", timeout)
@@ -0,0 +1,38 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import typing
+
+from pydantic import BaseModel
+from pydantic import Field
+
+from aiq.plugins.opentelemetry.export_worker import ExportOverflowPolicy
+
+
+class OTLPExportConfigMixin(BaseModel):
+    """Mixin for telemetry exporters that send spans with the OTLP HTTP exporter."""
+    compression: typing.Literal["gzip", "deflate", "none"] | None = Field(
+        default=None,
+        description="Compression of the request bodies. Defaults to the OTEL_EXPORTER_OTLP_COMPRESSION environment "
+        "variable.")
+    background_export: bool = Field(
+        default=False,
+        description="Serialize and send the batches from a background thread instead of the event loop.")
+    export_queue_size: int = Field(default=16,
+                                   gt=0,
+                                   description="The maximum number of batches waiting for the background thread.")
+    export_overflow_policy: ExportOverflowPolicy = Field(
+        default=ExportOverflowPolicy.DROP,
+        description="Whether to 'drop' a batch or 'block' until there is room when the background queue is full.")
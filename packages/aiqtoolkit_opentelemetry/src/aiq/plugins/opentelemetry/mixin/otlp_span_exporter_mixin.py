@@ -15,8 +15,11 @@
 
 import logging
 
+from opentelemetry.exporter.otlp.proto.http import Compression
 from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
 
+from aiq.plugins.opentelemetry.export_worker import ExportOverflowPolicy
+from aiq.plugins.opentelemetry.export_worker import OTLPExportWorker
 from aiq.plugins.opentelemetry.otel_span import OtelSpan
 
 logger = logging.getLogger(__name__)
@@ -33,6 +36,8 @@ class OTLPSpanExporterMixin:
     - Configurable endpoint and headers for authentication/routing
     - Integration with OpenTelemetry's OTLPSpanExporter for reliable transmission
     - Works with any OTLP-compatible collector or service
+    - Optional background export worker which keeps serialization and HTTP requests off the event loop
+    - Optional gzip or deflate compression of the request bodies
 
     This mixin is designed to be used with OtelSpanExporter as a base class:
 
@@ -42,16 +47,41 @@ class OTLPSpanExporterMixin:
                 super().__init__(endpoint=endpoint, headers=headers, **kwargs)
     """
 
-    def __init__(self, *args, endpoint: str, headers: dict[str, str] | None = None, **kwargs):
+    def __init__(self,
+                 *args,
+                 endpoint: str,
+                 headers: dict[str, str] | None = None,
+                 compression: str | None = None,
+                 background_export: bool = False,
+                 export_queue_size: int = 16,
+                 export_overflow_policy: ExportOverflowPolicy = ExportOverflowPolicy.DROP,
+                 **kwargs):
         """Initialize the OTLP span exporter.
 
         Args:
             endpoint: OTLP service endpoint URL.
             headers: HTTP headers for authentication and metadata.
+            compression: Compression of the request bodies, one of "gzip", "deflate" or "none". Defaults to the
+                OpenTelemetry default, configured by the `OTEL_EXPORTER_OTLP_COMPRESSION` environment variable.
+            background_export: Export the batches from a background thread instead of the event loop.
+            export_queue_size: Maximum number of batches waiting for the background thread.
+            export_overflow_policy: Whether to drop or wait when the queue of the background thread is full.
         """
+        otlp_kwargs = {}
+        if compression is not None:
+            otlp_kwargs["compression"] = Compression(compression)
+
         # Initialize exporter before super().__init__() to ensure it's available
         # if parent class initialization potentially calls export_otel_spans()
-        self._exporter = OTLPSpanExporter(endpoint=endpoint, headers=headers)
+        self._exporter = OTLPSpanExporter(endpoint=endpoint, headers=headers, **otlp_kwargs)
+
+        self._export_worker: OTLPExportWorker | None = None
+        if background_export:
+            self._export_worker = OTLPExportWorker(self._exporter,
+                                                   max_queue_size=export_queue_size,
+                                                   overflow_policy=export_overflow_policy)
+        self._export_shutdown_timeout = kwargs.get("shutdown_timeout", 10.0)
+
         super().__init__(*args, **kwargs)
 
     async def export_otel_spans(self, spans: list[OtelSpan]) -> None:
@@ -64,6 +94,20 @@ class OTLPSpanExporterMixin:
             Exception: If there's an error during span export (logged but not re-raised).
         """
         try:
-            self._exporter.export(spans)  # type: ignore[arg-type]
+            if self._export_worker is not None:
+                await self._export_worker.submit(spans)
+            else:
+                self._exporter.export(spans)  # type: ignore[arg-type]
         except Exception as e:
             logger.error("Error exporting spans: %s", e, exc_info=True)
+
+    async def _cleanup(self):
+        """Export the batches queued for the background export worker after the final batch was submitted.
+
+        Isolated copies, one per workflow run, share the worker of the original exporter and return without waiting
+        for the collector. The worker is only stopped when the original exporter is cleaned up.
+        """
+        await super()._cleanup()
+
+        if self._export_worker is not None and not self.is_isolated_instance:
+            await self._export_worker.shutdown(self._export_shutdown_timeout)
@@ -16,6 +16,7 @@
 import logging
 
 from aiq.builder.context import AIQContextState
+from aiq.plugins.opentelemetry.export_worker import ExportOverflowPolicy
 from aiq.plugins.opentelemetry.mixin.otlp_span_exporter_mixin import OTLPSpanExporterMixin
 from aiq.plugins.opentelemetry.otel_span_exporter import OtelSpanExporter
 
@@ -34,6 +35,7 @@ class OTLPSpanAdapterExporter(OTLPSpanExporterMixin, OtelSpanExporter):  # pylin
     - Batching support for efficient transmission
     - OTLP HTTP protocol for maximum compatibility
     - Configurable authentication via headers
+    - Optional background export worker and request compression
     - Resource attribute management
     - Error handling and retry logic
 
@@ -66,6 +68,10 @@ class OTLPSpanAdapterExporter(OTLPSpanExporterMixin, OtelSpanExporter):  # pylin
             # OTLPSpanExporterMixin args
             endpoint: str,
             headers: dict[str, str] | None = None,
+            compression: str | None = None,
+            background_export: bool = False,
+            export_queue_size: int = 16,
+            export_overflow_policy: ExportOverflowPolicy = ExportOverflowPolicy.DROP,
             **otlp_kwargs):
         """Initialize the OTLP span exporter.
 
@@ -79,6 +85,10 @@ class OTLPSpanAdapterExporter(OTLPSpanExporterMixin, OtelSpanExporter):  # pylin
             resource_attributes: Additional resource attributes for spans.
             endpoint: The endpoint for the OTLP service.
             headers: The headers for the OTLP service.
+            compression: Compression of the request bodies, "gzip", "deflate" or "none".
+            background_export: Export batches from a background thread instead of the event loop.
+            export_queue_size: Maximum number of batches waiting for the background thread.
+            export_overflow_policy: Whether to drop or wait when the background queue is full.
             **otlp_kwargs: Additional keyword arguments for the OTLP service.
         """
         super().__init__(context_state=context_state,
@@ -90,4 +100,8 @@ class OTLPSpanAdapterExporter(OTLPSpanExporterMixin, OtelSpanExporter):  # pylin
                          resource_attributes=resource_attributes,
                          endpoint=endpoint,
                          headers=headers,
+                         compression=compression,
+                         background_export=background_export,
+                         export_queue_size=export_queue_size,
+                         export_overflow_policy=export_overflow_policy,
                          **otlp_kwargs)
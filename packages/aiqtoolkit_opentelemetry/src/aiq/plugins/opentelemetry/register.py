@@ -23,11 +23,12 @@ from aiq.cli.register_workflow import register_telemetry_exporter
 from aiq.data_models.telemetry_exporter import TelemetryExporterBaseConfig
 from aiq.observability.mixin.batch_config_mixin import BatchConfigMixin
 from aiq.observability.mixin.collector_config_mixin import CollectorConfigMixin
+from aiq.plugins.opentelemetry.mixin.otlp_export_config_mixin import OTLPExportConfigMixin
 
 logger = logging.getLogger(__name__)
 
 
-class LangfuseTelemetryExporter(BatchConfigMixin, TelemetryExporterBaseConfig, name="langfuse"):
+class LangfuseTelemetryExporter(BatchConfigMixin, OTLPExportConfigMixin, TelemetryExporterBaseConfig, name="langfuse"):
     """A telemetry exporter to transmit traces to externally hosted langfuse service."""
 
     endpoint: str = Field(description="The langfuse OTEL endpoint (/api/public/otel/v1/traces)")
@@ -59,10 +60,18 @@ async def langfuse_telemetry_exporter(config: LangfuseTelemetryExporter, builder
                                   flush_interval=config.flush_interval,
                                   max_queue_size=config.max_queue_size,
                                   drop_on_overflow=config.drop_on_overflow,
-                                  shutdown_timeout=config.shutdown_timeout)
-
-
-class LangsmithTelemetryExporter(BatchConfigMixin, CollectorConfigMixin, TelemetryExporterBaseConfig, name="langsmith"):
+                                  shutdown_timeout=config.shutdown_timeout,
+                                  compression=config.compression,
+                                  background_export=config.background_export,
+                                  export_queue_size=config.export_queue_size,
+                                  export_overflow_policy=config.export_overflow_policy)
+
+
+class LangsmithTelemetryExporter(BatchConfigMixin,
+                                 CollectorConfigMixin,
+                                 OTLPExportConfigMixin,
+                                 TelemetryExporterBaseConfig,
+                                 name="langsmith"):
     """A telemetry exporter to transmit traces to externally hosted langsmith service."""
 
     endpoint: str = Field(
@@ -91,11 +100,16 @@ async def langsmith_telemetry_exporter(config: LangsmithTelemetryExporter, build
                                   flush_interval=config.flush_interval,
                                   max_queue_size=config.max_queue_size,
                                   drop_on_overflow=config.drop_on_overflow,
-                                  shutdown_timeout=config.shutdown_timeout)
+                                  shutdown_timeout=config.shutdown_timeout,
+                                  compression=config.compression,
+                                  background_export=config.background_export,
+                                  export_queue_size=config.export_queue_size,
+                                  export_overflow_policy=config.export_overflow_policy)
 
 
 class OtelCollectorTelemetryExporter(BatchConfigMixin,
                                      CollectorConfigMixin,
+                                     OTLPExportConfigMixin,
                                      TelemetryExporterBaseConfig,
                                      name="otelcollector"):
     """A telemetry exporter to transmit traces to externally hosted otel collector service."""
@@ -128,10 +142,18 @@ async def otel_telemetry_exporter(config: OtelCollectorTelemetryExporter, builde
                                   flush_interval=config.flush_interval,
                                   max_queue_size=config.max_queue_size,
                                   drop_on_overflow=config.drop_on_overflow,
-                                  shutdown_timeout=config.shutdown_timeout)
-
-
-class PatronusTelemetryExporter(BatchConfigMixin, CollectorConfigMixin, TelemetryExporterBaseConfig, name="patronus"):
+                                  shutdown_timeout=config.shutdown_timeout,
+                                  compression=config.compression,
+                                  background_export=config.background_export,
+                                  export_queue_size=config.export_queue_size,
+                                  export_overflow_policy=config.export_overflow_policy)
+
+
+class PatronusTelemetryExporter(BatchConfigMixin,
+                                CollectorConfigMixin,
+                                OTLPExportConfigMixin,
+                                TelemetryExporterBaseConfig,
+                                name="patronus"):
     """A telemetry exporter to transmit traces to Patronus service."""
 
     api_key: str = Field(description="The Patronus API key", default="")
@@ -159,11 +181,19 @@ async def patronus_telemetry_exporter(config: PatronusTelemetryExporter, builder
                                   flush_interval=config.flush_interval,
                                   max_queue_size=config.max_queue_size,
                                   drop_on_overflow=config.drop_on_overflow,
-                                  shutdown_timeout=config.shutdown_timeout)
+                                  shutdown_timeout=config.shutdown_timeout,
+                                  compression=config.compression,
+                                  background_export=config.background_export,
+                                  export_queue_size=config.export_queue_size,
+                                  export_overflow_policy=config.export_overflow_policy)
 
 
 # pylint: disable=W0613
-class GalileoTelemetryExporter(BatchConfigMixin, CollectorConfigMixin, TelemetryExporterBaseConfig, name="galileo"):
+class GalileoTelemetryExporter(BatchConfigMixin,
+                               CollectorConfigMixin,
+                               OTLPExportConfigMixin,
+                               TelemetryExporterBaseConfig,
+                               name="galileo"):
     """A telemetry exporter to transmit traces to externally hosted galileo service."""
 
     endpoint: str = Field(description="The galileo endpoint to export telemetry traces.",
@@ -192,4 +222,8 @@ async def galileo_telemetry_exporter(config: GalileoTelemetryExporter, builder:
         max_queue_size=config.max_queue_size,
         drop_on_overflow=config.drop_on_overflow,
         shutdown_timeout=config.shutdown_timeout,
+        compression=config.compression,
+        background_export=config.background_export,
+        export_queue_size=config.export_queue_size,
+        export_overflow_policy=config.export_overflow_policy,
     )
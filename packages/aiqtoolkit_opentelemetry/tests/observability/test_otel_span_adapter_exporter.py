@@ -333,6 +333,20 @@ class TestOTLPSpanAdapterExporter:
         # Verify OTLPSpanExporter was initialized with correct parameters
         mock_otlp_exporter_class.assert_called_once_with(endpoint=endpoint, headers=None)
 
+    async def test_isolated_instances_share_the_export_worker(self, mock_context_state, basic_exporter_config):
+        """Test that isolated copies share the background export worker, which only the original exporter stops."""
+        exporter = OTLPSpanAdapterExporter(endpoint=basic_exporter_config["endpoint"], background_export=True)
+        isolated = exporter.create_isolated_instance(mock_context_state)
+
+        assert isolated._export_worker is exporter._export_worker
+
+        with patch.object(exporter._export_worker, "shutdown") as shutdown:
+            await isolated._cleanup()
+            shutdown.assert_not_called()
+
+            await exporter._cleanup()
+            shutdown.assert_called_once()
+
     def test_missing_endpoint_parameter(self):
         """Test that missing endpoint parameter raises appropriate error."""
         with pytest.raises(TypeError, match="missing 1 required keyword-only argument: 'endpoint'"):
@@ -20,6 +20,8 @@ without mocking the underlying OTLP exporter.
 """
 
 import asyncio
+import statistics
+import time
 import uuid
 from datetime import datetime
 
@@ -28,6 +30,7 @@ import pytest_httpserver
 from werkzeug import Request
 from werkzeug import Response
 
+from aiq.builder.context import AIQContextState
 from aiq.builder.framework_enum import LLMFrameworkEnum
 from aiq.data_models.intermediate_step import IntermediateStep
 from aiq.data_models.intermediate_step import IntermediateStepPayload
@@ -226,3 +229,81 @@ class TestOTLPSpanAdapterExporterIntegration:
         assert len(mock_otlp_server.received_spans) >= 1
         received_headers = mock_otlp_server.received_headers[0]
         assert received_headers.get("Content-Type") == "application/x-protobuf"
+
+    @pytest.fixture
+    def slow_otlp_server(self):
+        """Create an OTLP HTTP server which takes a long time to answer each request."""
+        server = pytest_httpserver.HTTPServer(host="127.0.0.1", port=0)
+        server.start()
+
+        server.received_spans = []
+        server.received_headers = []
+
+        def slow_trace_handler(request: Request):
+            time.sleep(0.3)
+            server.received_spans.append(request.data)
+            server.received_headers.append(dict(request.headers))
+            return Response(status=200, response="{}")
+
+        server.expect_request("/v1/traces", method="POST").respond_with_handler(slow_trace_handler)
+
+        yield server
+        server.stop()
+
+    async def test_background_export_keeps_event_loop_responsive(self, slow_otlp_server):
+        """Test that a slow collector neither stalls the event loop nor delays workflow runs when exporting in the
+        background.
+
+        Each run exports through an isolated copy of the exporter, like the runs of the exporter manager. The delay of
+        short sleeps stands in for the latency of requests served by the same event loop, such as the FastAPI front
+        end. Exporting on the event loop, or waiting for the collector at the end of each run, would delay them by the
+        0.3s the collector takes per batch.
+        """
+        num_spans = 4
+        endpoint = f"http://127.0.0.1:{slow_otlp_server.port}/v1/traces"
+        exporter = OTLPSpanAdapterExporter(endpoint=endpoint,
+                                           batch_size=1,
+                                           flush_interval=0.1,
+                                           compression="gzip",
+                                           background_export=True)
+
+        delays = []
+        run_times = []
+
+        async with exporter.start():
+            for i in range(num_spans):
+                run_exporter = exporter.create_isolated_instance(AIQContextState.get())
+                run_start = time.perf_counter()
+
+                async with run_exporter.start():
+                    for event_type in (IntermediateStepType.LLM_START, IntermediateStepType.LLM_END):
+                        run_exporter.export(
+                            create_test_intermediate_step(parent_id="root",
+                                                          function_name=f"test_function_{i}",
+                                                          function_id=f"func_{i}",
+                                                          event_type=event_type,
+                                                          framework=LLMFrameworkEnum.LANGCHAIN,
+                                                          name=f"test_call_{i}",
+                                                          event_timestamp=datetime.now().timestamp(),
+                                                          data=StreamEventData(input=f"Input {i}"),
+                                                          UUID=f"uuid_{i}"))
+
+                    await run_exporter._wait_for_tasks()
+
+                run_times.append(time.perf_counter() - run_start)
+
+            # Measure the event loop latency while the collector works through the batches
+            for _ in range(50):
+                start_time = time.perf_counter()
+                await asyncio.sleep(0.01)
+                delays.append(time.perf_counter() - start_time - 0.01)
+
+        p99_delay = statistics.quantiles(delays, n=100)[98]
+        assert p99_delay < 0.15, f"Event loop p99 delay of {p99_delay:.3f}s while exporting to a slow collector"
+
+        # Runs return without waiting for the collector
+        assert max(run_times) < 0.2, f"A run took {max(run_times):.3f}s to complete with a slow collector"
+
+        # Stopping the exporter exported every queued batch
+        assert len(slow_otlp_server.received_spans) == num_spans
+        assert slow_otlp_server.received_headers[0].get("Content-Encoding") == "gzip"
@@ -0,0 +1,139 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from aiq.plugins.opentelemetry.export_worker import ExportOverflowPolicy
+from aiq.plugins.opentelemetry.export_worker import OTLPExportWorker
+
+
+class TestOTLPExportWorker:
+    """Test suite for OTLPExportWorker."""
+
+    @pytest.fixture
+    def release(self):
+        """Event which blocks the exports of the blocking exporter until it is set."""
+        event = threading.Event()
+        yield event
+        event.set()
+
+    @pytest.fixture
+    def blocking_exporter(self, release):
+        """Create an exporter whose exports block until released."""
+        exporter = Mock()
+        exporter.export = Mock(side_effect=lambda spans: release.wait(5))
+        return exporter
+
+    async def test_batches_exported_in_order_off_the_event_loop(self):
+        """Test that batches are exported from the worker thread in submission order."""
+        threads = []
+        exporter = Mock()
+        exporter.export = Mock(side_effect=lambda spans: threads.append(threading.current_thread()))
+
+        worker = OTLPExportWorker(exporter)
+
+        assert await worker.submit(["a"])
+        assert await worker.submit(["b", "c"])
+        await worker.shutdown()
+
+        assert [call.args[0] for call in exporter.export.call_args_list] == [["a"], ["b", "c"]]
+        assert threading.current_thread() not in threads
+
+    async def test_drop_policy(self, blocking_exporter, release):
+        """Test that batches are dropped when the queue is full with the drop policy."""
+        worker = OTLPExportWorker(blocking_exporter, max_queue_size=1, overflow_policy=ExportOverflowPolicy.DROP)
+
+        assert await worker.submit(["in export"])
+        await asyncio.sleep(0.05)
+        assert await worker.submit(["queued"])
+        assert not await worker.submit(["dropped", "spans"])
+        assert worker.dropped_spans == 2
+
+        release.set()
+        await worker.shutdown()
+
+        assert blocking_exporter.export.call_count == 2
+
+    async def test_block_policy(self, blocking_exporter, release):
+        """Test that submitting waits for room in the queue with the block policy."""
+        worker = OTLPExportWorker(blocking_exporter, max_queue_size=1, overflow_policy=ExportOverflowPolicy.BLOCK)
+
+        assert await worker.submit(["in export"])
+        await asyncio.sleep(0.05)
+        assert await worker.submit(["queued"])
+
+        blocked_submit = asyncio.create_task(worker.submit(["waiting"]))
+        await asyncio.sleep(0.05)
+        assert not blocked_submit.done()
+
+        release.set()
+        assert await blocked_submit
+        await worker.shutdown()
+
+        assert blocking_exporter.export.call_count == 3
+        assert worker.dropped_spans == 0
+
+    async def test_cancelled_blocked_submit_is_not_queued(self, blocking_exporter, release):
+        """Test that a batch whose blocked submit was cancelled is never exported."""
+        worker = OTLPExportWorker(blocking_exporter, max_queue_size=1, overflow_policy=ExportOverflowPolicy.BLOCK)
+
+        assert await worker.submit(["in export"])
+        await asyncio.sleep(0.05)
+        assert await worker.submit(["queued"])
+
+        blocked_submit = asyncio.create_task(worker.submit(["cancelled"]))
+        await asyncio.sleep(0.05)
+        blocked_submit.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await blocked_submit
+
+        release.set()
+        await worker.shutdown()
+
+        assert [call.args[0] for call in blocking_exporter.export.call_args_list] == [["in export"], ["queued"]]
+
+    def test_queue_size_must_be_positive(self):
+        """Test that an unbounded queue size is rejected."""
+        with pytest.raises(ValueError, match="max_queue_size"):
+            OTLPExportWorker(Mock(), max_queue_size=0)
+
+    async def test_export_errors_do_not_stop_the_worker(self):
+        """Test that an export error is logged and the following batches are still exported."""
+        exporter = Mock()
+        exporter.export = Mock(side_effect=[Exception("Network error"), None])
+
+        worker = OTLPExportWorker(exporter)
+
+        await worker.submit(["failing"])
+        await worker.submit(["succeeding"])
+        await worker.shutdown()
+
+        assert exporter.export.call_count == 2
+
+    async def test_submit_after_shutdown_restarts_worker(self):
+        """Test that the worker can be used again after it was shut down."""
+        exporter = Mock()
+        worker = OTLPExportWorker(exporter)
+
+        await worker.submit(["first"])
+        await worker.shutdown()
+        await worker.submit(["second"])
+        await worker.shutdown()
+
+        assert exporter.export.call_count == 2
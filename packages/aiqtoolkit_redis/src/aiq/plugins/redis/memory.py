@@ -30,6 +30,18 @@ class RedisMemoryClientConfig(MemoryBaseConfig, name="redis_memory"):
     key_prefix: str | None = Field(default="aiq", description="Key prefix to use for redis keys")
     embedder: EmbedderRef = Field(description=("Instance name of the memory client instance from the workflow "
                                                "configuration object."))
+    batch_size: int = Field(default=500, ge=1, description="Maximum number of memories written in one round-trip")
+    use_transaction: bool = Field(default=False, description="Whether each batch of writes is applied atomically")
+    verify_writes: bool = Field(default=False,
+                                description="Whether to read back every memory after it was written, for debugging")
+    embed_as_documents: bool = Field(default=False,
+                                     description=("Whether to embed memories as documents in a single request. "
+                                                  "Memories are embedded as queries by default, changing this for an "
+                                                  "existing index with an asymmetric embedder degrades recall."))
+    embed_concurrency: int = Field(default=16,
+                                   ge=1,
+                                   description=("Maximum number of concurrent requests when embedding memories as "
+                                                "queries."))
 
 
 @register_memory(config_type=RedisMemoryClientConfig)
@@ -52,6 +64,13 @@ async def redis_memory_client(config: RedisMemoryClientConfig, builder: Builder)
     embedding_dim = len(test_embedding)
     await ensure_index_exists(client=redis_client, key_prefix=config.key_prefix, embedding_dim=embedding_dim)
 
-    memory_editor = RedisEditor(redis_client=redis_client, key_prefix=config.key_prefix, embedder=embedder)
+    memory_editor = RedisEditor(redis_client=redis_client,
+                                key_prefix=config.key_prefix,
+                                embedder=embedder,
+                                batch_size=config.batch_size,
+                                use_transaction=config.use_transaction,
+                                verify_writes=config.verify_writes,
+                                embed_as_documents=config.embed_as_documents,
+                                embed_concurrency=config.embed_concurrency)
 
     yield memory_editor
@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import logging
 import secrets
 
@@ -35,7 +36,15 @@ class RedisEditor(MemoryEditor):
     Wrapper class that implements AIQ Toolkit Interfaces for Redis memory storage.
     """
 
-    def __init__(self, redis_client: redis.Redis, key_prefix: str, embedder: Embeddings):
+    def __init__(self,
+                 redis_client: redis.Redis,
+                 key_prefix: str,
+                 embedder: Embeddings,
+                 batch_size: int = 500,
+                 use_transaction: bool = False,
+                 verify_writes: bool = False,
+                 embed_as_documents: bool = False,
+                 embed_concurrency: int = 16):
         """
         Initialize Redis client for memory storage.
 
@@ -43,63 +52,96 @@ class RedisEditor(MemoryEditor):
             redis_client: (redis.Redis) Redis client
             key_prefix: (str) Redis key prefix
             embedder: (Embeddings) Embedder for semantic search functionality
+            batch_size: (int) Maximum number of items written in one pipelined round-trip
+            use_transaction: (bool) Whether each batch of writes is applied atomically with MULTI/EXEC
+            verify_writes: (bool) Whether to read back every item after it was written, for debugging
+            embed_as_documents: (bool) Whether to embed memories with a single `aembed_documents` request instead of
+                concurrent `aembed_query` requests. Asymmetric embedders embed documents and queries differently, so
+                only enable this for new indexes.
+            embed_concurrency: (int) Maximum number of concurrent `aembed_query` requests when embedding memories as
+                queries
         """
 
         self._client: redis.Redis = redis_client
         self._key_prefix: str = key_prefix
         self._embedder: Embeddings = embedder
+        self._batch_size: int = batch_size
+        self._use_transaction: bool = use_transaction
+        self._verify_writes: bool = verify_writes
+        self._embed_as_documents: bool = embed_as_documents
+        self._embed_concurrency: int = embed_concurrency
 
     async def add_items(self, items: list[MemoryItem]) -> None:
         """
         Insert Multiple MemoryItems into Redis.
         Each MemoryItem is stored with its metadata and tags.
+        Memories are embedded with up to `embed_concurrency` concurrent requests and items are written in pipelined
+        batches of `batch_size`.
         """
         logger.debug(f"Attempting to add {len(items)} items to Redis")
 
+        if not items:
+            return
+
+        # Prepare memory data, keyed by a unique key for each memory item
+        memories: list[tuple[str, dict]] = []
         for memory_item in items:
-            item_meta = memory_item.metadata
-            conversation = memory_item.conversation
-            user_id = memory_item.user_id
-            tags = memory_item.tags
             memory_id = secrets.token_hex(4)  # e.g. 02ba3fe9
-
-            # Create a unique key for this memory item
             memory_key = f"{self._key_prefix}:memory:{memory_id}"
-            logger.debug(f"Generated memory key: {memory_key}")
-
-            # Prepare memory data
-            memory_data = {
-                "conversation": conversation,
-                "user_id": user_id,
-                "tags": tags,
-                "metadata": item_meta,
-                "memory": memory_item.memory or ""
-            }
-            logger.debug(f"Prepared memory data for key {memory_key}")
-
-            # If we have memory, compute and store the embedding
-            if memory_item.memory:
-                logger.debug("Computing embedding for memory text")
-                search_vector = await self._embedder.aembed_query(memory_item.memory)
-                logger.debug(f"Generated embedding vector of length: {len(search_vector)}")
+
+            memories.append((memory_key,
+                             {
+                                 "conversation": memory_item.conversation,
+                                 "user_id": memory_item.user_id,
+                                 "tags": memory_item.tags,
+                                 "metadata": memory_item.metadata,
+                                 "memory": memory_item.memory or ""
+                             }))
+
+        # If we have memory, compute and store the embedding
+        to_embed = [memory_data for _, memory_data in memories if memory_data["memory"]]
+        if to_embed:
+            logger.debug(f"Computing embeddings for {len(to_embed)} memories")
+            texts = [memory_data["memory"] for memory_data in to_embed]
+            if self._embed_as_documents:
+                search_vectors = await self._embedder.aembed_documents(texts)
+            else:
+                semaphore = asyncio.Semaphore(self._embed_concurrency)
+
+                async def _embed_query(text: str) -> list[float]:
+                    async with semaphore:
+                        return await self._embedder.aembed_query(text)
+
+                search_vectors = await asyncio.gather(*(_embed_query(text) for text in texts))
+            for memory_data, search_vector in zip(to_embed, search_vectors):
                 memory_data["embedding"] = search_vector
 
-            try:
+        try:
+            for i in range(0, len(memories), self._batch_size):
+                batch = memories[i:i + self._batch_size]
+
                 # Store as JSON in Redis
-                logger.debug(f"Attempting to store memory data in Redis for key: {memory_key}")
-                await self._client.json().set(memory_key, "$", memory_data)
-                logger.debug(f"Successfully stored memory data for key: {memory_key}")
-
-                # Verify the data was stored
-                stored_data = await self._client.json().get(memory_key)
-                logger.debug(f"Verified data storage for key {memory_key}: {bool(stored_data)}")
-
-            except redis_exceptions.ResponseError as e:
-                logger.error(f"Failed to store memory item: {str(e)}")
-                raise
-            except redis_exceptions.ConnectionError as e:
-                logger.error(f"Redis connection error while storing memory item: {str(e)}")
-                raise
+                logger.debug(f"Storing {len(batch)} memory items in Redis")
+                pipe = self._client.pipeline(transaction=self._use_transaction)
+                for memory_key, memory_data in batch:
+                    pipe.json().set(memory_key, "$", memory_data)
+                await pipe.execute()
+
+                if self._verify_writes:
+                    # Verify the data was stored
+                    pipe = self._client.pipeline(transaction=False)
+                    for memory_key, _ in batch:
+                        pipe.json().get(memory_key)
+                    stored = await pipe.execute()
+                    for (memory_key, _), stored_data in zip(batch, stored):
+                        logger.debug(f"Verified data storage for key {memory_key}: {bool(stored_data)}")
+
+        except redis_exceptions.ResponseError as e:
+            logger.error(f"Failed to store memory item: {str(e)}")
+            raise
+        except redis_exceptions.ConnectionError as e:
+            logger.error(f"Redis connection error while storing memory item: {str(e)}")
+            raise
 
     async def search(self, query: str, top_k: int = 5, **kwargs) -> list[MemoryItem]:
         """
@@ -13,8 +13,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import logging
+import time
 from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
+from unittest.mock import patch
 
 import pytest
 from langchain_core.embeddings import Embeddings
@@ -23,6 +27,8 @@ from aiq.memory.models import MemoryItem
 from aiq.plugins.redis.redis_editor import RedisEditor
 from aiq.utils.type_utils import override
 
+logger = logging.getLogger(__name__)
+
 
 class TestEmbeddings(Embeddings):
 
@@ -48,14 +54,18 @@ def mock_redis_client_fixture() -> AsyncMock:
     """Fixture to provide a mocked AsyncMemoryClient."""
     mock_client = AsyncMock()
 
-    # Create a mock for the JSON commands
-    mock_json = AsyncMock()
-    mock_json.set = AsyncMock()
-    mock_json.get = AsyncMock()
+    # Create a mock for the JSON commands, which are queued on pipelines rather than awaited
+    mock_json = MagicMock()
 
     # Set up the json() method to return our mock
     mock_client.json = MagicMock(return_value=mock_json)
 
+    # Pipelines share the JSON mock so queued commands can be inspected the same way
+    mock_pipeline = MagicMock()
+    mock_pipeline.json = MagicMock(return_value=mock_json)
+    mock_pipeline.execute = AsyncMock()
+    mock_client.pipeline = MagicMock(return_value=mock_pipeline)
+
     return mock_client
 
 
@@ -128,6 +138,142 @@ async def test_add_items_empty_list(redis_editor: RedisEditor, mock_redis_client
     mock_redis_client.add_items.assert_not_called()
 
 
+@pytest.mark.parametrize("use_transaction", [False, True])
+async def test_add_items_pipelined(mock_redis_client: AsyncMock, sample_memory_item: MemoryItem, use_transaction: bool):
+    """Test that items are written in pipelined batches without reading them back."""
+    editor = RedisEditor(redis_client=mock_redis_client,
+                         key_prefix="pytest",
+                         embedder=TestEmbeddings(),
+                         batch_size=2,
+                         use_transaction=use_transaction)
+
+    await editor.add_items([sample_memory_item] * 5)
+
+    assert mock_redis_client.json().set.call_count == 5
+    assert mock_redis_client.pipeline.return_value.execute.await_count == 3
+    mock_redis_client.pipeline.assert_called_with(transaction=use_transaction)
+    mock_redis_client.json().get.assert_not_called()
+
+    keys = {call.args[0] for call in mock_redis_client.json().set.call_args_list}
+    assert len(keys) == 5
+
+
+async def test_add_items_verify_writes(mock_redis_client: AsyncMock, sample_memory_item: MemoryItem):
+    """Test that written items are read back when write verification is enabled."""
+    editor = RedisEditor(redis_client=mock_redis_client,
+                         key_prefix="pytest",
+                         embedder=TestEmbeddings(),
+                         verify_writes=True)
+
+    await editor.add_items([sample_memory_item] * 3)
+
+    assert mock_redis_client.json().get.call_count == 3
+
+
+async def test_add_items_embeds_as_queries(mock_redis_client: AsyncMock, sample_memory_item: MemoryItem):
+    """Test that memories are embedded like search queries by default and items without memory are not embedded."""
+    embedder = TestEmbeddings()
+    editor = RedisEditor(redis_client=mock_redis_client, key_prefix="pytest", embedder=embedder)
+    no_memory = sample_memory_item.model_copy(update={"memory": None})
+
+    with patch.object(embedder, "aembed_documents", wraps=embedder.aembed_documents) as aembed_documents, \
+            patch.object(embedder, "aembed_query", wraps=embedder.aembed_query) as aembed_query:
+        await editor.add_items([sample_memory_item, no_memory, sample_memory_item])
+
+    aembed_documents.assert_not_called()
+    assert aembed_query.await_count == 2
+
+    stored = [call.args[2] for call in mock_redis_client.json().set.call_args_list]
+    assert [data.get("embedding") for data in stored] == [embedder.embed_query("Sample memory"), None,
+                                                         embedder.embed_query("Sample memory")]
+
+
+async def test_add_items_bounds_embedding_concurrency(mock_redis_client: AsyncMock, sample_memory_item: MemoryItem):
+    """Test that no more than `embed_concurrency` memories are embedded at once."""
+    embedder = TestEmbeddings()
+    editor = RedisEditor(redis_client=mock_redis_client, key_prefix="pytest", embedder=embedder, embed_concurrency=3)
+    in_flight = max_in_flight = 0
+
+    async def aembed_query(text: str) -> list[float]:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return embedder.embed_query(text)
+
+    with patch.object(embedder, "aembed_query", side_effect=aembed_query):
+        await editor.add_items([sample_memory_item] * 10)
+
+    assert max_in_flight == 3
+    assert mock_redis_client.json().set.call_count == 10
+
+
+async def test_add_items_embeds_as_documents(mock_redis_client: AsyncMock, sample_memory_item: MemoryItem):
+    """Test that all memories are embedded with a single request when embedding them as documents."""
+    embedder = TestEmbeddings()
+    editor = RedisEditor(redis_client=mock_redis_client,
+                         key_prefix="pytest",
+                         embedder=embedder,
+                         embed_as_documents=True)
+    no_memory = sample_memory_item.model_copy(update={"memory": None})
+
+    with patch.object(embedder, "aembed_documents", wraps=embedder.aembed_documents) as aembed_documents:
+        await editor.add_items([sample_memory_item, no_memory, sample_memory_item])
+
+    aembed_documents.assert_awaited_once_with(["Sample memory", "Sample memory"])
+
+    stored = [call.args[2] for call in mock_redis_client.json().set.call_args_list]
+    assert [("embedding" in data) for data in stored] == [True, False, True]
+
+
+async def test_add_items_fake_redis(sample_memory_item: MemoryItem):
+    """Test that items written through a pipeline can be read back from a Redis compatible server."""
+    fakeredis = pytest.importorskip("fakeredis")
+
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    editor = RedisEditor(redis_client=client, key_prefix="pytest", embedder=TestEmbeddings(), use_transaction=True)
+
+    await editor.add_items([sample_memory_item] * 3)
+
+    keys = await client.keys("pytest:memory:*")
+    assert len(keys) == 3
+    stored = await client.json().get(keys[0])
+    assert stored["memory"] == sample_memory_item.memory
+    assert stored["embedding"] == [0.0, 1.0, 2.0, 3.0, 4.0, 5.0]
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+@pytest.mark.parametrize("num_items", [1000, 10000])
+async def test_add_items_throughput_benchmark(sample_memory_item: MemoryItem, num_items: int):
+    """Compare items/sec of the previous sequential set and read-back writes with pipelined writes."""
+    fakeredis = pytest.importorskip("fakeredis")
+
+    items = [sample_memory_item] * num_items
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    embedder = TestEmbeddings()
+
+    start = time.perf_counter()
+    for i, item in enumerate(items):
+        data = {"memory": item.memory, "embedding": await embedder.aembed_query(item.memory)}
+        await client.json().set(f"sequential:memory:{i}", "$", data)
+        await client.json().get(f"sequential:memory:{i}")
+    sequential_throughput = num_items / (time.perf_counter() - start)
+
+    editor = RedisEditor(redis_client=client, key_prefix="pipelined", embedder=embedder)
+    start = time.perf_counter()
+    await editor.add_items(items)
+    pipelined_throughput = num_items / (time.perf_counter() - start)
+
+    logger.info("Redis add_items throughput for %d items, sequential: %.0f items/s, pipelined: %.0f items/s",
+                num_items,
+                sequential_throughput,
+                pipelined_throughput)
+    assert len(await client.keys("pipelined:memory:*")) == num_items
+    assert pipelined_throughput > sequential_throughput
+
+
 @pytest.mark.asyncio
 async def test_search_success(redis_editor: RedisEditor, mock_redis_client: AsyncMock):
     """Test searching with a valid query and user ID."""
@@ -13,9 +13,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import json
 # pylint: disable=R0917
 import logging
+import re
 from json import JSONDecodeError
 
 from langchain_core.callbacks.base import AsyncCallbackHandler
@@ -65,9 +67,14 @@ class ReWOOAgentGraph(BaseAgent):
                  tools: list[BaseTool],
                  use_tool_schema: bool = True,
                  callbacks: list[AsyncCallbackHandler] | None = None,
-                 detailed_logs: bool = False):
+                 detailed_logs: bool = False,
+                 parallel_execution: bool = False,
+                 max_concurrent_tool_calls: int = 4):
         super().__init__(llm=llm, tools=tools, callbacks=callbacks, detailed_logs=detailed_logs)
 
+        if max_concurrent_tool_calls < 1:
+            raise ValueError("max_concurrent_tool_calls must be at least 1")
+
         logger.debug(
             "%s Filling the prompt variables 'tools' and 'tool_names', using the tools provided in the config.",
             AGENT_LOG_PREFIX)
@@ -87,6 +94,8 @@ class ReWOOAgentGraph(BaseAgent):
         self.planner_prompt = planner_prompt.partial(tools=tool_names_and_descriptions, tool_names=tool_names)
         self.solver_prompt = solver_prompt
         self.tools_dict = {tool.name: tool for tool in tools}
+        self.parallel_execution = parallel_execution
+        self.max_concurrent_tool_calls = max_concurrent_tool_calls
 
         logger.debug("%s Initialized ReWOO Agent Graph", AGENT_LOG_PREFIX)
 
@@ -202,6 +211,139 @@ class ReWOOAgentGraph(BaseAgent):
             logger.exception("%s Failed to call planner_node: %s", AGENT_LOG_PREFIX, ex, exc_info=True)
             raise ex
 
+    @staticmethod
+    def _get_step_info(step) -> dict | None:
+        if isinstance(step, dict) and "evidence" in step:
+            return step["evidence"]
+        return None
+
+    @staticmethod
+    def _get_step_dependencies(steps: list[dict]) -> dict[str, set[str]]:
+        """
+        Build the dependency graph of the plan. A step depends on every earlier step whose placeholder is referenced
+        in its tool input, this matches the order in which the sequential executor resolves placeholders. Only the
+        placeholders of the plan are matched, as whole tokens, so `#E1` does not match `#E10`, and a step never depends
+        on itself.
+        """
+        placeholders = {step["evidence"].get("placeholder", "") for step in steps} - {""}
+        # Longer placeholders first, so a placeholder which is a prefix of another one does not shadow it
+        alternatives = "|".join(re.escape(placeholder) for placeholder in sorted(placeholders, key=len, reverse=True))
+        placeholder_pattern = re.compile(rf"(?<!\w)(?:{alternatives})(?!\w)") if placeholders else None
+
+        dependencies: dict[str, set[str]] = {}
+        seen_placeholders: list[str] = []
+        for step in steps:
+            step_info = step["evidence"]
+            placeholder = step_info.get("placeholder", "")
+            referenced = set()
+            if placeholder_pattern is not None:
+                referenced = set(placeholder_pattern.findall(str(step_info.get("tool_input", ""))))
+            dependencies[placeholder] = {
+                _placeholder
+                for _placeholder in seen_placeholders if _placeholder in referenced and _placeholder != placeholder
+            }
+            seen_placeholders.append(placeholder)
+
+        return dependencies
+
+    async def _execute_step(self, step_info: dict, intermediate_results: dict[str, ToolMessage]) -> ToolMessage:
+        tool = step_info.get("tool", "")
+        tool_input = step_info.get("tool_input", "")
+
+        # Replace the placeholder in the tool input with the previous tool output
+        for _placeholder, _tool_output in intermediate_results.items():
+            _tool_output = _tool_output.content
+            # If the content is a list, get the first element which should be a dict
+            if isinstance(_tool_output, list):
+                _tool_output = _tool_output[0]
+                assert isinstance(_tool_output, dict)
+
+            tool_input = self._replace_placeholder(_placeholder, tool_input, _tool_output)
+
+        requested_tool = self._get_tool(tool)
+        if not requested_tool:
+            configured_tool_names = list(self.tools_dict.keys())
+            logger.warning(
+                "%s ReWOO Agent wants to call tool %s. In the ReWOO Agent's configuration within the config file,"
+                "there is no tool with that name: %s",
+                AGENT_LOG_PREFIX,
+                tool,
+                configured_tool_names)
+
+            return ToolMessage(content=TOOL_NOT_FOUND_ERROR_MESSAGE.format(tool_name=tool, tools=configured_tool_names),
+                               tool_call_id=tool)
+
+        if self.detailed_logs:
+            logger.debug("%s Calling tool %s with input: %s", AGENT_LOG_PREFIX, requested_tool.name, tool_input)
+
+        # Run the tool. Try to use structured input, if possible
+        tool_input_parsed = self._parse_tool_input(tool_input)
+        tool_response = await self._call_tool(requested_tool,
+                                              tool_input_parsed,
+                                              RunnableConfig(callbacks=self.callbacks),
+                                              max_retries=3)
+
+        # ToolMessage only accepts str or list[str | dict] as content.
+        # Convert into list if the response is a dict.
+        if isinstance(tool_response, dict):
+            tool_response = [tool_response]
+
+        tool_response_message = ToolMessage(name=tool, tool_call_id=tool, content=tool_response)
+
+        if self.detailed_logs:
+            self._log_tool_response(requested_tool.name, tool_input_parsed, str(tool_response))
+
+        return tool_response_message
+
+    async def _execute_steps_in_parallel(self, steps: list[dict], intermediate_results: dict[str, ToolMessage]):
+        """
+        Execute all remaining steps of the plan, dispatching every step whose dependencies are resolved concurrently.
+        Results are added to `intermediate_results` as they complete, which may unblock further steps.
+        """
+        dependencies = self._get_step_dependencies(steps)
+        pending = {
+            step["evidence"].get("placeholder", ""): step["evidence"]
+            for step in steps if step["evidence"].get("placeholder", "") not in intermediate_results
+        }
+        semaphore = asyncio.Semaphore(self.max_concurrent_tool_calls)
+
+        async def _run(step_info: dict) -> ToolMessage:
+            async with semaphore:
+                return await self._execute_step(step_info, intermediate_results)
+
+        running: dict[asyncio.Task, str] = {}
+        try:
+            while pending or running:
+                ready = [
+                    placeholder for placeholder in pending
+                    if all(dependency in intermediate_results for dependency in dependencies[placeholder])
+                ]
+                for placeholder in ready:
+                    logger.debug("%s Dispatching ReWOO step %s", AGENT_LOG_PREFIX, placeholder)
+                    running[asyncio.create_task(_run(pending.pop(placeholder)))] = placeholder
+
+                if not running:
+                    unresolved = {
+                        placeholder: sorted(dependencies[placeholder] - intermediate_results.keys())
+                        for placeholder in pending
+                    }
+                    raise RuntimeError(f"ReWOO plan cannot be completed, the dependencies of steps {unresolved} "
+                                       "are never resolved")
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    intermediate_results[running.pop(task)] = task.result()
+        finally:
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+
+        # Keep the results in plan order regardless of the order in which the steps completed
+        return {
+            placeholder: intermediate_results[placeholder]
+            for placeholder in dependencies if placeholder in intermediate_results
+        } | intermediate_results
+
     async def executor_node(self, state: ReWOOGraphState):
         try:
             logger.debug("%s Starting the ReWOO Executor Node", AGENT_LOG_PREFIX)
@@ -214,69 +356,29 @@ class ReWOOAgentGraph(BaseAgent):
                              current_step)
                 raise RuntimeError(f"ReWOO Executor is invoked with an invalid step number: {current_step}")
 
+            intermediate_results = state.intermediate_results
             steps_content = state.steps.content
+
+            if self.parallel_execution and isinstance(steps_content, list):
+                invalid_steps = [index for index, step in enumerate(steps_content) if not self._get_step_info(step)]
+                if invalid_steps:
+                    logger.error("%s Invalid step format at index %s", AGENT_LOG_PREFIX, invalid_steps)
+                    return {"intermediate_results": intermediate_results}
+
+                intermediate_results = await self._execute_steps_in_parallel(steps_content, intermediate_results)
+                return {"intermediate_results": intermediate_results}
+
             if isinstance(steps_content, list) and current_step < len(steps_content):
-                step = steps_content[current_step]
-                if isinstance(step, dict) and "evidence" in step:
-                    step_info = step["evidence"]
-                    placeholder = step_info.get("placeholder", "")
-                    tool = step_info.get("tool", "")
-                    tool_input = step_info.get("tool_input", "")
-                else:
+                step_info = self._get_step_info(steps_content[current_step])
+                if step_info is None:
                     logger.error("%s Invalid step format at index %s", AGENT_LOG_PREFIX, current_step)
-                    return {"intermediate_results": state.intermediate_results}
+                    return {"intermediate_results": intermediate_results}
             else:
                 logger.error("%s Invalid steps content or index %s", AGENT_LOG_PREFIX, current_step)
-                return {"intermediate_results": state.intermediate_results}
-
-            intermediate_results = state.intermediate_results
-
-            # Replace the placeholder in the tool input with the previous tool output
-            for _placeholder, _tool_output in intermediate_results.items():
-                _tool_output = _tool_output.content
-                # If the content is a list, get the first element which should be a dict
-                if isinstance(_tool_output, list):
-                    _tool_output = _tool_output[0]
-                    assert isinstance(_tool_output, dict)
-
-                tool_input = self._replace_placeholder(_placeholder, tool_input, _tool_output)
-
-            requested_tool = self._get_tool(tool)
-            if not requested_tool:
-                configured_tool_names = list(self.tools_dict.keys())
-                logger.warning(
-                    "%s ReWOO Agent wants to call tool %s. In the ReWOO Agent's configuration within the config file,"
-                    "there is no tool with that name: %s",
-                    AGENT_LOG_PREFIX,
-                    tool,
-                    configured_tool_names)
-
-                intermediate_results[placeholder] = ToolMessage(content=TOOL_NOT_FOUND_ERROR_MESSAGE.format(
-                    tool_name=tool, tools=configured_tool_names),
-                                                                tool_call_id=tool)
                 return {"intermediate_results": intermediate_results}
 
-            if self.detailed_logs:
-                logger.debug("%s Calling tool %s with input: %s", AGENT_LOG_PREFIX, requested_tool.name, tool_input)
-
-            # Run the tool. Try to use structured input, if possible
-            tool_input_parsed = self._parse_tool_input(tool_input)
-            tool_response = await self._call_tool(requested_tool,
-                                                  tool_input_parsed,
-                                                  RunnableConfig(callbacks=self.callbacks),
-                                                  max_retries=3)
-
-            # ToolMessage only accepts str or list[str | dict] as content.
-            # Convert into list if the response is a dict.
-            if isinstance(tool_response, dict):
-                tool_response = [tool_response]
-
-            tool_response_message = ToolMessage(name=tool, tool_call_id=tool, content=tool_response)
-
-            if self.detailed_logs:
-                self._log_tool_response(requested_tool.name, tool_input_parsed, str(tool_response))
-
-            intermediate_results[placeholder] = tool_response_message
+            placeholder = step_info.get("placeholder", "")
+            intermediate_results[placeholder] = await self._execute_step(step_info, intermediate_results)
             return {"intermediate_results": intermediate_results}
 
         except Exception as ex:
@@ -18,6 +18,7 @@ import logging
 
 from langchain_core.callbacks.base import AsyncCallbackHandler
 from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import ToolMessage
 from langchain_core.messages.base import BaseMessage
 from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import BaseTool
@@ -29,6 +30,7 @@ from aiq.agent.base import AGENT_CALL_LOG_MESSAGE
 from aiq.agent.base import AGENT_LOG_PREFIX
 from aiq.agent.base import AgentDecision
 from aiq.agent.dual_node import DualNodeAgent
+from aiq.agent.tool_executor import ToolCallExecutor
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +38,7 @@ logger = logging.getLogger(__name__)
 class ToolCallAgentGraphState(BaseModel):
     """State schema for the Tool Calling Agent Graph"""
     messages: list[BaseMessage] = Field(default_factory=list)  # input and output of the Agent
+    tool_call_results: dict[str, ToolMessage] = Field(default_factory=dict)  # tool responses reused within a run
 
 
 class ToolCallAgentGraph(DualNodeAgent):
@@ -48,9 +51,19 @@ class ToolCallAgentGraph(DualNodeAgent):
                  tools: list[BaseTool],
                  callbacks: list[AsyncCallbackHandler] = None,
                  detailed_logs: bool = False,
-                 handle_tool_errors: bool = True):
+                 handle_tool_errors: bool = True,
+                 max_concurrent_tool_calls: int | None = None,
+                 tool_call_timeout: float | None = None,
+                 tool_call_timeouts: dict[str, float] | None = None,
+                 deduplicate_tool_calls: bool = False):
         super().__init__(llm=llm, tools=tools, callbacks=callbacks, detailed_logs=detailed_logs)
         self.tool_caller = ToolNode(tools, handle_tool_errors=handle_tool_errors)
+        self.tool_executor = ToolCallExecutor(self.tool_caller,
+                                              max_concurrency=max_concurrent_tool_calls,
+                                              timeout=tool_call_timeout,
+                                              tool_timeouts=tool_call_timeouts,
+                                              handle_tool_errors=handle_tool_errors,
+                                              deduplicate=deduplicate_tool_calls)
         logger.debug("%s Initialized Tool Calling Agent Graph", AGENT_LOG_PREFIX)
 
     async def agent_node(self, state: ToolCallAgentGraphState):
@@ -94,12 +107,13 @@ class ToolCallAgentGraph(DualNodeAgent):
             tool_calls = state.messages[-1].tool_calls
             tools = [tool.get('name') for tool in tool_calls]
             tool_input = state.messages[-1]
-            tool_response = await self.tool_caller.ainvoke(input={"messages": [tool_input]},
-                                                           config=RunnableConfig(callbacks=self.callbacks,
-                                                                                 configurable={}))
+            tool_responses = await self.tool_executor.execute(tool_calls,
+                                                              config=RunnableConfig(callbacks=self.callbacks,
+                                                                                    configurable={}),
+                                                              results=state.tool_call_results)
             # this configurable = {} argument is needed due to a bug in LangGraph PreBuilt ToolNode ^
 
-            for response in tool_response.get('messages'):
+            for response in tool_responses:
                 if self.detailed_logs:
                     self._log_tool_response(str(tools), str(tool_input), response.content)
                 state.messages += [response]
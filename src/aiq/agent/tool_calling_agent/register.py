@@ -42,6 +42,21 @@ class ToolCallAgentWorkflowConfig(FunctionBaseConfig, name="tool_calling_agent")
     handle_tool_errors: bool = Field(default=True, description="Specify ability to handle tool calling errors.")
     description: str = Field(default="Tool Calling Agent Workflow", description="Description of this functions use.")
     max_iterations: int = Field(default=15, description="Number of tool calls before stoping the tool calling agent.")
+    max_concurrent_tool_calls: int | None = Field(default=None,
+                                                  ge=1,
+                                                  description="Maximum number of tool calls the agent runs at the same "
+                                                  "time, across all of its runs. Unlimited if not set.")
+    tool_call_timeout: float | None = Field(default=None,
+                                            gt=0,
+                                            description="Number of seconds after which a tool call is stopped. No "
+                                            "timeout if not set.")
+    tool_call_timeouts: dict[str, float] = Field(default_factory=dict,
+                                                 description="Timeouts of individual tools, overriding "
+                                                 "`tool_call_timeout`.")
+    deduplicate_tool_calls: bool = Field(default=False,
+                                         description="Reuse the response of a successful tool call for calls of the "
+                                         "same tool with the same arguments within a run. Only enable it when all "
+                                         "tools are free of side effects.")
 
 
 @register_function(config_type=ToolCallAgentWorkflowConfig, framework_wrappers=[LLMFrameworkEnum.LANGCHAIN])
@@ -70,10 +85,15 @@ async def tool_calling_agent_workflow(config: ToolCallAgentWorkflowConfig, build
         raise ex
 
     # construct the Tool Calling Agent Graph from the configured llm, and tools
-    graph: CompiledGraph = await ToolCallAgentGraph(llm=llm,
-                                                    tools=tools,
-                                                    detailed_logs=config.verbose,
-                                                    handle_tool_errors=config.handle_tool_errors).build_graph()
+    graph: CompiledGraph = await ToolCallAgentGraph(
+        llm=llm,
+        tools=tools,
+        detailed_logs=config.verbose,
+        handle_tool_errors=config.handle_tool_errors,
+        max_concurrent_tool_calls=config.max_concurrent_tool_calls,
+        tool_call_timeout=config.tool_call_timeout,
+        tool_call_timeouts=config.tool_call_timeouts,
+        deduplicate_tool_calls=config.deduplicate_tool_calls).build_graph()
 
     async def _response_fn(input_message: str) -> str:
         try:
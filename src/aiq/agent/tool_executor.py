@@ -0,0 +1,168 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import json
+import logging
+import time
+from contextlib import nullcontext
+from typing import Any
+
+from langchain_core.messages import AIMessage
+from langchain_core.messages import ToolCall
+from langchain_core.messages import ToolMessage
+from langchain_core.runnables import RunnableConfig
+from langgraph.prebuilt import ToolNode
+
+from aiq.agent.base import AGENT_LOG_PREFIX
+from aiq.utils.intermediate_step_utils import report_custom_step
+
+logger = logging.getLogger(__name__)
+
+TOOL_TIMEOUT_ERROR_MESSAGE = "The tool {tool_name} did not respond within {timeout} seconds."
+
+TOOL_EXECUTION_STEP_NAME = "tool_execution"
+
+
+def tool_call_key(tool_call: ToolCall) -> str:
+    """Key identifying calls of the same tool with the same arguments, regardless of the order of the arguments."""
+    args = json.dumps(tool_call.get("args", {}), sort_keys=True, separators=(",", ":"), default=str)
+    return f"{tool_call['name']}:{args}"
+
+
+class ToolCallExecutor:
+    """
+    Runs the tool calls requested in a single model response.
+
+    Each call is run through the `ToolNode` of the agent, so unknown tools and tool errors are handled the same way as
+    when the `ToolNode` is invoked directly. On top of that the executor:
+
+    - runs independent calls concurrently, at most `max_concurrency` at a time across all runs of the agent,
+    - stops calls which take longer than their timeout,
+    - when `deduplicate` is set, runs identical calls (same tool and arguments) only once and, when a results cache is
+      passed, reuses successful results of earlier calls in the same run.
+
+    Each call is reported as a ``tool_execution`` custom step recording the time it waited for a free slot
+    (``queue_time``) and the time it ran (``run_time``).
+    """
+
+    def __init__(self,
+                 tool_node: ToolNode,
+                 max_concurrency: int | None = None,
+                 timeout: float | None = None,
+                 tool_timeouts: dict[str, float] | None = None,
+                 handle_tool_errors: bool = True,
+                 deduplicate: bool = False):
+        self.tool_node = tool_node
+        self.timeout = timeout
+        self.tool_timeouts = tool_timeouts or {}
+        self.handle_tool_errors = handle_tool_errors
+        self.deduplicate = deduplicate
+        self._semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+    def _report(self, tool_call: ToolCall, message: ToolMessage | None, **metadata: Any) -> None:
+        metadata = {
+            "tool_name": tool_call["name"],
+            "tool_call_id": tool_call.get("id"),
+            "status": message.status if message is not None else "error",
+            **metadata
+        }
+
+        report_custom_step(TOOL_EXECUTION_STEP_NAME, metadata)
+
+    async def _run(self, tool_call: ToolCall, config: RunnableConfig | None) -> ToolMessage:
+        queued_at = time.perf_counter()
+        timeout = self.tool_timeouts.get(tool_call["name"], self.timeout)
+        tool_input = {"messages": [AIMessage(content="", tool_calls=[tool_call])]}
+
+        async with self._semaphore if self._semaphore is not None else nullcontext():
+            started_at = time.perf_counter()
+            message = None
+            timed_out = False
+            try:
+                response = await asyncio.wait_for(self.tool_node.ainvoke(input=tool_input, config=config),
+                                                  timeout=timeout)
+                message = response["messages"][0]
+            except asyncio.TimeoutError:
+                timed_out = True
+                logger.warning("%s Tool %s timed out after %s seconds", AGENT_LOG_PREFIX, tool_call["name"], timeout)
+                if not self.handle_tool_errors:
+                    raise
+                message = ToolMessage(content=TOOL_TIMEOUT_ERROR_MESSAGE.format(tool_name=tool_call["name"],
+                                                                                timeout=timeout),
+                                      name=tool_call["name"],
+                                      tool_call_id=tool_call["id"],
+                                      status="error")
+            finally:
+                self._report(tool_call,
+                             message,
+                             queue_time=started_at - queued_at,
+                             run_time=time.perf_counter() - started_at,
+                             deduplicated=False,
+                             timed_out=timed_out)
+
+        return message
+
+    async def execute(self,
+                      tool_calls: list[ToolCall],
+                      config: RunnableConfig | None = None,
+                      results: dict[str, ToolMessage] | None = None) -> list[ToolMessage]:
+        """
+        Run *tool_calls* and return their responses in the order of the calls.
+
+        Args:
+            tool_calls (list[ToolCall]): The tool calls of a model response.
+            config (RunnableConfig | None): The config to run the tools with.
+            results (dict[str, ToolMessage] | None): Successful responses of earlier calls in the same run, keyed by
+                `tool_call_key`. Reused for identical calls and updated with the responses of new calls.
+
+        Returns:
+            list[ToolMessage]: One response per tool call.
+        """
+        if results is None or not self.deduplicate:
+            results = {}
+
+        tasks: dict[str, asyncio.Task] = {}
+        keys = []
+        for i, tool_call in enumerate(tool_calls):
+            key = tool_call_key(tool_call) if self.deduplicate else str(i)
+            keys.append(key)
+            if key not in results and key not in tasks:
+                tasks[key] = asyncio.create_task(self._run(tool_call, config))
+
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+
+        responses = []
+        for tool_call, key in zip(tool_calls, keys):
+            task = tasks.pop(key, None)
+            if task is not None:
+                message = task.result()
+                if message.status != "error":
+                    results[key] = message
+            else:
+                # An identical call was run earlier in the run or in this response
+                message = results.get(key) or next(r for r, k in zip(responses, keys) if k == key)
+                message = message.model_copy(update={"tool_call_id": tool_call["id"]})
+                self._report(tool_call, message, queue_time=0.0, run_time=0.0, deduplicated=True, timed_out=False)
+
+            responses.append(message)
+
+        return responses
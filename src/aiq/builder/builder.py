@@ -45,6 +45,9 @@ from aiq.memory.interfaces import MemoryEditor
 from aiq.object_store.interfaces import ObjectStore
 from aiq.retriever.interface import AIQRetriever
 
+if typing.TYPE_CHECKING:
+    from aiq.utils.llm_endpoint_pool import LLMEndpointMetrics
+
 
 class UserManagerHolder():
 
@@ -115,6 +118,21 @@ class Builder(ABC):  # pylint: disable=too-many-public-methods
     def get_llm_config(self, llm_name: str | LLMRef) -> LLMBaseConfig:
         pass
 
+    def get_llm_http_client(self, llm_config: LLMBaseConfig, asynchronous: bool = True) -> typing.Any:
+        """
+        Returns the HTTP client shared by the LLMs which send requests to the same endpoint as *llm_config*, or None if
+        LLM clients should create their own. Used by the LLM client plugins of frameworks which accept an `httpx`
+        client.
+        """
+        return None
+
+    def get_llm_endpoint_metrics(self) -> list["LLMEndpointMetrics"]:
+        """
+        Returns the concurrency and rate limit metrics of the model endpoints used by the LLMs of the workflow, such as
+        the number of requests which waited for a limit and how long they waited.
+        """
+        return []
+
     @abstractmethod
     async def add_object_store(self, name: str | ObjectStoreRef, config: ObjectStoreBaseConfig):
         pass
@@ -70,6 +70,9 @@ class AIQContextState(metaclass=Singleton):
                                                                       default=InvocationNode(function_id="root",
                                                                                              function_name="root"))
         self.active_span_id_stack: ContextVar[list[str]] = ContextVar("active_span_id_stack", default=["root"])
+        # Backends of the `request` scoped function caches of the current workflow run, keyed by function name
+        self.function_cache_backends: ContextVar[dict[str, typing.Any] | None] = ContextVar("function_cache_backends",
+                                                                                            default=None)
 
         # Default is a lambda no-op which returns NoneType
         self.user_input_callback: ContextVar[Callable[[InteractionPrompt], Awaitable[HumanResponse | None]]
@@ -31,6 +31,9 @@ from aiq.builder.function_base import StreamingOutputT
 from aiq.builder.function_info import FunctionInfo
 from aiq.data_models.function import FunctionBaseConfig
 
+if typing.TYPE_CHECKING:
+    from aiq.utils.function_cache import FunctionCache
+
 _InvokeFnT = Callable[[InputT], Awaitable[SingleOutputT]]
 _StreamFnT = Callable[[InputT], AsyncGenerator[StreamingOutputT]]
 
@@ -59,6 +62,8 @@ class Function(FunctionBase[InputT, StreamingOutputT, SingleOutputT], ABC):
         self.config = config
         self.description = description
         self.instance_name = instance_name or config.type
+        # Set by the builder when the config enables `function_cache`
+        self.cache: "FunctionCache | None" = None
         self._context = AIQContext.get()
 
     def convert(self, value: typing.Any, to_type: type[_T]) -> _T:
@@ -136,7 +141,10 @@ class Function(FunctionBase[InputT, StreamingOutputT, SingleOutputT], ABC):
             try:
                 converted_input: InputT = self._convert_input(value)  # type: ignore
 
-                result = await self._ainvoke(converted_input)
+                if self.cache is not None:
+                    result = await self.cache.ainvoke(converted_input, self._ainvoke)
+                else:
+                    result = await self._ainvoke(converted_input)
 
                 if to_type is not None and not isinstance(result, to_type):
                     result = self._converter.try_convert(result, to_type=to_type)
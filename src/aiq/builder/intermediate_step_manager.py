@@ -155,13 +155,29 @@ class IntermediateStepManager:
         else:
             assert False, "Invalid event state"
 
+        event_stream = self._context_state.event_stream.get()
+
+        # Only build the step if someone receives it. The span bookkeeping above is needed either way.
+        if (event_stream is None or not event_stream.has_observers):
+            return
+
         active_function = self._context_state.active_function.get()
 
         intermediate_step = IntermediateStep(parent_id=parent_step_id,
                                              function_ancestry=active_function,
                                              payload=payload)
 
-        self._context_state.event_stream.get().on_next(intermediate_step)
+        event_stream.on_next(intermediate_step)
+
+    @property
+    def has_subscribers(self) -> bool:
+        """
+        Whether any subscriber receives the intermediate steps of the current context. Producers of high frequency
+        events can check this to skip building payloads nobody receives.
+        """
+        event_stream = self._context_state.event_stream.get()
+
+        return event_stream is not None and event_stream.has_observers
 
     def subscribe(self,
                   on_next: OnNext[IntermediateStep],
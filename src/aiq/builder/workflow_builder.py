@@ -16,6 +16,7 @@
 import dataclasses
 import inspect
 import logging
+import typing
 import warnings
 from contextlib import AbstractAsyncContextManager
 from contextlib import AsyncExitStack
@@ -45,15 +46,19 @@ from aiq.data_models.component_ref import LLMRef
 from aiq.data_models.component_ref import MemoryRef
 from aiq.data_models.component_ref import ObjectStoreRef
 from aiq.data_models.component_ref import RetrieverRef
+from aiq.data_models.concurrency_limit_mixin import ConcurrencyLimitMixin
 from aiq.data_models.config import AIQConfig
 from aiq.data_models.config import GeneralConfig
 from aiq.data_models.embedder import EmbedderBaseConfig
+from aiq.data_models.embedding_cache_mixin import EmbeddingCacheMixin
 from aiq.data_models.function import FunctionBaseConfig
 from aiq.data_models.function_dependencies import FunctionDependencies
 from aiq.data_models.its_strategy import ITSStrategyBaseConfig
 from aiq.data_models.llm import LLMBaseConfig
 from aiq.data_models.memory import MemoryBaseConfig
 from aiq.data_models.object_store import ObjectStoreBaseConfig
+from aiq.data_models.rate_limit_mixin import RateLimitMixin
+from aiq.data_models.response_cache_mixin import ResponseCacheMixin
 from aiq.data_models.retriever import RetrieverBaseConfig
 from aiq.data_models.telemetry_exporter import TelemetryExporterBaseConfig
 from aiq.experimental.decorators.experimental_warning_decorator import aiq_experimental
@@ -63,8 +68,24 @@ from aiq.experimental.inference_time_scaling.models.strategy_base import Strateg
 from aiq.memory.interfaces import MemoryEditor
 from aiq.object_store.interfaces import ObjectStore
 from aiq.observability.exporter.base_exporter import BaseExporter
+from aiq.observability.sampler import TraceSampler
 from aiq.profiler.decorators.framework_wrapper import chain_wrapped_build_fn
 from aiq.profiler.utils import detect_llm_frameworks_in_build_fn
+from aiq.utils.embedding_cache import EmbeddingCache
+from aiq.utils.embedding_cache import build_embedding_cache
+from aiq.utils.embedding_cache import patch_embedder
+from aiq.utils.function_cache import build_function_cache
+from aiq.utils.llm_endpoint_pool import AdaptiveConcurrencyLimiter
+from aiq.utils.llm_endpoint_pool import LLMEndpointMetrics
+from aiq.utils.llm_endpoint_pool import LLMEndpointPool
+from aiq.utils.llm_endpoint_pool import limited_methods
+from aiq.utils.llm_endpoint_pool import patch_with_concurrency_limit
+from aiq.utils.llm_rate_limiter import RateLimiter
+from aiq.utils.llm_rate_limiter import patch_with_rate_limit
+from aiq.utils.response_cache import ResponseCache
+from aiq.utils.response_cache import build_response_cache
+from aiq.utils.response_cache import cached_methods
+from aiq.utils.response_cache import patch_with_cache
 from aiq.utils.type_utils import override
 
 logger = logging.getLogger(__name__)
@@ -86,12 +107,16 @@ class ConfiguredFunction:
 class ConfiguredLLM:
     config: LLMBaseConfig
     instance: LLMProviderInfo
+    response_cache: ResponseCache | None = None
+    concurrency_limiter: AdaptiveConcurrencyLimiter | None = None
+    rate_limiter: RateLimiter | None = None
 
 
 @dataclasses.dataclass
 class ConfiguredEmbedder:
     config: EmbedderBaseConfig
     instance: EmbedderProviderInfo
+    embedding_cache: EmbeddingCache | None = None
 
 
 @dataclasses.dataclass
@@ -146,6 +171,9 @@ class WorkflowBuilder(Builder, AbstractAsyncContextManager):
         self._retrievers: dict[str, ConfiguredRetriever] = {}
         self._its_strategies: dict[str, ConfiguredITSStrategy] = {}
 
+        # Concurrency limits and HTTP clients shared by the LLMs of each model endpoint
+        self._llm_endpoint_pool = LLMEndpointPool()
+
         self._context_state = AIQContextState.get()
 
         self._exit_stack: AsyncExitStack | None = None
@@ -158,6 +186,9 @@ class WorkflowBuilder(Builder, AbstractAsyncContextManager):
 
         self._exit_stack = AsyncExitStack()
 
+        # Closed last, after the LLM clients using the shared HTTP clients
+        self._exit_stack.push_async_callback(self._llm_endpoint_pool.aclose)
+
         # Get the telemetry info from the config
         telemetry_config = self.general_config.telemetry
 
@@ -336,6 +367,11 @@ class WorkflowBuilder(Builder, AbstractAsyncContextManager):
             raise ValueError("Expected a function, FunctionInfo object, or FunctionBase object to be "
                              f"returned from the function builder. Got {type(build_result)}")
 
+        if config.function_cache is not None:
+            function_cache = await build_function_cache(config.function_cache, config, self, name=str(name))
+            self._get_exit_stack().push_async_callback(function_cache.aclose)
+            build_result.cache = function_cache
+
         return ConfiguredFunction(config=config, instance=build_result)
 
     @override
@@ -425,7 +461,16 @@ class WorkflowBuilder(Builder, AbstractAsyncContextManager):
 
             info_obj = await self._get_exit_stack().enter_async_context(llm_info.build_fn(config, self))
 
-            self._llms[name] = ConfiguredLLM(config=config, instance=info_obj)
+            response_cache = None
+            if isinstance(config, ResponseCacheMixin) and config.response_cache is not None:
+                response_cache = await build_response_cache(config.response_cache, config, self, name=str(name))
+                self._get_exit_stack().push_async_callback(response_cache.aclose)
+
+            self._llms[name] = ConfiguredLLM(config=config,
+                                             instance=info_obj,
+                                             response_cache=response_cache,
+                                             concurrency_limiter=self._llm_endpoint_pool.get_limiter(config),
+                                             rate_limiter=self._llm_endpoint_pool.get_rate_limiter(config))
         except Exception as e:
             logger.error("Error adding llm `%s` with config `%s`", name, config, exc_info=True)
             raise e
@@ -445,6 +490,27 @@ class WorkflowBuilder(Builder, AbstractAsyncContextManager):
 
             client = await self._get_exit_stack().enter_async_context(client_info.build_fn(llm_info.config, self))
 
+            # The limits are applied before the response cache so that cache hits do not wait for them
+            if llm_info.concurrency_limiter is not None:
+                assert isinstance(llm_info.config, ConcurrencyLimitMixin)
+                assert llm_info.config.concurrency_limit is not None
+                client = patch_with_concurrency_limit(client,
+                                                      llm_info.concurrency_limiter,
+                                                      limited_methods(llm_info.config.concurrency_limit, wrapper_type))
+
+            # Requests wait for the rate limit before they queue for a slot of the concurrency limit
+            if llm_info.rate_limiter is not None:
+                assert isinstance(llm_info.config, RateLimitMixin) and llm_info.config.rate_limit is not None
+                client = patch_with_rate_limit(client,
+                                               llm_info.rate_limiter,
+                                               limited_methods(llm_info.config.rate_limit, wrapper_type))
+
+            if llm_info.response_cache is not None:
+                assert isinstance(llm_info.config, ResponseCacheMixin) and llm_info.config.response_cache is not None
+                client = patch_with_cache(client,
+                                          llm_info.response_cache,
+                                          cached_methods(llm_info.config.response_cache, wrapper_type))
+
             # Return a frameworks specific client
             return client
         except Exception as e:
@@ -460,6 +526,22 @@ class WorkflowBuilder(Builder, AbstractAsyncContextManager):
         # Return the tool configuration object
         return self._llms[llm_name].config
 
+    @override
+    def get_llm_http_client(self, llm_config: LLMBaseConfig, asynchronous: bool = True) -> typing.Any:
+
+        if not isinstance(llm_config, ConcurrencyLimitMixin) or llm_config.concurrency_limit is None:
+            return None
+
+        return self._llm_endpoint_pool.get_http_client(llm_config, asynchronous=asynchronous)
+
+    @override
+    def get_llm_endpoint_metrics(self) -> list[LLMEndpointMetrics]:
+        return self._llm_endpoint_pool.endpoint_metrics()
+
+    @property
+    def llm_endpoint_pool(self) -> LLMEndpointPool:
+        return self._llm_endpoint_pool
+
     @override
     async def add_embedder(self, name: str | EmbedderRef, config: EmbedderBaseConfig):
 
@@ -471,7 +553,14 @@ class WorkflowBuilder(Builder, AbstractAsyncContextManager):
 
             info_obj = await self._get_exit_stack().enter_async_context(embedder_info.build_fn(config, self))
 
-            self._embedders[name] = ConfiguredEmbedder(config=config, instance=info_obj)
+            embedding_cache = None
+            if isinstance(config, EmbeddingCacheMixin) and config.embedding_cache is not None:
+                embedding_cache = await build_embedding_cache(config.embedding_cache, config, self)
+                self._get_exit_stack().push_async_callback(embedding_cache.aclose)
+
+            self._embedders[name] = ConfiguredEmbedder(config=config,
+                                                       instance=info_obj,
+                                                       embedding_cache=embedding_cache)
         except Exception as e:
             logger.error("Error adding embedder `%s` with config `%s`", name, config, exc_info=True)
 
@@ -492,6 +581,14 @@ class WorkflowBuilder(Builder, AbstractAsyncContextManager):
                                                              wrapper_type=wrapper_type)
             client = await self._get_exit_stack().enter_async_context(client_info.build_fn(embedder_info.config, self))
 
+            if embedder_info.embedding_cache is not None:
+                assert isinstance(embedder_info.config, EmbeddingCacheMixin)
+                assert embedder_info.config.embedding_cache is not None
+                client = patch_embedder(client,
+                                        embedder_info.embedding_cache,
+                                        embedder_info.config.embedding_cache,
+                                        wrapper_type)
+
             # Return a frameworks specific client
             return client
         except Exception as e:
@@ -709,6 +806,16 @@ class WorkflowBuilder(Builder, AbstractAsyncContextManager):
 
         # Only protect the shared state modifications (serialized)
         exporter = await self._get_exit_stack().enter_async_context(exporter_context_manager)
+
+        sampler = TraceSampler.from_config(config)
+        if sampler is not None:
+            if isinstance(exporter, BaseExporter):
+                exporter.set_sampler(sampler)
+            else:
+                logger.warning("Telemetry exporter '%s' of type %s does not support sampling, exporting every event",
+                               name,
+                               type(exporter).__name__)
+
         self._telemetry_exporters[name] = ConfiguredTelemetryExporter(config=config, instance=exporter)
 
     def _log_build_failure(self,
@@ -929,6 +1036,14 @@ class ChildBuilder(Builder):
     def get_llm_config(self, llm_name: str) -> LLMBaseConfig:
         return self._workflow_builder.get_llm_config(llm_name)
 
+    @override
+    def get_llm_http_client(self, llm_config: LLMBaseConfig, asynchronous: bool = True) -> typing.Any:
+        return self._workflow_builder.get_llm_http_client(llm_config, asynchronous=asynchronous)
+
+    @override
+    def get_llm_endpoint_metrics(self) -> list[LLMEndpointMetrics]:
+        return self._workflow_builder.get_llm_endpoint_metrics()
+
     @override
     async def add_embedder(self, name: str, config: EmbedderBaseConfig):
         return await self._workflow_builder.add_embedder(name, config)
@@ -0,0 +1,93 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import importlib
+import typing
+
+import click
+from click.utils import make_default_short_help
+
+
+class LazyCommand(typing.NamedTuple):
+    """
+    A subcommand of a `LazyGroup` which is only imported when it is invoked.
+
+    Args:
+        import_path: Path of the click command in the form ``module:attribute``.
+        short_help: Help shown in the command list of the group, listing the commands does not import them.
+        subcommand: Name of a subcommand of the imported group to use instead of the group itself, for aliases.
+    """
+    import_path: str
+    short_help: str
+    subcommand: str | None = None
+
+
+class LazyGroup(click.Group):
+    """
+    A click group which imports the module of a subcommand the first time the subcommand is resolved, so that the
+    dependencies of every subcommand are not imported to run any one of them.
+    """
+
+    def __init__(self, *args, lazy_commands: dict[str, LazyCommand] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.lazy_commands = lazy_commands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        command = super().get_command(ctx, cmd_name)
+
+        if (command is None and cmd_name in self.lazy_commands):
+            command = self._import_command(ctx, self.lazy_commands[cmd_name])
+
+            # Cache the imported command, it is only imported once
+            if (command is not None):
+                self.add_command(command, name=cmd_name)
+
+        return command
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        # Same as `click.Group.format_commands` except the help of commands which are not imported yet is taken from
+        # their `LazyCommand`
+        names = self.list_commands(ctx)
+        if (not names):
+            return
+
+        limit = formatter.width - 6 - max(len(name) for name in names)
+
+        rows = []
+        for name in names:
+            command = self.commands.get(name)
+            if (command is None):
+                rows.append((name, make_default_short_help(self.lazy_commands[name].short_help, limit)))
+            elif (not command.hidden):
+                rows.append((name, command.get_short_help_str(limit)))
+
+        if (rows):
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+    @staticmethod
+    def _import_command(ctx: click.Context, lazy_command: LazyCommand) -> click.Command | None:
+        module_name, attribute = lazy_command.import_path.split(":")
+
+        command = getattr(importlib.import_module(module_name), attribute)
+
+        if (lazy_command.subcommand is not None):
+            command = command.get_command(ctx, lazy_command.subcommand)
+
+        return command
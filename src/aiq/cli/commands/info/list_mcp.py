@@ -98,12 +98,11 @@ async def list_tools_and_schemas(url: str, tool_name: str | None = None) -> list
     Raises:
         MCPError: Caught internally and logged, returns empty list instead
     """
-    builder = MCPBuilder(url=url)
     try:
-        if tool_name:
-            tool = await builder.get_tool(tool_name)
-            return [format_tool(tool)]
-        else:
+        async with MCPBuilder(url=url, max_sessions=1) as builder:
+            if tool_name:
+                tool = await builder.get_tool(tool_name)
+                return [format_tool(tool)]
             tools = await builder.get_tools()
             return [format_tool(tool) for tool in tools.values()]
     except MCPError as e:
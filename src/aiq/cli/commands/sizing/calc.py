@@ -113,6 +113,28 @@ logger = logging.getLogger(__name__)
     default=300,
     help="Timeout for the remote workflow endpoint in seconds (default: 300).",
 )
+@click.option(
+    "--max_parallel_runs",
+    type=click.IntRange(min=1),
+    required=False,
+    default=1,
+    help="Number of concurrency passes to run in parallel against a remote endpoint. Parallel passes load the "
+    "endpoint together, so the measured latencies include the load of the other passes. Default: 1",
+)
+@click.option(
+    "--max_outstanding_requests",
+    type=click.IntRange(min=0),
+    required=False,
+    default=0,
+    help="Maximum number of requests outstanding across all parallel passes. 0 for no limit. Default: 0",
+)
+@click.option(
+    "--resume",
+    is_flag=True,
+    required=False,
+    default=False,
+    help="Skip the concurrencies completed by a previous run with the same --calc_output_dir.",
+)
 @click.pass_context
 def calc_command(ctx,
                  config_file,
@@ -126,7 +148,10 @@ def calc_command(ctx,
                  num_passes,
                  append_calc_outputs,
                  endpoint,
-                 endpoint_timeout):
+                 endpoint_timeout,
+                 max_parallel_runs,
+                 max_outstanding_requests,
+                 resume):
     """Estimate GPU count and plot metrics for a workflow profile."""
     # Only use CLI concurrencies, with default
     concurrencies_list = [int(x) for x in concurrencies.split(",") if x.strip()]
@@ -159,6 +184,9 @@ def calc_command(ctx,
         if not config_file:
             click.echo("Config file is required in online mode.")
             return
+        if resume and not calc_output_dir:
+            click.echo("Output directory is required to resume a previous run.")
+            return
         if target_llm_latency == 0 and target_workflow_runtime == 0:
             click.echo("Both --target_llm_latency and --target_workflow_runtime are 0. "
                        "GPU count will not be estimated.")
@@ -181,6 +209,9 @@ def calc_command(ctx,
         append_job=append_calc_outputs,
         endpoint=endpoint,
         endpoint_timeout=endpoint_timeout,
+        max_parallel_runs=max_parallel_runs,
+        max_outstanding_requests=max_outstanding_requests,
+        resume=resume,
     )
 
     async def run_calc() -> CalcRunnerOutput:
@@ -169,23 +169,22 @@ class StartCommandGroup(click.Group):
                           override: tuple[tuple[str, str], ...],
                           **kwargs) -> int | None:
 
-        from aiq.runtime.loader import PluginTypes
-        from aiq.runtime.loader import discover_and_register_plugins
+        from aiq.runtime.loader import discover_and_register_config_plugins
 
         if (config_file is None):
             raise click.ClickException("No config file provided.")
 
-        # Here we need to ensure all objects are loaded before we try to create the config object
-        discover_and_register_plugins(PluginTypes.CONFIG_OBJECT)
-
         logger.info("Starting AIQ Toolkit from config file: '%s'", config_file)
 
         config_dict = load_and_override_config(config_file, override)
 
+        # Here we need to ensure the objects used by the config are loaded before we try to create the config object
+        discover_and_register_config_plugins(config_dict)
+
         # Get the front end for the command
         front_end: RegisteredFrontEndInfo = self._registered_front_ends[cmd_name]
 
-        config = validate_schema(config_dict, AIQConfig)
+        config = validate_schema(config_dict, AIQConfig.validate_narrowed)
 
         # Check that we have the right kind of front end
         if (not isinstance(config.general.front_end, front_end.config_type)):
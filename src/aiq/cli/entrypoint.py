@@ -28,20 +28,9 @@ import sys
 import time
 
 import click
-import nest_asyncio
 
-from .commands.configure.configure import configure_command
-from .commands.evaluate import eval_command
-from .commands.info.info import info_command
-from .commands.registry.registry import registry_command
-from .commands.sizing.sizing import sizing
-from .commands.start import start_command
-from .commands.uninstall import uninstall_command
-from .commands.validate import validate_command
-from .commands.workflow.workflow import workflow_command
-
-# Apply at the beginning of the file to avoid issues with asyncio
-nest_asyncio.apply()
+from .cli_utils.lazy_group import LazyCommand
+from .cli_utils.lazy_group import LazyGroup
 
 # Define log level choices
 LOG_LEVELS = {
@@ -60,6 +49,43 @@ def setup_logging(log_level: str):
     return numeric_level
 
 
+# The subcommands are imported when they are invoked, `aiq --help` and `aiq --version` do not import any of them
+LAZY_COMMANDS = {
+    "configure":
+        LazyCommand("aiq.cli.commands.configure.configure:configure_command",
+                    "Configure AIQ Toolkit developer preferences."),
+    "eval":
+        LazyCommand("aiq.cli.commands.evaluate:eval_command", "Evaluate a workflow with the specified dataset."),
+    "info":
+        LazyCommand("aiq.cli.commands.info.info:info_command",
+                    "Provide information about the local AIQ Toolkit environment."),
+    "registry":
+        LazyCommand("aiq.cli.commands.registry.registry:registry_command",
+                    "Utility to configure AIQ Toolkit remote registry channels."),
+    "start":
+        LazyCommand("aiq.cli.commands.start:start_command",
+                    "Run an AIQ Toolkit workflow using a front end configuration."),
+    "uninstall":
+        LazyCommand("aiq.cli.commands.uninstall:uninstall_command",
+                    "Uninstall an AIQ Toolkit plugin packages from the local environment."),
+    "validate":
+        LazyCommand("aiq.cli.commands.validate:validate_command", "Validate a configuration file"),
+    "workflow":
+        LazyCommand("aiq.cli.commands.workflow.workflow:workflow_command", "Interact with templated workflows."),
+    "sizing":
+        LazyCommand("aiq.cli.commands.sizing.sizing:sizing",
+                    "Size GPU clusters for workflows with the specified options."),
+
+    # Aliases
+    "run":
+        LazyCommand("aiq.cli.commands.start:start_command", "Run a workflow using the console front end.", "console"),
+    "serve":
+        LazyCommand("aiq.cli.commands.start:start_command", "Run a workflow using the fastapi front end.", "fastapi"),
+    "mcp":
+        LazyCommand("aiq.cli.commands.start:start_command", "Run a workflow using the mcp front end.", "mcp"),
+}
+
+
 def get_version():
     from importlib.metadata import PackageNotFoundError
     from importlib.metadata import version
@@ -70,7 +96,12 @@ def get_version():
         return "unknown"
 
 
-@click.group(name="aiq", chain=False, invoke_without_command=True, no_args_is_help=True)
+@click.group(name="aiq",
+             cls=LazyGroup,
+             lazy_commands=LAZY_COMMANDS,
+             chain=False,
+             invoke_without_command=True,
+             no_args_is_help=True)
 @click.version_option(version=get_version())
 @click.option('--log-level',
               type=click.Choice(LOG_LEVELS.keys(), case_sensitive=False),
@@ -79,6 +110,11 @@ def get_version():
 @click.pass_context
 def cli(ctx: click.Context, log_level: str):
     """Main entrypoint for the AIQ Toolkit CLI"""
+    import nest_asyncio
+
+    # Apply before any subcommand runs to avoid issues with asyncio. Not applied by `--help` and `--version`, which
+    # exit before this callback is invoked
+    nest_asyncio.apply()
 
     ctx_dict = ctx.ensure_object(dict)
 
@@ -98,22 +134,6 @@ def cli(ctx: click.Context, log_level: str):
     ctx_dict["log_level"] = log_level
 
 
-cli.add_command(configure_command, name="configure")
-cli.add_command(eval_command, name="eval")
-cli.add_command(info_command, name="info")
-cli.add_command(registry_command, name="registry")
-cli.add_command(start_command, name="start")
-cli.add_command(uninstall_command, name="uninstall")
-cli.add_command(validate_command, name="validate")
-cli.add_command(workflow_command, name="workflow")
-cli.add_command(sizing, name="sizing")
-
-# Aliases
-cli.add_command(start_command.get_command(None, "console"), name="run")  # type: ignore
-cli.add_command(start_command.get_command(None, "fastapi"), name="serve")  # type: ignore
-cli.add_command(start_command.get_command(None, "mcp"), name="mcp")
-
-
 @cli.result_callback()
 @click.pass_context
 def after_pipeline(ctx: click.Context, pipeline_start_time: float, *_, **__):
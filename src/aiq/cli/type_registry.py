@@ -346,10 +346,18 @@ class TypeRegistry:  # pylint: disable=too-many-public-methods
         self._registration_changed_hooks: list[Callable[[], None]] = []
         self._registration_changed_hooks_active: bool = True
 
+        # Loads the plugins which were skipped by lazy plugin loading
+        self._deferred_plugin_loader: Callable[[], None] | None = None
+
         self._registered_channel_map = {}
 
+        # Hash of the registered config types, computed on demand by `get_registration_key`
+        self._registration_key: int | None = None
+
     def _registration_changed(self):
 
+        self._registration_key = None
+
         if (not self._registration_changed_hooks_active):
             return
 
@@ -375,6 +383,26 @@ class TypeRegistry:  # pylint: disable=too-many-public-methods
             # Ensure that the registration changed hooks are called
             self._registration_changed()
 
+    def set_deferred_plugin_loader(self, loader: Callable[[], None] | None) -> None:
+        """
+        Set a callback which loads the plugins skipped by lazy plugin loading. It is called once, the first time a
+        client or tool wrapper lookup fails, before the lookup is retried.
+        """
+        self._deferred_plugin_loader = loader
+
+    def _load_deferred_plugins(self) -> bool:
+
+        loader = self._deferred_plugin_loader
+        if (loader is None):
+            return False
+
+        self._deferred_plugin_loader = None
+
+        logger.debug("Loading the plugins skipped by lazy plugin loading")
+        loader()
+
+        return True
+
     def register_telemetry_exporter(self, registration: RegisteredTelemetryExporter):
 
         if (registration.config_type in self._registered_telemetry_exporters):
@@ -501,6 +529,9 @@ class TypeRegistry:  # pylint: disable=too-many-public-methods
         try:
             client_info = self._llm_client_provider_to_framework[config_type][wrapper_type]
         except KeyError as err:
+            if (self._load_deferred_plugins()):
+                return self.get_llm_client(config_type, wrapper_type)
+
             raise KeyError(f"An invalid LLM config and wrapper combination was supplied. Config: `{config_type}`, "
                            f"Wrapper: `{wrapper_type}`. The workflow is requesting a {wrapper_type} LLM client but "
                            f"there is no registered conversion from that LLM provider to LLM framework: "
@@ -550,6 +581,9 @@ class TypeRegistry:  # pylint: disable=too-many-public-methods
         try:
             client_info = self._embedder_client_provider_to_framework[config_type][wrapper_type]
         except KeyError as err:
+            if (self._load_deferred_plugins()):
+                return self.get_embedder_client(config_type, wrapper_type)
+
             raise KeyError(
                 f"An invalid Embedder config and wrapper combination was supplied. Config: `{config_type}`, "
                 "Wrapper: `{wrapper_type}`. The workflow is requesting a {wrapper_type} Embedder client but "
@@ -665,6 +699,9 @@ class TypeRegistry:  # pylint: disable=too-many-public-methods
         try:
             client_info = self._retriever_client_provider_to_framework[config_type][wrapper_type]
         except KeyError as err:
+            if (self._load_deferred_plugins()):
+                return self.get_retriever_client(config_type, wrapper_type)
+
             raise KeyError(
                 f"An invalid Retriever config and wrapper combination was supplied. Config: `{config_type}`, "
                 "Wrapper: `{wrapper_type}`. The workflow is requesting a {wrapper_type} Retriever client but "
@@ -689,6 +726,9 @@ class TypeRegistry:  # pylint: disable=too-many-public-methods
         try:
             return self._registered_tool_wrappers[llm_framework]
         except KeyError as err:
+            if (self._load_deferred_plugins()):
+                return self.get_tool_wrapper(llm_framework)
+
             raise KeyError(f"Could not find a registered tool wrapper for LLM framework `{llm_framework}`. "
                            f"Registered LLM frameworks: {set(self._registered_tool_wrappers.keys())}") from err
 
@@ -889,46 +929,88 @@ class TypeRegistry:  # pylint: disable=too-many-public-methods
         # pylint: disable=consider-alternative-union-syntax
         return typing.Union[tuple(typing.Annotated[x_type, Tag(x_id)] for x_id, x_type in type_list)]
 
-    def compute_annotation(self, cls: type[TypedBaseModelT]):
+    def _get_registrations_for(self, cls: type[TypedBaseModelT]) -> list[RegisteredInfo[TypedBaseModelT]]:
 
         if issubclass(cls, EmbedderBaseConfig):
-            return self._do_compute_annotation(cls, self.get_registered_embedder_providers())
+            return self.get_registered_embedder_providers()
 
         if issubclass(cls, EvaluatorBaseConfig):
-            return self._do_compute_annotation(cls, self.get_registered_evaluators())
+            return self.get_registered_evaluators()
 
         if issubclass(cls, FrontEndBaseConfig):
-            return self._do_compute_annotation(cls, self.get_registered_front_ends())
+            return self.get_registered_front_ends()
 
         if issubclass(cls, FunctionBaseConfig):
-            return self._do_compute_annotation(cls, self.get_registered_functions())
+            return self.get_registered_functions()
 
         if issubclass(cls, LLMBaseConfig):
-            return self._do_compute_annotation(cls, self.get_registered_llm_providers())
+            return self.get_registered_llm_providers()
 
         if issubclass(cls, MemoryBaseConfig):
-            return self._do_compute_annotation(cls, self.get_registered_memorys())
+            return self.get_registered_memorys()
 
         if issubclass(cls, ObjectStoreBaseConfig):
-            return self._do_compute_annotation(cls, self.get_registered_object_stores())
+            return self.get_registered_object_stores()
 
         if issubclass(cls, RegistryHandlerBaseConfig):
-            return self._do_compute_annotation(cls, self.get_registered_registry_handlers())
+            return self.get_registered_registry_handlers()
 
         if issubclass(cls, RetrieverBaseConfig):
-            return self._do_compute_annotation(cls, self.get_registered_retriever_providers())
+            return self.get_registered_retriever_providers()
 
         if issubclass(cls, TelemetryExporterBaseConfig):
-            return self._do_compute_annotation(cls, self.get_registered_telemetry_exporters())
+            return self.get_registered_telemetry_exporters()
 
         if issubclass(cls, LoggingBaseConfig):
-            return self._do_compute_annotation(cls, self.get_registered_logging_method())
+            return self.get_registered_logging_method()
 
         if issubclass(cls, ITSStrategyBaseConfig):
-            return self._do_compute_annotation(cls, self.get_registered_its_strategies())
+            return self.get_registered_its_strategies()
 
         raise ValueError(f"Supplied an unsupported component type {cls}")
 
+    def compute_annotation(self, cls: type[TypedBaseModelT], types: typing.Collection[str] | None = None):
+        """
+        Compute the discriminated union of the registered config types which derive from `cls`.
+
+        Args:
+            cls: The base config type of the component.
+            types: If set, the union only contains the registrations whose full or local type name is in `types`. A
+                local name matching several registrations keeps all of them, so it is still rejected as ambiguous.
+        """
+
+        registrations = self._get_registrations_for(cls)
+
+        if (types is not None):
+            registrations = [r for r in registrations if r.full_type in types or r.local_name in types]
+
+        return self._do_compute_annotation(cls, registrations)
+
+    def get_registration_key(self) -> int:
+        """
+        Return a hash of the config types registered for every component type. The key only changes when the set of
+        registered config types changes and is used to cache the schemas built from the registrations.
+        """
+
+        if (self._registration_key is None):
+            self._registration_key = hash(
+                tuple(
+                    tuple((info.full_type, info.config_type) for info in registrations.values())
+                    for registrations in (self._registered_embedder_provider_infos,
+                                          self._registered_evaluator_infos,
+                                          self._registered_front_end_infos,
+                                          self._registered_functions,
+                                          self._registered_its_strategies,
+                                          self._registered_llm_provider_infos,
+                                          self._registered_logging_methods,
+                                          self._registered_memory_infos,
+                                          self._registered_object_store_infos,
+                                          self._registered_registry_handler_infos,
+                                          self._registered_retriever_provider_infos,
+                                          self._registered_telemetry_exporters)))
+
+        return self._registration_key
+
 
 class GlobalTypeRegistry:
 
@@ -0,0 +1,66 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pydantic import BaseModel
+from pydantic import Field
+from pydantic import model_validator
+
+
+class ConcurrencyLimitConfig(BaseModel):
+    """
+    Configuration of the limit on concurrent requests to a model endpoint.
+
+    The limit is shared by every LLM with the same type and `base_url`. When `adaptive` is enabled the limit is
+    adjusted additive-increase/multiplicative-decrease style: it grows by `increase_step` per window of successful
+    requests and is multiplied by `decrease_factor` when the endpoint reports an overload.
+    """
+    max_in_flight: int = Field(default=16, ge=1, description="Maximum number of concurrent requests to the endpoint.")
+    min_in_flight: int = Field(default=1, ge=1, description="Lower bound of the adaptive limit.")
+    initial_in_flight: int | None = Field(default=None,
+                                          ge=1,
+                                          description="Limit to start with. Defaults to `max_in_flight`.")
+    adaptive: bool = Field(default=True,
+                           description="Whether to lower the limit on overload responses and raise it again on "
+                           "successful requests.")
+    increase_step: float = Field(default=1.0,
+                                 gt=0,
+                                 description="Amount the limit grows by after a limit's worth of successful requests.")
+    decrease_factor: float = Field(default=0.5,
+                                   gt=0,
+                                   lt=1,
+                                   description="Factor the limit is multiplied by on an overload response.")
+    overload_status_codes: list[int | str] = Field(default_factory=lambda: [429, "5xx"],
+                                                   description="HTTP status codes which signal an overloaded "
+                                                   "endpoint. Supports wildcards such as `5xx`.")
+    methods: list[str] | None = Field(default=None,
+                                      description="Client methods to limit. Defaults to the asynchronous request "
+                                      "methods of the client's framework.")
+
+    @model_validator(mode="after")
+    def check_bounds(self) -> "ConcurrencyLimitConfig":
+        if self.min_in_flight > self.max_in_flight:
+            raise ValueError("`min_in_flight` must not be greater than `max_in_flight`")
+        if self.initial_in_flight is not None and not (self.min_in_flight <= self.initial_in_flight <=
+                                                       self.max_in_flight):
+            raise ValueError("`initial_in_flight` must be between `min_in_flight` and `max_in_flight`")
+        return self
+
+
+class ConcurrencyLimitMixin(BaseModel):
+    """Mixin class for endpoint concurrency limit configuration."""
+    concurrency_limit: ConcurrencyLimitConfig | None = Field(default=None,
+                                                             description="Limits the concurrent requests sent to "
+                                                             "the model endpoint. Unlimited if not set.",
+                                                             exclude=True)
@@ -16,6 +16,7 @@
 import logging
 import sys
 import typing
+from functools import lru_cache
 
 from pydantic import BaseModel
 from pydantic import ConfigDict
@@ -23,6 +24,7 @@ from pydantic import Discriminator
 from pydantic import ValidationError
 from pydantic import ValidationInfo
 from pydantic import ValidatorFunctionWrapHandler
+from pydantic import create_model
 from pydantic import field_validator
 
 from aiq.data_models.evaluate import EvalConfig
@@ -263,6 +265,9 @@ class AIQConfig(HashableBaseModel):
     # Evaluation Options
     eval: EvalConfig = EvalConfig()
 
+    # Registration key of the type registry the annotations were last computed for
+    _registration_key: typing.ClassVar[int | None] = None
+
     def print_summary(self, stream: typing.TextIO = sys.stdout):
         """Print a summary of the configuration"""
 
@@ -303,6 +308,12 @@ class AIQConfig(HashableBaseModel):
 
         type_registry = GlobalTypeRegistry.get()
 
+        registration_key = type_registry.get_registration_key()
+
+        # The annotations are unchanged unless the set of registered types has changed
+        if (registration_key == cls._registration_key):
+            return False
+
         LLMsAnnotation = dict[str,
                               typing.Annotated[type_registry.compute_annotation(LLMBaseConfig),
                                                Discriminator(TypedBaseModel.discriminator)]]
@@ -382,7 +393,96 @@ class AIQConfig(HashableBaseModel):
         if (EvalConfig.rebuild_annotations()):
             should_rebuild = True
 
-        if (should_rebuild):
-            return cls.model_rebuild(force=True)
+        rebuilt = cls.model_rebuild(force=True) if should_rebuild else False
 
-        return False
+        cls._registration_key = registration_key
+
+        return rebuilt
+
+    @classmethod
+    def validate_narrowed(cls, **config: typing.Any) -> "AIQConfig":
+        """
+        Validate a configuration against a schema whose component unions only contain the types used by the
+        configuration, instead of every registered type. The result is the same as `AIQConfig(**config)`. The narrowed
+        schemas are cached per set of registered types and set of used types. Invalid configurations are validated
+        again against the full schema, so errors list the registered types rather than the narrowed ones.
+        """
+        from aiq.cli.type_registry import GlobalTypeRegistry
+
+        narrowed_model = _create_narrowed_model(GlobalTypeRegistry.get().get_registration_key(),
+                                                _get_component_types(config))
+
+        try:
+            narrowed_config = narrowed_model(**config)
+        except ValidationError:
+            return cls(**config)
+
+        return cls.model_construct(_fields_set=narrowed_config.model_fields_set, **dict(narrowed_config))
+
+
+# The component fields of `AIQConfig` which are narrowed by `AIQConfig.validate_narrowed`
+_NARROWED_COMPONENT_FIELDS: dict[str, type[TypedBaseModel]] = {
+    "functions": FunctionBaseConfig,
+    "llms": LLMBaseConfig,
+    "embedders": EmbedderBaseConfig,
+    "memory": MemoryBaseConfig,
+    "object_stores": ObjectStoreBaseConfig,
+    "retrievers": RetrieverBaseConfig,
+    "its_strategies": ITSStrategyBaseConfig,
+    "workflow": FunctionBaseConfig,
+}
+
+
+def _get_component_types(config: dict[str, typing.Any]) -> tuple[tuple[str, frozenset[str]], ...]:
+    """Return the type names used by each component field of a configuration."""
+
+    component_types = []
+
+    for field_name in _NARROWED_COMPONENT_FIELDS:
+        value = config.get(field_name)
+
+        if (field_name == "workflow"):
+            components = [value]
+        elif (isinstance(value, dict)):
+            components = list(value.values())
+        else:
+            components = []
+
+        types = set()
+        for component in components:
+            if (isinstance(component, (dict, TypedBaseModel))):
+                type_name = TypedBaseModel.discriminator(component)
+
+                if (isinstance(type_name, str)):
+                    types.add(type_name)
+
+        component_types.append((field_name, frozenset(types)))
+
+    return tuple(component_types)
+
+
+@lru_cache(maxsize=32)
+def _create_narrowed_model(registration_key: int,
+                           component_types: tuple[tuple[str, frozenset[str]], ...]) -> type[AIQConfig]:
+    """
+    Create a subclass of `AIQConfig` whose component fields only accept the given types. The registration key is only
+    part of the cache key, it ensures that a change to the registered types creates a new model.
+    """
+    # pylint: disable=unused-argument
+
+    from aiq.cli.type_registry import GlobalTypeRegistry
+
+    type_registry = GlobalTypeRegistry.get()
+
+    field_definitions = {}
+
+    for field_name, types in component_types:
+        annotation = typing.Annotated[type_registry.compute_annotation(_NARROWED_COMPONENT_FIELDS[field_name], types),
+                                      Discriminator(TypedBaseModel.discriminator)]
+
+        if (field_name != "workflow"):
+            annotation = dict[str, annotation]
+
+        field_definitions[field_name] = (annotation, AIQConfig.model_fields[field_name].default)
+
+    return create_model(AIQConfig.__name__, __base__=AIQConfig, **field_definitions)
@@ -0,0 +1,43 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pydantic import BaseModel
+from pydantic import Field
+
+from aiq.data_models.response_cache_mixin import CacheBackendConfig
+
+
+class EmbeddingCacheConfig(CacheBackendConfig):
+    """Configuration of the vector cache and request batching wrapped around an embedder client."""
+    max_entries: int = Field(default=10000, ge=1, description="Maximum number of vectors to keep.")
+    sqlite_path: str = Field(default=".tmp/aiq/embedding_cache.db",
+                             description="Path of the database file used by the `sqlite` backend.")
+    key_prefix: str = Field(default="embedding_cache/",
+                            description="Prefix of the keys written to the `object_store` backend.")
+    batch_window: float = Field(default=0.005,
+                                ge=0,
+                                description="Number of seconds to wait for concurrent requests to join a batch.")
+    max_batch_size: int = Field(default=64, ge=1, description="Maximum number of texts embedded in one request.")
+    batch_queries: bool = Field(default=False,
+                                description="Whether to embed concurrent queries in batched document requests. "
+                                "Only enable this for models which embed queries and documents the same way.")
+
+
+class EmbeddingCacheMixin(BaseModel):
+    """Mixin class for embedding cache configuration."""
+    embedding_cache: EmbeddingCacheConfig | None = Field(default=None,
+                                                         description="Caches vectors by text and batches concurrent "
+                                                         "requests. Disabled if not set.",
+                                                         exclude=True)
@@ -17,9 +17,10 @@ import typing
 
 from .common import BaseModelRegistryTag
 from .common import TypedBaseModel
+from .function_cache_mixin import FunctionCacheMixin
 
 
-class FunctionBaseConfig(TypedBaseModel, BaseModelRegistryTag):
+class FunctionBaseConfig(TypedBaseModel, BaseModelRegistryTag, FunctionCacheMixin):
     pass
 
 
@@ -0,0 +1,49 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import typing
+
+from pydantic import BaseModel
+from pydantic import Field
+from pydantic import model_validator
+
+from aiq.data_models.response_cache_mixin import CacheBackendConfig
+
+
+class FunctionCacheConfig(CacheBackendConfig):
+    """Configuration of the memoization cache of a function."""
+    scope: typing.Literal["request", "process"] = Field(
+        default="process",
+        description="`request` only reuses results within a single workflow run, `process` shares them between runs "
+        "through the configured backend.")
+    sqlite_path: str = Field(default=".tmp/aiq/function_cache.db",
+                             description="Path of the database file used by the `sqlite` backend.")
+    key_prefix: str = Field(default="function_cache/",
+                            description="Prefix of the keys written to the `object_store` backend.")
+
+    @model_validator(mode="after")
+    def check_scope(self) -> "FunctionCacheConfig":
+        if self.scope == "request" and self.backend != "memory":
+            raise ValueError("The `request` scope can only be used with the `memory` backend")
+        return self
+
+
+class FunctionCacheMixin(BaseModel):
+    """Mixin class for function cache configuration."""
+    function_cache: FunctionCacheConfig | None = Field(default=None,
+                                                       description="Reuses the results of calls with identical inputs. "
+                                                       "Only enable this for functions without side effects. "
+                                                       "Disabled if not set.",
+                                                       exclude=True)
@@ -14,6 +14,7 @@
 # limitations under the License.
 
 from pydantic import BaseModel
+from pydantic import Field
 
 
 class PromptCachingConfig(BaseModel):
@@ -40,6 +41,17 @@ class PrefixSpanConfig(BaseModel):
     chain_with_common_prefixes: bool = False
 
 
+class StreamingConfig(BaseModel):
+    """
+    Store the usage stats on disk and analyze them a chunk of examples at a time instead of holding the whole run in
+    memory. Nested stack, concurrency spike and prefix span analysis and token usage forecasting are not supported in
+    streaming mode.
+    """
+    enable: bool = False
+    # Number of examples written per row group and analyzed at a time
+    examples_per_chunk: int = Field(default=100, ge=1)
+
+
 class ProfilerConfig(BaseModel):
 
     base_metrics: bool = False
@@ -52,3 +64,4 @@ class ProfilerConfig(BaseModel):
     bottleneck_analysis: BottleneckConfig = BottleneckConfig()
     concurrency_spike_analysis: ConcurrencySpikeConfig = ConcurrencySpikeConfig()
     prefix_span_analysis: PrefixSpanConfig = PrefixSpanConfig()
+    streaming: StreamingConfig = StreamingConfig()
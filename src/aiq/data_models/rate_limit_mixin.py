@@ -0,0 +1,76 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from enum import Enum
+
+from pydantic import BaseModel
+from pydantic import Field
+from pydantic import model_validator
+
+
+class RequestPriority(str, Enum):
+    """
+    Priority of the model requests made while handling a workflow run. Requests waiting for a rate or concurrency limit
+    are admitted in order of priority, then in order of arrival.
+    """
+    INTERACTIVE = "interactive"
+    NORMAL = "normal"
+    BATCH = "batch"
+
+    @property
+    def rank(self) -> int:
+        """Lower ranks are admitted first."""
+        return _PRIORITY_RANKS[self]
+
+
+_PRIORITY_RANKS = {RequestPriority.INTERACTIVE: 0, RequestPriority.NORMAL: 1, RequestPriority.BATCH: 2}
+
+
+class RateLimitConfig(BaseModel):
+    """
+    Configuration of the request and token rate limits of a model endpoint.
+
+    Each limit is a token bucket holding a minute's worth of capacity. The tokens of a request are estimated from the
+    length of its prompt before it is sent and corrected with the token usage reported in the response.
+    """
+    requests_per_minute: int | None = Field(default=None, ge=1, description="Maximum number of requests per minute.")
+    tokens_per_minute: int | None = Field(default=None,
+                                          ge=1,
+                                          description="Maximum number of prompt and completion tokens per minute.")
+    chars_per_token: float = Field(default=4.0,
+                                   gt=0,
+                                   description="Average number of prompt characters per token, used to estimate the "
+                                   "prompt tokens of a request.")
+    estimated_completion_tokens: int = Field(default=256,
+                                             ge=0,
+                                             description="Number of completion tokens reserved for a request until its "
+                                             "actual usage is known.")
+    methods: list[str] | None = Field(default=None,
+                                      description="Client methods to limit. Defaults to the asynchronous request "
+                                      "methods of the client's framework.")
+
+    @model_validator(mode="after")
+    def check_limits(self) -> "RateLimitConfig":
+        if self.requests_per_minute is None and self.tokens_per_minute is None:
+            raise ValueError("At least one of `requests_per_minute` and `tokens_per_minute` must be set")
+        return self
+
+
+class RateLimitMixin(BaseModel):
+    """Mixin class for endpoint rate limit configuration."""
+    rate_limit: RateLimitConfig | None = Field(default=None,
+                                               description="Limits the rate of requests and tokens sent to the model "
+                                               "endpoint. Unlimited if not set.",
+                                               exclude=True)
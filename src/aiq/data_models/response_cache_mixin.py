@@ -0,0 +1,62 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import typing
+
+from pydantic import BaseModel
+from pydantic import Field
+from pydantic import model_validator
+
+from aiq.data_models.component_ref import ObjectStoreRef
+
+
+class CacheBackendConfig(BaseModel):
+    """Configuration of the storage used by a model cache."""
+    backend: typing.Literal["memory", "sqlite",
+                            "object_store"] = Field(default="memory", description="Where cached responses are stored.")
+    max_entries: int = Field(default=1024,
+                             ge=1,
+                             description="Maximum number of responses to keep. The least recently used response is "
+                             "evicted first. Not applied to the `object_store` backend.")
+    ttl: float | None = Field(default=None,
+                              gt=0,
+                              description="Number of seconds a cached response stays valid. Never expires if not set.")
+    sqlite_path: str = Field(default=".tmp/aiq/response_cache.db",
+                             description="Path of the database file used by the `sqlite` backend.")
+    object_store: ObjectStoreRef | None = Field(default=None,
+                                                description="Object store used by the `object_store` backend.")
+    key_prefix: str = Field(default="response_cache/",
+                            description="Prefix of the keys written to the `object_store` backend.")
+
+    @model_validator(mode="after")
+    def check_object_store(self) -> "CacheBackendConfig":
+        if self.backend == "object_store" and self.object_store is None:
+            raise ValueError("`object_store` must be set when using the `object_store` backend")
+        return self
+
+
+class ResponseCacheConfig(CacheBackendConfig):
+    """Configuration of a response cache wrapped around a model client."""
+    methods: list[str] | None = Field(default=None,
+                                      description="Client methods to cache. Defaults to the request methods of the "
+                                      "client's framework.")
+
+
+class ResponseCacheMixin(BaseModel):
+    """Mixin class for response cache configuration."""
+    response_cache: ResponseCacheConfig | None = Field(default=None,
+                                                       description="Caches responses of identical requests. "
+                                                       "Disabled if not set.",
+                                                       exclude=True)
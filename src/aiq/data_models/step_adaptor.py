@@ -43,9 +43,15 @@ class StepAdaptorConfig(BaseModel):
         custom_event_types (list[IntermediateStepType]):
             If mode == 'custom', we only pass events whose event_type is in this list.
             Otherwise, this field is ignored.
+        llm_token_deltas (bool):
+            If True, each LLM_NEW_TOKEN event only carries the text of its chunk.
     """
     mode: StepAdaptorMode = StepAdaptorMode.DEFAULT
     custom_event_types: list[IntermediateStepType] = Field(default_factory=list)
+    llm_token_deltas: bool = Field(default=False,
+                                   description="Send only the new text with each LLM_NEW_TOKEN event instead of the "
+                                   "input and all of the output so far. Clients append the payloads of the events "
+                                   "sharing an id.")
 
     @model_validator(mode="after")
     def check_custom_event_types(self) -> "StepAdaptorConfig":
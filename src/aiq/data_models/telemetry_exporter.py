@@ -15,12 +15,37 @@
 
 import typing
 
+from pydantic import BaseModel
+from pydantic import Field
+
 from aiq.data_models.common import BaseModelRegistryTag
 from aiq.data_models.common import TypedBaseModel
+from aiq.data_models.intermediate_step import IntermediateStepType
+
+
+class TelemetrySamplingConfig(BaseModel):
+    """Configuration of the traces a telemetry exporter keeps."""
+    ratio: float = Field(default=1.0,
+                         ge=0.0,
+                         le=1.0,
+                         description="Fraction of traces to export. The decision is made once per trace from a hash "
+                         "of its root step, so every exporter with the same ratio keeps the same traces.")
+    keep_errors: bool = Field(default=True,
+                              description="Whether to export traces which were not sampled but contain a failed step.")
+    latency_threshold: float | None = Field(default=None,
+                                            gt=0,
+                                            description="Export traces which were not sampled but contain a step "
+                                            "which took longer than this number of seconds.")
 
 
 class TelemetryExporterBaseConfig(TypedBaseModel, BaseModelRegistryTag):
-    pass
+    sampling: TelemetrySamplingConfig | None = Field(default=None,
+                                                     description="Samples the exported traces. Every trace is "
+                                                     "exported if not set.")
+    exclude_event_types: list[IntermediateStepType] = Field(
+        default_factory=list,
+        description="Intermediate step types which are not exported, for example `LLM_NEW_TOKEN`. Excluding the "
+        "start or end type of a step excludes both.")
 
 
 TelemetryExporterConfigT = typing.TypeVar("TelemetryExporterConfigT", bound=TelemetryExporterBaseConfig)
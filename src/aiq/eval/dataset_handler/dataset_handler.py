@@ -178,9 +178,10 @@ class DatasetHandler:
         # Return exactly the target size
         return input_df.head(target_size)
 
-    def get_eval_input_from_dataset(self, dataset: str) -> EvalInput:
-        # read the dataset and convert it to EvalInput
-
+    def load_dataset(self, dataset: str | None) -> pd.DataFrame:
+        """
+        Read the dataset, apply the filters and deduplicate it. Reps and dataset size adjustments are not applied.
+        """
         # if a dataset file has been provided in the command line, use that
         dataset_config = EvalDatasetJsonConfig(file_path=dataset) if dataset else self.dataset_config
 
@@ -195,6 +196,15 @@ class DatasetHandler:
         # Apply filters and deduplicate
         input_df = self.dataset_filter.apply_filters(input_df)
         input_df.drop_duplicates(subset=[self.dataset_config.id_key], inplace=True)
+        return input_df
+
+    def get_eval_input_from_dataset(self, dataset: str, input_df: pd.DataFrame | None = None) -> EvalInput:
+        """
+        Read the dataset and convert it to EvalInput. A dataframe previously returned by `load_dataset` can be
+        passed in `input_df` to skip reading the dataset again.
+        """
+        if input_df is None:
+            input_df = self.load_dataset(dataset)
 
         if self.reps > 1 and self.adjust_dataset_size:
             raise ValueError("reps and adjust_dataset_size are mutually exclusive")
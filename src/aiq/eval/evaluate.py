@@ -14,9 +14,12 @@
 # limitations under the License.
 
 import asyncio
+import json
 import logging
 import shutil
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import TYPE_CHECKING
 from typing import Any
 from uuid import uuid4
 
@@ -25,12 +28,14 @@ from tqdm import tqdm
 
 from aiq.data_models.evaluate import EvalConfig
 from aiq.data_models.evaluate import JobEvictionPolicy
+from aiq.data_models.rate_limit_mixin import RequestPriority
 from aiq.eval.config import EvaluationRunConfig
 from aiq.eval.config import EvaluationRunOutput
 from aiq.eval.dataset_handler.dataset_handler import DatasetHandler
 from aiq.eval.evaluator.evaluator_model import EvalInput
 from aiq.eval.evaluator.evaluator_model import EvalInputItem
 from aiq.eval.evaluator.evaluator_model import EvalOutput
+from aiq.eval.runners.run_cache import EvaluationRunCache
 from aiq.eval.usage_stats import UsageStats
 from aiq.eval.usage_stats import UsageStatsItem
 from aiq.eval.usage_stats import UsageStatsLLM
@@ -38,6 +43,10 @@ from aiq.eval.utils.output_uploader import OutputUploader
 from aiq.eval.utils.weave_eval import WeaveEvaluationIntegration
 from aiq.profiler.data_models import ProfilerResults
 from aiq.runtime.session import AIQSessionManager
+from aiq.utils.llm_rate_limiter import llm_request_priority
+
+if TYPE_CHECKING:
+    from aiq.profiler.profile_runner import ProfilerRunner
 
 logger = logging.getLogger(__name__)
 
@@ -47,15 +56,23 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
     Instantiated for each evaluation run and used to store data for that single run.
     """
 
-    def __init__(self, config: EvaluationRunConfig):
+    def __init__(self,
+                 config: EvaluationRunConfig,
+                 run_cache: EvaluationRunCache | None = None,
+                 request_semaphore: asyncio.Semaphore | None = None):
         """
         Initialize an EvaluationRun with configuration.
+
+        `run_cache` shares the loaded dataset and the built workflow with other runs, and `request_semaphore` limits
+        the requests sent to a remote endpoint across all runs sharing it.
         """
         from aiq.eval.intermediate_step_adapter import IntermediateStepAdapter
 
         # Run-specific configuration
         self.config: EvaluationRunConfig = config
         self.eval_config: EvalConfig | None = None
+        self.run_cache = run_cache
+        self.request_semaphore = request_semaphore
 
         # Helpers
         self.intermediate_step_adapter: IntermediateStepAdapter = IntermediateStepAdapter()
@@ -76,6 +93,10 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
         # evaluation output files
         self.evaluator_output_files: list[Path] = []
 
+        # streaming profiler fed with each item as its workflow completes, and the items it was fed
+        self.profiler_runner: "ProfilerRunner | None" = None
+        self._profiled_items: set[int] = set()
+
     def _compute_usage_stats(self, item: EvalInputItem):
         """Compute usage stats for a single item using the intermediate steps"""
         # get the prompt and completion tokens from the intermediate steps
@@ -199,6 +220,7 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
                 item.output_obj = output
                 item.trajectory = self.intermediate_step_adapter.validate_intermediate_steps(intermediate_steps)
                 usage_stats_item = self._compute_usage_stats(item)
+                self._add_to_streaming_profiler(item)
 
                 self.weave_eval.log_prediction(item, output)
                 await self.weave_eval.log_usage_stats(item, usage_stats_item)
@@ -221,13 +243,34 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
 
     async def run_workflow_remote(self):
         from aiq.eval.remote_workflow import EvaluationRemoteWorkflowHandler
-        handler = EvaluationRemoteWorkflowHandler(self.config, self.eval_config.general.max_concurrency)
+        handler = EvaluationRemoteWorkflowHandler(self.config,
+                                                  self.eval_config.general.max_concurrency,
+                                                  request_semaphore=self.request_semaphore)
         await handler.run_workflow_remote(self.eval_input)
         for item in self.eval_input.eval_input_items:
             usage_stats_item = self._compute_usage_stats(item)
             self.weave_eval.log_prediction(item, item.output_obj)
             await self.weave_eval.log_usage_stats(item, usage_stats_item)
 
+    def _get_profiler_runner(self) -> "ProfilerRunner":
+        from aiq.profiler.profile_runner import ProfilerRunner
+
+        if self.profiler_runner is None:
+            self.profiler_runner = ProfilerRunner(self.eval_config.general.profiler,
+                                                  self.eval_config.general.output_dir,
+                                                  write_output=self.config.write_output)
+
+        return self.profiler_runner
+
+    def _add_to_streaming_profiler(self, item: EvalInputItem):
+        """Hand the trajectory of a completed item to the profiler right away when it runs in streaming mode."""
+        profiler_config = self.eval_config.general.profiler if self.eval_config else None
+        if not profiler_config or not profiler_config.streaming.enable:
+            return
+
+        self._get_profiler_runner().add_request(item.trajectory)
+        self._profiled_items.add(id(item))
+
     async def profile_workflow(self) -> ProfilerResults:
         """
         Profile a dataset
@@ -237,17 +280,13 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
             logger.info("Profiler is not enabled. Skipping profiling.")
             return ProfilerResults()
 
-        from aiq.profiler.profile_runner import ProfilerRunner
-
+        # Items were already added to a streaming profiler as their workflow completed
         all_stats = []
         for input_item in self.eval_input.eval_input_items:
-            all_stats.append(input_item.trajectory)
-
-        profiler_runner = ProfilerRunner(self.eval_config.general.profiler,
-                                         self.eval_config.general.output_dir,
-                                         write_output=self.config.write_output)
+            if id(input_item) not in self._profiled_items:
+                all_stats.append(input_item.trajectory)
 
-        return await profiler_runner.run(all_stats)
+        return await self._get_profiler_runner().run(all_stats)
 
     def cleanup_output_directory(self):
         '''Remove contents of the output directory if it exists'''
@@ -376,17 +415,45 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
     def apply_overrides(self):
         from aiq.cli.cli_utils.config_override import load_and_override_config
         from aiq.data_models.config import AIQConfig
-        from aiq.runtime.loader import PluginTypes
-        from aiq.runtime.loader import discover_and_register_plugins
+        from aiq.runtime.loader import discover_and_register_config_plugins
         from aiq.utils.data_models.schema_validator import validate_schema
 
-        # Register plugins before validation
-        discover_and_register_plugins(PluginTypes.CONFIG_OBJECT)
-
         config_dict = load_and_override_config(self.config.config_file, self.config.override)
-        config = validate_schema(config_dict, AIQConfig)
+
+        # Register plugins before validation
+        discover_and_register_config_plugins(config_dict)
+        config = validate_schema(config_dict, AIQConfig.validate_narrowed)
         return config
 
+    def load_config(self):
+        """Load the config file and apply the overrides."""
+        from aiq.runtime.loader import load_config
+
+        if self.config.override:
+            return self.apply_overrides()
+        return load_config(self.config.config_file)
+
+    def load_eval_input(self, dataset_handler: DatasetHandler) -> EvalInput:
+        """Load the dataset, reusing the copy in the run cache if a previous run loaded the same dataset."""
+        if self.run_cache is None:
+            return dataset_handler.get_eval_input_from_dataset(self.config.dataset)
+
+        key = json.dumps([dataset_handler.dataset_config.model_dump(mode="json"), self.config.dataset], default=str)
+        input_df = self.run_cache.get_dataset(key, lambda: dataset_handler.load_dataset(self.config.dataset))
+        return dataset_handler.get_eval_input_from_dataset(self.config.dataset, input_df=input_df)
+
+    @asynccontextmanager
+    async def build_eval_workflow(self, config):
+        """Build the workflow and evaluators, or reuse the ones in the run cache."""
+        from aiq.builder.eval_builder import WorkflowEvalBuilder
+
+        if self.run_cache is not None:
+            yield await self.run_cache.get_eval_workflow(config)
+            return
+
+        async with WorkflowEvalBuilder.from_config(config=config) as eval_workflow:
+            yield eval_workflow
+
     def _get_workflow_alias(self, workflow_type: str | None = None):
         """Get the workflow alias for displaying in evaluation UI."""
         if self.eval_config.general.workflow_alias:
@@ -405,14 +472,8 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
         """
         logger.info("Starting evaluation run with config file: %s", self.config.config_file)
 
-        from aiq.builder.eval_builder import WorkflowEvalBuilder
-        from aiq.runtime.loader import load_config
-
         # Load and override the config
-        if self.config.override:
-            config = self.apply_overrides()
-        else:
-            config = load_config(self.config.config_file)
+        config = self.load_config()
         self.eval_config = config.eval
         workflow_alias = self._get_workflow_alias(config.workflow.type)
         logger.debug("Loaded %s evaluation configuration: %s", workflow_alias, self.eval_config)
@@ -449,7 +510,7 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
                                          concurrency=self.eval_config.general.max_concurrency,
                                          num_passes=self.config.num_passes,
                                          adjust_dataset_size=self.config.adjust_dataset_size)
-        self.eval_input = dataset_handler.get_eval_input_from_dataset(self.config.dataset)
+        self.eval_input = self.load_eval_input(dataset_handler)
         if not self.eval_input.eval_input_items:
             logger.info("Dataset is empty. Nothing to evaluate.")
             return EvaluationRunOutput(
@@ -458,24 +519,32 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
                 workflow_interrupted=self.workflow_interrupted,
             )
 
-        # Run workflow and evaluate
-        async with WorkflowEvalBuilder.from_config(config=config) as eval_workflow:
-            # Initialize Weave integration
-            self.weave_eval.initialize_logger(workflow_alias, self.eval_input, config)
-
-            # Run workflow
-            if self.config.endpoint:
-                await self.run_workflow_remote()
-            else:
-                if not self.config.skip_workflow:
-                    if session_manager is None:
-                        session_manager = AIQSessionManager(eval_workflow.build(),
-                                                            max_concurrency=self.eval_config.general.max_concurrency)
-                    await self.run_workflow_local(session_manager)
-
-            # Evaluate
-            evaluators = {name: eval_workflow.get_evaluator(name) for name in self.eval_config.evaluators}
-            await self.run_evaluators(evaluators)
+        # Run workflow and evaluate. The model requests of the workflow and the evaluators are admitted after those of
+        # interactive requests served by the same process.
+        try:
+            async with self.build_eval_workflow(config) as eval_workflow:
+                # Initialize Weave integration
+                self.weave_eval.initialize_logger(workflow_alias, self.eval_input, config)
+
+                with llm_request_priority(RequestPriority.BATCH):
+                    # Run workflow
+                    if self.config.endpoint:
+                        await self.run_workflow_remote()
+                    else:
+                        if not self.config.skip_workflow:
+                            if session_manager is None:
+                                session_manager = AIQSessionManager(
+                                    eval_workflow.build(), max_concurrency=self.eval_config.general.max_concurrency)
+                            await self.run_workflow_local(session_manager)
+
+                    # Evaluate
+                    evaluators = {name: eval_workflow.get_evaluator(name) for name in self.eval_config.evaluators}
+                    await self.run_evaluators(evaluators)
+        except BaseException:
+            # Items handed to a streaming profiler keep its trace store open until the profiler is run
+            if self.profiler_runner is not None:
+                self.profiler_runner.close()
+            raise
 
         # Profile the workflow
         profiler_results = await self.profile_workflow()
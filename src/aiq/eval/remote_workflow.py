@@ -38,10 +38,15 @@ INTERMEDIATE_DATA_PREFIX = "intermediate_data: "
 
 class EvaluationRemoteWorkflowHandler:
 
-    def __init__(self, config: EvaluationRunConfig, max_concurrency: int):
+    def __init__(self,
+                 config: EvaluationRunConfig,
+                 max_concurrency: int,
+                 request_semaphore: asyncio.Semaphore | None = None):
         self.config = config
         # Run metadata
         self.semaphore = asyncio.Semaphore(max_concurrency)
+        # Optional limit on the requests outstanding across all runs sharing the semaphore
+        self.request_semaphore = request_semaphore
 
     async def run_workflow_remote_single(self, session: aiohttp.ClientSession, item: EvalInputItem):
         """
@@ -110,7 +115,11 @@ class EvaluationRemoteWorkflowHandler:
         Sends limited number of concurrent requests to a remote workflow and retrieves responses.
         """
         async with self.semaphore:
-            await self.run_workflow_remote_single(session=session, item=item)
+            if self.request_semaphore is None:
+                await self.run_workflow_remote_single(session=session, item=item)
+            else:
+                async with self.request_semaphore:
+                    await self.run_workflow_remote_single(session=session, item=item)
             pbar.update(1)
 
     async def run_workflow_remote(self, eval_input: EvalInput) -> EvalInput:
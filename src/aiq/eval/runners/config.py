@@ -16,6 +16,7 @@
 import typing
 
 from pydantic import BaseModel
+from pydantic import Field
 
 from aiq.eval.config import EvaluationRunConfig
 from aiq.eval.config import EvaluationRunOutput
@@ -25,10 +26,19 @@ class MultiEvaluationRunConfig(BaseModel):
     """
     Parameters used for a multi-evaluation run.
     This includes a dict of configs. The key is an id of any type.
-    Each pass loads the config, applies the overrides and runs to completion
-    before the next pass starts.
+    Each pass loads the config and applies the overrides. Passes which run the workflow
+    locally run to completion before the next pass starts. Passes which target a remote
+    endpoint can run in parallel.
     """
     configs: dict[typing.Any, EvaluationRunConfig]
+    # maximum number of passes targeting a remote endpoint which run at the same time. Parallel passes
+    # load the endpoint together, so metrics measured per pass include the load of the other passes.
+    max_parallel_runs: int = Field(default=1, ge=1)
+    # maximum number of requests outstanding across all passes targeting a remote endpoint, 0 for no limit
+    max_outstanding_requests: int = Field(default=0, ge=0)
+    # if true, passes share the loaded dataset and the built workflow when their configs only differ in
+    # the concurrency, alias or profiler settings
+    share_resources: bool = True
 
 
 class MultiEvaluationRunOutput(BaseModel):
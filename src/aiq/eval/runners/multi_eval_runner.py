@@ -13,13 +13,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import copy
+import logging
 import typing
+from collections.abc import Callable
 
 from aiq.eval.config import EvaluationRunConfig
 from aiq.eval.config import EvaluationRunOutput
 from aiq.eval.evaluate import EvaluationRun
 from aiq.eval.runners.config import MultiEvaluationRunConfig
+from aiq.eval.runners.run_cache import EvaluationRunCache
+
+logger = logging.getLogger(__name__)
 
 
 class MultiEvaluationRunner:
@@ -27,28 +33,92 @@ class MultiEvaluationRunner:
     Run a multi-evaluation run.
     """
 
-    def __init__(self, config: MultiEvaluationRunConfig):
+    def __init__(self,
+                 config: MultiEvaluationRunConfig,
+                 on_run_complete: Callable[[typing.Any, EvaluationRunOutput], None] | None = None):
         """
         Initialize a multi-evaluation run.
+
+        `on_run_complete` is called with the id and the output of each evaluation as soon as it completes.
         """
         self.config = config
+        self.on_run_complete = on_run_complete
         self.evaluation_run_outputs: dict[typing.Any, EvaluationRunOutput] = {}
 
+        # Shared by the evaluations while run_all is running
+        self._run_cache: EvaluationRunCache | None = None
+        self._request_semaphore: asyncio.Semaphore | None = None
+
     async def run_all(self):
         """
         Run all evaluations defined by the overrides.
+
+        Evaluations which run the workflow locally run one after another. If `max_parallel_runs` is greater than one,
+        evaluations targeting a remote endpoint then run in parallel.
         """
-        for id, config in self.config.configs.items():
-            output = await self.run_single_evaluation(id, config)
-            self.evaluation_run_outputs[id] = output
+        if self.config.share_resources:
+            self._run_cache = EvaluationRunCache()
+        if self.config.max_outstanding_requests:
+            self._request_semaphore = asyncio.Semaphore(self.config.max_outstanding_requests)
+
+        try:
+            if self.config.max_parallel_runs == 1:
+                for id, config in self.config.configs.items():
+                    await self._run_and_store(id, config)
+            else:
+                await self._run_scheduled()
+        finally:
+            if self._run_cache is not None:
+                await self._run_cache.aclose()
+            self._run_cache = None
+            self._request_semaphore = None
 
         return self.evaluation_run_outputs
 
+    async def _run_scheduled(self):
+        local_configs = {id: config for id, config in self.config.configs.items() if not config.endpoint}
+        remote_configs = {id: config for id, config in self.config.configs.items() if config.endpoint}
+
+        for id, config in local_configs.items():
+            await self._run_and_store(id, config)
+
+        run_slots = asyncio.Semaphore(self.config.max_parallel_runs)
+
+        async def run_remote(id: typing.Any, config: EvaluationRunConfig):
+            async with run_slots:
+                await self._run_and_store(id, config)
+
+        logger.info("Running %d remote evaluations, at most %d at a time",
+                    len(remote_configs),
+                    self.config.max_parallel_runs)
+        tasks = [asyncio.create_task(run_remote(id, config)) for id, config in remote_configs.items()]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        finally:
+            # Keep the outputs in the order of the configs
+            self.evaluation_run_outputs = {
+                id: self.evaluation_run_outputs[id]
+                for id in self.config.configs if id in self.evaluation_run_outputs
+            }
+
+    async def _run_and_store(self, id: typing.Any, config: EvaluationRunConfig):
+        output = await self.run_single_evaluation(id, config)
+        self.evaluation_run_outputs[id] = output
+        if self.on_run_complete is not None:
+            self.on_run_complete(id, output)
+
     async def run_single_evaluation(self, id: typing.Any, config: EvaluationRunConfig) -> EvaluationRunOutput:
         """
         Run a single evaluation and return the output.
         """
         # copy the config in case the caller is using the same config for multiple evaluations
         config_copy = copy.deepcopy(config)
-        evaluation_run = EvaluationRun(config_copy)
+        evaluation_run = EvaluationRun(config_copy,
+                                       run_cache=self._run_cache,
+                                       request_semaphore=self._request_semaphore)
         return await evaluation_run.run_and_evaluate()
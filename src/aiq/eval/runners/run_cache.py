@@ -0,0 +1,123 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import json
+import logging
+import typing
+from contextlib import AsyncExitStack
+
+import pandas as pd
+from pydantic import BaseModel
+
+from aiq.data_models.config import AIQConfig
+
+if typing.TYPE_CHECKING:
+    from aiq.builder.eval_builder import WorkflowEvalBuilder
+
+logger = logging.getLogger(__name__)
+
+# Fields of `eval.general` which the workflow and evaluator builds do not depend on, other than the concurrency of
+# some evaluators. Configs which only differ in these fields (i.e. the passes of a concurrency sweep) share a builder.
+_BUILDER_INDEPENDENT_FIELDS = {"max_concurrency", "workflow_alias", "profiler"}
+
+
+def _dump_all_fields(value: typing.Any) -> typing.Any:
+    """
+    Dump a config like `model_dump`, but keep the fields marked with `exclude=True`. The retry, cache and limit mixins
+    exclude their fields from serialization, yet the builds depend on them.
+    """
+    if isinstance(value, BaseModel):
+        model_type = type(value)
+        return {
+            "__type__": f"{model_type.__module__}.{model_type.__qualname__}",
+            **{name: _dump_all_fields(getattr(value, name)) for name in model_type.model_fields}
+        }
+
+    if isinstance(value, dict):
+        return {str(key): _dump_all_fields(item) for key, item in value.items()}
+
+    if isinstance(value, list | tuple):
+        return [_dump_all_fields(item) for item in value]
+
+    if isinstance(value, set | frozenset):
+        return sorted((_dump_all_fields(item) for item in value), key=str)
+
+    return value
+
+
+class EvaluationRunCache:
+    """
+    Loaded datasets and built workflows shared by the evaluation runs of a multi-evaluation run.
+
+    Builders stay open until `aclose` is called. Evaluators which read `max_concurrency` from the builder use the
+    value of the first run which built it.
+    """
+
+    def __init__(self):
+        # dict[dataset key, dataframe]: the parsed, filtered and deduplicated dataset before reps are applied
+        self._datasets: dict[str, pd.DataFrame] = {}
+        self._builders: dict[str, "WorkflowEvalBuilder"] = {}
+        self._builder_lock = asyncio.Lock()
+        self._exit_stack = AsyncExitStack()
+
+    def get_dataset(self, key: str, load_fn: typing.Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        """
+        Returns a copy of the dataset cached for `key`, loading it with `load_fn` on the first call.
+        """
+        input_df = self._datasets.get(key)
+        if input_df is None:
+            input_df = load_fn()
+            self._datasets[key] = input_df
+        else:
+            logger.debug("Using cached dataset for %s", key)
+
+        # The dataframe is adjusted in place by the handlers
+        return input_df.copy()
+
+    @staticmethod
+    def get_builder_key(config: AIQConfig) -> str:
+        dumped = _dump_all_fields(config)
+        for field in _BUILDER_INDEPENDENT_FIELDS:
+            dumped["eval"]["general"].pop(field, None)
+
+        return json.dumps(dumped, sort_keys=True, default=str)
+
+    async def get_eval_workflow(self, config: AIQConfig) -> "WorkflowEvalBuilder":
+        """
+        Returns the builder for `config`, building it on the first call for each distinct config.
+        """
+        from aiq.builder.eval_builder import WorkflowEvalBuilder
+
+        key = self.get_builder_key(config)
+
+        # Runs started in parallel wait for the first one to finish building instead of building it again
+        async with self._builder_lock:
+            eval_workflow = self._builders.get(key)
+            if eval_workflow is None:
+                eval_workflow = await self._exit_stack.enter_async_context(WorkflowEvalBuilder.from_config(config))
+                self._builders[key] = eval_workflow
+            else:
+                logger.info("Reusing the workflow built for a previous evaluation run")
+
+        return eval_workflow
+
+    async def aclose(self):
+        """
+        Closes all of the builders and drops the cached datasets.
+        """
+        self._datasets.clear()
+        self._builders.clear()
+        await self._exit_stack.aclose()
@@ -176,6 +176,24 @@ class FastApiFrontEndConfig(FrontEndBaseConfig, name="fastapi"):
             description="Sets a maximum time in seconds for browsers to cache CORS responses.",
         )
 
+    class JobStoreConfig(BaseModel):
+        backend: typing.Literal["memory", "sqlite", "redis"] = Field(
+            default="memory",
+            description="Where async generation and evaluation jobs are stored. Use `sqlite` or `redis` to share jobs "
+            "between workers.")
+        sqlite_path: str = Field(default=".tmp/aiq/jobs.db",
+                                 description="Path of the database file used by the `sqlite` backend.")
+        redis_url: str = Field(default="redis://localhost:6379/0",
+                               description="URL of the Redis server used by the `redis` backend.")
+        key_prefix: str = Field(default="aiq/jobs/",
+                                description="Prefix of the keys written to Redis and to the `object_store`.")
+        object_store: ObjectStoreRef | None = Field(
+            default=None, description="Object store to which job outputs are written instead of the job store backend.")
+        max_outputs_in_memory: int = Field(default=100,
+                                           ge=0,
+                                           description="Maximum number of job outputs to keep in memory. The least "
+                                           "recently used output is evicted first.")
+
     root_path: str = Field(default="", description="The root path for the API")
     host: str = Field(default="localhost", description="Host to bind the server to")
     port: int = Field(default=8000, description="Port to bind the server to", ge=0, le=65535)
@@ -207,6 +225,10 @@ class FastApiFrontEndConfig(FrontEndBaseConfig, name="fastapi"):
             "Additional endpoints to add to the FastAPI app which run functions within the AIQ Toolkit configuration. "
             "Each endpoint must have a unique path."))
 
+    job_store: JobStoreConfig = Field(
+        default_factory=JobStoreConfig,
+        description="Storage of the jobs of the async generation and evaluation endpoints")
+
     cors: CrossOriginResourceSharing = Field(
         default_factory=CrossOriginResourceSharing,
         description="Cross origin resource sharing configuration for the FastAPI app")
@@ -44,6 +44,7 @@ from aiq.data_models.api_server import AIQResponseIntermediateStep
 from aiq.data_models.config import AIQConfig
 from aiq.data_models.object_store import KeyAlreadyExistsError
 from aiq.data_models.object_store import NoSuchKeyError
+from aiq.data_models.rate_limit_mixin import RequestPriority
 from aiq.eval.config import EvaluationRunOutput
 from aiq.eval.evaluate import EvaluationRun
 from aiq.eval.evaluate import EvaluationRunConfig
@@ -55,11 +56,15 @@ from aiq.front_ends.fastapi.fastapi_front_end_config import AIQEvaluateStatusRes
 from aiq.front_ends.fastapi.fastapi_front_end_config import FastApiFrontEndConfig
 from aiq.front_ends.fastapi.job_store import JobInfo
 from aiq.front_ends.fastapi.job_store import JobStore
+from aiq.front_ends.fastapi.job_store import JobStoreBackend
+from aiq.front_ends.fastapi.job_store import create_job_store_backend
+from aiq.front_ends.fastapi.job_store import get_job_output_store
 from aiq.front_ends.fastapi.response_helpers import generate_single_response
 from aiq.front_ends.fastapi.response_helpers import generate_streaming_response_as_str
 from aiq.front_ends.fastapi.response_helpers import generate_streaming_response_full_as_str
 from aiq.front_ends.fastapi.step_adaptor import StepAdaptor
 from aiq.front_ends.fastapi.websocket import AIQWebSocket
+from aiq.object_store.interfaces import ObjectStore
 from aiq.object_store.models import ObjectStoreItem
 from aiq.runtime.session import AIQSessionManager
 
@@ -79,6 +84,10 @@ class FastApiFrontEndPluginWorkerBase(ABC):
         self._cleanup_tasks: list[str] = []
         self._cleanup_tasks_lock = asyncio.Lock()
 
+        # Shared by the job stores of all routes, created in `configure`
+        self._job_store_backend: JobStoreBackend | None = None
+        self._job_output_store: ObjectStore | None = None
+
     @property
     def config(self) -> AIQConfig:
         return self._config
@@ -116,6 +125,10 @@ class FastApiFrontEndPluginWorkerBase(ABC):
 
                     self._cleanup_tasks.clear()
 
+                if self._job_store_backend is not None:
+                    await self._job_store_backend.aclose()
+                    self._job_store_backend = None
+
             logger.debug("Closing AIQ Toolkit server from process %s", os.getpid())
 
         aiq_app = FastAPI(lifespan=lifespan)
@@ -176,7 +189,7 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
     async def _periodic_cleanup(name: str, job_store: JobStore, sleep_time_sec: int = 300):
         while True:
             try:
-                job_store.cleanup_expired_jobs()
+                await job_store.cleanup_expired_jobs()
                 logger.debug("Expired %s jobs cleaned up", name)
             except Exception as e:
                 logger.error("Error during %s job cleanup: %s", name, e)
@@ -202,24 +215,40 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
         return StepAdaptor(self.front_end_config.step_adaptor)
 
+    def create_job_store(self, namespace: str) -> JobStore:
+        """Create a job store for the jobs of one route, keeping its jobs apart from those of the other routes."""
+        config = self.front_end_config.job_store
+        return JobStore(backend=self._job_store_backend,
+                        namespace=namespace,
+                        output_store=self._job_output_store,
+                        output_key_prefix=config.key_prefix,
+                        max_outputs_in_memory=config.max_outputs_in_memory)
+
     async def configure(self, app: FastAPI, builder: WorkflowBuilder):
 
         # Do things like setting the base URL and global configuration options
         app.root_path = self.front_end_config.root_path
 
+        self._job_store_backend = create_job_store_backend(self.front_end_config.job_store)
+        self._job_output_store = await get_job_output_store(self.front_end_config.job_store, builder)
+
         await self.add_routes(app, builder)
 
     async def add_routes(self, app: FastAPI, builder: WorkflowBuilder):
 
-        await self.add_default_route(app, AIQSessionManager(builder.build()))
-        await self.add_evaluate_route(app, AIQSessionManager(builder.build()))
+        # Requests from clients are admitted ahead of evaluation runs by the rate and concurrency limits of the LLMs
+        await self.add_default_route(app, AIQSessionManager(builder.build(), priority=RequestPriority.INTERACTIVE))
+        await self.add_evaluate_route(app, AIQSessionManager(builder.build(), priority=RequestPriority.BATCH))
         await self.add_static_files_route(app, builder)
 
         for ep in self.front_end_config.endpoints:
 
             entry_workflow = builder.build(entry_function=ep.function_name)
 
-            await self.add_route(app, endpoint=ep, session_manager=AIQSessionManager(entry_workflow))
+            await self.add_route(app,
+                                 endpoint=ep,
+                                 session_manager=AIQSessionManager(entry_workflow,
+                                                                   priority=RequestPriority.INTERACTIVE))
 
     async def add_default_route(self, app: FastAPI, session_manager: AIQSessionManager):
 
@@ -240,7 +269,7 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
         }
 
         # Create job store for tracking evaluation jobs
-        job_store = JobStore()
+        job_store = self.create_job_store("evaluate")
         # Don't run multiple evaluations at the same time
         evaluation_lock = asyncio.Lock()
 
@@ -252,20 +281,20 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
                     eval_config = EvaluationRunConfig(config_file=Path(config_file), dataset=None, reps=reps)
 
                     # Create a new EvaluationRun with the evaluation-specific config
-                    job_store.update_status(job_id, "running")
+                    await job_store.update_status(job_id, "running")
                     eval_runner = EvaluationRun(eval_config)
                     output: EvaluationRunOutput = await eval_runner.run_and_evaluate(session_manager=session_manager,
                                                                                      job_id=job_id)
                     if output.workflow_interrupted:
-                        job_store.update_status(job_id, "interrupted")
+                        await job_store.update_status(job_id, "interrupted")
                     else:
                         parent_dir = os.path.dirname(
                             output.workflow_output_file) if output.workflow_output_file else None
 
-                        job_store.update_status(job_id, "success", output_path=str(parent_dir))
+                        await job_store.update_status(job_id, "success", output_path=str(parent_dir))
                 except Exception as e:
                     logger.error("Error in evaluation job %s: %s", job_id, str(e))
-                    job_store.update_status(job_id, "failure", error=str(e))
+                    await job_store.update_status(job_id, "failure", error=str(e))
 
         async def start_evaluation(request: AIQEvaluateRequest,
                                    background_tasks: BackgroundTasks,
@@ -276,11 +305,11 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
                 # if job_id is present and already exists return the job info
                 if request.job_id:
-                    job = job_store.get_job(request.job_id)
+                    job = await job_store.get_job(request.job_id)
                     if job:
                         return AIQEvaluateResponse(job_id=job.job_id, status=job.status)
 
-                job_id = job_store.create_job(request.config_file, request.job_id, request.expiry_seconds)
+                job_id = await job_store.create_job(request.config_file, request.job_id, request.expiry_seconds)
                 await self.create_cleanup_task(app=app, name="async_evaluation", job_store=job_store)
                 background_tasks.add_task(run_evaluation, job_id, request.config_file, request.reps, session_manager)
 
@@ -303,7 +332,7 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
             async with session_manager.session(request=http_request):
 
-                job = job_store.get_job(job_id)
+                job = await job_store.get_job(job_id)
                 if not job:
                     logger.warning("Job %s not found", job_id)
                     raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
@@ -316,7 +345,7 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
             async with session_manager.session(request=http_request):
 
-                job = job_store.get_last_job()
+                job = await job_store.get_last_job()
                 if not job:
                     logger.warning("No jobs found when requesting last job status")
                     raise HTTPException(status_code=404, detail="No jobs found")
@@ -330,10 +359,10 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
                 if status is None:
                     logger.info("Getting all jobs")
-                    jobs = job_store.get_all_jobs()
+                    jobs = await job_store.get_all_jobs()
                 else:
                     logger.info("Getting jobs with status %s", status)
-                    jobs = job_store.get_jobs_by_status(status)
+                    jobs = await job_store.get_jobs_by_status(status)
                 logger.info("Found %d jobs", len(jobs))
                 return [translate_job_to_response(job) for job in jobs]
 
@@ -530,7 +559,8 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
         }
 
         # Create job store for tracking async generation jobs
-        job_store = JobStore()
+        job_namespace = f"generate:{endpoint.path or endpoint.websocket_path}"
+        job_store = self.create_job_store(job_namespace)
 
         # Run up to max_running_async_jobs jobs at the same time
         async_job_concurrency = asyncio.Semaphore(self._front_end_config.max_running_async_jobs)
@@ -702,10 +732,10 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
                     result = await generate_single_response(payload=payload,
                                                             session_manager=session_manager,
                                                             result_type=result_type)
-                    job_store.update_status(job_id, "success", output=result)
+                    await job_store.update_status(job_id, "success", output=result)
                 except Exception as e:
                     logger.error("Error in evaluation job %s: %s", job_id, e)
-                    job_store.update_status(job_id, "failure", error=str(e))
+                    await job_store.update_status(job_id, "failure", error=str(e))
 
         def _job_status_to_response(job: JobInfo) -> AIQAsyncGenerationStatusResponse:
             job_output = job.output
@@ -730,12 +760,14 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
                     # if job_id is present and already exists return the job info
                     if request.job_id:
-                        job = job_store.get_job(request.job_id)
+                        job = await job_store.get_job(request.job_id)
                         if job:
                             return AIQAsyncGenerateResponse(job_id=job.job_id, status=job.status)
 
-                    job_id = job_store.create_job(job_id=request.job_id, expiry_seconds=request.expiry_seconds)
-                    await self.create_cleanup_task(app=app, name="async_generation", job_store=job_store)
+                    job_id = await job_store.create_job(job_id=request.job_id, expiry_seconds=request.expiry_seconds)
+                    await self.create_cleanup_task(app=app,
+                                                   name=f"async_generation:{job_namespace}",
+                                                   job_store=job_store)
 
                     # The fastapi/starlette background tasks won't begin executing until after the response is sent
                     # to the client, so we need to wrap the task in a function, alowing us to start the task now,
@@ -754,7 +786,7 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
                     now = time.time()
                     sync_timeout = now + request.sync_timeout
                     while time.time() < sync_timeout:
-                        job = job_store.get_job(job_id)
+                        job = await job_store.get_job(job_id)
                         if job is not None and job.status not in job_store.ACTIVE_STATUS:
                             # If the job is done, return the result
                             response.status_code = 200
@@ -774,7 +806,7 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
             async with session_manager.session(request=http_request):
 
-                job = job_store.get_job(job_id)
+                job = await job_store.get_job(job_id)
                 if not job:
                     logger.warning("Job %s not found", job_id)
                     raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
@@ -13,10 +13,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import json
 import logging
 import os
 import shutil
+import sqlite3
 import threading
+import typing
+from abc import ABC
+from abc import abstractmethod
+from collections import OrderedDict
 from datetime import UTC
 from datetime import datetime
 from datetime import timedelta
@@ -24,6 +31,16 @@ from enum import Enum
 from uuid import uuid4
 
 from pydantic import BaseModel
+from pydantic import RootModel
+
+from aiq.data_models.object_store import NoSuchKeyError
+from aiq.object_store.interfaces import ObjectStore
+from aiq.object_store.models import ObjectStoreItem
+from aiq.utils.optional_imports import optional_import
+
+if typing.TYPE_CHECKING:
+    from aiq.builder.builder import Builder
+    from aiq.front_ends.fastapi.fastapi_front_end_config import FastApiFrontEndConfig
 
 logger = logging.getLogger(__name__)
 
@@ -50,7 +67,317 @@ class JobInfo(BaseModel):
     output: BaseModel | None = None
 
 
+class JobOutput(RootModel[typing.Any]):
+    """The output of a job read back from storage, which dumps to the same data as the original output."""
+
+
+def _status_value(status: JobStatus | str) -> str:
+    return status.value if isinstance(status, JobStatus) else status
+
+
+class JobStoreBackend(ABC):
+    """
+    Storage of job records. Backends do not store the ``output`` of a job, which the `JobStore` keeps separately.
+
+    Backends shared by several job stores keep the jobs of each namespace apart.
+    """
+
+    @abstractmethod
+    async def put(self, namespace: str, job: JobInfo) -> None:
+        """Insert or replace a job."""
+        pass
+
+    @abstractmethod
+    async def get(self, namespace: str, job_id: str) -> JobInfo | None:
+        """Get a job by its ID."""
+        pass
+
+    @abstractmethod
+    async def get_last(self, namespace: str) -> JobInfo | None:
+        """Get the most recently created job."""
+        pass
+
+    @abstractmethod
+    async def get_by_status(self, namespace: str, status: str) -> list[JobInfo]:
+        """Get all jobs with the specified status, in order of creation."""
+        pass
+
+    @abstractmethod
+    async def get_all(self, namespace: str) -> list[JobInfo]:
+        """Get all jobs, in order of creation."""
+        pass
+
+    @abstractmethod
+    async def delete(self, namespace: str, job_ids: list[str]) -> None:
+        """Delete jobs and their outputs."""
+        pass
+
+    @abstractmethod
+    async def put_output(self, namespace: str, job_id: str, data: bytes) -> None:
+        """Store the serialized output of a job."""
+        pass
+
+    @abstractmethod
+    async def get_output(self, namespace: str, job_id: str) -> bytes | None:
+        """Get the serialized output of a job."""
+        pass
+
+    async def aclose(self) -> None:
+        """Release the resources held by the backend."""
+        pass
+
+
+class InMemoryJobStoreBackend(JobStoreBackend):
+    """Jobs kept in process memory, indexed by creation order and status. Jobs are not shared between workers."""
+
+    def __init__(self):
+        self._jobs: dict[tuple[str, str], JobInfo] = {}
+        self._outputs: dict[tuple[str, str], bytes] = {}
+        # Insertion ordered sets of job IDs per namespace, jobs are created in order so these are ordered by creation
+        self._created: dict[str, dict[str, None]] = {}
+        # Sets of job IDs per namespace and status
+        self._by_status: dict[tuple[str, str], dict[str, None]] = {}
+        self._lock = threading.Lock()  # Ensure thread safety for job operations
+
+    async def put(self, namespace: str, job: JobInfo) -> None:
+        job = job.model_copy(update={"output": None})
+        with self._lock:
+            previous = self._jobs.get((namespace, job.job_id))
+            if previous is not None:
+                self._by_status.get((namespace, _status_value(previous.status)), {}).pop(job.job_id, None)
+            else:
+                self._created.setdefault(namespace, {})[job.job_id] = None
+            self._jobs[(namespace, job.job_id)] = job
+            self._by_status.setdefault((namespace, _status_value(job.status)), {})[job.job_id] = None
+
+    async def get(self, namespace: str, job_id: str) -> JobInfo | None:
+        with self._lock:
+            job = self._jobs.get((namespace, job_id))
+        return None if job is None else job.model_copy()
+
+    async def get_last(self, namespace: str) -> JobInfo | None:
+        with self._lock:
+            created = self._created.get(namespace)
+            if not created:
+                return None
+            return self._jobs[(namespace, next(reversed(created)))].model_copy()
+
+    async def get_by_status(self, namespace: str, status: str) -> list[JobInfo]:
+        with self._lock:
+            # A status change moves a job to the end of its new status set, so sort by creation
+            jobs = [self._jobs[(namespace, job_id)] for job_id in self._by_status.get((namespace, status), {})]
+        return [job.model_copy() for job in sorted(jobs, key=lambda job: job.created_at)]
+
+    async def get_all(self, namespace: str) -> list[JobInfo]:
+        with self._lock:
+            return [self._jobs[(namespace, job_id)].model_copy() for job_id in self._created.get(namespace, {})]
+
+    async def delete(self, namespace: str, job_ids: list[str]) -> None:
+        with self._lock:
+            for job_id in job_ids:
+                job = self._jobs.pop((namespace, job_id), None)
+                if job is not None:
+                    self._by_status.get((namespace, _status_value(job.status)), {}).pop(job_id, None)
+                    self._created.get(namespace, {}).pop(job_id, None)
+                self._outputs.pop((namespace, job_id), None)
+
+    async def put_output(self, namespace: str, job_id: str, data: bytes) -> None:
+        with self._lock:
+            self._outputs[(namespace, job_id)] = data
+
+    async def get_output(self, namespace: str, job_id: str) -> bytes | None:
+        with self._lock:
+            return self._outputs.get((namespace, job_id))
+
+
+class SQLiteJobStoreBackend(JobStoreBackend):
+    """Jobs stored in a SQLite database file, which can be shared by the workers of a single host."""
+
+    def __init__(self, path: str):
+        self._lock = threading.Lock()
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30.0)
+        with self._lock, self._conn:
+            if path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS jobs "
+                               "(namespace TEXT NOT NULL, job_id TEXT NOT NULL, status TEXT NOT NULL, "
+                               "created_at REAL NOT NULL, info TEXT NOT NULL, output BLOB, "
+                               "PRIMARY KEY (namespace, job_id))")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs (namespace, status, created_at)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_created_at ON jobs (namespace, created_at)")
+
+    def _query(self, sql: str, params: tuple) -> list[JobInfo]:
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [JobInfo.model_validate_json(row[0]) for row in rows]
+
+    def _execute(self, sql: str, params: tuple) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(sql, params)
+
+    async def put(self, namespace: str, job: JobInfo) -> None:
+        # Keep the output column of an existing row
+        await asyncio.to_thread(
+            self._execute,
+            "INSERT INTO jobs (namespace, job_id, status, created_at, info) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT (namespace, job_id) DO UPDATE SET status = excluded.status, info = excluded.info",
+            (namespace,
+             job.job_id,
+             _status_value(job.status),
+             job.created_at.timestamp(),
+             job.model_dump_json(exclude={"output"})))
+
+    async def get(self, namespace: str, job_id: str) -> JobInfo | None:
+        jobs = await asyncio.to_thread(self._query,
+                                       "SELECT info FROM jobs WHERE namespace = ? AND job_id = ?", (namespace, job_id))
+        return jobs[0] if jobs else None
+
+    async def get_last(self, namespace: str) -> JobInfo | None:
+        jobs = await asyncio.to_thread(self._query,
+                                       "SELECT info FROM jobs WHERE namespace = ? ORDER BY created_at DESC LIMIT 1",
+                                       (namespace, ))
+        return jobs[0] if jobs else None
+
+    async def get_by_status(self, namespace: str, status: str) -> list[JobInfo]:
+        return await asyncio.to_thread(self._query,
+                                       "SELECT info FROM jobs WHERE namespace = ? AND status = ? ORDER BY created_at",
+                                       (namespace, status))
+
+    async def get_all(self, namespace: str) -> list[JobInfo]:
+        return await asyncio.to_thread(self._query,
+                                       "SELECT info FROM jobs WHERE namespace = ? ORDER BY created_at", (namespace, ))
+
+    async def delete(self, namespace: str, job_ids: list[str]) -> None:
+
+        def _delete():
+            with self._lock, self._conn:
+                self._conn.executemany("DELETE FROM jobs WHERE namespace = ? AND job_id = ?",
+                                       [(namespace, job_id) for job_id in job_ids])
+
+        await asyncio.to_thread(_delete)
+
+    async def put_output(self, namespace: str, job_id: str, data: bytes) -> None:
+        await asyncio.to_thread(self._execute,
+                                "UPDATE jobs SET output = ? WHERE namespace = ? AND job_id = ?",
+                                (data, namespace, job_id))
+
+    async def get_output(self, namespace: str, job_id: str) -> bytes | None:
+
+        def _get_output():
+            with self._lock:
+                return self._conn.execute("SELECT output FROM jobs WHERE namespace = ? AND job_id = ?",
+                                          (namespace, job_id)).fetchone()
+
+        row = await asyncio.to_thread(_get_output)
+        return row[0] if row else None
+
+    async def aclose(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class RedisJobStoreBackend(JobStoreBackend):
+    """
+    Jobs stored in Redis, which can be shared by the workers of several hosts.
+
+    Each job is a JSON string, indexed by sorted sets of job IDs scored by creation time: one for all jobs of a
+    namespace and one per status.
+    """
+
+    def __init__(self, client, key_prefix: str = "aiq/jobs/"):
+        self._client = client
+        self._key_prefix = key_prefix
+
+    @classmethod
+    def from_url(cls, url: str, key_prefix: str = "aiq/jobs/") -> "RedisJobStoreBackend":
+        redis = optional_import("redis.asyncio")
+        return cls(redis.from_url(url), key_prefix=key_prefix)
+
+    def _key(self, namespace: str, *parts: str) -> str:
+        return ":".join((f"{self._key_prefix}{namespace}", ) + parts)
+
+    async def _get_many(self, namespace: str, job_ids: list) -> list[JobInfo]:
+        if not job_ids:
+            return []
+        job_ids = [job_id.decode() if isinstance(job_id, bytes) else job_id for job_id in job_ids]
+        keys = [self._key(namespace, "job", job_id) for job_id in job_ids]
+        return [JobInfo.model_validate_json(raw) for raw in await self._client.mget(keys) if raw is not None]
+
+    async def put(self, namespace: str, job: JobInfo) -> None:
+        redis_exceptions = optional_import("redis.exceptions")
+
+        status = _status_value(job.status)
+        job_key = self._key(namespace, "job", job.job_id)
+
+        # The previous status is read under WATCH, so a concurrent update of the job retries the transaction instead of
+        # leaving the job in the index of a stale status
+        async with self._client.pipeline(transaction=True) as pipe:
+            while True:
+                try:
+                    await pipe.watch(job_key)
+                    raw = await pipe.get(job_key)
+                    previous_status = None if raw is None else _status_value(JobInfo.model_validate_json(raw).status)
+
+                    pipe.multi()
+                    pipe.set(job_key, job.model_dump_json(exclude={"output"}))
+                    pipe.zadd(self._key(namespace, "created"), {job.job_id: job.created_at.timestamp()})
+                    if previous_status is not None and previous_status != status:
+                        pipe.zrem(self._key(namespace, "status", previous_status), job.job_id)
+                    pipe.zadd(self._key(namespace, "status", status), {job.job_id: job.created_at.timestamp()})
+                    await pipe.execute()
+                    return
+                except redis_exceptions.WatchError:
+                    continue
+
+    async def get(self, namespace: str, job_id: str) -> JobInfo | None:
+        raw = await self._client.get(self._key(namespace, "job", job_id))
+        return None if raw is None else JobInfo.model_validate_json(raw)
+
+    async def get_last(self, namespace: str) -> JobInfo | None:
+        jobs = await self._get_many(namespace, await self._client.zrevrange(self._key(namespace, "created"), 0, 0))
+        return jobs[0] if jobs else None
+
+    async def get_by_status(self, namespace: str, status: str) -> list[JobInfo]:
+        return await self._get_many(namespace, await self._client.zrange(self._key(namespace, "status", status), 0, -1))
+
+    async def get_all(self, namespace: str) -> list[JobInfo]:
+        return await self._get_many(namespace, await self._client.zrange(self._key(namespace, "created"), 0, -1))
+
+    async def delete(self, namespace: str, job_ids: list[str]) -> None:
+        if not job_ids:
+            return
+
+        jobs = await self._get_many(namespace, job_ids)
+        async with self._client.pipeline(transaction=True) as pipe:
+            for job in jobs:
+                pipe.zrem(self._key(namespace, "status", _status_value(job.status)), job.job_id)
+            pipe.zrem(self._key(namespace, "created"), *job_ids)
+            pipe.delete(*(self._key(namespace, "job", job_id) for job_id in job_ids))
+            pipe.delete(*(self._key(namespace, "output", job_id) for job_id in job_ids))
+            await pipe.execute()
+
+    async def put_output(self, namespace: str, job_id: str, data: bytes) -> None:
+        await self._client.set(self._key(namespace, "output", job_id), data)
+
+    async def get_output(self, namespace: str, job_id: str) -> bytes | None:
+        return await self._client.get(self._key(namespace, "output", job_id))
+
+    async def aclose(self) -> None:
+        await self._client.close()
+
+
 class JobStore:
+    """
+    Jobs submitted to the asynchronous endpoints of the FastAPI front end, stored in a `JobStoreBackend`.
+
+    All methods which read or write jobs are coroutines, since the backend may be shared with other workers. Code
+    written against the earlier synchronous `JobStore` must await them, and `list_jobs` now returns jobs without their
+    outputs.
+    """
 
     MIN_EXPIRY = 600  # 10 minutes
     MAX_EXPIRY = 86400  # 24 hours
@@ -58,15 +385,88 @@ class JobStore:
 
     # active jobs are exempt from expiry
     ACTIVE_STATUS = {"running", "submitted"}
+    FINISHED_STATUS = ("success", "failure", "interrupted")
+
+    def __init__(self,
+                 backend: JobStoreBackend | None = None,
+                 namespace: str = "default",
+                 output_store: ObjectStore | None = None,
+                 output_key_prefix: str = "aiq/jobs/",
+                 max_outputs_in_memory: int = 100):
+        """
+        Args:
+            backend (JobStoreBackend | None): Where jobs are stored. Defaults to a new in-memory backend.
+            namespace (str): Keeps the jobs of job stores sharing a backend apart.
+            output_store (ObjectStore | None): If set, job outputs are written to this object store instead of the
+                backend.
+            output_key_prefix (str): Prefix of the keys of the outputs written to the output store.
+            max_outputs_in_memory (int): Number of deserialized job outputs kept in memory, least recently used first.
+        """
+        self._backend = backend or InMemoryJobStoreBackend()
+        self._namespace = namespace
+        self._output_store = output_store
+        self._output_key_prefix = output_key_prefix
+        self._max_outputs_in_memory = max_outputs_in_memory
+        self._outputs: OrderedDict[str, BaseModel] = OrderedDict()
+        self._outputs_lock = threading.Lock()
+
+    @property
+    def backend(self) -> JobStoreBackend:
+        return self._backend
+
+    def _output_key(self, job_id: str) -> str:
+        return f"{self._output_key_prefix}{self._namespace}/{job_id}.json"
+
+    def _remember_output(self, job_id: str, output: BaseModel) -> None:
+        if self._max_outputs_in_memory == 0:
+            return
+        with self._outputs_lock:
+            self._outputs[job_id] = output
+            self._outputs.move_to_end(job_id)
+            while len(self._outputs) > self._max_outputs_in_memory:
+                self._outputs.popitem(last=False)
+
+    async def _store_output(self, job_id: str, output: BaseModel) -> None:
+        data = output.model_dump_json().encode("utf-8")
+        if self._output_store is not None:
+            await self._output_store.upsert_object(self._output_key(job_id),
+                                                   ObjectStoreItem(data=data, content_type="application/json"))
+        else:
+            await self._backend.put_output(self._namespace, job_id, data)
+
+        self._remember_output(job_id, output)
+
+    async def _load_output(self, job_id: str) -> BaseModel | None:
+        with self._outputs_lock:
+            output = self._outputs.get(job_id)
+            if output is not None:
+                self._outputs.move_to_end(job_id)
+                return output
+
+        if self._output_store is not None:
+            try:
+                data = (await self._output_store.get_object(self._output_key(job_id))).data
+            except NoSuchKeyError:
+                data = None
+        else:
+            data = await self._backend.get_output(self._namespace, job_id)
+
+        if data is None:
+            return None
 
-    def __init__(self):
-        self._jobs = {}
-        self._lock = threading.Lock()  # Ensure thread safety for job operations
+        output = JobOutput(json.loads(data))
+        self._remember_output(job_id, output)
+        return output
 
-    def create_job(self,
-                   config_file: str | None = None,
-                   job_id: str | None = None,
-                   expiry_seconds: int = DEFAULT_EXPIRY) -> str:
+    async def _with_output(self, job: JobInfo | None) -> JobInfo | None:
+        if job is not None and _status_value(job.status) == JobStatus.SUCCESS.value:
+            job.output = await self._load_output(job.job_id)
+        return job
+
+    async def create_job(self,
+                         config_file: str | None = None,
+                         job_id: str | None = None,
+                         expiry_seconds: int = DEFAULT_EXPIRY) -> str:
         if job_id is None:
             job_id = str(uuid4())
 
@@ -83,61 +483,59 @@ class JobStore:
                       output_path=None,
                       expiry_seconds=clamped_expiry)
 
-        with self._lock:
-            self._jobs[job_id] = job
+        await self._backend.put(self._namespace, job)
 
         logger.info("Created new job %s with config %s", job_id, config_file)
         return job_id
 
-    def update_status(self,
-                      job_id: str,
-                      status: str,
-                      error: str | None = None,
-                      output_path: str | None = None,
-                      output: BaseModel | None = None):
-        if job_id not in self._jobs:
+    async def update_status(self,
+                            job_id: str,
+                            status: str,
+                            error: str | None = None,
+                            output_path: str | None = None,
+                            output: BaseModel | None = None):
+        job = await self._backend.get(self._namespace, job_id)
+        if job is None:
             raise ValueError(f"Job {job_id} not found")
 
-        with self._lock:
-            job = self._jobs[job_id]
-            job.status = status
-            job.error = error
-            job.output_path = output_path
-            job.updated_at = datetime.now(UTC)
-            job.output = output
-
-    def get_status(self, job_id: str) -> JobInfo | None:
-        with self._lock:
-            return self._jobs.get(job_id)
+        # Store the output first so that readers never see a successful job without its output
+        if output is not None:
+            await self._store_output(job_id, output)
 
-    def list_jobs(self):
-        with self._lock:
-            return self._jobs
+        job.status = JobStatus(status)
+        job.error = error
+        job.output_path = output_path
+        job.updated_at = datetime.now(UTC)
+
+        await self._backend.put(self._namespace, job)
+
+    async def get_status(self, job_id: str) -> JobInfo | None:
+        return await self.get_job(job_id)
 
-    def get_job(self, job_id: str) -> JobInfo | None:
+    async def list_jobs(self) -> dict[str, JobInfo]:
+        """Get all jobs in the store by their ID, without their outputs."""
+        return {job.job_id: job for job in await self.get_all_jobs()}
+
+    async def get_job(self, job_id: str) -> JobInfo | None:
         """Get a job by its ID."""
-        with self._lock:
-            return self._jobs.get(job_id)
+        return await self._with_output(await self._backend.get(self._namespace, job_id))
 
-    def get_last_job(self) -> JobInfo | None:
+    async def get_last_job(self) -> JobInfo | None:
         """Get the last created job."""
-        with self._lock:
-            if not self._jobs:
-                logger.info("No jobs found in job store")
-                return None
-            last_job = max(self._jobs.values(), key=lambda job: job.created_at)
-            logger.info("Retrieved last job %s created at %s", last_job.job_id, last_job.created_at)
-            return last_job
+        last_job = await self._backend.get_last(self._namespace)
+        if last_job is None:
+            logger.info("No jobs found in job store")
+            return None
+        logger.info("Retrieved last job %s created at %s", last_job.job_id, last_job.created_at)
+        return await self._with_output(last_job)
 
-    def get_jobs_by_status(self, status: str) -> list[JobInfo]:
-        """Get all jobs with the specified status."""
-        with self._lock:
-            return [job for job in self._jobs.values() if job.status == status]
+    async def get_jobs_by_status(self, status: str) -> list[JobInfo]:
+        """Get all jobs with the specified status, without their outputs."""
+        return await self._backend.get_by_status(self._namespace, status)
 
-    def get_all_jobs(self) -> list[JobInfo]:
-        """Get all jobs in the store."""
-        with self._lock:
-            return list(self._jobs.values())
+    async def get_all_jobs(self) -> list[JobInfo]:
+        """Get all jobs in the store, without their outputs."""
+        return await self._backend.get_all(self._namespace)
 
     def get_expires_at(self, job: JobInfo) -> datetime | None:
         """Get the time for a job to expire."""
@@ -145,7 +543,7 @@ class JobStore:
             return None
         return job.updated_at + timedelta(seconds=job.expiry_seconds)
 
-    def cleanup_expired_jobs(self):
+    async def cleanup_expired_jobs(self):
         """
         Cleanup expired jobs, keeping the most recent one.
         Updated_at is used instead of created_at to determine the most recent job.
@@ -153,31 +551,64 @@ class JobStore:
         """
         now = datetime.now(UTC)
 
-        # Filter out active jobs
-        with self._lock:
-            finished_jobs = {job_id: job for job_id, job in self._jobs.items() if job.status not in self.ACTIVE_STATUS}
+        # Look up finished jobs in the status index rather than scanning every job
+        finished_jobs = []
+        for status in self.FINISHED_STATUS:
+            finished_jobs.extend(await self.get_jobs_by_status(status))
 
         # Sort finished jobs by updated_at descending
-        sorted_finished = sorted(finished_jobs.items(), key=lambda item: item[1].updated_at, reverse=True)
+        sorted_finished = sorted(finished_jobs, key=lambda job: job.updated_at, reverse=True)
 
         # Always keep the most recent finished job
         jobs_to_check = sorted_finished[1:]
 
         expired_ids = []
-        for job_id, job in jobs_to_check:
+        for job in jobs_to_check:
             expires_at = self.get_expires_at(job)
             if expires_at and now > expires_at:
-                expired_ids.append(job_id)
+                expired_ids.append(job.job_id)
                 # cleanup output dir if present
                 if job.output_path:
-                    logger.info("Cleaning up output directory for job %s at %s", job_id, job.output_path)
+                    logger.info("Cleaning up output directory for job %s at %s", job.job_id, job.output_path)
                     # If it is a file remove it
                     if os.path.isfile(job.output_path):
                         os.remove(job.output_path)
                     # If it is a directory remove it
                     elif os.path.isdir(job.output_path):
-                        shutil.rmtree(job.output_path)
+                        shutil.rmtree(job.output_path, ignore_errors=True)
 
-        with self._lock:
+        if not expired_ids:
+            return
+
+        await self._backend.delete(self._namespace, expired_ids)
+
+        with self._outputs_lock:
+            for job_id in expired_ids:
+                self._outputs.pop(job_id, None)
+
+        if self._output_store is not None:
             for job_id in expired_ids:
-                del self._jobs[job_id]
+                try:
+                    await self._output_store.delete_object(self._output_key(job_id))
+                except NoSuchKeyError:
+                    pass
+
+
+def create_job_store_backend(config: "FastApiFrontEndConfig.JobStoreConfig") -> JobStoreBackend | None:
+    """
+    Create the backend shared by the job stores of a FastAPI worker, or None if every job store keeps its jobs in
+    memory.
+    """
+    if config.backend == "sqlite":
+        return SQLiteJobStoreBackend(config.sqlite_path)
+    if config.backend == "redis":
+        return RedisJobStoreBackend.from_url(config.redis_url, key_prefix=config.key_prefix)
+    return None
+
+
+async def get_job_output_store(config: "FastApiFrontEndConfig.JobStoreConfig",
+                               builder: "Builder") -> ObjectStore | None:
+    """Get the object store to which job outputs are written, if configured."""
+    if config.object_store is None:
+        return None
+    return await builder.get_object_store_client(config.object_store)
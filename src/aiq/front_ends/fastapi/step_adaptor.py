@@ -15,7 +15,6 @@
 
 import html
 import logging
-from functools import reduce
 from textwrap import dedent
 
 from aiq.data_models.api_server import AIQResponseIntermediateStep
@@ -31,6 +30,25 @@ from aiq.utils.type_utils import is_valid_json
 
 logger = logging.getLogger(__name__)
 
+# Maps the end event of each step type whose start is looked up to its start event
+_START_EVENT_TYPES = {
+    IntermediateStepType.LLM_NEW_TOKEN: IntermediateStepType.LLM_START,
+    IntermediateStepType.LLM_END: IntermediateStepType.LLM_START,
+    IntermediateStepType.TOOL_END: IntermediateStepType.TOOL_START,
+    IntermediateStepType.FUNCTION_END: IntermediateStepType.FUNCTION_START,
+}
+
+
+class _LLMOutputBuffer:
+    """The markdown of a streaming LLM call, built up one token at a time."""
+
+    __slots__ = ("input_payload", "has_input", "chunks")
+
+    def __init__(self, input_payload: str, has_input: bool):
+        self.input_payload = input_payload
+        self.has_input = has_input
+        self.chunks: list[str] = []  # The escaped chunks of the output so far
+
 
 class StepAdaptor:
 
@@ -39,6 +57,14 @@ class StepAdaptor:
         self._history: list[IntermediateStep] = []
         self.config = config
 
+        # Index of the start events of open steps by type and UUID, so that later events do not scan the history
+        self._open_steps: dict[tuple[IntermediateStepType, str], IntermediateStepPayload] = {}
+        self._llm_outputs: dict[str, _LLMOutputBuffer] = {}
+
+    def _get_start_step(self, step: IntermediateStepPayload) -> IntermediateStepPayload | None:
+        start_type = _START_EVENT_TYPES.get(step.event_type, step.event_type)
+        return self._open_steps.get((start_type, step.UUID))
+
     def _step_matches_filter(self, step: IntermediateStep, config: StepAdaptorConfig) -> bool:
         """
         Returns True if this intermediate step should be included (based on the config.mode).
@@ -67,58 +93,102 @@ class StepAdaptor:
         input_str: str | None = None
         output_str: str | None = None
 
-        # Find the start in the history with matching run_id
-        start_step = next(
-            (x for x in self._history if x.event_type == IntermediateStepType.LLM_START and x.UUID == step.UUID), None)
+        # Find the start of the LLM call with matching run_id
+        start_step = self._get_start_step(step)
 
         if not start_step:
             # If we don't have a start step, we can't do anything
             return None
 
-        input_str = str(start_step.data.input)
-
         if step.event_type == IntermediateStepType.LLM_NEW_TOKEN:
+            return self._handle_llm_token(step, start_step, ancestry)
 
-            # Find all of the previous LLM chunks and concatenate them
-            output_str = reduce(
-                lambda x, y: x + y,
-                (str(x.data.chunk)
-                 for x in self._history if x.event_type == IntermediateStepType.LLM_NEW_TOKEN and x.UUID == step.UUID),
-                "")
+        input_str = str(start_step.data.input)
 
-        elif step.event_type == IntermediateStepType.LLM_END:
+        if step.event_type == IntermediateStepType.LLM_END:
             output_str = str(step.data.output)
 
         if not input_str and not output_str:
             return None
 
+        payload = self._llm_input_payload(input_str)
+
+        if (output_str):
+            escaped_output = html.escape(output_str, quote=False) if output_str else ""
+            payload = self._llm_output_payload(payload, escaped_output)
+
+        event = AIQResponseIntermediateStep(id=step.UUID,
+                                            name=step.name or "",
+                                            payload=payload,
+                                            parent_id=ancestry.function_id)
+
+        return event
+
+    @staticmethod
+    def _llm_input_payload(input_str: str) -> str:
         escaped_input = html.escape(input_str, quote=False)
 
         # Dont use f-strings here because the payload is markdown and screws up the dedent
-        payload = dedent("""
+        return dedent("""
         **Input:**
         ```python
         {input_value}
         ```
         """).strip("\n").format(input_value=escaped_input)
 
-        if (output_str):
-            escaped_output = html.escape(output_str, quote=False) if output_str else ""
-
-            # Dont use f-strings here because the payload is markdown and screws up the dedent
-            payload = dedent("""
+    @staticmethod
+    def _llm_output_payload(input_payload: str, escaped_output: str) -> str:
+        # Dont use f-strings here because the payload is markdown and screws up the dedent
+        return dedent("""
             {payload}
 
             **Output:**
             {output_value}
-            """).strip("\n").format(payload=payload, output_value=escaped_output)
+            """).strip("\n").format(payload=input_payload, output_value=escaped_output)
 
-        event = AIQResponseIntermediateStep(id=step.UUID,
-                                            name=step.name or "",
-                                            payload=payload,
-                                            parent_id=ancestry.function_id)
+    def _handle_llm_token(self,
+                          step: IntermediateStepPayload,
+                          start_step: IntermediateStepPayload,
+                          ancestry: InvocationNode) -> AIQResponseSerializable | None:
+        """
+        Converts an LLM_NEW_TOKEN event. Each chunk is only converted and escaped once, escaping the chunks one by one
+        gives the same text as escaping their concatenation.
 
-        return event
+        With `llm_token_deltas` the event carries only the escaped chunk and nothing is accumulated, so each token
+        costs O(1). Otherwise the escaped chunks are appended to a list and the event carries the input and all of the
+        output so far, which has to be joined for every event.
+        """
+        escaped_chunk = html.escape(str(step.data.chunk), quote=False)
+
+        if self.config.llm_token_deltas:
+            if not escaped_chunk:
+                return None
+
+            return AIQResponseIntermediateStep(id=step.UUID,
+                                               name=step.name or "",
+                                               payload=escaped_chunk,
+                                               parent_id=ancestry.function_id)
+
+        buffer = self._llm_outputs.get(step.UUID)
+        if buffer is None:
+            input_str = str(start_step.data.input)
+            buffer = _LLMOutputBuffer(self._llm_input_payload(input_str), bool(input_str))
+            self._llm_outputs[step.UUID] = buffer
+
+        if escaped_chunk:
+            buffer.chunks.append(escaped_chunk)
+
+        if buffer.chunks:
+            payload = self._llm_output_payload(buffer.input_payload, "".join(buffer.chunks))
+        elif buffer.has_input:
+            payload = buffer.input_payload
+        else:
+            return None
+
+        return AIQResponseIntermediateStep(id=step.UUID,
+                                           name=step.name or "",
+                                           payload=payload,
+                                           parent_id=ancestry.function_id)
 
     def _handle_tool(self, step: IntermediateStepPayload, ancestry: InvocationNode) -> AIQResponseSerializable | None:
         """
@@ -127,9 +197,8 @@ class StepAdaptor:
         input_str: str | None = None
         output_str: str | None = None
 
-        # Find the start in the history with matching run_id
-        start_step = next(
-            (x for x in self._history if x.event_type == IntermediateStepType.TOOL_START and x.UUID == step.UUID), None)
+        # Find the start of the tool call with matching run_id
+        start_step = self._get_start_step(step)
 
         if not start_step:
             # If we don't have a start step, we can't do anything
@@ -212,10 +281,7 @@ class StepAdaptor:
 
         if step.event_type == IntermediateStepType.FUNCTION_END:
             # Find the start event with matching UUID
-            start_step = next(
-                (x
-                 for x in self._history if x.event_type == IntermediateStepType.FUNCTION_START and x.UUID == step.UUID),
-                None)
+            start_step = self._get_start_step(step)
 
             # For function end events, display output data
             if step.data and hasattr(step.data, 'output'):
@@ -298,7 +364,13 @@ class StepAdaptor:
         payload = step.payload
         ancestry = step.function_ancestry
 
+        if payload.event_type in (IntermediateStepType.LLM_START,
+                                  IntermediateStepType.TOOL_START,
+                                  IntermediateStepType.FUNCTION_START):
+            self._open_steps[(payload.event_type, payload.UUID)] = payload
+
         if not self._step_matches_filter(step, self.config):
+            self._close_step(payload)
             return None
 
         try:
@@ -318,4 +390,15 @@ class StepAdaptor:
         except Exception as e:
             logger.error("Error processing intermediate step: %s", e, exc_info=True)
 
+        finally:
+            self._close_step(payload)
+
         return None
+
+    def _close_step(self, step: IntermediateStepPayload) -> None:
+        """Drops the state of a step once its end event was processed."""
+        if step.event_type in (IntermediateStepType.LLM_END,
+                               IntermediateStepType.TOOL_END,
+                               IntermediateStepType.FUNCTION_END):
+            self._open_steps.pop((_START_EVENT_TYPES[step.event_type], step.UUID), None)
+            self._llm_outputs.pop(step.UUID, None)
@@ -20,11 +20,19 @@ from pydantic import Field
 from aiq.builder.builder import Builder
 from aiq.builder.llm import LLMProviderInfo
 from aiq.cli.register_workflow import register_llm_provider
+from aiq.data_models.concurrency_limit_mixin import ConcurrencyLimitMixin
 from aiq.data_models.llm import LLMBaseConfig
+from aiq.data_models.rate_limit_mixin import RateLimitMixin
+from aiq.data_models.response_cache_mixin import ResponseCacheMixin
 from aiq.data_models.retry_mixin import RetryMixin
 
 
-class AWSBedrockModelConfig(LLMBaseConfig, RetryMixin, name="aws_bedrock"):
+class AWSBedrockModelConfig(LLMBaseConfig,
+                            RetryMixin,
+                            ResponseCacheMixin,
+                            ConcurrencyLimitMixin,
+                            RateLimitMixin,
+                            name="aws_bedrock"):
     """An AWS Bedrock llm provider to be used with an LLM client."""
 
     model_config = ConfigDict(protected_namespaces=())
@@ -21,11 +21,19 @@ from pydantic import PositiveInt
 from aiq.builder.builder import Builder
 from aiq.builder.llm import LLMProviderInfo
 from aiq.cli.register_workflow import register_llm_provider
+from aiq.data_models.concurrency_limit_mixin import ConcurrencyLimitMixin
 from aiq.data_models.llm import LLMBaseConfig
+from aiq.data_models.rate_limit_mixin import RateLimitMixin
+from aiq.data_models.response_cache_mixin import ResponseCacheMixin
 from aiq.data_models.retry_mixin import RetryMixin
 
 
-class NIMModelConfig(LLMBaseConfig, RetryMixin, name="nim"):
+class NIMModelConfig(LLMBaseConfig,
+                     RetryMixin,
+                     ResponseCacheMixin,
+                     ConcurrencyLimitMixin,
+                     RateLimitMixin,
+                     name="nim"):
     """An NVIDIA Inference Microservice (NIM) llm provider to be used with an LLM client."""
 
     model_config = ConfigDict(protected_namespaces=())
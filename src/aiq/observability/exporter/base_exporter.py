@@ -29,6 +29,7 @@ from typing import overload
 from aiq.builder.context import AIQContextState
 from aiq.data_models.intermediate_step import IntermediateStep
 from aiq.observability.exporter.exporter import Exporter
+from aiq.observability.sampler import TraceSampler
 from aiq.utils.reactive.subject import Subject
 from aiq.utils.type_utils import override
 
@@ -130,6 +131,9 @@ class BaseExporter(Exporter):
     _ready_event: IsolatedAttribute[asyncio.Event] = IsolatedAttribute(asyncio.Event)
     _shutdown_event: IsolatedAttribute[asyncio.Event] = IsolatedAttribute(asyncio.Event)
 
+    # Stateful, so every isolated instance gets a clone
+    _sampler: TraceSampler | None = None
+
     def __init__(self, context_state: AIQContextState | None = None):
         """Initialize the BaseExporter."""
         if context_state is None:
@@ -253,6 +257,28 @@ class BaseExporter(Exporter):
         """
         return self._is_isolated_instance
 
+    def set_sampler(self, sampler: TraceSampler | None) -> None:
+        """Set the sampler which decides which events are exported.
+
+        Args:
+            sampler (TraceSampler | None): The sampler to use, or None to export every event.
+        """
+        self._sampler = sampler
+
+    def _sample(self, event: IntermediateStep) -> list[IntermediateStep]:
+        """Return the events to export in response to an event from the event stream.
+
+        Args:
+            event (IntermediateStep): The event received from the event stream.
+
+        Returns:
+            list[IntermediateStep]: The events to export, in order.
+        """
+        if self._sampler is None:
+            return [event]
+
+        return self._sampler.sample(event)
+
     @abstractmethod
     def export(self, event: IntermediateStep) -> None:
         """This method is called on each event from the event stream to initiate the trace export.
@@ -400,6 +426,9 @@ class BaseExporter(Exporter):
 
         await self._cleanup()
 
+        if self._sampler is not None:
+            self._sampler.reset()
+
         if self._subscription:
             self._subscription.unsubscribe()
         self._subscription = None
@@ -446,4 +475,7 @@ class BaseExporter(Exporter):
         isolated_instance._subscription = None
         isolated_instance._running = False
 
+        if self._sampler is not None:
+            isolated_instance._sampler = self._sampler.clone()
+
         return isolated_instance
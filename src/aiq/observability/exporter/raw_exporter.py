@@ -49,4 +49,5 @@ class RawExporter(ProcessingExporter[InputT, OutputT]):
         if not isinstance(event, IntermediateStep):
             return
 
-        self._create_export_task(self._export_with_processing(event))  # type: ignore
+        for sampled_event in self._sample(event):
+            self._create_export_task(self._export_with_processing(sampled_event))  # type: ignore
@@ -95,10 +95,12 @@ class SpanExporter(ProcessingExporter[InputSpanT, OutputSpanT], SerializeMixin):
         if not isinstance(event, IntermediateStep):
             return
 
-        if (event.event_state == IntermediateStepState.START):
-            self._process_start_event(event)
-        elif (event.event_state == IntermediateStepState.END):
-            self._process_end_event(event)
+        # Sampling and event type filters apply before any span is built
+        for sampled_event in self._sample(event):
+            if (sampled_event.event_state == IntermediateStepState.START):
+                self._process_start_event(sampled_event)
+            elif (sampled_event.event_state == IntermediateStepState.END):
+                self._process_end_event(sampled_event)
 
     def _process_start_event(self, event: IntermediateStep):
         """Process the start event of an intermediate step.
@@ -19,8 +19,13 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from aiq.observability.mixin.file_mode import FileCompression
 from aiq.observability.mixin.file_mode import FileMode
+from aiq.observability.mixin.file_mode import FileRecordFormat
 from aiq.observability.mixin.resource_conflict_mixin import ResourceConflictMixin
+from aiq.observability.utils.file_records import RecordBuffer
+from aiq.observability.utils.file_records import compress_file
+from aiq.observability.utils.file_records import import_zstandard
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +36,10 @@ class FileExportMixin(ResourceConflictMixin):
     This mixin provides file I/O functionality for exporters that need to write
     serialized data to local files, with support for file overwriting and rolling logs.
 
+    With `buffered` enabled, records are buffered in memory and written through a single open
+    file handle once `buffer_size` bytes are buffered or `flush_interval` seconds after the
+    first buffered record, instead of reopening the file for every export.
+
     Automatically detects and prevents file path conflicts between multiple instances
     by raising ResourceConflictError during initialization.
     """
@@ -45,6 +54,11 @@ class FileExportMixin(ResourceConflictMixin):
             max_file_size: int = 10 * 1024 * 1024,  # 10MB default
             max_files: int = 5,
             cleanup_on_init: bool = False,
+            buffered: bool = False,
+            buffer_size: int = 1024 * 1024,  # 1MB default
+            flush_interval: float = 1.0,
+            compression: FileCompression = FileCompression.NONE,
+            record_format: FileRecordFormat = FileRecordFormat.TEXT,
             **kwargs):
         """Initialize the file exporter with the specified output_path and project.
 
@@ -56,10 +70,18 @@ class FileExportMixin(ResourceConflictMixin):
             max_file_size (int): Maximum file size in bytes before rolling. Defaults to 10MB.
             max_files (int): Maximum number of rolled files to keep. Defaults to 5.
             cleanup_on_init (bool): Clean up old files during initialization. Defaults to False.
+            buffered (bool): Buffer records in memory and keep the file open. Defaults to False.
+            buffer_size (int): Buffered bytes at which the buffer is flushed. Defaults to 1MB.
+            flush_interval (float): Maximum seconds a record stays buffered. Defaults to 1.0.
+            compression (FileCompression): Compression of rolled files. Defaults to "none".
+            record_format (FileRecordFormat): Either "text" or "length_prefixed", the latter
+                requires `buffered`. Defaults to "text".
 
         Raises:
             ResourceConflictError: If another FileExportMixin instance is already using
                                  the same file path or would create conflicting files.
+            ValueError: If the length prefixed record format is used without `buffered`.
+            ImportError: If zstd compression is requested and zstandard is not installed.
         """
         self._filepath = Path(output_path)
         self._project = project
@@ -70,6 +92,21 @@ class FileExportMixin(ResourceConflictMixin):
         self._cleanup_on_init = cleanup_on_init
         self._lock = asyncio.Lock()
         self._first_write = True
+        self._buffered = buffered
+        self._flush_interval = flush_interval
+        self._compression = FileCompression(compression)
+        self._record_format = FileRecordFormat(record_format)
+
+        if self._record_format == FileRecordFormat.LENGTH_PREFIXED and not self._buffered:
+            raise ValueError("The length prefixed record format requires the buffered writer")
+
+        if self._compression == FileCompression.ZSTD:
+            import_zstandard()
+
+        # Shared by shallow copies of the exporter, so they write through the same handle
+        self._record_buffer = RecordBuffer(self._record_format,
+                                           buffer_size,
+                                           truncate=(self._mode == FileMode.OVERWRITE)) if buffered else None
 
         # Initialize file paths first, then check for conflicts via ResourceConflictMixin
         self._setup_file_paths()
@@ -138,12 +175,19 @@ class FileExportMixin(ResourceConflictMixin):
             case _:
                 return f"Unknown file resource conflict: {resource_type} = {identifier}"
 
+    def _find_rolled_files(self) -> list[Path]:
+        """Find the rolled files, compressed or not, since earlier runs may have used another compression."""
+        patterns = {
+            f"{self._base_filename}_*{self._file_extension}{compression.suffix}"
+            for compression in FileCompression
+        }
+
+        return [path for pattern in sorted(patterns) for path in self._base_dir.glob(pattern)]
+
     def _cleanup_old_files_sync(self) -> None:
         """Synchronous version of cleanup for use during initialization."""
         try:
-            # Find all rolled files matching our pattern
-            pattern = f"{self._base_filename}_*{self._file_extension}"
-            rolled_files = list(self._base_dir.glob(pattern))
+            rolled_files = self._find_rolled_files()
 
             # Sort by modification time (newest first)
             rolled_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
@@ -183,10 +227,18 @@ class FileExportMixin(ResourceConflictMixin):
         rolled_path = self._base_dir / rolled_filename
 
         try:
+            # The buffered writer must not keep writing to the renamed file
+            if self._record_buffer is not None:
+                await asyncio.to_thread(self._record_buffer.close)
+
             # Rename current file
             self._current_file_path.rename(rolled_path)
             logger.info("Rolled log file to: %s", rolled_path)
 
+            if self._compression != FileCompression.NONE:
+                rolled_path = await asyncio.to_thread(compress_file, rolled_path, self._compression)
+                logger.info("Compressed rolled log file to: %s", rolled_path)
+
             # Clean up old files
             await self._cleanup_old_files()
 
@@ -196,9 +248,7 @@ class FileExportMixin(ResourceConflictMixin):
     async def _cleanup_old_files(self) -> None:
         """Remove old rolled files beyond the maximum count."""
         try:
-            # Find all rolled files matching our pattern
-            pattern = f"{self._base_filename}_*{self._file_extension}"
-            rolled_files = list(self._base_dir.glob(pattern))
+            rolled_files = self._find_rolled_files()
 
             # Sort by modification time (newest first)
             rolled_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
@@ -220,6 +270,10 @@ class FileExportMixin(ResourceConflictMixin):
         Args:
             item (str | list[str]): The string or list of strings to export.
         """
+        if self._record_buffer is not None:
+            await self._export_buffered(item)
+            return
+
         try:
             # Lazy import to avoid slow startup times
             import aiofiles
@@ -250,6 +304,68 @@ class FileExportMixin(ResourceConflictMixin):
         except Exception as e:
             logger.error("Error exporting event: %s", e, exc_info=True)
 
+    async def _export_buffered(self, item: str | list[str]) -> None:
+        """Buffer a processed string or list of strings, flushing the buffer when it is full."""
+        try:
+            if self._record_buffer.append(item if isinstance(item, list) else [item]):
+                await self.flush()
+            elif self._record_buffer.pending_bytes and (self._record_buffer.flush_task is None
+                                                        or self._record_buffer.flush_task.done()):
+                self._record_buffer.flush_task = asyncio.create_task(self._flush_after_interval())
+
+        except Exception as e:
+            logger.error("Error exporting event: %s", e, exc_info=True)
+
+    async def _flush_after_interval(self) -> None:
+        """Flush the buffer once the flush interval has elapsed."""
+        await asyncio.sleep(self._flush_interval)
+
+        try:
+            # Shielded so that `close` cancelling the timer does not interrupt a write in progress
+            await asyncio.shield(self.flush())
+        except Exception as e:
+            logger.error("Error flushing buffered events: %s", e, exc_info=True)
+
+    async def flush(self) -> None:
+        """Write the buffered records to the file. Does nothing unless the buffered writer is enabled."""
+        if self._record_buffer is None:
+            return
+
+        async with self._lock:
+            data = self._record_buffer.peek()
+            if not data:
+                return
+
+            # Check if we need to roll the file, once per flush instead of once per record
+            if await self._should_roll_file():
+                await self._roll_file()
+
+            await asyncio.to_thread(self._record_buffer.write, self._current_file_path, data)
+
+            # Only drop the records once they were written, a failed write is retried by the next flush
+            self._record_buffer.consume(len(data))
+
+    async def close(self) -> None:
+        """Flush the buffered records and close the file handle of the buffered writer."""
+        if self._record_buffer is None:
+            return
+
+        flush_task = self._record_buffer.flush_task
+        self._record_buffer.flush_task = None
+        if flush_task is not None and not flush_task.done():
+            flush_task.cancel()
+
+        try:
+            await self.flush()
+        finally:
+            async with self._lock:
+                await asyncio.to_thread(self._record_buffer.close)
+
+    async def _cleanup(self):
+        """Flush the buffered writer after the final items of the exporter were exported."""
+        await super()._cleanup()
+        await self.close()
+
     def get_current_file_path(self) -> Path:
         """Get the current file path being written to.
 
@@ -272,6 +388,9 @@ class FileExportMixin(ResourceConflictMixin):
             "cleanup_on_init": self._cleanup_on_init,
             "project": self._project,
             "effective_project": self._project,
+            "buffered": self._buffered,
+            "compression": self._compression,
+            "record_format": self._record_format,
         }
 
         if self._enable_rolling:
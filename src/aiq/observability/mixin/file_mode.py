@@ -21,3 +21,26 @@ class FileMode(StrEnum):
 
     APPEND = "append"
     OVERWRITE = "overwrite"
+
+
+class FileRecordFormat(StrEnum):
+    """Record formats of the buffered writer of FileExportMixin."""
+
+    TEXT = "text"
+    """One record per line."""
+
+    LENGTH_PREFIXED = "length_prefixed"
+    """Each record is its UTF-8 encoded length as a little-endian uint32 followed by the UTF-8 encoded record."""
+
+
+class FileCompression(StrEnum):
+    """Compression applied to rolled files by FileExportMixin."""
+
+    NONE = "none"
+    GZIP = "gzip"
+    ZSTD = "zstd"
+
+    @property
+    def suffix(self) -> str:
+        """The file name suffix added to compressed files."""
+        return {FileCompression.NONE: "", FileCompression.GZIP: ".gz", FileCompression.ZSTD: ".zst"}[self]
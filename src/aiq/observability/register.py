@@ -22,7 +22,9 @@ from aiq.cli.register_workflow import register_logging_method
 from aiq.cli.register_workflow import register_telemetry_exporter
 from aiq.data_models.logging import LoggingBaseConfig
 from aiq.data_models.telemetry_exporter import TelemetryExporterBaseConfig
+from aiq.observability.mixin.file_mode import FileCompression
 from aiq.observability.mixin.file_mode import FileMode
+from aiq.observability.mixin.file_mode import FileRecordFormat
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +44,22 @@ class FileTelemetryExporterConfig(TelemetryExporterBaseConfig, name="file"):
         description="Maximum file size in bytes before rolling to a new file.")
     max_files: int = Field(default=5, description="Maximum number of rolled files to keep.")
     cleanup_on_init: bool = Field(default=False, description="Clean up old files during initialization.")
+    buffered: bool = Field(
+        default=False,
+        description="Keep the file open and buffer records in memory, flushing them when `buffer_size` bytes are "
+        "buffered or `flush_interval` seconds after the first buffered record.")
+    buffer_size: int = Field(
+        default=1024 * 1024,  # 1MB
+        description="Buffered bytes at which the buffer is flushed when `buffered` is enabled.")
+    flush_interval: float = Field(default=1.0,
+                                  description="Maximum seconds a record stays buffered when `buffered` is enabled.")
+    compression: FileCompression = Field(
+        default=FileCompression.NONE,
+        description="Compression of rolled files: 'none', 'gzip' or 'zstd' (requires the zstandard package).")
+    record_format: FileRecordFormat = Field(
+        default=FileRecordFormat.TEXT,
+        description="Record format: 'text' writes one record per line, 'length_prefixed' writes each record after its "
+        "length as a little-endian uint32 and requires `buffered`.")
 
 
 @register_telemetry_exporter(config_type=FileTelemetryExporterConfig)
@@ -58,7 +76,12 @@ async def file_telemetry_exporter(config: FileTelemetryExporterConfig, builder:
                        enable_rolling=config.enable_rolling,
                        max_file_size=config.max_file_size,
                        max_files=config.max_files,
-                       cleanup_on_init=config.cleanup_on_init)
+                       cleanup_on_init=config.cleanup_on_init,
+                       buffered=config.buffered,
+                       buffer_size=config.buffer_size,
+                       flush_interval=config.flush_interval,
+                       compression=config.compression,
+                       record_format=config.record_format)
 
 
 class ConsoleLoggingMethodConfig(LoggingBaseConfig, name="console"):
@@ -0,0 +1,205 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import logging
+
+from aiq.data_models.intermediate_step import IntermediateStep
+from aiq.data_models.intermediate_step import IntermediateStepState
+from aiq.data_models.intermediate_step import IntermediateStepType
+from aiq.data_models.intermediate_step import TraceMetadata
+from aiq.data_models.telemetry_exporter import TelemetryExporterBaseConfig
+
+logger = logging.getLogger(__name__)
+
+_HASH_SCALE = float(2**64)
+
+
+def _paired_event_types(event_types: set[IntermediateStepType]) -> set[IntermediateStepType]:
+    """Add the start and end types of every step type in *event_types*."""
+    paired = set(event_types)
+    for event_type in event_types:
+        prefix, _, state = event_type.value.rpartition("_")
+        if state in ("START", "END"):
+            for counterpart in ("START", "END"):
+                try:
+                    paired.add(IntermediateStepType(f"{prefix}_{counterpart}"))
+                except ValueError:
+                    pass
+    return paired
+
+
+class TraceSampler:
+    """
+    Decides which intermediate steps of each trace a telemetry exporter exports.
+
+    A trace is the tree of steps below a step whose parent is ``root``. Head sampling keeps a fixed fraction of traces,
+    decided once per trace from a hash of its root step. The steps of a trace which was not sampled are buffered until
+    the trace ends, and exported after all if the trace contains a failed step (``keep_errors``) or a step which took
+    longer than ``latency_threshold`` seconds. Steps of the excluded event types are never exported; their children are
+    attached to the closest exported ancestor instead.
+
+    The sampler is stateful, use `clone` to create a sampler for an isolated exporter.
+    """
+
+    def __init__(self,
+                 ratio: float = 1.0,
+                 keep_errors: bool = True,
+                 latency_threshold: float | None = None,
+                 exclude_event_types: set[IntermediateStepType] | None = None):
+        self._ratio = ratio
+        self._keep_errors = keep_errors
+        self._latency_threshold = latency_threshold
+        self._exclude_event_types = _paired_event_types(exclude_event_types or set())
+
+        self._sampling = ratio < 1.0
+        self._tail_sampling = self._sampling and (keep_errors or latency_threshold is not None)
+
+        self._root_of: dict[str, str] = {}  # UUID of an open step -> UUID of the root of its trace
+        self._sampled: dict[str, bool] = {}  # UUID of the root of an open trace -> sampling decision
+        self._pending: dict[str, list[IntermediateStep]] = {}  # Buffered steps of traces which were not sampled
+        self._reparent: dict[str, str] = {}  # UUID of an open excluded step -> parent of its children
+
+    @classmethod
+    def from_config(cls, config: TelemetryExporterBaseConfig) -> "TraceSampler | None":
+        """Create the sampler described by an exporter configuration, or ``None`` if everything is exported."""
+        sampling = config.sampling
+        if (sampling is None or sampling.ratio >= 1.0) and not config.exclude_event_types:
+            return None
+
+        if sampling is None:
+            return cls(exclude_event_types=set(config.exclude_event_types))
+
+        return cls(ratio=sampling.ratio,
+                   keep_errors=sampling.keep_errors,
+                   latency_threshold=sampling.latency_threshold,
+                   exclude_event_types=set(config.exclude_event_types))
+
+    def clone(self) -> "TraceSampler":
+        """Create a sampler with the same policy and no state."""
+        return TraceSampler(ratio=self._ratio,
+                            keep_errors=self._keep_errors,
+                            latency_threshold=self._latency_threshold,
+                            exclude_event_types=self._exclude_event_types)
+
+    def reset(self) -> None:
+        """Discard the state of the open traces."""
+        if self._pending:
+            logger.debug("Discarding %d unsampled traces which did not end", len(self._pending))
+
+        self._root_of.clear()
+        self._sampled.clear()
+        self._pending.clear()
+        self._reparent.clear()
+
+    def is_sampled(self, trace_id: str) -> bool:
+        """Return the head sampling decision of the trace whose root step has the UUID *trace_id*."""
+        if not self._sampling:
+            return True
+
+        digest = hashlib.blake2b(trace_id.encode("utf-8"), digest_size=8).digest()
+        return int.from_bytes(digest, "big") / _HASH_SCALE < self._ratio
+
+    def _is_notable(self, event: IntermediateStep) -> bool:
+        """Return whether *event* ends a step which makes its trace worth exporting."""
+        payload = event.payload
+
+        if self._latency_threshold is not None and payload.span_event_timestamp is not None:
+            if payload.event_timestamp - payload.span_event_timestamp > self._latency_threshold:
+                return True
+
+        if not self._keep_errors:
+            return False
+
+        output = payload.data.output if payload.data else None
+        if isinstance(output, BaseException) or getattr(output, "status", None) == "error":
+            return True
+
+        metadata = payload.metadata
+        if isinstance(metadata, TraceMetadata):
+            metadata = metadata.provided_metadata
+
+        return isinstance(metadata, dict) and metadata.get("error") is not None
+
+    def _filter(self, event: IntermediateStep) -> IntermediateStep | None:
+        """Drop *event* if its type is excluded and attach it to its closest exported ancestor otherwise."""
+        if event.event_type in self._exclude_event_types:
+            if event.event_state == IntermediateStepState.START:
+                self._reparent[event.UUID] = self._reparent.get(event.parent_id, event.parent_id)
+            elif event.event_state == IntermediateStepState.END:
+                self._reparent.pop(event.UUID, None)
+            return None
+
+        if self._reparent:
+            parent_id = self._reparent.get(event.parent_id)
+            if parent_id is not None:
+                return event.model_copy(update={"parent_id": parent_id})
+
+        return event
+
+    def sample(self, event: IntermediateStep) -> list[IntermediateStep]:
+        """
+        Return the steps to export in response to *event*.
+
+        Args:
+            event (IntermediateStep): The step received by the exporter.
+
+        Returns:
+            list[IntermediateStep]: Nothing if the step is excluded or buffered, the step itself if its trace is
+            sampled, or all buffered steps of its trace if the step made the trace worth exporting.
+        """
+        if not self._sampling:
+            filtered = self._filter(event)
+            return [] if filtered is None else [filtered]
+
+        uuid = event.UUID
+        state = event.event_state
+
+        if state == IntermediateStepState.START:
+            root = self._root_of.get(event.parent_id, uuid)
+            self._root_of[uuid] = root
+            if root == uuid:
+                self._sampled[root] = self.is_sampled(root)
+        elif state == IntermediateStepState.END:
+            root = self._root_of.pop(uuid, None) or self._root_of.get(event.parent_id, uuid)
+        else:
+            root = self._root_of.get(uuid) or self._root_of.get(event.parent_id, uuid)
+
+        sampled = self._sampled.get(root)
+        if sampled is None:
+            # The start of the trace was not seen
+            sampled = self.is_sampled(root)
+
+        filtered = self._filter(event)
+        exported: list[IntermediateStep] = []
+
+        if sampled:
+            if filtered is not None:
+                exported.append(filtered)
+        elif self._tail_sampling and root in self._sampled:
+            pending = self._pending.setdefault(root, [])
+            if filtered is not None:
+                pending.append(filtered)
+
+            if state == IntermediateStepState.END and self._is_notable(event):
+                # Export the trace so far and the rest of it as it arrives
+                self._sampled[root] = True
+                exported = self._pending.pop(root)
+
+        if state == IntermediateStepState.END and uuid == root:
+            self._sampled.pop(root, None)
+            self._pending.pop(root, None)
+
+        return exported
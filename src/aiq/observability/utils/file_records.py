@@ -0,0 +1,207 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import gzip
+import logging
+import shutil
+import struct
+import typing
+from collections.abc import Iterator
+from pathlib import Path
+
+from aiq.observability.mixin.file_mode import FileCompression
+from aiq.observability.mixin.file_mode import FileRecordFormat
+
+logger = logging.getLogger(__name__)
+
+_LENGTH_PREFIX = struct.Struct("<I")
+
+_READ_CHUNK_SIZE = 1024 * 1024
+
+
+def encode_records(items: list[str], record_format: FileRecordFormat) -> bytes:
+    """
+    Encode records for writing to a file.
+
+    Args:
+        items (list[str]): The records to encode.
+        record_format (FileRecordFormat): The format of the records in the file.
+
+    Returns:
+        bytes: The encoded records.
+    """
+    if record_format == FileRecordFormat.LENGTH_PREFIXED:
+        parts = []
+        for item in items:
+            encoded = item.encode("utf-8")
+            parts.append(_LENGTH_PREFIX.pack(len(encoded)))
+            parts.append(encoded)
+
+        return b"".join(parts)
+
+    return "".join(f"{item}\n" for item in items).encode("utf-8")
+
+
+def import_zstandard():
+    """Import the optional `zstandard` package used for zstd compression."""
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError("zstandard is required for zstd compression of telemetry files. "
+                          "Install it with `uv pip install zstandard`.") from e
+
+    return zstandard
+
+
+def _open_for_reading(path: Path) -> typing.BinaryIO:
+    if path.suffix == FileCompression.GZIP.suffix:
+        return gzip.open(path, "rb")
+
+    if path.suffix == FileCompression.ZSTD.suffix:
+        return import_zstandard().open(path, "rb")
+
+    return open(path, "rb")
+
+
+def iter_records(path: str | Path, record_format: FileRecordFormat = FileRecordFormat.TEXT) -> Iterator[str]:
+    """
+    Read the records written by the file exporter. Files compressed when they were rolled are decompressed based on
+    their suffix.
+
+    Args:
+        path (str | Path): The path of the file to read.
+        record_format (FileRecordFormat): The format the file was written with. Defaults to TEXT.
+
+    Yields:
+        str: Each record of the file.
+    """
+    with _open_for_reading(Path(path)) as f:
+        buffer = b""
+        while chunk := f.read(_READ_CHUNK_SIZE):
+            buffer += chunk
+
+            if record_format == FileRecordFormat.LENGTH_PREFIXED:
+                offset = 0
+                while len(buffer) - offset >= _LENGTH_PREFIX.size:
+                    (length, ) = _LENGTH_PREFIX.unpack_from(buffer, offset)
+                    end = offset + _LENGTH_PREFIX.size + length
+                    if end > len(buffer):
+                        break
+
+                    yield buffer[offset + _LENGTH_PREFIX.size:end].decode("utf-8")
+                    offset = end
+            else:
+                *lines, remainder = buffer.split(b"\n")
+                offset = len(buffer) - len(remainder)
+                for line in lines:
+                    yield line.decode("utf-8")
+
+            buffer = buffer[offset:]
+
+        if buffer:
+            if record_format == FileRecordFormat.LENGTH_PREFIXED:
+                logger.warning("Ignoring a truncated record of %d bytes at the end of %s", len(buffer), path)
+            else:
+                yield buffer.decode("utf-8")
+
+
+def compress_file(path: Path, compression: FileCompression) -> Path:
+    """
+    Compress a file and remove the uncompressed file.
+
+    Args:
+        path (Path): The file to compress.
+        compression (FileCompression): The compression to apply.
+
+    Returns:
+        Path: The path of the compressed file, or `path` when compression is NONE.
+    """
+    if compression == FileCompression.NONE:
+        return path
+
+    compressed_path = path.with_name(path.name + compression.suffix)
+
+    with open(path, "rb") as src:
+        if compression == FileCompression.GZIP:
+            with gzip.open(compressed_path, "wb") as dst:
+                shutil.copyfileobj(src, dst)
+        else:
+            with open(compressed_path, "wb") as dst:
+                import_zstandard().ZstdCompressor().copy_stream(src, dst)
+
+    path.unlink()
+
+    return compressed_path
+
+
+class RecordBuffer:
+    """
+    The state of the buffered writer of FileExportMixin. Records are encoded into an in-memory buffer and written to
+    the file through a single handle which stays open between flushes. Shallow copies of an exporter share the buffer.
+    """
+
+    def __init__(self, record_format: FileRecordFormat, buffer_size: int, truncate: bool = False):
+        """
+        Args:
+            record_format (FileRecordFormat): The format of the records in the file.
+            buffer_size (int): The number of buffered bytes at which the buffer should be flushed.
+            truncate (bool): Truncate the file the first time it is opened. Defaults to False.
+        """
+        self._record_format = record_format
+        self._buffer_size = buffer_size
+        self._truncate = truncate
+        self._buffer = bytearray()
+        self._handle: typing.BinaryIO | None = None
+        self.flush_task: asyncio.Task | None = None
+
+    @property
+    def pending_bytes(self) -> int:
+        """The number of buffered bytes which have not been written yet."""
+        return len(self._buffer)
+
+    def append(self, items: list[str]) -> bool:
+        """
+        Encode and buffer records.
+
+        Returns:
+            bool: True if the buffer reached its size and should be flushed.
+        """
+        self._buffer += encode_records(items, self._record_format)
+
+        return len(self._buffer) >= self._buffer_size
+
+    def peek(self) -> bytes:
+        """Return the buffered bytes without removing them."""
+        return bytes(self._buffer)
+
+    def consume(self, size: int) -> None:
+        """Remove the first `size` buffered bytes, once they were written."""
+        del self._buffer[:size]
+
+    def write(self, path: Path, data: bytes) -> None:
+        """Write to the file, opening the handle if it is not open. Blocking, run it in a thread."""
+        if self._handle is None:
+            self._handle = open(path, "wb" if self._truncate else "ab")  # pylint: disable=consider-using-with
+            self._truncate = False
+
+        self._handle.write(data)
+        self._handle.flush()
+
+    def close(self) -> None:
+        """Close the handle, the next write reopens the file."""
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
@@ -23,6 +23,7 @@ from pathlib import Path
 from pydantic import ValidationError
 
 from aiq.eval.config import EvaluationRunConfig
+from aiq.eval.config import EvaluationRunOutput
 from aiq.eval.runners.config import MultiEvaluationRunConfig
 from aiq.eval.runners.multi_eval_runner import MultiEvaluationRunner
 from aiq.profiler.calc.calculations import LinearFitResult
@@ -167,6 +168,13 @@ class CalcRunner:
             # Online mode validation
             if not self.config.config_file:
                 raise ValueError("Config file is required in online mode.")
+            if self.config.resume and not self.config.output_dir:
+                raise ValueError("Output directory is required to resume a previous run.")
+            if self.config.max_parallel_runs < 1:
+                raise ValueError("max_parallel_runs must be at least 1.")
+            if self.config.max_parallel_runs > 1 and not self.config.endpoint:
+                logger.warning("max_parallel_runs is only used with a remote endpoint. "
+                               "Concurrencies will be run one after another.")
             if self.target_llm_latency <= 0 and self.target_wf_runtime <= 0:
                 logger.warning("Both target_llm_latency and target_workflow_runtime are 0. "
                                "No SLA will be enforced.")
@@ -474,6 +482,64 @@ class CalcRunner:
         output_path.write_text(calc_runner_output.model_dump_json(indent=2))
         logger.info("Wrote output to %s", job_dir)
 
+    def _concurrency_dir(self, concurrency: int) -> Path:
+        """Directory holding the results of a single concurrency pass in online mode."""
+        return Path(self.config.output_dir) / "online" / f"concurrency_{concurrency}"
+
+    def _write_concurrency_metrics(self, concurrency: int, eval_output: EvaluationRunOutput):
+        """
+        Write the sizing metrics of a concurrency pass as soon as it completes, so that an interrupted sweep can be
+        resumed.
+        """
+        if not self.output_dir:
+            return
+
+        metrics = self._get_sizing_metrics(eval_output)
+        concurrency_dir = self._concurrency_dir(concurrency)
+        concurrency_dir.mkdir(parents=True, exist_ok=True)
+        (concurrency_dir / "sizing_metrics.json").write_text(metrics.model_dump_json(indent=2))
+
+    def _read_concurrency_metrics(self, concurrency: int) -> SizingMetrics | None:
+        """Read the sizing metrics of a completed concurrency pass of a previous run."""
+        metrics_path = self._concurrency_dir(concurrency) / "sizing_metrics.json"
+        if not metrics_path.exists():
+            return None
+
+        try:
+            metrics = SizingMetrics.model_validate_json(metrics_path.read_text())
+        except ValidationError as e:
+            logger.warning("Failed to validate sizing metrics file %s: %s", metrics_path, e)
+            return None
+
+        # Interrupted passes are run again
+        if metrics.alerts.workflow_interrupted:
+            return None
+
+        return metrics
+
+    @staticmethod
+    def _get_sizing_metrics(eval_output: EvaluationRunOutput) -> SizingMetrics:
+        """Create the sizing metrics of a concurrency pass from its profiler results and usage stats."""
+        profiler_results = eval_output.profiler_results
+        usage_stats = eval_output.usage_stats
+        workflow_interrupted = eval_output.workflow_interrupted
+
+        per_item_metrics = {
+            item_id: SizingMetricPerItem(llm_latency=item_metrics.llm_latency, workflow_runtime=item_metrics.runtime)
+            for item_id, item_metrics in eval_output.usage_stats.usage_stats_items.items()
+        }
+
+        # if the workflow was interrupted, the metrics are not eligible for slope-based GPU estimation
+        llm_latency_p95 = profiler_results.llm_latency_ci.p95 \
+            if profiler_results.llm_latency_ci else 0
+        workflow_runtime_p95 = profiler_results.workflow_runtime_metrics.p95 \
+            if profiler_results.workflow_runtime_metrics else 0
+        return SizingMetrics(llm_latency_p95=llm_latency_p95,
+                             workflow_runtime_p95=workflow_runtime_p95,
+                             total_runtime=usage_stats.total_runtime,
+                             per_item_metrics=per_item_metrics,
+                             alerts=SizingMetricsAlerts(workflow_interrupted=workflow_interrupted))
+
     def run_offline(self) -> CalcRunnerOutput:
         """
         Run in offline mode.
@@ -555,6 +621,14 @@ class CalcRunner:
         # Create a copy of the base config and apply the overrides for each concurrency
         configs = {}
         for concurrency in self.config.concurrencies:
+            # Reuse the metrics of concurrencies completed by a previous run
+            if self.config.resume:
+                metrics = self._read_concurrency_metrics(concurrency)
+                if metrics is not None:
+                    logger.info("Resuming with the metrics of a previous run for concurrency %d", concurrency)
+                    self.metrics_per_concurrency[concurrency] = metrics
+                    continue
+
             config = copy.deepcopy(eval_run_config)
             override = ((concurrency_key, str(concurrency)), (alias_key, "wf_concurrency_" + str(concurrency)),
                         (profiler_base_metrics_key, "true"))
@@ -562,39 +636,26 @@ class CalcRunner:
             configs[concurrency] = config
 
         # Instantiate the multi-evaluation run config with the overrides for each concurrency
-        config = MultiEvaluationRunConfig(configs=configs)
-
-        # Instantiate and run multi-evaluation runner
-        runner = MultiEvaluationRunner(config)
-        evaluation_run_outputs = await runner.run_all()
-        if not evaluation_run_outputs:
+        config = MultiEvaluationRunConfig(configs=configs,
+                                          max_parallel_runs=self.config.max_parallel_runs,
+                                          max_outstanding_requests=self.config.max_outstanding_requests)
+
+        # Instantiate and run multi-evaluation runner, the metrics of each pass are written as soon as it completes
+        runner = MultiEvaluationRunner(config, on_run_complete=self._write_concurrency_metrics)
+        evaluation_run_outputs = await runner.run_all() if configs else {}
+        if not evaluation_run_outputs and not self.metrics_per_concurrency:
             logger.warning("No evaluation run outputs found. Skipping online mode.")
             return CalcRunnerOutput()
 
         # Calculate sizing metrics per concurrency
-        # if the workflow was interrupted, the metrics are not eligible for slope-based GPU estimation
         for concurrency, eval_output in evaluation_run_outputs.items():
-            profiler_results = eval_output.profiler_results
-            usage_stats = eval_output.usage_stats
-            workflow_interrupted = eval_output.workflow_interrupted
-
-            per_item_metrics = {
-                item_id:
-                    SizingMetricPerItem(llm_latency=item_metrics.llm_latency, workflow_runtime=item_metrics.runtime)
-                for item_id, item_metrics in eval_output.usage_stats.usage_stats_items.items()
-            }
-
-            # if the workflow was interrupted, the metrics are not eligible for slope-based GPU estimation
-            llm_latency_p95 = profiler_results.llm_latency_ci.p95 \
-                if profiler_results.llm_latency_ci else 0
-            workflow_runtime_p95 = profiler_results.workflow_runtime_metrics.p95 \
-                if profiler_results.workflow_runtime_metrics else 0
-            self.metrics_per_concurrency[concurrency] = SizingMetrics(
-                llm_latency_p95=llm_latency_p95,
-                workflow_runtime_p95=workflow_runtime_p95,
-                total_runtime=usage_stats.total_runtime,
-                per_item_metrics=per_item_metrics,
-                alerts=SizingMetricsAlerts(workflow_interrupted=workflow_interrupted))
+            self.metrics_per_concurrency[concurrency] = self._get_sizing_metrics(eval_output)
+
+        # Keep the metrics in the order of the concurrencies
+        self.metrics_per_concurrency = {
+            concurrency: self.metrics_per_concurrency[concurrency]
+            for concurrency in self.config.concurrencies if concurrency in self.metrics_per_concurrency
+        }
 
         # calculate gpu estimates
         calc_runner_output = self.generate_calc_runner_output()
@@ -60,6 +60,15 @@ class CalcRunnerConfig(BaseModel):
     # concurrency values to test
     concurrencies: list[int] = [1, 2, 4, 8]
 
+    # number of concurrency passes run in parallel, only used with a remote endpoint. Parallel passes load the
+    # endpoint together, so the measured latencies include the load of the other passes.
+    max_parallel_runs: int = 1
+    # maximum number of requests outstanding across all parallel passes, 0 for no limit
+    max_outstanding_requests: int = 0
+    # if true, concurrencies with metrics in the per-concurrency output directories of a previous run are not
+    # run again
+    resume: bool = False
+
     # Targets for GPU estimation
     target_llm_latency_p95: float = 0
     target_workflow_runtime_p95: float = 0
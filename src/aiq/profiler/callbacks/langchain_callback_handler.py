@@ -169,6 +169,10 @@ class LangchainProfilerHandler(AsyncCallbackHandler, BaseProfilerCallback):  # p
 
     async def on_llm_new_token(self, token: str, **kwargs: Any) -> None:
         """Collect stats for just the token"""
+        # Token events do not change the span state, so there is nothing to do if nobody receives them
+        if not self.step_manager.has_subscribers:
+            return
+
         model_name = ""
         try:
             model_name = self._run_id_to_model_name.get(str(kwargs.get("run_id", "")), "")
@@ -16,9 +16,13 @@
 from pydantic import BaseModel
 
 from aiq.profiler.inference_metrics_model import InferenceMetricsModel
+from aiq.profiler.inference_optimization.data_models import LLMEndpointWaitsByEndpoint
+from aiq.profiler.inference_optimization.data_models import ResponseCacheSavingsByLLM
 from aiq.profiler.inference_optimization.data_models import WorkflowRuntimeMetrics
 
 
 class ProfilerResults(BaseModel):
     workflow_runtime_metrics: WorkflowRuntimeMetrics | None = None
     llm_latency_ci: InferenceMetricsModel | None = None
+    response_cache_savings: ResponseCacheSavingsByLLM | None = None
+    llm_endpoint_waits: LLMEndpointWaitsByEndpoint | None = None
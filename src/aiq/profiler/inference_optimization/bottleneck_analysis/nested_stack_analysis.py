@@ -32,6 +32,7 @@ An enhanced script that:
 import logging
 import os
 
+import numpy as np
 import pandas as pd
 
 from aiq.data_models.intermediate_step import IntermediateStep
@@ -175,71 +176,71 @@ def build_call_tree_per_example(all_steps: list[list[IntermediateStep]]) -> list
 # --------------------------------------------------------------------------------
 
 
-def compute_time_based_concurrency(roots: list[CallNode]) -> ConcurrencyDistribution:
+def flatten_call_trees(roots: list[CallNode]) -> list[CallNode]:
     """
-    Build a timeline of (start, +1), (end, -1) from all calls, then:
-      - Sort events by time
-      - Create segments [ (t_i, t_{i+1}, concurrency) ]
-      - Compute concurrency percentiles (p50, p90, p95, p99) based on total time spent at each concurrency.
-      - This concurrency is across ALL calls from ALL examples.
+    Return every node of the call trees in depth-first pre-order (each parent before its children).
+    """
+    all_nodes = []
+    # Iterative rather than recursive, deeply nested calls must not hit the recursion limit
+    stack = list(reversed(roots))
+    while stack:
+        node = stack.pop()
+        all_nodes.append(node)
+        stack.extend(reversed(node.children))
+
+    return all_nodes
+
+
+def build_concurrency_timeline(all_nodes: list[CallNode]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Sweep-line over the start and end times of all calls.
 
     Returns:
     --------
-    ConcurrencyDistribution
-        with the piecewise segments + concurrency percentiles.
+    tuple[np.ndarray, np.ndarray]
+        The sorted distinct event times ``boundaries`` and the number of calls running in each segment
+        ``[boundaries[i], boundaries[i + 1])``, as ``levels`` (one shorter than ``boundaries``).
     """
-    # Flatten
-    all_nodes = []
+    start_times = np.fromiter((n.start_time for n in all_nodes), dtype=np.float64, count=len(all_nodes))
+    end_times = np.fromiter((n.end_time for n in all_nodes), dtype=np.float64, count=len(all_nodes))
 
-    def dfs(n: CallNode):
-        all_nodes.append(n)
-        for c in n.children:
-            dfs(c)
+    # partial or invalid => skip
+    valid = start_times <= end_times
+    start_times = np.sort(start_times[valid])
+    end_times = np.sort(end_times[valid])
 
-    for r in roots:
-        dfs(r)
+    boundaries = np.unique(np.concatenate((start_times, end_times)))
+    segment_starts = boundaries[:-1]
 
-    if not all_nodes:
-        return ConcurrencyDistribution(timeline_segments=[], p50=0, p90=0, p95=0, p99=0)
+    # The concurrency of a segment is the number of calls started but not yet ended at its start
+    levels = (np.searchsorted(start_times, segment_starts, side="right") -
+              np.searchsorted(end_times, segment_starts, side="right"))
 
-    events = []
-    for n in all_nodes:
-        st = n.start_time
-        et = n.end_time
-        if st > et:
-            # partial or invalid => skip
-            continue
-        events.append((st, +1))
-        events.append((et, -1))
-
-    events.sort(key=lambda x: x[0])
-    timeline_segments: list[tuple[float, float, int]] = []
-    curr_concurrency = 0
-    prev_time = events[0][0]
-
-    for _, (t, delta) in enumerate(events):
-        if t > prev_time:
-            # segment is [prev_time, t) at concurrency=curr_concurrency
-            timeline_segments.append((prev_time, t, curr_concurrency))
-        curr_concurrency += delta
-        prev_time = t
-
-    # Summaries
-    total_time = 0.0
-    concurrency_durations: dict[int, float] = {}
-
-    for (seg_start, seg_end, c_val) in timeline_segments:
-        length = seg_end - seg_start
-        if length <= 0:
-            continue
-        total_time += length
-        concurrency_durations[c_val] = concurrency_durations.get(c_val, 0) + length
+    return boundaries, levels
+
+
+def summarize_concurrency_timeline(boundaries: np.ndarray, levels: np.ndarray) -> ConcurrencyDistribution:
+    """
+    Compute concurrency percentiles (p50, p90, p95, p99) based on total time spent at each concurrency level of a
+    timeline built by `build_concurrency_timeline`.
+    """
+    timeline_segments: list[tuple[float, float, int]] = list(
+        zip(boundaries[:-1].tolist(), boundaries[1:].tolist(), levels.tolist()))
+
+    if not timeline_segments:
+        return ConcurrencyDistribution(timeline_segments=timeline_segments, p50=0, p90=0, p95=0, p99=0)
+
+    # Summaries. Durations are accumulated in timeline order, matching a running sum over the segments.
+    lengths = np.diff(boundaries)
+    total_time = float(np.cumsum(lengths)[-1])
 
     if total_time <= 0:
         return ConcurrencyDistribution(timeline_segments=timeline_segments, p50=0, p90=0, p95=0, p99=0)
 
-    # Build concurrency-level distribution
-    sorted_levels = sorted(concurrency_durations.items(), key=lambda x: x[0])  # ascending concurrency
+    # Build concurrency-level distribution, ascending concurrency
+    concurrency_levels, level_index = np.unique(levels, return_inverse=True)
+    concurrency_durations = np.bincount(level_index, weights=lengths)
+    sorted_levels = list(zip(concurrency_levels.tolist(), concurrency_durations.tolist()))
 
     def concurrency_at_percentile(p: float) -> float:
         threshold = total_time * (p / 100.0)
@@ -264,6 +265,40 @@ def compute_time_based_concurrency(roots: list[CallNode]) -> ConcurrencyDistribu
                                    p99=p99_val)
 
 
+def compute_time_based_concurrency(roots: list[CallNode]) -> ConcurrencyDistribution:
+    """
+    Build a timeline of (start, +1), (end, -1) from all calls, then:
+      - Sort events by time
+      - Create segments [ (t_i, t_{i+1}, concurrency) ]
+      - Compute concurrency percentiles (p50, p90, p95, p99) based on total time spent at each concurrency.
+      - This concurrency is across ALL calls from ALL examples.
+
+    Returns:
+    --------
+    ConcurrencyDistribution
+        with the piecewise segments + concurrency percentiles.
+    """
+    return summarize_concurrency_timeline(*build_concurrency_timeline(flatten_call_trees(roots)))
+
+
+def compute_midpoint_concurrency(all_nodes: list[CallNode], boundaries: np.ndarray, levels: np.ndarray) -> np.ndarray:
+    """
+    Vectorized `find_midpoint_concurrency` for all nodes at once, over a timeline built by
+    `build_concurrency_timeline`.
+    """
+    start_times = np.fromiter((n.start_time for n in all_nodes), dtype=np.float64, count=len(all_nodes))
+    end_times = np.fromiter((n.end_time for n in all_nodes), dtype=np.float64, count=len(all_nodes))
+    midpoints = np.where(start_times >= end_times, start_times, 0.5 * (start_times + end_times))
+
+    # Index of the segment containing each midpoint, midpoints outside of the timeline have a concurrency of 0
+    segment_index = np.searchsorted(boundaries, midpoints, side="right") - 1
+    in_timeline = (segment_index >= 0) & (segment_index < len(levels))
+
+    concurrency = np.zeros(len(all_nodes), dtype=np.float64)
+    concurrency[in_timeline] = levels[segment_index[in_timeline]]
+    return concurrency
+
+
 def find_midpoint_concurrency(node: CallNode, segments: list[tuple[float, float, int]]) -> float:
     """
     Approximate concurrency for a node by finding the concurrency in timeline_segments
@@ -365,26 +400,19 @@ def analyze_calls_and_build_result(roots: list[CallNode], output_dir: str | None
                                          textual_report="No calls found.")
 
     # Flatten all calls
-    all_nodes: list[CallNode] = []
-
-    def dfs(n: CallNode):
-        all_nodes.append(n)
-        for c in n.children:
-            dfs(c)
-
-    for r in roots:
-        dfs(r)
+    all_nodes = flatten_call_trees(roots)
 
     # 1) concurrency across all calls
-    concurrency_info = compute_time_based_concurrency(roots)
+    boundaries, levels = build_concurrency_timeline(all_nodes)
+    concurrency_info = summarize_concurrency_timeline(boundaries, levels)
+    midpoint_concurrency = compute_midpoint_concurrency(all_nodes, boundaries, levels).tolist()
 
     # 2) build NodeMetrics
     node_metrics_map: dict[str, NodeMetrics] = {}
-    for node in all_nodes:
+    for node, mid_conc in zip(all_nodes, midpoint_concurrency):
         self_t = node.compute_self_time()
         subtree_t = node.compute_subtree_time()
         bscore = subtree_t
-        mid_conc = find_midpoint_concurrency(node, concurrency_info.timeline_segments)
 
         m = NodeMetrics(uuid=node.uuid,
                         operation_type=node.operation_type,
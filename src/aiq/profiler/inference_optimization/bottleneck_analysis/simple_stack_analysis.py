@@ -25,6 +25,8 @@ We pair start/end events by UUID, compute operation durations,
 then analyze concurrency and produce a summary report.
 """
 
+from collections.abc import Iterable
+
 import numpy as np
 import pandas as pd
 
@@ -56,6 +58,28 @@ def profile_workflow_bottlenecks(all_steps: list[list[IntermediateStep]]) -> Sim
         Contains detailed stats per operation and a textual summary of top bottlenecks.
     """
     df = create_standardized_dataframe(all_steps)
+    return profile_workflow_bottlenecks_from_chunks([df])
+
+
+def profile_workflow_bottlenecks_from_chunks(chunks: Iterable[pd.DataFrame]) -> SimpleBottleneckReport:
+    """
+    Produces the same report as `profile_workflow_bottlenecks` from standardized DataFrames, each of which holds all
+    of the rows of the examples in it (see `aiq.profiler.trace_store.ProfilerTraceStore.iter_chunks`).
+    """
+    operations_records = []
+    for df in chunks:
+        operations_records.extend(_collect_operations(df))
+
+    # Put the operations of all chunks back in the order a single groupby over every example yields them
+    operations_records.sort(key=lambda record: record["UUID"])
+
+    return _build_bottleneck_report(operations_records)
+
+
+def _collect_operations(df: pd.DataFrame) -> list[dict]:
+    """
+    Pair the start and end events of the operations in `df` and return one record per operation.
+    """
     # -------------------------------------------------------------
     # 1) Separate events by operation type and match start/end
     # -------------------------------------------------------------
@@ -141,6 +165,13 @@ def profile_workflow_bottlenecks(all_steps: list[list[IntermediateStep]]) -> Sim
             "UUID": uuid_val
         })
 
+    return operations_records
+
+
+def _build_bottleneck_report(operations_records: list[dict]) -> SimpleBottleneckReport:
+    """
+    Analyze the concurrency and durations of the collected operations and summarize them.
+    """
     if not operations_records:
         # No valid operations found
         return SimpleBottleneckReport(stats={}, summary="No operations found to profile.")
@@ -19,6 +19,7 @@ from pydantic import BaseModel
 from pydantic import ConfigDict
 from pydantic import Field
 from pydantic import RootModel
+from pydantic import computed_field
 
 # -----------------------------------------------------------
 # Prompt Caching Data Models
@@ -96,6 +97,73 @@ class WorkflowRuntimeMetrics(BaseModel):
     p99: float
 
 
+# ----------------------------------------------------------------
+# Response Cache Models
+# ----------------------------------------------------------------
+
+
+class ResponseCacheSavings(BaseModel):
+    """
+    Stores the response cache lookups of one LLM and the latency and tokens
+    which the cache hits saved.
+    """
+    hits: int = 0
+    misses: int = 0
+    saved_latency: float = 0.0
+    saved_prompt_tokens: int = 0
+    saved_completion_tokens: int = 0
+    saved_total_tokens: int = 0
+
+    @computed_field
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResponseCacheSavingsByLLM(RootModel[dict[str, ResponseCacheSavings]]):
+    """
+    A RootModel containing a dictionary where each key is an LLM name
+    and each value is the ResponseCacheSavings of that LLM.
+    """
+
+    def to_dict(self) -> dict[str, ResponseCacheSavings]:
+        return self.root
+
+
+# ----------------------------------------------------------------
+# LLM Endpoint Wait Models
+# ----------------------------------------------------------------
+
+
+class LLMEndpointWaits(BaseModel):
+    """
+    Stores the requests to one model endpoint which waited for its
+    concurrency limit or rate limit, and how long they waited.
+    """
+    concurrency_limit_waits: int = 0
+    rate_limit_waits: int = 0
+    total_wait_time: float = 0.0
+    max_wait_time: float = 0.0
+    max_queue_depth: int = 0
+
+    @computed_field
+    @property
+    def mean_wait_time(self) -> float:
+        waits = self.concurrency_limit_waits + self.rate_limit_waits
+        return self.total_wait_time / waits if waits else 0.0
+
+
+class LLMEndpointWaitsByEndpoint(RootModel[dict[str, LLMEndpointWaits]]):
+    """
+    A RootModel containing a dictionary where each key is a model endpoint
+    and each value is the LLMEndpointWaits of that endpoint.
+    """
+
+    def to_dict(self) -> dict[str, LLMEndpointWaits]:
+        return self.root
+
+
 # ----------------------------------------------------------------------
 # Simple Bottleneck Detection Models
 # ----------------------------------------------------------------------
@@ -0,0 +1,71 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections.abc import Iterable
+
+from aiq.data_models.intermediate_step import IntermediateStep
+from aiq.data_models.intermediate_step import IntermediateStepType
+from aiq.data_models.intermediate_step import TraceMetadata
+from aiq.profiler.inference_optimization.data_models import LLMEndpointWaits
+from aiq.profiler.inference_optimization.data_models import LLMEndpointWaitsByEndpoint
+from aiq.utils.llm_endpoint_pool import QUEUE_STEP_NAME
+from aiq.utils.llm_rate_limiter import RATE_LIMIT_STEP_NAME
+
+_WAIT_STEP_NAMES = (QUEUE_STEP_NAME, RATE_LIMIT_STEP_NAME)
+
+def add_llm_endpoint_waits(waits: dict[str, LLMEndpointWaits], steps: Iterable[IntermediateStep]) -> None:
+    """
+    Adds the concurrency and rate limit waits recorded in the intermediate
+    steps of one example to *waits*, which is keyed by endpoint.
+    """
+    for step in steps:
+        if step.event_type != IntermediateStepType.CUSTOM_END or step.name not in _WAIT_STEP_NAMES:
+            continue
+
+        metadata = step.metadata
+        if isinstance(metadata, TraceMetadata):
+            metadata = metadata.provided_metadata
+        elif isinstance(metadata, dict):
+            metadata = metadata.get("provided_metadata")
+        if not metadata:
+            continue
+
+        endpoint_waits = waits.setdefault(str(metadata.get("endpoint")), LLMEndpointWaits())
+        if step.name == QUEUE_STEP_NAME:
+            endpoint_waits.concurrency_limit_waits += 1
+        else:
+            endpoint_waits.rate_limit_waits += 1
+
+        wait_time = metadata.get("wait_time") or 0.0
+        endpoint_waits.total_wait_time += wait_time
+        endpoint_waits.max_wait_time = max(endpoint_waits.max_wait_time, wait_time)
+        endpoint_waits.max_queue_depth = max(endpoint_waits.max_queue_depth, metadata.get("queue_depth") or 0)
+
+
+def compute_llm_endpoint_waits(all_steps: Iterable[Iterable[IntermediateStep]]) -> LLMEndpointWaitsByEndpoint | None:
+    """
+    Computes how many requests to each model endpoint waited for its
+    concurrency limit or rate limit, and how long they waited.
+
+    Returns
+    -------
+    LLMEndpointWaitsByEndpoint | None
+        The waits keyed by endpoint, or None if no request waited.
+    """
+    waits: dict[str, LLMEndpointWaits] = {}
+    for steps in all_steps:
+        add_llm_endpoint_waits(waits, steps)
+
+    return LLMEndpointWaitsByEndpoint(waits) if waits else None
@@ -75,8 +75,20 @@ class LLMMetrics:
         :return:   The same DataFrame with the six NOVA- columns appended.
         """
 
-        df = create_standardized_dataframe(all_steps)
+        return LLMMetrics.compute_profiling_metrics_from_df(create_standardized_dataframe(all_steps))
 
+    @staticmethod
+    def compute_profiling_metrics_from_df(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Append the columns described in `compute_profiling_metrics` to a standardized DataFrame.
+
+        Every metric is computed within an example_number, so a DataFrame holding complete examples (such as a chunk
+        from `aiq.profiler.trace_store.ProfilerTraceStore.iter_chunks`) gets the same values it would get as part of
+        the DataFrame of the whole run.
+
+        :param df: A standardized DataFrame, as returned by `create_standardized_dataframe`.
+        :return:   The DataFrame with the six NOVA- columns appended.
+        """
         if df.empty:
             return df
 
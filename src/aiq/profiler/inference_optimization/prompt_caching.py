@@ -13,6 +13,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections.abc import Iterable
+
+import pandas as pd
+
 from aiq.data_models.intermediate_step import IntermediateStep
 from aiq.profiler.inference_optimization.data_models import CommonPrefixesOutput
 from aiq.profiler.inference_optimization.data_models import FrameworkLLMPrefixData
@@ -21,69 +25,139 @@ from aiq.profiler.utils import create_standardized_dataframe
 
 
 # -----------------------------------------------------------
-# 1. Helper: Build a prefix trie
+# 1. Helper: Build a radix tree of the prefixes
 # -----------------------------------------------------------
-def build_prefix_trie(strings: list[str]) -> dict:
+class PrefixTreeNode:
+    """
+    Node of a radix (compressed prefix) tree. Nodes only exist where strings branch or end, the characters between a
+    node and its parent are not stored separately since every string passing through the node shares them.
+    """
+
+    __slots__ = ("count", "depth", "source", "children")
+
+    def __init__(self, count: int, depth: int, source: str):
+        # number of strings passing through this node
+        self.count = count
+        # length of the prefix ending at this node
+        self.depth = depth
+        # one of the strings passing through this node, the prefix is `source[:depth]`
+        self.source = source
+        # children keyed by the first character of their edge
+        self.children: dict[str, PrefixTreeNode] = {}
+
+    @property
+    def prefix(self) -> str:
+        return self.source[:self.depth]
+
+
+def _common_prefix_end(a: str, b: str, start: int, end: int) -> int:
     """
-    Build a trie from a list of strings.
+    Return the largest index `i <= end` such that `a[start:i] == b[start:i]`. Slices are compared with a binary search
+    so that the characters are compared in C instead of one by one.
+    """
+    if a[start:end] == b[start:end]:
+        return end
+
+    lo, hi = start, end - 1
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[lo:mid] == b[lo:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
 
-    Returns a nested dictionary with::
 
-        {
-            'count': int,         # number of strings passing through this node
-            'children': dict[str, TrieNode]
-        }
+def build_prefix_tree(strings: list[str]) -> PrefixTreeNode:
+    """
+    Build a radix tree from a list of strings.
 
+    The tree holds at most two nodes per string and references the input strings instead of copying their characters,
+    so memory grows with the number of strings rather than their total length.
     """
-    root = {'count': 0, 'children': {}}
+    root = PrefixTreeNode(count=0, depth=0, source="")
     for s in strings:
         node = root
-        node['count'] += 1  # every string passes through the root
-        for ch in s:
-            if ch not in node['children']:
-                node['children'][ch] = {'count': 0, 'children': {}}
-            node = node['children'][ch]
-            node['count'] += 1
+        node.count += 1  # every string passes through the root
+        pos = 0
+        while pos < len(s):
+            child = node.children.get(s[pos])
+            if child is None:
+                node.children[s[pos]] = PrefixTreeNode(count=1, depth=len(s), source=s)
+                break
+
+            split = _common_prefix_end(s, child.source, pos, min(child.depth, len(s)))
+            if split == child.depth:
+                # The whole edge matches, continue below the child
+                child.count += 1
+                node = child
+                pos = split
+                continue
+
+            # Split the edge where the string diverges from it (or ends)
+            mid = PrefixTreeNode(count=child.count + 1, depth=split, source=child.source)
+            mid.children[child.source[split]] = child
+            node.children[s[pos]] = mid
+            if split < len(s):
+                mid.children[s[split]] = PrefixTreeNode(count=1, depth=len(s), source=s)
+            break
     return root
 
 
 # -----------------------------------------------------------
-# 2. Helper: Iterative traversal of the trie
+# 2. Helper: Iterative traversal of the tree
 # -----------------------------------------------------------
-def collect_prefixes_iterative(root: dict, total_calls: int) -> list[dict]:
+def collect_prefixes_iterative(root: PrefixTreeNode, total_calls: int, min_call_percentage: float = 0.0) -> list[dict]:
     """
-    Iteratively traverse the trie to collect prefix statistics,
-    avoiding recursion depth limits.
+    Iteratively traverse the tree to collect the statistics of the longest
+    prefixes meeting `min_call_percentage`, avoiding recursion depth limits.
 
-    :param root: Trie node with 'count' and 'children'
+    A prefix is only collected if none of the longer prefixes extending it meet
+    the threshold. Any other prefix is contained in a longer retained prefix, and
+    would be dropped by the substring filtering of `get_common_prefixes`.
+
+    :param root: Root of the tree built by `build_prefix_tree`
     :param total_calls: Number of total calls in this group (denominator for percentages)
+    :param min_call_percentage: Minimum fraction of the calls sharing a prefix
     :return: A list of dicts, each dict containing prefix info
     """
     results = []
-    # stack holds (node, prefix_so_far)
-    stack = [(root, "")]
+    # Visit the nodes in the same order as a character by character trie traversal
+    stack = [root]
 
     while stack:
-        node, prefix = stack.pop()
+        node = stack.pop()
+
+        passing_children = [
+            child for child in node.children.values() if child.count / total_calls >= min_call_percentage
+        ]
 
         # Skip storing the empty root prefix
-        if prefix:
-            calls_count = node['count']
-            calls_percentage = calls_count / total_calls
+        if node.depth and not passing_children:
+            calls_count = node.count
             results.append({
-                'prefix': prefix,
-                'prefix_length': len(prefix),
+                'prefix': node.prefix,
+                'prefix_length': node.depth,
                 'calls_count': calls_count,
-                'calls_percentage': calls_percentage
+                'calls_percentage': calls_count / total_calls
             })
 
-        # Add children to the stack
-        for ch, child_node in node['children'].items():
-            stack.append((child_node, prefix + ch))
+        # Add children to the stack, the children of a node below the threshold are below it as well
+        stack.extend(passing_children)
 
     return results
 
 
+def _is_contained_in_any(prefix: str, kept_text: str, kept_prefixes: list[str]) -> bool:
+    """
+    Check if `prefix` is a substring of any kept prefix. `kept_text` holds the kept prefixes joined by NUL
+    characters, which a match cannot span unless the prefix itself contains one.
+    """
+    if "\0" in prefix:
+        return any(prefix in kept for kept in kept_prefixes)
+    return prefix in kept_text
+
+
 # -----------------------------------------------------------
 # 3. Main Function
 # -----------------------------------------------------------
@@ -107,33 +181,45 @@ def get_common_prefixes(all_steps: list[list[IntermediateStep]],
     Sorting: primarily by prefix length (descending),
              secondarily by frequency (descending).
     """
-    # Validate necessary columns
     df = create_standardized_dataframe(all_steps)
+    return get_common_prefixes_from_chunks([df], min_call_percentage=min_call_percentage)
 
-    required_cols = {'framework', 'llm_name', 'llm_text_input'}
-    if not required_cols.issubset(df.columns):
-        missing = required_cols - set(df.columns)
-        raise ValueError(f"DataFrame missing required columns: {missing}")
 
-    output_data: dict[str, FrameworkLLMPrefixData] = {}
+def get_common_prefixes_from_chunks(chunks: Iterable[pd.DataFrame],
+                                    min_call_percentage: float = 0.0) -> CommonPrefixesOutput:
+    """
+    Computes the same prefixes as `get_common_prefixes` from standardized DataFrames, such as the chunks of
+    `aiq.profiler.trace_store.ProfilerTraceStore.iter_chunks`. Only the LLM text inputs are kept in memory.
+    """
+    text_inputs_by_llm: dict[str, list[str]] = {}
+    for df in chunks:
+        # Validate necessary columns
+        required_cols = {'framework', 'llm_name', 'llm_text_input'}
+        if not required_cols.issubset(df.columns):
+            missing = required_cols - set(df.columns)
+            raise ValueError(f"DataFrame missing required columns: {missing}")
+
+        # Group DataFrame by (framework, llm_name)
+        grouped = df.groupby(['llm_name'])
+        for llm_name, group_df in grouped:
+            # Unpack llm_name Tuple
+            llm_name = llm_name[0]
+            text_inputs_by_llm.setdefault(llm_name, []).extend(group_df['llm_text_input'].astype(str).tolist())
 
-    # Group DataFrame by (framework, llm_name)
-    grouped = df.groupby(['llm_name'])
-    for llm_name, group_df in grouped:
-        # Unpack llm_name Tuple
-        llm_name = llm_name[0]
+    output_data: dict[str, FrameworkLLMPrefixData] = {}
 
-        text_inputs = group_df['llm_text_input'].astype(str).tolist()
+    # LLMs are reported in the order a groupby over every example yields them
+    for llm_name in sorted(text_inputs_by_llm):
+        text_inputs = text_inputs_by_llm[llm_name]
         total_calls = len(text_inputs)
 
-        # Build trie for all text inputs
-        trie = build_prefix_trie(text_inputs)
-
-        # Collect prefix info using iterative traversal
-        results = collect_prefixes_iterative(trie, total_calls=total_calls)
+        # Build radix tree for all text inputs
+        tree = build_prefix_tree(text_inputs)
 
-        # 1) Filter out prefixes below min_call_percentage
-        results_filtered = [r for r in results if r['calls_percentage'] >= min_call_percentage]
+        # 1) Collect info of the prefixes meeting min_call_percentage using iterative traversal
+        results_filtered = collect_prefixes_iterative(tree,
+                                                      total_calls=total_calls,
+                                                      min_call_percentage=min_call_percentage)
 
         # 2) Sort results: prefix_length desc, then calls_count desc
         results_sorted = sorted(results_filtered, key=lambda x: (x['prefix_length'], x['calls_count']), reverse=True)
@@ -143,11 +229,15 @@ def get_common_prefixes(all_steps: list[list[IntermediateStep]],
         #    if we keep a prefix, we exclude any shorter prefix that
         #    is a substring of that already-kept prefix.
         final_results = []
+        kept_prefixes = []
+        kept_text = ""
         for r in results_sorted:
             pfx = r['prefix']
             # Check if this prefix is contained in any longer prefix we have kept
-            if not any(pfx in kept['prefix'] for kept in final_results):
+            if not _is_contained_in_any(pfx, kept_text, kept_prefixes):
                 final_results.append(r)
+                kept_prefixes.append(pfx)
+                kept_text += pfx + "\0"
 
         # Convert each dict to a PrefixInfo model
         prefix_info_list = [PrefixInfo(**res) for res in final_results]
@@ -0,0 +1,72 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections.abc import Iterable
+
+from aiq.data_models.intermediate_step import IntermediateStep
+from aiq.data_models.intermediate_step import IntermediateStepType
+from aiq.data_models.intermediate_step import TraceMetadata
+from aiq.profiler.inference_optimization.data_models import ResponseCacheSavings
+from aiq.profiler.inference_optimization.data_models import ResponseCacheSavingsByLLM
+from aiq.utils.response_cache import CACHE_STEP_NAME
+
+
+def add_response_cache_savings(savings: dict[str, ResponseCacheSavings], steps: Iterable[IntermediateStep]) -> None:
+    """
+    Adds the response cache lookups recorded in the intermediate steps of one
+    example to *savings*, which is keyed by LLM name.
+    """
+    for step in steps:
+        if step.event_type != IntermediateStepType.CUSTOM_END or step.name != CACHE_STEP_NAME:
+            continue
+
+        metadata = step.metadata
+        if isinstance(metadata, TraceMetadata):
+            metadata = metadata.provided_metadata
+        elif isinstance(metadata, dict):
+            metadata = metadata.get("provided_metadata")
+        if not metadata:
+            continue
+
+        llm_savings = savings.setdefault(str(metadata.get("llm_name")), ResponseCacheSavings())
+        if not metadata.get("cache_hit"):
+            llm_savings.misses += 1
+            continue
+
+        llm_savings.hits += 1
+        llm_savings.saved_latency += metadata.get("saved_latency") or 0.0
+
+        token_usage = metadata.get("saved_token_usage") or {}
+        llm_savings.saved_prompt_tokens += token_usage.get("prompt_tokens", 0)
+        llm_savings.saved_completion_tokens += token_usage.get("completion_tokens", 0)
+        llm_savings.saved_total_tokens += token_usage.get("total_tokens", 0)
+
+
+def compute_response_cache_savings(
+        all_steps: Iterable[Iterable[IntermediateStep]]) -> ResponseCacheSavingsByLLM | None:
+    """
+    Computes the response cache hits and misses of each LLM along with the
+    latency and tokens saved by the hits.
+
+    Returns
+    -------
+    ResponseCacheSavingsByLLM | None
+        The savings keyed by LLM name, or None if no LLM used a response cache.
+    """
+    savings: dict[str, ResponseCacheSavings] = {}
+    for steps in all_steps:
+        add_response_cache_savings(savings, steps)
+
+    return ResponseCacheSavingsByLLM(savings) if savings else None
@@ -14,8 +14,10 @@
 # limitations under the License.
 
 import re
+from collections.abc import Iterable
 
 import numpy as np
+import pandas as pd
 
 from aiq.data_models.intermediate_step import IntermediateStep
 from aiq.profiler.inference_optimization.data_models import LLMUniquenessMetrics
@@ -42,6 +44,41 @@ def compute_inter_query_token_uniqueness_by_llm(all_steps: list[list[Intermediat
          { llm_name -> LLMUniquenessMetrics(p90, p95, p99) }.
     """
     df = create_standardized_dataframe(all_steps)
+    return compute_inter_query_token_uniqueness_by_llm_from_chunks([df])
+
+
+def compute_inter_query_token_uniqueness_by_llm_from_chunks(
+        chunks: Iterable[pd.DataFrame]) -> LLMUniquenessMetricsByLLM:
+    """
+    Computes the same metrics as `compute_inter_query_token_uniqueness_by_llm` from standardized DataFrames, each of
+    which holds all of the rows of the examples in it (see `aiq.profiler.trace_store.ProfilerTraceStore.iter_chunks`).
+    """
+    # We'll store new_words counts for each llm_name
+    llm_to_counts: dict[str, list[int]] = {}
+
+    for df in chunks:
+        _collect_new_words_counts(df, llm_to_counts)
+
+    # 4) For each llm_name, compute p90, p95, p99. LLMs are reported in the order a groupby over every example
+    #    yields them, regardless of which chunk they first appear in.
+    output_dict = {}
+    for llm_name in sorted(llm_to_counts):
+        arr = np.array(llm_to_counts[llm_name])
+        p90_val = float(np.percentile(arr, 90))
+        p95_val = float(np.percentile(arr, 95))
+        p99_val = float(np.percentile(arr, 99))
+
+        output_dict[llm_name] = LLMUniquenessMetrics(p90=p90_val, p95=p95_val, p99=p99_val)
+
+    ret_val = LLMUniquenessMetricsByLLM(root=output_dict)
+    # Validate & return as a RootModel
+    return ret_val
+
+
+def _collect_new_words_counts(df: pd.DataFrame, llm_to_counts: dict[str, list[int]]):
+    """
+    Adds the 'new words count' of each llm_start event in `df` to `llm_to_counts`.
+    """
     # Validate that the necessary columns exist
     required_cols = {'event_type', 'llm_name', 'example_number', 'event_timestamp', 'llm_text_input'}
     missing = required_cols - set(df.columns)
@@ -51,8 +88,8 @@ def compute_inter_query_token_uniqueness_by_llm(all_steps: list[list[Intermediat
     # 1) Filter to llm_start events
     cdf = df[df['event_type'] == 'LLM_START'].copy()
     if cdf.empty:
-        # Return an empty dictionary if no llm_start events
-        return LLMUniquenessMetricsByLLM(root={})
+        # Nothing to add if no llm_start events
+        return
 
     # Helper to tokenize text into a set of words
     def tokenize_to_set(text: str) -> set:
@@ -60,9 +97,6 @@ def compute_inter_query_token_uniqueness_by_llm(all_steps: list[list[Intermediat
             return set()
         return set(re.findall(r"\w+", text.lower()))
 
-    # We'll store new_words counts for each llm_name
-    llm_to_counts: dict[str, list[int]] = {}
-
     # 2) Group by (llm_name, example_number), then sort each group
     grouped = cdf.groupby(['llm_name', 'example_number'], as_index=False, group_keys=True)
 
@@ -91,17 +125,3 @@ def compute_inter_query_token_uniqueness_by_llm(all_steps: list[list[Intermediat
             if llm not in llm_to_counts:
                 llm_to_counts[llm] = []
             llm_to_counts[llm].extend(counts)
-
-    # 4) For each llm_name, compute p90, p95, p99
-    output_dict = {}
-    for llm_name, counts_list in llm_to_counts.items():
-        arr = np.array(counts_list)
-        p90_val = float(np.percentile(arr, 90))
-        p95_val = float(np.percentile(arr, 95))
-        p99_val = float(np.percentile(arr, 99))
-
-        output_dict[llm_name] = LLMUniquenessMetrics(p90=p90_val, p95=p95_val, p99=p99_val)
-
-    ret_val = LLMUniquenessMetricsByLLM(root=output_dict)
-    # Validate & return as a RootModel
-    return ret_val
@@ -13,7 +13,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections.abc import Iterable
+
 import numpy as np
+import pandas as pd
 
 from aiq.data_models.intermediate_step import IntermediateStep
 from aiq.profiler.inference_optimization.data_models import WorkflowRuntimeMetrics
@@ -43,21 +46,32 @@ def compute_workflow_runtime_metrics(all_steps: list[list[IntermediateStep]]) ->
         A Pydantic model with 'p90', 'p95', and 'p99' attributes.
     """
     df = create_standardized_dataframe(all_steps)
-    required_cols = {"example_number", "event_timestamp"}
-    missing = required_cols - set(df.columns)
-    if missing:
-        raise ValueError(f"DataFrame is missing required columns: {missing}")
+    return compute_workflow_runtime_metrics_from_chunks([df])
+
+
+def compute_workflow_runtime_metrics_from_chunks(chunks: Iterable[pd.DataFrame]) -> WorkflowRuntimeMetrics:
+    """
+    Computes the same metrics as `compute_workflow_runtime_metrics` from standardized DataFrames, each of which holds
+    all of the rows of the examples in it (see `aiq.profiler.trace_store.ProfilerTraceStore.iter_chunks`).
+    """
+    runtimes_per_chunk = []
+    for df in chunks:
+        required_cols = {"example_number", "event_timestamp"}
+        missing = required_cols - set(df.columns)
+        if missing:
+            raise ValueError(f"DataFrame is missing required columns: {missing}")
 
-    # Group by example_number, then find min and max timestamp
-    grouped = df.groupby("example_number")["event_timestamp"]
-    min_timestamps = grouped.min()
-    max_timestamps = grouped.max()
+        # Group by example_number, then find min and max timestamp
+        grouped = df.groupby("example_number")["event_timestamp"]
+        min_timestamps = grouped.min()
+        max_timestamps = grouped.max()
 
-    # Workflow runtime is difference between max and min
-    runtimes = max_timestamps - min_timestamps
+        # Workflow runtime is difference between max and min
+        runtimes = max_timestamps - min_timestamps
+        runtimes_per_chunk.append(runtimes.values)
 
     # Convert to a NumPy array for percentile calculations
-    runtimes_arr = runtimes.values
+    runtimes_arr = np.concatenate(runtimes_per_chunk) if runtimes_per_chunk else np.array([])
 
     # Edge case: if there's only one example or no data
     # (NumPy percentile can handle 1-element arrays, but let's guard for empties)
@@ -13,14 +13,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import contextlib
 import json
 import logging
 import math
 import os
 import statistics
+import tempfile
 from pathlib import Path
 from typing import Any
+from typing import TextIO
 
+import pandas as pd
 from pydantic import BaseModel
 
 from aiq.data_models.evaluate import ProfilerConfig
@@ -28,6 +32,10 @@ from aiq.data_models.intermediate_step import IntermediateStep
 from aiq.profiler.data_models import ProfilerResults
 from aiq.profiler.forecasting.model_trainer import ModelTrainer
 from aiq.profiler.inference_metrics_model import InferenceMetricsModel
+from aiq.profiler.inference_optimization.data_models import LLMEndpointWaits
+from aiq.profiler.inference_optimization.data_models import LLMEndpointWaitsByEndpoint
+from aiq.profiler.inference_optimization.data_models import ResponseCacheSavings
+from aiq.profiler.inference_optimization.data_models import ResponseCacheSavingsByLLM
 from aiq.profiler.utils import create_standardized_dataframe
 from aiq.utils.type_converter import TypeConverter
 
@@ -45,6 +53,8 @@ class InferenceOptimizationHolder(BaseModel):
     common_prefixes: Any
     token_uniqueness: Any
     workflow_runtimes: Any
+    response_cache_savings: Any = None
+    llm_endpoint_waits: Any = None
 
 
 class ProfilerRunner:
@@ -79,6 +89,13 @@ class ProfilerRunner:
         self.all_requests_data: list[dict] = []
         self.all_steps = []
 
+        # State of streaming mode, opened by the first request added to the trace store
+        self._streaming_stack: contextlib.ExitStack | None = None
+        self._trace_store = None
+        self._traces_file: TextIO | None = None
+        self._response_cache_savings: dict[str, ResponseCacheSavings] = {}
+        self._llm_endpoint_waits: dict[str, LLMEndpointWaits] = {}
+
         # Ensure output directory
         os.makedirs(output_dir, exist_ok=True)
 
@@ -87,6 +104,8 @@ class ProfilerRunner:
         Main entrypoint: Works on Input DataFrame generated from eval to fit forecasting model,
         writes out combined requests JSON, then computes and saves additional metrics,
         and optionally fits a forecasting model.
+
+        In streaming mode `all_steps` are added after the requests already passed to `add_request`.
         """
         from aiq.profiler.inference_optimization.bottleneck_analysis.nested_stack_analysis import \
             multi_example_call_profiling
@@ -96,12 +115,19 @@ class ProfilerRunner:
             concurrency_spike_analysis
         from aiq.profiler.inference_optimization.experimental.prefix_span_analysis import \
             prefixspan_subworkflow_with_text
+        from aiq.profiler.inference_optimization.llm_endpoint_waits import compute_llm_endpoint_waits
         from aiq.profiler.inference_optimization.llm_metrics import LLMMetrics
         from aiq.profiler.inference_optimization.prompt_caching import get_common_prefixes
+        from aiq.profiler.inference_optimization.response_cache import compute_response_cache_savings
         from aiq.profiler.inference_optimization.token_uniqueness import compute_inter_query_token_uniqueness_by_llm
         from aiq.profiler.inference_optimization.workflow_runtimes import compute_workflow_runtime_metrics
         from aiq.profiler.intermediate_property_adapter import IntermediatePropertyAdaptor
 
+        if self.profile_config.streaming.enable:
+            for steps in all_steps:
+                self.add_request(steps)
+            return await self._run_streaming()
+
         # Convert the incoming DataFrame to a list of dicts and store
         all_steps = [[IntermediatePropertyAdaptor.from_intermediate_step(step) for step in steps]
                      for steps in all_steps]  # Add adapter properties to each step
@@ -182,17 +208,24 @@ class ProfilerRunner:
             workflow_runtimes = compute_workflow_runtime_metrics(all_steps)
             workflow_runtimes_results = workflow_runtimes
 
+        # ------------------------------------------------------------
+        # Compute the latency and tokens saved by response caches
+        # ------------------------------------------------------------
+        response_cache_savings = compute_response_cache_savings(all_steps)
+
+        # ------------------------------------------------------------
+        # Compute the time requests waited for the limits of the model endpoints
+        # ------------------------------------------------------------
+        llm_endpoint_waits = compute_llm_endpoint_waits(all_steps)
+
         inference_optimization_results = InferenceOptimizationHolder(confidence_intervals=simple_metrics,
                                                                      common_prefixes=common_prefix_results,
                                                                      token_uniqueness=token_uniqueness_results,
-                                                                     workflow_runtimes=workflow_runtimes_results)
+                                                                     workflow_runtimes=workflow_runtimes_results,
+                                                                     response_cache_savings=response_cache_savings,
+                                                                     llm_endpoint_waits=llm_endpoint_waits)
 
-        if self.write_output and inference_optimization_results:
-            # Save to JSON
-            optimization_results_path = os.path.join(self.output_dir, "inference_optimization.json")
-            with open(optimization_results_path, 'w', encoding='utf-8') as f:
-                json.dump(inference_optimization_results.model_dump(), f, indent=2)
-            logger.info("Wrote inference optimization results to: %s", optimization_results_path)
+        self._write_inference_optimization_results(inference_optimization_results)
 
         workflow_profiling_reports = ""
         workflow_profiling_metrics = {}
@@ -251,19 +284,7 @@ class ProfilerRunner:
                 exclude=["textual_report"])
             logger.info("Prefix span analysis complete")
 
-        if self.write_output and workflow_profiling_reports:
-            # Save to text file
-            profiling_report_path = os.path.join(self.output_dir, "workflow_profiling_report.txt")
-            with open(profiling_report_path, 'w', encoding='utf-8') as f:
-                f.write(workflow_profiling_reports)
-            logger.info("Wrote workflow profiling report to: %s", profiling_report_path)
-
-        if self.write_output and workflow_profiling_metrics:
-            # Save to JSON
-            profiling_metrics_path = os.path.join(self.output_dir, "workflow_profiling_metrics.json")
-            with open(profiling_metrics_path, 'w', encoding='utf-8') as f:
-                json.dump(workflow_profiling_metrics, f, indent=2)
-            logger.info("Wrote workflow profiling metrics to: %s", profiling_metrics_path)
+        self._write_workflow_profiling_results(workflow_profiling_reports, workflow_profiling_metrics)
 
         if self.profile_config.token_usage_forecast:
             # ------------------------------------------------------------
@@ -278,7 +299,8 @@ class ProfilerRunner:
                 logger.info("Fitted model for forecasting.")
             except Exception as e:
                 logger.exception("Fitting model failed. %s", e, exc_info=True)
-                return ProfilerResults()
+                return ProfilerResults(response_cache_savings=response_cache_savings,
+                                       llm_endpoint_waits=llm_endpoint_waits)
 
             if self.write_output:
                 os.makedirs(self.output_dir, exist_ok=True)
@@ -289,11 +311,275 @@ class ProfilerRunner:
 
             logger.info("Saved fitted model to disk.")
 
-        return ProfilerResults(workflow_runtime_metrics=workflow_runtimes_results, llm_latency_ci=llm_latency_ci)
+        return ProfilerResults(workflow_runtime_metrics=workflow_runtimes_results,
+                               llm_latency_ci=llm_latency_ci,
+                               response_cache_savings=response_cache_savings,
+                               llm_endpoint_waits=llm_endpoint_waits)
+
+    def _open_streaming(self):
+        from aiq.profiler.trace_store import ProfilerTraceStore
+
+        self._streaming_stack = contextlib.ExitStack()
+
+        # Without output the trace store is only needed for the analysis and is removed once it is done
+        if self.write_output:
+            store_dir = self.output_dir
+        else:
+            store_dir = self._streaming_stack.enter_context(tempfile.TemporaryDirectory(prefix="aiq_profiler_"))
+
+        self._trace_store = self._streaming_stack.enter_context(
+            ProfilerTraceStore(os.path.join(store_dir, "standardized_data_all.parquet"),
+                               self.profile_config.streaming.examples_per_chunk))
+
+        if self.write_output:
+            traces_path = os.path.join(self.output_dir, "all_requests_profiler_traces.json")
+            self._traces_file = self._streaming_stack.enter_context(open(traces_path, 'w', encoding='utf-8'))
+
+    def add_request(self, steps: list[IntermediateStep]):
+        """
+        Add the intermediate steps of a finished request in streaming mode. The steps are appended to the trace store
+        and the combined traces file right away, so callers can hand each request over as soon as it completes instead
+        of collecting the whole run for `run`. Requests are numbered in the order they are added.
+        """
+        from aiq.profiler.inference_optimization.llm_endpoint_waits import add_llm_endpoint_waits
+        from aiq.profiler.inference_optimization.response_cache import add_response_cache_savings
+        from aiq.profiler.intermediate_property_adapter import IntermediatePropertyAdaptor
+
+        if not self.profile_config.streaming.enable:
+            raise RuntimeError("Requests can only be added to the profiler in streaming mode")
+
+        if self._streaming_stack is None:
+            self._open_streaming()
+
+        request_number = self._trace_store.num_examples
+        steps = [IntermediatePropertyAdaptor.from_intermediate_step(step) for step in steps]
+        self._trace_store.append(steps)
+        add_response_cache_savings(self._response_cache_savings, steps)
+        add_llm_endpoint_waits(self._llm_endpoint_waits, steps)
+
+        if self._traces_file is not None:
+            request_data = {
+                "request_number": request_number, "intermediate_steps": [step.model_dump() for step in steps]
+            }
+            self._write_traces_entry(self._traces_file, request_data, first=(request_number == 0))
+
+    async def _run_streaming(self) -> ProfilerResults:
+        """
+        Streaming counterpart of `run`. The usage stats of each request were appended to a Parquet trace store by
+        `add_request`, and the analyses read the store back a chunk of requests at a time, so the standardized data of
+        the whole run is never held in memory at once.
+        """
+        if self._streaming_stack is None:
+            self._open_streaming()
+
+        try:
+            return await self._analyze_trace_store()
+        finally:
+            self.close()
+
+    def close(self):
+        """
+        Close the trace store and the combined traces file opened by `add_request` and discard the requests added so
+        far. `run` closes them itself, this is only needed when a run is abandoned after requests were added.
+        """
+        if self._streaming_stack is not None:
+            # Also removes the trace store when it was only kept in a temporary directory
+            self._streaming_stack.close()
+
+        self._streaming_stack = None
+        self._trace_store = None
+        self._traces_file = None
+        self._response_cache_savings = {}
+        self._llm_endpoint_waits = {}
+
+    async def _analyze_trace_store(self) -> ProfilerResults:
+        from aiq.profiler.inference_optimization.bottleneck_analysis.simple_stack_analysis import \
+            profile_workflow_bottlenecks_from_chunks
+        from aiq.profiler.inference_optimization.llm_metrics import LLMMetrics
+        from aiq.profiler.inference_optimization.prompt_caching import get_common_prefixes_from_chunks
+        from aiq.profiler.inference_optimization.token_uniqueness import \
+            compute_inter_query_token_uniqueness_by_llm_from_chunks
+        from aiq.profiler.inference_optimization.workflow_runtimes import compute_workflow_runtime_metrics_from_chunks
+
+        unsupported = [
+            name for name, enabled in (
+                ("nested stack analysis", self.profile_config.bottleneck_analysis.enable_nested_stack),
+                ("concurrency spike analysis", self.profile_config.concurrency_spike_analysis.enable),
+                ("prefix span analysis", self.profile_config.prefix_span_analysis.enable),
+                ("token usage forecasting", self.profile_config.token_usage_forecast),
+            ) if enabled
+        ]
+        if unsupported:
+            logger.warning("Skipping %s, not supported in streaming mode", ", ".join(unsupported))
+
+        store = self._trace_store
+        store.close()
+
+        if self._traces_file is not None:
+            self._traces_file.write("\n]" if store.num_examples else "[]")
+            self._traces_file.close()
+            logger.info("Wrote combined data to: %s", self._traces_file.name)
+
+        response_cache_savings = self._response_cache_savings
+        llm_endpoint_waits = self._llm_endpoint_waits
+
+        # ------------------------------------------------------------
+        # Write the standardized CSV a chunk at a time
+        # ------------------------------------------------------------
+        csv_path = os.path.join(self.output_dir, "standardized_data_all.csv")
+        wrote_header = False
+        for chunk_df in store.iter_chunks():
+            if self.profile_config.compute_llm_metrics:
+                chunk_df = LLMMetrics.compute_profiling_metrics_from_df(chunk_df)
+
+            if self.profile_config.csv_exclude_io_text:
+                chunk_df = chunk_df.drop(columns=['llm_text_input', 'llm_text_output', 'llm_new_token'])
+
+            chunk_df.to_csv(csv_path, mode='a' if wrote_header else 'w', header=not wrote_header, index=False,
+                            encoding='utf-8')
+            wrote_header = True
+
+        if not wrote_header:
+            pd.DataFrame().to_csv(csv_path, index=False, encoding='utf-8')
+        logger.info("Wrote merged standardized DataFrame to %s", csv_path)
+
+        # ------------------------------------------------------------
+        # Compute and save additional performance metrics
+        # ------------------------------------------------------------
+        run_times = []
+        latencies = []
+        min_ts = max_ts = None
+        for chunk_df in store.iter_chunks(columns=["event_type", "event_timestamp", "example_number"]):
+            run_times.extend(self._get_workflow_run_times(chunk_df))
+            latencies.extend(self._get_llm_latencies(chunk_df))
+            chunk_min_ts = chunk_df["event_timestamp"].min()
+            chunk_max_ts = chunk_df["event_timestamp"].max()
+            min_ts = chunk_min_ts if min_ts is None else min(min_ts, chunk_min_ts)
+            max_ts = chunk_max_ts if max_ts is None else max(max_ts, chunk_max_ts)
+
+        workflow_run_time_ci = self._compute_confidence_intervals(run_times, "Workflow Run Time")
+        llm_latency_ci = self._compute_confidence_intervals(latencies, "LLM Latency")
+        if min_ts is None:
+            throughput_ci = InferenceMetricsModel()
+        else:
+            throughput_ci = self._compute_throughput_from_time_window(float(min_ts), float(max_ts), store.num_examples)
+
+        simple_metrics = SimpleMetricsHolder(workflow_run_time_confidence_intervals=workflow_run_time_ci.model_dump(),
+                                             llm_latency_confidence_intervals=llm_latency_ci.model_dump(),
+                                             throughput_estimate_confidence_interval=throughput_ci.model_dump())
+
+        common_prefix_results = token_uniqueness_results = workflow_runtimes_results = None
+
+        if self.profile_config.prompt_caching_prefixes.enable:
+            common_prefix_results = get_common_prefixes_from_chunks(
+                store.iter_chunks(columns=["framework", "llm_name", "llm_text_input"]),
+                self.profile_config.prompt_caching_prefixes.min_frequency)
+
+        if self.profile_config.token_uniqueness_forecast:
+            token_uniqueness_results = compute_inter_query_token_uniqueness_by_llm_from_chunks(
+                store.iter_chunks(
+                    columns=["event_type", "llm_name", "example_number", "event_timestamp", "llm_text_input"]))
+
+        if self.profile_config.workflow_runtime_forecast or self.profile_config.base_metrics:
+            workflow_runtimes_results = compute_workflow_runtime_metrics_from_chunks(
+                store.iter_chunks(columns=["example_number", "event_timestamp"]))
+
+        response_cache_savings_results = ResponseCacheSavingsByLLM(
+            response_cache_savings) if response_cache_savings else None
+        llm_endpoint_waits_results = LLMEndpointWaitsByEndpoint(llm_endpoint_waits) if llm_endpoint_waits else None
+
+        inference_optimization_results = InferenceOptimizationHolder(
+            confidence_intervals=simple_metrics,
+            common_prefixes=common_prefix_results,
+            token_uniqueness=token_uniqueness_results,
+            workflow_runtimes=workflow_runtimes_results,
+            response_cache_savings=response_cache_savings_results,
+            llm_endpoint_waits=llm_endpoint_waits_results)
+        self._write_inference_optimization_results(inference_optimization_results)
+
+        workflow_profiling_reports = ""
+        workflow_profiling_metrics = {}
+
+        if self.profile_config.bottleneck_analysis.enable_simple_stack:
+            workflow_bottlenecks = profile_workflow_bottlenecks_from_chunks(
+                store.iter_chunks(columns=["event_type", "event_timestamp", "UUID", "llm_name", "tool_name"]))
+            workflow_bottlenecks = workflow_bottlenecks.model_dump()
+            workflow_profiling_reports += "\n\n\n" + workflow_bottlenecks["summary"]
+            workflow_profiling_metrics["simple_stack_analysis"] = workflow_bottlenecks["stats"]
+            logger.info("Simple stack analysis complete")
+
+        self._write_workflow_profiling_results(workflow_profiling_reports, workflow_profiling_metrics)
+
+        return ProfilerResults(workflow_runtime_metrics=workflow_runtimes_results,
+                               llm_latency_ci=llm_latency_ci,
+                               response_cache_savings=response_cache_savings_results,
+                               llm_endpoint_waits=llm_endpoint_waits_results)
+
+    @staticmethod
+    def _write_traces_entry(f: TextIO, request_data: dict, first: bool):
+        """
+        Write one request of the combined traces, producing the same file as dumping the list of all requests with
+        ``json.dump(..., indent=2)``.
+        """
+        entry = json.dumps(request_data, indent=2, default=str)
+        # Strings are escaped in JSON, so every newline in the entry is a line break of the indentation
+        f.write(("[\n  " if first else ",\n  ") + entry.replace("\n", "\n  "))
+
+    def _write_inference_optimization_results(self, inference_optimization_results: InferenceOptimizationHolder):
+        if self.write_output and inference_optimization_results:
+            # Save to JSON
+            optimization_results_path = os.path.join(self.output_dir, "inference_optimization.json")
+            with open(optimization_results_path, 'w', encoding='utf-8') as f:
+                json.dump(inference_optimization_results.model_dump(), f, indent=2)
+            logger.info("Wrote inference optimization results to: %s", optimization_results_path)
+
+    def _write_workflow_profiling_results(self, workflow_profiling_reports: str, workflow_profiling_metrics: dict):
+        if self.write_output and workflow_profiling_reports:
+            # Save to text file
+            profiling_report_path = os.path.join(self.output_dir, "workflow_profiling_report.txt")
+            with open(profiling_report_path, 'w', encoding='utf-8') as f:
+                f.write(workflow_profiling_reports)
+            logger.info("Wrote workflow profiling report to: %s", profiling_report_path)
+
+        if self.write_output and workflow_profiling_metrics:
+            # Save to JSON
+            profiling_metrics_path = os.path.join(self.output_dir, "workflow_profiling_metrics.json")
+            with open(profiling_metrics_path, 'w', encoding='utf-8') as f:
+                json.dump(workflow_profiling_metrics, f, indent=2)
+            logger.info("Wrote workflow profiling metrics to: %s", profiling_metrics_path)
 
     # -------------------------------------------------------------------
     # Confidence Intervals / Metrics
     # -------------------------------------------------------------------
+    @staticmethod
+    def _get_workflow_run_times(df: pd.DataFrame) -> list[float]:
+        """
+        Returns the workflow run time of each example in a standardized DataFrame, in example order.
+        """
+        grouped = df.groupby("example_number")["event_timestamp"]
+        return (grouped.max() - grouped.min()).tolist()
+
+    @staticmethod
+    def _get_llm_latencies(df: pd.DataFrame) -> list[float]:
+        """
+        Returns the LLM latencies of the examples in a standardized DataFrame, paired the same way as
+        `_compute_llm_latency_confidence_intervals` pairs them.
+        """
+        latencies = []
+        for _, example_df in df.groupby("example_number"):
+            # A stable sort keeps events with equal timestamps in the order they were recorded
+            example_df = example_df.sort_values("event_timestamp", kind="stable")
+
+            previous_llm_start_time = None
+            for event_type, ts in zip(example_df["event_type"], example_df["event_timestamp"]):
+                if event_type == "LLM_START":
+                    previous_llm_start_time = ts
+                elif event_type == "LLM_END" and previous_llm_start_time is not None:
+                    latencies.append(ts - previous_llm_start_time)
+                    previous_llm_start_time = None
+
+        return latencies
+
     def _compute_workflow_run_time_confidence_intervals(self) -> InferenceMetricsModel:
         """
         Computes 90, 95, 99% confidence intervals for the mean total workflow run time (in seconds).
@@ -355,14 +641,20 @@ class ProfilerRunner:
         if not all_timestamps:
             return InferenceMetricsModel()
 
-        min_ts = min(all_timestamps)
-        max_ts = max(all_timestamps)
+        return self._compute_throughput_from_time_window(min(all_timestamps), max(all_timestamps),
+                                                         len(self.all_requests_data))
+
+    def _compute_throughput_from_time_window(self, min_ts: float, max_ts: float,
+                                             total_requests: int) -> InferenceMetricsModel:
+        """
+        Computes the throughput estimates of `_compute_throughput_estimates` for `total_requests` requests whose
+        events span from `min_ts` to `max_ts`.
+        """
         total_time = max_ts - min_ts
         if total_time <= 0:
             # Can't compute a meaningful throughput if time <= 0
             return InferenceMetricsModel()
 
-        total_requests = len(self.all_requests_data)
         # Single estimate of throughput
         throughput_value = total_requests / total_time
 
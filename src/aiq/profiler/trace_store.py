@@ -0,0 +1,158 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import typing
+from collections.abc import Iterator
+from enum import Enum
+from pathlib import Path
+
+import pandas as pd
+
+from aiq.data_models.intermediate_step import IntermediateStep
+from aiq.profiler.utils import create_standardized_rows
+
+if typing.TYPE_CHECKING:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+# Columns of the standardized rows in the order of `DataFrameRow`, so that a chunk has the same layout as the
+# DataFrame returned by `create_standardized_dataframe`
+_COLUMN_TYPES = (
+    ("event_type", "string"),
+    ("event_timestamp", "float64"),
+    ("example_number", "int64"),
+    ("prompt_tokens", "int64"),
+    ("completion_tokens", "int64"),
+    ("total_tokens", "int64"),
+    ("llm_text_input", "string"),
+    ("llm_text_output", "string"),
+    ("llm_new_token", "string"),
+    ("llm_name", "string"),
+    ("tool_name", "string"),
+    ("function_name", "string"),
+    ("function_id", "string"),
+    ("parent_function_name", "string"),
+    ("parent_function_id", "string"),
+    ("UUID", "string"),
+    ("framework", "string"),
+)
+
+_ENUM_COLUMNS = ("event_type", "framework")
+
+
+def _get_schema() -> "pa.Schema":
+    import pyarrow as pa
+
+    return pa.schema([(name, pa.type_for_alias(type_name)) for name, type_name in _COLUMN_TYPES])
+
+
+class ProfilerTraceStore:
+    """
+    Standardized usage stats of a profiler run, stored in a Parquet file so that runs which are too large to hold in
+    memory can be analyzed a chunk of requests at a time.
+
+    Requests are numbered in the order they are appended, the same way `create_standardized_dataframe` numbers them.
+    Every row group holds complete requests, so each chunk yielded by `iter_chunks` contains all of the rows of the
+    requests in it. Enum columns are stored as their string values.
+    """
+
+    def __init__(self, path: str | Path, examples_per_chunk: int = 100):
+        if examples_per_chunk < 1:
+            raise ValueError("examples_per_chunk must be >= 1")
+
+        self.path = Path(path)
+        self.examples_per_chunk = examples_per_chunk
+        self.num_examples = 0
+
+        self._pending_rows: list[dict] = []
+        self._pending_examples = 0
+        self._writer: "pq.ParquetWriter | None" = None
+        self._closed = False
+
+    def __enter__(self) -> "ProfilerTraceStore":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def append(self, steps: list[IntermediateStep]):
+        """
+        Append the steps of the next request. The steps must provide the `IntermediatePropertyAdaptor` properties.
+        """
+        if self._closed:
+            raise RuntimeError("Cannot append to a closed trace store")
+
+        rows = create_standardized_rows(steps, example_number=self.num_examples)
+        for row in rows:
+            for column in _ENUM_COLUMNS:
+                if isinstance(row[column], Enum):
+                    row[column] = row[column].value
+
+        self._pending_rows.extend(rows)
+        self._pending_examples += 1
+        self.num_examples += 1
+
+        if self._pending_examples >= self.examples_per_chunk:
+            self.flush()
+
+    def flush(self):
+        """
+        Write the buffered requests to the file as a single row group.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if self._writer is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._writer = pq.ParquetWriter(self.path, _get_schema())
+
+        if self._pending_rows:
+            table = pa.Table.from_pylist(self._pending_rows, schema=self._writer.schema)
+            # A single row group per flush keeps the rows of a request from being split across chunks
+            self._writer.write_table(table, row_group_size=len(self._pending_rows))
+
+        self._pending_rows = []
+        self._pending_examples = 0
+
+    def close(self):
+        """
+        Write any buffered requests and finalize the file. The store can only be read once it is closed.
+        """
+        if self._closed:
+            return
+
+        self.flush()
+        self._writer.close()
+        self._writer = None
+        self._closed = True
+        logger.info("Wrote %d requests to trace store: %s", self.num_examples, self.path)
+
+    def iter_chunks(self, columns: list[str] | None = None) -> Iterator[pd.DataFrame]:
+        """
+        Yield the stored rows as DataFrames of complete requests, in the order the requests were appended.
+
+        :param columns: Only read these columns, by default all columns are read.
+        """
+        import pyarrow.parquet as pq
+
+        if not self._closed:
+            raise RuntimeError("The trace store must be closed before it can be read")
+
+        parquet_file = pq.ParquetFile(self.path)
+        for i in range(parquet_file.num_row_groups):
+            yield parquet_file.read_row_group(i, columns=columns).to_pandas()
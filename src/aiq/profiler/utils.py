@@ -145,6 +145,31 @@ def detect_llm_frameworks_in_build_fn(registration: RegisteredFunctionInfo) -> l
 # -------------------------------------------------------------------
 # Create a single standardized DataFrame for all usage stats
 # -------------------------------------------------------------------
+def create_standardized_rows(steps: list[IntermediateStep], example_number: int) -> list[dict]:
+    """
+    Convert the usage stats of a single request into standardized rows, one dict per usage_stats entry.
+    """
+    return [
+        DataFrameRow(event_timestamp=step.event_timestamp,
+                     example_number=example_number,
+                     prompt_tokens=step.token_usage.prompt_tokens,
+                     completion_tokens=step.token_usage.completion_tokens,
+                     total_tokens=step.token_usage.total_tokens,
+                     llm_text_input=step.llm_text_input,
+                     llm_text_output=step.llm_text_output,
+                     llm_new_token=step.llm_text_chunk,
+                     llm_name=step.llm_name,
+                     tool_name=step.tool_name,
+                     function_name=step.function_name,
+                     function_id=step.function_id,
+                     parent_function_name=step.parent_function_name,
+                     parent_function_id=step.parent_function_id,
+                     UUID=step.payload.UUID,
+                     framework=step.framework,
+                     event_type=step.event_type).model_dump() for step in steps
+    ]
+
+
 def create_standardized_dataframe(requests_data: list[list[IntermediateStep]]) -> pd.DataFrame:
     """
     Merge usage stats for *all* requests into one DataFrame, each row representing a usage_stats entry.
@@ -153,26 +178,7 @@ def create_standardized_dataframe(requests_data: list[list[IntermediateStep]]) -
     all_rows = []
     try:
         for i, steps in enumerate(requests_data):
-            for step in steps:
-                # Create a DataFrameRow
-                all_rows.append(
-                    DataFrameRow(event_timestamp=step.event_timestamp,
-                                 example_number=i,
-                                 prompt_tokens=step.token_usage.prompt_tokens,
-                                 completion_tokens=step.token_usage.completion_tokens,
-                                 total_tokens=step.token_usage.total_tokens,
-                                 llm_text_input=step.llm_text_input,
-                                 llm_text_output=step.llm_text_output,
-                                 llm_new_token=step.llm_text_chunk,
-                                 llm_name=step.llm_name,
-                                 tool_name=step.tool_name,
-                                 function_name=step.function_name,
-                                 function_id=step.function_id,
-                                 parent_function_name=step.parent_function_name,
-                                 parent_function_id=step.parent_function_id,
-                                 UUID=step.payload.UUID,
-                                 framework=step.framework,
-                                 event_type=step.event_type).model_dump(), )
+            all_rows.extend(create_standardized_rows(steps, example_number=i))
 
     except Exception as e:
         logger.exception("Error creating standardized DataFrame: %s", e, exc_info=True)
@@ -17,15 +17,27 @@ from __future__ import annotations
 
 import importlib.metadata
 import logging
+import os
 import time
+import typing
 from contextlib import asynccontextmanager
 from enum import IntFlag
 from enum import auto
+from functools import partial
 from functools import reduce
 
 from aiq.builder.workflow_builder import WorkflowBuilder
 from aiq.cli.type_registry import GlobalTypeRegistry
+from aiq.cli.type_registry import TypeRegistry
+from aiq.data_models.component import AIQComponentEnum
 from aiq.data_models.config import AIQConfig
+from aiq.runtime.plugin_manifest import PluginManifest
+from aiq.runtime.plugin_manifest import Registration
+from aiq.runtime.plugin_manifest import compute_fingerprint
+from aiq.runtime.plugin_manifest import entry_point_id
+from aiq.runtime.plugin_manifest import get_manifest_path
+from aiq.runtime.plugin_manifest import get_referenced_types
+from aiq.runtime.plugin_manifest import snapshot_registry
 from aiq.runtime.session import AIQSessionManager
 from aiq.utils.data_models.schema_validator import validate_schema
 from aiq.utils.debugging_utils import is_debugger_attached
@@ -34,6 +46,9 @@ from aiq.utils.type_utils import StrPath
 
 logger = logging.getLogger(__name__)
 
+# Registrations made by each entry point loaded in this process, keyed by entry point id
+_entry_point_registrations: dict[str, set[Registration]] = {}
+
 
 class PluginTypes(IntFlag):
     COMPONENT = auto()
@@ -63,8 +78,8 @@ class PluginTypes(IntFlag):
 
 def load_config(config_file: StrPath) -> AIQConfig:
     """
-    This is the primary entry point for loading an AIQ Toolkit configuration file. It ensures that all plugins are
-    loaded and then validates the configuration file against the AIQConfig schema.
+    This is the primary entry point for loading an AIQ Toolkit configuration file. It ensures that the plugins used by
+    the configuration are loaded and then validates the configuration file against the AIQConfig schema.
 
     Parameters
     ----------
@@ -77,13 +92,13 @@ def load_config(config_file: StrPath) -> AIQConfig:
         The validated AIQConfig object
     """
 
-    # Ensure all of the plugins are loaded
-    discover_and_register_plugins(PluginTypes.CONFIG_OBJECT)
-
     config_yaml = yaml_load(config_file)
 
+    # Ensure the plugins used by the configuration are loaded
+    discover_and_register_config_plugins(config_yaml)
+
     # Validate configuration adheres to AIQ Toolkit schemas
-    validated_aiq_config = validate_schema(config_yaml, AIQConfig)
+    validated_aiq_config = validate_schema(config_yaml, AIQConfig.validate_narrowed)
 
     return validated_aiq_config
 
@@ -137,21 +152,36 @@ def discover_entrypoints(plugin_type: PluginTypes):
     return aiq_plugins
 
 
-def discover_and_register_plugins(plugin_type: PluginTypes):
+def is_lazy_plugin_loading_enabled() -> bool:
     """
-    Discover all the requested plugin types which were registered via an entry point group and register them into the
-    GlobalTypeRegistry.
+    Lazy plugin loading is opt-in, it is enabled by setting the `AIQ_LAZY_PLUGIN_LOADING` environment variable to a
+    true value. Plugins which register components as a side effect of importing a module, rather than from the module
+    of their entry point, can be missed by it.
     """
+    return os.getenv("AIQ_LAZY_PLUGIN_LOADING", "0").strip().lower() in ("1", "true", "yes", "on")
 
-    # Get the entry points for the specified groups
-    aiq_plugins = discover_entrypoints(plugin_type)
+
+def _load_entry_points(entry_points: typing.Iterable[importlib.metadata.EntryPoint]):
+    """
+    Load the entry points which were not loaded yet. When lazy plugin loading is enabled, the components each of them
+    registers are recorded for the manifest.
+    """
+
+    registry = GlobalTypeRegistry.get()
+
+    # A single running snapshot, each entry point's registrations are the difference with the next one
+    snapshot = snapshot_registry(registry) if is_lazy_plugin_loading_enabled() else None
 
     count = 0
 
     # Pause registration hooks for performance. This is useful when loading a large number of plugins.
-    with GlobalTypeRegistry.get().pause_registration_changed_hooks():
+    with registry.pause_registration_changed_hooks():
+
+        for entry_point in entry_points:
+            ep_id = entry_point_id(entry_point)
+            if (ep_id in _entry_point_registrations):
+                continue
 
-        for entry_point in aiq_plugins:
             try:
                 logger.debug("Loading module '%s' from entry point '%s'...", entry_point.module, entry_point.name)
 
@@ -186,3 +216,129 @@ def discover_and_register_plugins(plugin_type: PluginTypes):
 
             finally:
                 count += 1
+
+                if (snapshot is None):
+                    _entry_point_registrations[ep_id] = set()
+                else:
+                    current = snapshot_registry(registry)
+                    _entry_point_registrations[ep_id] = current - snapshot
+                    snapshot = current
+
+
+def discover_and_register_plugins(plugin_type: PluginTypes):
+    """
+    Discover all the requested plugin types which were registered via an entry point group and register them into the
+    GlobalTypeRegistry.
+    """
+
+    # Get the entry points for the specified groups
+    aiq_plugins = discover_entrypoints(plugin_type)
+
+    _load_entry_points(aiq_plugins)
+
+    if ((plugin_type & PluginTypes.CONFIG_OBJECT) == PluginTypes.CONFIG_OBJECT):
+        # Everything a configuration file can reference is loaded now, nothing is left to load on demand
+        GlobalTypeRegistry.get().set_deferred_plugin_loader(None)
+
+        if (is_lazy_plugin_loading_enabled()):
+            _update_manifest(discover_entrypoints(PluginTypes.CONFIG_OBJECT))
+
+
+def _update_manifest(entry_points: list[importlib.metadata.EntryPoint]):
+    """
+    Write the manifest of *entry_points* if the cached one is missing or out of date.
+    """
+
+    manifest_path = get_manifest_path()
+    fingerprint = compute_fingerprint(entry_points)
+
+    if (PluginManifest.load(manifest_path, fingerprint) is not None):
+        return
+
+    registrations = {}
+    for entry_point in entry_points:
+        ep_id = entry_point_id(entry_point)
+        if (ep_id not in _entry_point_registrations):
+            return
+        registrations[ep_id] = _entry_point_registrations[ep_id]
+
+    PluginManifest.from_registrations(fingerprint, registrations).save(manifest_path)
+    logger.debug("Wrote plugin manifest for %d entry points to %s", len(registrations), manifest_path)
+
+
+def _is_registered(registry: TypeRegistry, component_type: AIQComponentEnum, type_name: str) -> bool:
+    return any(type_name in (info.full_type, info.local_name)
+               for info in registry.get_infos_by_type(component_type).values())
+
+
+def discover_and_register_config_plugins(config_dict: dict[str, typing.Any]):
+    """
+    Register the plugins needed to validate and build the configuration *config_dict* into the GlobalTypeRegistry.
+
+    When lazy plugin loading is enabled, a cached manifest of the components registered by each plugin is used to only
+    import the plugins providing the components referenced by the configuration, along with the plugins adapting
+    them to the LLM frameworks used by the referenced functions. The remaining plugins are loaded the first time the
+    GlobalTypeRegistry is asked for a client or tool wrapper which is not registered. All plugins are loaded, and the
+    manifest is regenerated, when there is no up to date manifest or the configuration references a component it
+    does not contain.
+
+    Parameters
+    ----------
+    config_dict : dict[str, typing.Any]
+        The configuration file as a dictionary, before validation
+    """
+
+    if (not is_lazy_plugin_loading_enabled()):
+        discover_and_register_plugins(PluginTypes.CONFIG_OBJECT)
+        return
+
+    entry_points = discover_entrypoints(PluginTypes.CONFIG_OBJECT)
+    manifest = PluginManifest.load(get_manifest_path(), compute_fingerprint(entry_points))
+
+    if (manifest is None):
+        logger.debug("No up to date plugin manifest, loading all plugins")
+        discover_and_register_plugins(PluginTypes.CONFIG_OBJECT)
+        return
+
+    registry = GlobalTypeRegistry.get()
+    entry_points_by_id = {entry_point_id(entry_point): entry_point for entry_point in entry_points}
+    referenced_types = get_referenced_types(config_dict)
+
+    required_ids: set[str] = set()
+    for component_type, type_names in referenced_types.items():
+        for type_name in type_names:
+            if (_is_registered(registry, component_type, type_name)):
+                continue
+
+            ep_ids = manifest.get_entry_points(component_type, type_name)
+            if (not ep_ids):
+                logger.debug("The %s `%s` is not in the plugin manifest, loading all plugins",
+                             component_type.value,
+                             type_name)
+                discover_and_register_plugins(PluginTypes.CONFIG_OBJECT)
+                return
+
+            required_ids.update(ep_ids)
+
+    _load_entry_points(entry_points_by_id[ep_id] for ep_id in sorted(required_ids) if ep_id in entry_points_by_id)
+
+    # Load the clients and tool wrappers for the LLM frameworks the referenced functions are built with
+    function_types = referenced_types.get(AIQComponentEnum.FUNCTION, set())
+    llm_frameworks = {
+        llm_framework
+        for info in registry.get_registered_functions() if function_types & {info.full_type, info.local_name}
+        for llm_framework in info.framework_wrappers
+    }
+    framework_ids = {
+        ep_id
+        for llm_framework in llm_frameworks for ep_id in manifest.get_framework_entry_points(llm_framework)
+    }
+
+    _load_entry_points(entry_points_by_id[ep_id] for ep_id in sorted(framework_ids) if ep_id in entry_points_by_id)
+
+    if (len(_entry_point_registrations.keys() & entry_points_by_id.keys()) < len(entry_points_by_id)):
+        registry.set_deferred_plugin_loader(partial(discover_and_register_plugins, PluginTypes.CONFIG_OBJECT))
+
+    logger.debug("Loaded %d of %d plugins referenced by the configuration",
+                 len(required_ids | framework_ids),
+                 len(entry_points_by_id))
@@ -0,0 +1,243 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import json
+import logging
+import os
+import typing
+from collections.abc import Iterable
+from importlib.metadata import EntryPoint
+from pathlib import Path
+
+from platformdirs import user_cache_dir
+from pydantic import BaseModel
+
+from aiq.data_models.component import AIQComponentEnum
+
+if typing.TYPE_CHECKING:
+    from aiq.cli.type_registry import TypeRegistry
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE_NAME = "plugin_manifest.json"
+
+# A registration made while loading an entry point: (component type or `framework:<name>`, registered name)
+Registration = tuple[str, str]
+
+# Component types which can be referenced with `_type` in a configuration file
+CONFIG_COMPONENT_TYPES = (
+    AIQComponentEnum.FRONT_END,
+    AIQComponentEnum.FUNCTION,
+    AIQComponentEnum.LLM_PROVIDER,
+    AIQComponentEnum.EMBEDDER_PROVIDER,
+    AIQComponentEnum.EVALUATOR,
+    AIQComponentEnum.MEMORY,
+    AIQComponentEnum.OBJECT_STORE,
+    AIQComponentEnum.RETRIEVER_PROVIDER,
+    AIQComponentEnum.ITS_STRATEGY,
+    AIQComponentEnum.LOGGING,
+    AIQComponentEnum.TRACING,
+)
+
+# Components which adapt a provider or function to an LLM framework, recorded by the framework they support
+_FRAMEWORK_COMPONENT_TYPES = (
+    AIQComponentEnum.LLM_CLIENT,
+    AIQComponentEnum.EMBEDDER_CLIENT,
+    AIQComponentEnum.RETRIEVER_CLIENT,
+)
+
+_FRAMEWORK_PREFIX = "framework:"
+
+
+def get_manifest_path() -> Path:
+    """
+    The location of the cached manifest. The directory can be changed with the `AIQ_CACHE_DIR` environment variable.
+    """
+    return Path(os.getenv("AIQ_CACHE_DIR", user_cache_dir(appname="aiq"))) / MANIFEST_FILE_NAME
+
+
+def entry_point_id(entry_point: EntryPoint) -> str:
+    return f"{entry_point.group}:{entry_point.name}"
+
+
+def compute_fingerprint(entry_points: Iterable[EntryPoint]) -> str:
+    """
+    Hash of the plugin entry points and the versions of the distributions providing them. Installing, removing or
+    upgrading a plugin distribution changes the fingerprint and invalidates the manifest.
+    """
+    items = []
+    for entry_point in entry_points:
+        dist = entry_point.dist
+        dist_id = f"{dist.name}=={dist.version}" if dist is not None else ""
+        items.append(f"{entry_point_id(entry_point)}={entry_point.value}@{dist_id}")
+
+    return hashlib.sha256("\n".join(sorted(items)).encode("utf-8")).hexdigest()
+
+
+def snapshot_registry(registry: "TypeRegistry") -> set[Registration]:
+    """
+    Return everything registered in *registry* which the manifest records. Comparing the snapshots taken after loading
+    consecutive entry points gives the registrations made by each of them.
+    """
+    snapshot: set[Registration] = set()
+
+    for component_type in CONFIG_COMPONENT_TYPES:
+        snapshot.update((component_type.value, info.full_type)
+                        for info in registry.get_infos_by_type(component_type).values())
+
+    for component_type in _FRAMEWORK_COMPONENT_TYPES:
+        snapshot.update((f"{_FRAMEWORK_PREFIX}{info.llm_framework}", f"{component_type.value}/{info.full_type}")
+                        for info in registry.get_infos_by_type(component_type).values())
+
+    snapshot.update((f"{_FRAMEWORK_PREFIX}{llm_framework}", AIQComponentEnum.TOOL_WRAPPER.value)
+                    for llm_framework in registry.get_infos_by_type(AIQComponentEnum.TOOL_WRAPPER))
+
+    return snapshot
+
+
+def get_referenced_types(config_dict: dict[str, typing.Any]) -> dict[AIQComponentEnum, set[str]]:
+    """
+    Collect the `_type` values of every component in a configuration file, by component type.
+
+    Parameters
+    ----------
+    config_dict : dict[str, typing.Any]
+        The configuration file as a dictionary, before validation
+
+    Returns
+    -------
+    dict[AIQComponentEnum, set[str]]
+        The local or full type names referenced for each component type
+    """
+
+    def _type_of(component: typing.Any) -> str | None:
+        if not isinstance(component, dict):
+            return None
+        type_name = component.get("_type", component.get("type"))
+        return type_name if isinstance(type_name, str) else None
+
+    def _types_of(components: typing.Any) -> set[str]:
+        if not isinstance(components, dict):
+            return set()
+        return {type_name for type_name in map(_type_of, components.values()) if type_name is not None}
+
+    general = config_dict.get("general") or {}
+    telemetry = general.get("telemetry") or {}
+    evaluation = config_dict.get("eval") or {}
+
+    referenced = {
+        AIQComponentEnum.FUNCTION: _types_of(config_dict.get("functions")),
+        AIQComponentEnum.LLM_PROVIDER: _types_of(config_dict.get("llms")),
+        AIQComponentEnum.EMBEDDER_PROVIDER: _types_of(config_dict.get("embedders")),
+        AIQComponentEnum.MEMORY: _types_of(config_dict.get("memory")),
+        AIQComponentEnum.OBJECT_STORE: _types_of(config_dict.get("object_stores")),
+        AIQComponentEnum.RETRIEVER_PROVIDER: _types_of(config_dict.get("retrievers")),
+        AIQComponentEnum.ITS_STRATEGY: _types_of(config_dict.get("its_strategies")),
+        AIQComponentEnum.EVALUATOR: _types_of(evaluation.get("evaluators")),
+        AIQComponentEnum.LOGGING: _types_of(telemetry.get("logging")),
+        AIQComponentEnum.TRACING: _types_of(telemetry.get("tracing")),
+        AIQComponentEnum.FRONT_END: set(),
+    }
+
+    for component_type, component in ((AIQComponentEnum.FUNCTION, config_dict.get("workflow")),
+                                      (AIQComponentEnum.FRONT_END, general.get("front_end"))):
+        type_name = _type_of(component)
+        if type_name is not None:
+            referenced[component_type].add(type_name)
+
+    return {component_type: names for component_type, names in referenced.items() if names}
+
+
+class PluginManifest(BaseModel):
+    """
+    Records which plugin entry point registers each component, so that only the entry points referenced by a
+    configuration file need to be imported.
+    """
+
+    fingerprint: str
+
+    # component type -> local or full type name -> ids of the entry points registering it
+    components: dict[str, dict[str, list[str]]] = {}
+
+    # LLM framework -> ids of the entry points registering clients or tool wrappers for it
+    frameworks: dict[str, list[str]] = {}
+
+    @classmethod
+    def from_registrations(cls, fingerprint: str, registrations: dict[str, set[Registration]]) -> "PluginManifest":
+        """
+        Build a manifest from the registrations made by each entry point, keyed by entry point id.
+        """
+        components: dict[str, dict[str, list[str]]] = {}
+        frameworks: dict[str, list[str]] = {}
+
+        for ep_id, entry_point_registrations in sorted(registrations.items()):
+            for kind, name in sorted(entry_point_registrations):
+                if kind.startswith(_FRAMEWORK_PREFIX):
+                    ep_ids = frameworks.setdefault(kind[len(_FRAMEWORK_PREFIX):], [])
+                    if ep_id not in ep_ids:
+                        ep_ids.append(ep_id)
+                    continue
+
+                # Components can be referenced by their full type or, when it is unique, their local name
+                names = components.setdefault(kind, {})
+                for type_name in {name, name.split("/")[-1]}:
+                    ep_ids = names.setdefault(type_name, [])
+                    if ep_id not in ep_ids:
+                        ep_ids.append(ep_id)
+
+        return cls(fingerprint=fingerprint, components=components, frameworks=frameworks)
+
+    def get_entry_points(self, component_type: AIQComponentEnum, type_name: str) -> list[str]:
+        """
+        The ids of the entry points registering *type_name*. Empty if the type is not in the manifest.
+        """
+        return self.components.get(component_type.value, {}).get(type_name, [])
+
+    def get_framework_entry_points(self, llm_framework: str) -> list[str]:
+        return self.frameworks.get(llm_framework, [])
+
+    @staticmethod
+    def load(path: Path, fingerprint: str) -> "PluginManifest | None":
+        """
+        Read the manifest at *path*. Returns `None` if there is no manifest, it cannot be read or it was generated for
+        a different set of installed plugins.
+        """
+        try:
+            manifest = PluginManifest.model_validate_json(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logger.debug("Ignoring unreadable plugin manifest: %s", path, exc_info=True)
+            return None
+
+        if manifest.fingerprint != fingerprint:
+            logger.debug("Plugin manifest %s is out of date", path)
+            return None
+
+        return manifest
+
+    def save(self, path: Path) -> None:
+        """
+        Write the manifest to *path*. Failures are logged, since the manifest is only an optimization.
+        """
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(self.model_dump(), indent=2), encoding="utf-8")
+            # Replace atomically so concurrent processes never read a partial manifest
+            os.replace(tmp_path, path)
+        except OSError:
+            logger.debug("Unable to write plugin manifest: %s", path, exc_info=True)
@@ -100,6 +100,9 @@ class AIQRunner:
             function_id="root",
         ))
 
+        # Results of `request` scoped function caches are only reused within this run
+        self._context_state.function_cache_backends.set({})
+
         if (self._state == AIQRunnerState.UNINITIALIZED):
             self._state = AIQRunnerState.INITIALIZED
         else:
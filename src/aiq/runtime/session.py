@@ -29,6 +29,8 @@ from aiq.builder.workflow import Workflow
 from aiq.data_models.config import AIQConfig
 from aiq.data_models.interactive import HumanResponse
 from aiq.data_models.interactive import InteractionPrompt
+from aiq.data_models.rate_limit_mixin import RequestPriority
+from aiq.utils.llm_rate_limiter import llm_request_priority
 
 _T = typing.TypeVar("_T")
 
@@ -39,7 +41,7 @@ class UserManagerBase:
 
 class AIQSessionManager:
 
-    def __init__(self, workflow: Workflow, max_concurrency: int = 8):
+    def __init__(self, workflow: Workflow, max_concurrency: int = 8, priority: RequestPriority | None = None):
         """
         The AIQSessionManager class is used to run and manage a user workflow session. It runs and manages the context,
         and configuration of a workflow with the specified concurrency.
@@ -50,6 +52,8 @@ class AIQSessionManager:
             The workflow to run
         max_concurrency : int, optional
             The maximum number of simultaneous workflow invocations, by default 8
+        priority : RequestPriority | None, optional
+            The priority of the model requests made by the workflow runs, by default the priority of the caller
         """
 
         if (workflow is None):
@@ -58,6 +62,7 @@ class AIQSessionManager:
         self._workflow: Workflow = workflow
 
         self._max_concurrency = max_concurrency
+        self._priority = priority
         self._context_state = AIQContextState.get()
         self._context = AIQContext(self._context_state)
 
@@ -121,8 +126,9 @@ class AIQSessionManager:
             for k, v in self._saved_context.items():
                 k.set(v)
 
-            async with self._workflow.run(message) as runner:
-                yield runner
+            with llm_request_priority(self._priority) if self._priority is not None else nullcontext():
+                async with self._workflow.run(message) as runner:
+                    yield runner
 
     def set_metadata_from_http_request(self, request: Request | None) -> None:
         """
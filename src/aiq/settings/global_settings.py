@@ -51,6 +51,9 @@ class Settings(HashableBaseModel):
     _settings_changed_hooks: typing.ClassVar[list[Callable[[], None]]] = []
     _settings_changed_hooks_active: bool = True
 
+    # Registration key of the type registry the annotations were last computed for
+    _registration_key: typing.ClassVar[int | None] = None
+
     @field_validator("channels", mode="wrap")
     @classmethod
     def validate_components(cls, value: typing.Any, handler: ValidatorFunctionWrapHandler, info: ValidationInfo):
@@ -97,6 +100,12 @@ class Settings(HashableBaseModel):
     @classmethod
     def rebuild_annotations(cls):
 
+        registration_key = GlobalTypeRegistry.get().get_registration_key()
+
+        # The annotations are unchanged unless the set of registered types has changed
+        if (registration_key == cls._registration_key):
+            return
+
         def compute_annotation(cls: type[TypedBaseModelT], registrations: list[RegisteredInfo[TypedBaseModelT]]):
 
             while (len(registrations) < 2):
@@ -137,6 +146,8 @@ class Settings(HashableBaseModel):
         if (should_rebuild):
             cls.model_rebuild(force=True)
 
+        cls._registration_key = registration_key
+
     @property
     def channel_names(self) -> list:
         return list(self.channels.keys())
@@ -19,8 +19,7 @@ import textwrap
 from typing import Any
 from urllib.parse import urljoin
 
-import requests
-import requests.adapters
+import httpx
 from pydantic import HttpUrl
 
 from aiq.utils.type_utils import override
@@ -41,35 +40,57 @@ class Sandbox(abc.ABC):
             Can also be specified through NEMO_SKILLS_SSH_SERVER env var.
         ssh_key_path: Optional[str] = None - Path to the ssh key for tunneling.
             Can also be specified through NEMO_SKILLS_SSH_KEY_PATH env var.
+        max_connections: int = 1500 - Maximum number of concurrent connections to the sandbox server.
+        max_retries: int = 3 - Number of times a request is retried when connecting to the sandbox server fails.
     """
 
     def __init__(
         self,
         *,
         uri: HttpUrl,
+        max_connections: int = 1500,
+        max_retries: int = 3,
     ):
         self.url: str = self._get_execute_url(uri)
-        session = requests.Session()
-        adapter = requests.adapters.HTTPAdapter(pool_maxsize=1500, pool_connections=1500, max_retries=3)
-        session.mount('http://', adapter)
-        session.mount('https://', adapter)
-        self.http_session: requests.Session = session
-
-    def _send_request(self, request: dict[str, Any], timeout_seconds: float) -> dict[str, str]:
-        output = self.http_session.post(
+        self._max_connections = max_connections
+        self._max_retries = max_retries
+        self._http_client: httpx.AsyncClient | None = None
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """
+        The asynchronous HTTP client used to send requests to the sandbox. The client, and its connection pool, is
+        shared by all requests of this sandbox and is created on first use.
+        """
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=self._max_connections,
+                                    max_keepalive_connections=self._max_connections),
+                transport=httpx.AsyncHTTPTransport(retries=self._max_retries),
+            )
+        return self._http_client
+
+    async def aclose(self):
+        """Close the HTTP client and its connection pool."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    async def _send_request(self, request: dict[str, Any], timeout_seconds: float) -> dict[str, str]:
+        output = await self.http_client.post(
             url=self.url,
-            data=json.dumps(request),
+            content=json.dumps(request),
             timeout=timeout_seconds,
             headers={"Content-Type": "application/json"},
         )
         # retrying 502 errors
         if output.status_code == 502:
-            raise requests.exceptions.Timeout
+            raise httpx.TimeoutException("Bad gateway")
 
         return self._parse_request_output(output)
 
     @abc.abstractmethod
-    def _parse_request_output(self, output: requests.Response) -> dict[str, str]:
+    def _parse_request_output(self, output: httpx.Response) -> dict[str, str]:
         pass
 
     @abc.abstractmethod
@@ -134,23 +155,23 @@ class Sandbox(abc.ABC):
         """).strip()
         request = self._prepare_request(code_to_execute, timeout_seconds)
         try:
-            return self._send_request(request, timeout_seconds)
-        except requests.exceptions.Timeout:
+            return await self._send_request(request, timeout_seconds)
+        except httpx.TimeoutException:
             return {"process_status": "timeout", "stdout": "", "stderr": "Timed out\n"}
 
 
 class LocalSandbox(Sandbox):
     """Locally hosted sandbox."""
 
-    def __init__(self, *, uri: HttpUrl):
-        super().__init__(uri=uri)
+    def __init__(self, *, uri: HttpUrl, **kwargs):
+        super().__init__(uri=uri, **kwargs)
 
     @override
     def _get_execute_url(self, uri: HttpUrl) -> str:
         return urljoin(str(uri), "execute")
 
     @override
-    def _parse_request_output(self, output: requests.Response) -> dict[str, str]:
+    def _parse_request_output(self, output: httpx.Response) -> dict[str, str]:
         try:
             output_json = output.json()
             assert isinstance(output_json, dict)
@@ -218,8 +239,8 @@ class LocalSandbox(Sandbox):
         # Our server already handles stdout/stderr capture and error handling
         request = self._prepare_request(actual_code, timeout_seconds, language)
         try:
-            return self._send_request(request, timeout_seconds)
-        except requests.exceptions.Timeout:
+            return await self._send_request(request, timeout_seconds)
+        except httpx.TimeoutException:
             return {"process_status": "timeout", "stdout": "", "stderr": "Timed out\n"}
 
 
@@ -231,7 +252,7 @@ class PistonSandbox(Sandbox):
         return urljoin(str(uri), "execute")
 
     @override
-    def _parse_request_output(self, output: requests.Response) -> dict[str, str]:
+    def _parse_request_output(self, output: httpx.Response) -> dict[str, str]:
         output_json = output.json()
         assert isinstance(output_json, dict)
         assert 'run' in output_json
@@ -19,8 +19,11 @@ import logging
 import multiprocessing
 import os
 import resource
+import threading
 from enum import Enum
 from io import StringIO
+from queue import Empty
+from queue import SimpleQueue
 
 from flask import Flask
 from flask import Request
@@ -33,6 +36,20 @@ app = Flask(__name__)
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.WARNING)
 
+# "pool" executes code in pre-started, recyclable worker processes, "process" starts a new process for every request
+SANDBOX_EXECUTION_MODE = os.environ.get("SANDBOX_EXECUTION_MODE", "pool")
+# Number of pre-started worker processes per server process
+SANDBOX_NUM_WORKERS = int(os.environ.get("SANDBOX_NUM_WORKERS", "2"))
+# Number of snippets a worker executes before it is replaced, bounding state leaked between snippets
+SANDBOX_MAX_TASKS_PER_WORKER = int(os.environ.get("SANDBOX_MAX_TASKS_PER_WORKER", "50"))
+# Address space limit of the processes executing code
+# 10gb - somehow with a smaller limit the server dies when numpy is used
+SANDBOX_MEMORY_LIMIT_BYTES = int(os.environ.get("SANDBOX_MEMORY_LIMIT_BYTES", str(1024 * 1024 * 1024 * 10)))
+# Workers whose peak resident memory exceeds this value are replaced after the current snippet
+SANDBOX_WORKER_MAX_RSS_BYTES = int(os.environ.get("SANDBOX_WORKER_MAX_RSS_BYTES", str(1024 * 1024 * 1024)))
+# Number of seconds a request waits for an idle worker before it fails
+SANDBOX_WORKER_ACQUIRE_TIMEOUT = float(os.environ.get("SANDBOX_WORKER_ACQUIRE_TIMEOUT", "60"))
+
 
 class CodeExecutionStatus(str, Enum):
     """
@@ -79,7 +96,24 @@ def add_hsts_header(response):
 
 def execute_python(generated_code: str, timeout: float) -> CodeExecutionResult:
     """
-    Execute Python code in a subprocess.
+    Execute Python code in a separate process, using the execution mode configured with `SANDBOX_EXECUTION_MODE`.
+
+    Args:
+        generated_code: The code to execute
+        timeout: The timeout for the execution
+
+    Returns:
+        CodeExecutionResult object containing the execution result
+    """
+    if SANDBOX_EXECUTION_MODE == "process":
+        return execute_python_in_process(generated_code, timeout)
+
+    return get_worker_pool().execute(generated_code, timeout)
+
+
+def execute_python_in_process(generated_code: str, timeout: float) -> CodeExecutionResult:
+    """
+    Execute Python code in a new subprocess.
 
     Args:
         generated_code: The code to execute
@@ -103,42 +137,244 @@ def execute_python(generated_code: str, timeout: float) -> CodeExecutionResult:
     return queue.get()
 
 
-# need to memory-limit to avoid common errors of allocating too much
-# but this has to be done in a subprocess to not crush server itself
-def execute_code_subprocess(generated_code: str, queue):
+def set_resource_limits(limit: int = SANDBOX_MEMORY_LIMIT_BYTES):
     """
-    Execute code in a subprocess.
+    Limit the memory of the current process.
 
     Args:
-        generated_code: The code to execute
-        queue: The queue to put the result in
+        limit: The address space and data segment limit in bytes
     """
-
-    logger.debug("execute_code_subprocess started, PID: %s", os.getpid())
-
     try:
-        limit = 1024 * 1024 * 1024 * 10  # 10gb - somehow with a smaller limit the server dies when numpy is used
         resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
         resource.setrlimit(resource.RLIMIT_DATA, (limit, limit))
     except Exception as e:
         logger.error("Failed to set resource limits, PID: %s, error: %s", os.getpid(), e)
 
+
+def run_code(generated_code: str) -> CodeExecutionResult:
+    """
+    Execute code in the current process, capturing its output.
+
+    Args:
+        generated_code: The code to execute
+
+    Returns:
+        CodeExecutionResult object containing the execution result
+    """
     stdout_capture = StringIO()
     stderr_capture = StringIO()
     try:
         with contextlib.redirect_stdout(stdout_capture), contextlib.redirect_stderr(stderr_capture):
             exec(generated_code, {})  # pylint: disable=W0122
-        logger.debug("execute_code_subprocess finished, PID: %s", os.getpid())
-        queue.put(CodeExecutionResult(stdout=stdout_capture.getvalue(), stderr=stderr_capture.getvalue()))
+        logger.debug("run_code finished, PID: %s", os.getpid())
+        return CodeExecutionResult(stdout=stdout_capture.getvalue(), stderr=stderr_capture.getvalue())
     except Exception as e:
         import traceback
         with contextlib.redirect_stderr(stderr_capture):
             traceback.print_exc()
-        logger.debug("execute_code_subprocess failed, PID: %s, error: %s", os.getpid(), e)
-        queue.put(
-            CodeExecutionResult(process_status=CodeExecutionStatus.ERROR,
-                                stdout=stdout_capture.getvalue(),
-                                stderr=stderr_capture.getvalue()))
+        logger.debug("run_code failed, PID: %s, error: %s", os.getpid(), e)
+        return CodeExecutionResult(process_status=CodeExecutionStatus.ERROR,
+                                   stdout=stdout_capture.getvalue(),
+                                   stderr=stderr_capture.getvalue())
+
+
+# need to memory-limit to avoid common errors of allocating too much
+# but this has to be done in a subprocess to not crush server itself
+def execute_code_subprocess(generated_code: str, queue):
+    """
+    Execute code in a subprocess.
+
+    Args:
+        generated_code: The code to execute
+        queue: The queue to put the result in
+    """
+
+    logger.debug("execute_code_subprocess started, PID: %s", os.getpid())
+
+    set_resource_limits()
+    queue.put(run_code(generated_code))
+
+
+def sandbox_worker_main(conn, memory_limit: int):
+    """
+    Main loop of a pooled sandbox worker. Receives code over the pipe and sends back the result along with the peak
+    resident memory of the worker, until the pipe is closed.
+
+    Args:
+        conn: The worker's end of the pipe
+        memory_limit: The memory limit of the worker in bytes
+    """
+    logger.debug("sandbox worker started, PID: %s", os.getpid())
+
+    set_resource_limits(memory_limit)
+
+    while True:
+        try:
+            generated_code = conn.recv()
+        except EOFError:
+            break
+
+        result = run_code(generated_code)
+        # ru_maxrss is reported in kilobytes on Linux
+        max_rss_bytes = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+        conn.send((result, max_rss_bytes))
+
+
+class SandboxWorker:
+    """
+    A pre-started process which executes code snippets sent to it over a pipe.
+    """
+
+    def __init__(self, memory_limit: int):
+        self._conn, child_conn = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(target=sandbox_worker_main, args=(child_conn, memory_limit), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.num_tasks = 0
+        self.max_rss_bytes = 0
+
+    def execute(self, generated_code: str, timeout: float) -> CodeExecutionResult | None:
+        """
+        Execute code in the worker.
+
+        Returns:
+            The execution result, or None if the worker timed out or died and needs to be replaced
+        """
+        self.num_tasks += 1
+        try:
+            self._conn.send(generated_code)
+            if not self._conn.poll(timeout):
+                return CodeExecutionResult(process_status=CodeExecutionStatus.TIMEOUT, stdout="", stderr="Timed out\n")
+            result, self.max_rss_bytes = self._conn.recv()
+            return result
+        except (EOFError, OSError) as e:
+            logger.debug("sandbox worker %s died: %s", self.process.pid, e)
+            return None
+
+    def kill(self):
+        self._conn.close()
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join()
+
+
+class SandboxWorkerPool:
+    """
+    Pool of pre-started sandbox workers. Short snippets avoid the cost of starting a new process for every request,
+    while workers are still replaced after `max_tasks_per_worker` snippets, when a snippet times out or crashes the
+    worker, and when the worker's peak resident memory exceeds `max_rss_bytes`.
+
+    A worker which cannot be replaced leaves an empty slot in the pool, and starting its replacement is retried by the
+    next request using the slot, so the pool never shrinks.
+
+    Args:
+        num_workers: The number of pre-started workers
+        max_tasks_per_worker: The number of snippets a worker executes before it is replaced
+        memory_limit: The memory limit of each worker in bytes
+        max_rss_bytes: The peak resident memory after which a worker is replaced
+        acquire_timeout: The number of seconds a request waits for an idle worker before it fails
+    """
+
+    def __init__(self,
+                 num_workers: int = SANDBOX_NUM_WORKERS,
+                 max_tasks_per_worker: int = SANDBOX_MAX_TASKS_PER_WORKER,
+                 memory_limit: int = SANDBOX_MEMORY_LIMIT_BYTES,
+                 max_rss_bytes: int = SANDBOX_WORKER_MAX_RSS_BYTES,
+                 acquire_timeout: float = SANDBOX_WORKER_ACQUIRE_TIMEOUT):
+        self.num_workers = num_workers
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self.memory_limit = memory_limit
+        self.max_rss_bytes = max_rss_bytes
+        self.acquire_timeout = acquire_timeout
+
+        # None marks a slot whose worker could not be started
+        self._idle_workers: SimpleQueue[SandboxWorker | None] = SimpleQueue()
+        for _ in range(num_workers):
+            self._idle_workers.put(SandboxWorker(memory_limit))
+
+    def _start_worker(self) -> SandboxWorker | None:
+        try:
+            return SandboxWorker(self.memory_limit)
+        except Exception as e:
+            logger.error("Failed to start sandbox worker: %s", e)
+            return None
+
+    def _replace_worker(self, worker: SandboxWorker) -> SandboxWorker | None:
+        try:
+            worker.kill()
+        except Exception as e:
+            logger.error("Failed to stop sandbox worker %s: %s", worker.process.pid, e)
+        return self._start_worker()
+
+    def execute(self, generated_code: str, timeout: float) -> CodeExecutionResult:
+        """
+        Execute code on the next idle worker.
+
+        Args:
+            generated_code: The code to execute
+            timeout: The timeout for the execution
+
+        Returns:
+            CodeExecutionResult object containing the execution result
+        """
+        try:
+            worker = self._idle_workers.get(timeout=self.acquire_timeout)
+        except Empty:
+            return CodeExecutionResult(process_status=CodeExecutionStatus.ERROR,
+                                       stdout="",
+                                       stderr="No sandbox worker available\n")
+
+        if worker is None:
+            worker = self._start_worker()
+            if worker is None:
+                self._idle_workers.put(None)
+                return CodeExecutionResult(process_status=CodeExecutionStatus.ERROR,
+                                           stdout="",
+                                           stderr="Failed to start sandbox worker\n")
+
+        result = None
+        try:
+            result = worker.execute(generated_code, timeout)
+        finally:
+            if (result is None or result.process_status == CodeExecutionStatus.TIMEOUT
+                    or worker.num_tasks >= self.max_tasks_per_worker or worker.max_rss_bytes > self.max_rss_bytes):
+                worker = self._replace_worker(worker)
+            # The slot is returned even when the replacement failed to start
+            self._idle_workers.put(worker)
+
+        if result is None:
+            return CodeExecutionResult(process_status=CodeExecutionStatus.ERROR,
+                                       stdout="",
+                                       stderr="Process exited unexpectedly\n")
+        return result
+
+    def shutdown(self):
+        """
+        Stop all workers of the pool.
+        """
+        for _ in range(self.num_workers):
+            worker = self._idle_workers.get()
+            if worker is not None:
+                worker.kill()
+
+
+_worker_pool: SandboxWorkerPool | None = None
+_worker_pool_lock = threading.Lock()
+
+
+def get_worker_pool() -> SandboxWorkerPool:
+    """
+    Get the worker pool of this server process, starting it on first use so that workers are forked from the process
+    serving requests.
+    """
+    global _worker_pool  # pylint: disable=global-statement
+
+    if _worker_pool is None:
+        with _worker_pool_lock:
+            if _worker_pool is None:
+                _worker_pool = SandboxWorkerPool()
+
+    return _worker_pool
 
 
 def do_execute(request: Request) -> CodeExecutionResponse:
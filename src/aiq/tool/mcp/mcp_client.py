@@ -15,10 +15,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from collections import deque
 from contextlib import asynccontextmanager
 from enum import Enum
 from typing import Any
+from typing import ClassVar
 
 from mcp import ClientSession
 from mcp.client.sse import sse_client
@@ -107,39 +111,333 @@ def model_from_mcp_schema(name: str, mcp_input_schema: dict) -> type[BaseModel]:
     return create_model(f"{_generate_valid_classname(name)}InputSchema", **schema_dict)
 
 
+class _PooledSession:
+    """
+    A single long-lived MCP session. The SSE connection and the `ClientSession` are entered and exited by a dedicated
+    task since the underlying anyio cancel scopes must be exited from the task which entered them.
+    """
+
+    def __init__(self, url: str):
+        self.url = url
+        self.session: ClientSession | None = None
+        self.last_checked = 0.0
+        self._ready = asyncio.Event()
+        self._close = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._error: BaseException | None = None
+
+    @property
+    def is_alive(self) -> bool:
+        return self.session is not None and self._task is not None and not self._task.done()
+
+    async def start(self):
+        self._task = asyncio.create_task(self._run())
+        await self._ready.wait()
+        if self._error is not None:
+            raise self._error
+        self.last_checked = time.monotonic()
+
+    async def _run(self):
+        try:
+            async with sse_client(url=self.url) as (read, write):
+                async with ClientSession(read, write) as session:
+                    await session.initialize()
+                    self.session = session
+                    self._ready.set()
+                    await self._close.wait()
+        except Exception as e:
+            if not self._ready.is_set():
+                self._error = e
+            else:
+                logger.warning("MCP session to %s closed unexpectedly: %s", self.url, e)
+        finally:
+            self.session = None
+            self._ready.set()
+
+    async def aclose(self):
+        self._close.set()
+        if self._task is not None:
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+
+class MCPSessionPool:
+    """
+    Pool of long-lived, initialized MCP sessions to a single server.
+
+    Sessions are created lazily up to `max_sessions` and leased exclusively to one caller at a time. Idle sessions which
+    have not been used for `health_check_interval` seconds are pinged before being handed out, and sessions whose
+    connection has dropped are transparently replaced.
+
+    Use `acquire_shared` to get the pool shared by every client of a server in the process, it is closed when the last
+    client calls `release_shared`.
+
+    Args:
+        url (str): The url of the MCP server
+        max_sessions (int): The maximum number of concurrently open sessions
+        health_check_interval (float): Seconds after which an idle session is pinged before it is reused
+        health_check_timeout (float): Seconds to wait for the ping response before the session is discarded
+    """
+
+    _shared_pools: ClassVar[dict[str, MCPSessionPool]] = {}
+
+    def __init__(self,
+                 url: str,
+                 max_sessions: int = 4,
+                 health_check_interval: float = 30.0,
+                 health_check_timeout: float = 5.0):
+        if max_sessions < 1:
+            raise ValueError("max_sessions must be at least 1")
+
+        self.url = url
+        self.max_sessions = max_sessions
+        self.health_check_interval = health_check_interval
+        self.health_check_timeout = health_check_timeout
+
+        self._idle: deque[_PooledSession] = deque()
+        self._num_sessions = 0
+        self._condition = asyncio.Condition()
+        self._closed = False
+        self._shared_refs = 0
+
+    @classmethod
+    def acquire_shared(cls, url: str, max_sessions: int = 4, health_check_interval: float = 30.0) -> MCPSessionPool:
+        """
+        Get the pool shared by every client of the MCP server at `url` in the process, creating it if needed. When the
+        pool already exists, its limits are raised to satisfy the new client. Every call must be paired with a call to
+        `release_shared`.
+
+        Args:
+            url (str): The url of the MCP server
+            max_sessions (int): The maximum number of concurrently open sessions requested by the client
+            health_check_interval (float): Seconds after which an idle session is pinged before it is reused
+
+        Returns:
+            MCPSessionPool: The shared pool for `url`.
+        """
+        pool = cls._shared_pools.get(url)
+        if pool is None or pool._closed:
+            pool = cls(url, max_sessions=max_sessions, health_check_interval=health_check_interval)
+            cls._shared_pools[url] = pool
+        else:
+            pool.max_sessions = max(pool.max_sessions, max_sessions)
+            pool.health_check_interval = min(pool.health_check_interval, health_check_interval)
+
+        pool._shared_refs += 1
+        return pool
+
+    async def release_shared(self):
+        """
+        Release a reference obtained with `acquire_shared`, the pool is closed once it is no longer referenced.
+        """
+        if self._shared_refs <= 0:
+            return
+
+        self._shared_refs -= 1
+        if self._shared_refs > 0:
+            return
+
+        if self._shared_pools.get(self.url) is self:
+            del self._shared_pools[self.url]
+        await self.aclose()
+
+    @property
+    def num_sessions(self) -> int:
+        """The number of sessions currently open or being opened, both idle and leased."""
+        return self._num_sessions
+
+    async def _is_healthy(self, pooled: _PooledSession) -> bool:
+        if not pooled.is_alive:
+            return False
+
+        if time.monotonic() - pooled.last_checked < self.health_check_interval:
+            return True
+
+        try:
+            await asyncio.wait_for(pooled.session.send_ping(), timeout=self.health_check_timeout)
+        except Exception as e:
+            logger.info("Health check of MCP session to %s failed, reconnecting: %s", self.url, e)
+            return False
+
+        pooled.last_checked = time.monotonic()
+        return True
+
+    async def _acquire(self) -> _PooledSession:
+        async with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError(f"The MCP session pool for {self.url} has been closed")
+                if self._idle:
+                    pooled = self._idle.pop()
+                    break
+                if self._num_sessions < self.max_sessions:
+                    # Reserve the slot before connecting so concurrent callers respect the limit
+                    self._num_sessions += 1
+                    pooled = None
+                    break
+                await self._condition.wait()
+
+        try:
+            if pooled is not None:
+                if await self._is_healthy(pooled):
+                    return pooled
+                await pooled.aclose()
+
+            pooled = _PooledSession(self.url)
+            await pooled.start()
+            return pooled
+        except BaseException:
+            await self._discard(None)
+            raise
+
+    async def _release(self, pooled: _PooledSession):
+        if self._closed or not pooled.is_alive:
+            await self._discard(pooled)
+            return
+
+        pooled.last_checked = time.monotonic()
+        async with self._condition:
+            self._idle.append(pooled)
+            self._condition.notify()
+
+    async def _discard(self, pooled: _PooledSession | None):
+        if pooled is not None:
+            await pooled.aclose()
+        async with self._condition:
+            self._num_sessions -= 1
+            self._condition.notify()
+
+    @asynccontextmanager
+    async def session(self):
+        """
+        Lease an initialized session from the pool for the duration of the async context.
+        """
+        pooled = await self._acquire()
+        try:
+            yield pooled.session
+        except BaseException:
+            # The session may still be usable, force a health check before it is leased again
+            pooled.last_checked = 0.0
+            await self._release(pooled)
+            raise
+
+        await self._release(pooled)
+
+    async def call_tool(self, tool_name: str, tool_args: dict | None, retry_on_disconnect: bool = False):
+        """
+        Call a tool using a pooled session. Sessions found dead or unhealthy when they are leased are replaced before
+        the request is sent. Once sent, the server may have executed the call even if the connection drops before the
+        response arrives, so the call is only retried on a new session when `retry_on_disconnect` is set, which should
+        be limited to idempotent tools.
+        """
+        pooled = await self._acquire()
+        try:
+            result = await pooled.session.call_tool(tool_name, tool_args)
+        except Exception:
+            if pooled.is_alive:
+                pooled.last_checked = 0.0
+                await self._release(pooled)
+                raise
+
+            await self._discard(pooled)
+            if not retry_on_disconnect:
+                raise
+
+            logger.info("MCP session to %s was disconnected during a call to %s, reconnecting", self.url, tool_name)
+            async with self.session() as session:
+                return await session.call_tool(tool_name, tool_args)
+
+        await self._release(pooled)
+        return result
+
+    async def aclose(self):
+        """
+        Close all idle sessions. Sessions which are currently leased are closed once they are released.
+        """
+        async with self._condition:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._condition.notify_all()
+
+        for pooled in idle:
+            await self._discard(pooled)
+
+
 class MCPSSEClient:
     """
     Client for creating a session and connecting to an MCP server using SSE
 
     Args:
       url (str): The url of the MCP server
+      session_pool (MCPSessionPool | None): Pool of persistent sessions to use. If None, a new connection is
+        established for every request.
     """
 
-    def __init__(self, url: str):
+    def __init__(self, url: str, session_pool: MCPSessionPool | None = None):
         self.url = url
+        self._session_pool = session_pool
 
     @asynccontextmanager
     async def connect_to_sse_server(self):
         """
         Establish a session with an MCP SSE server within an aync context
         """
+        if self._session_pool is not None:
+            async with self._session_pool.session() as session:
+                yield session
+            return
+
         async with sse_client(url=self.url) as (read, write):
             async with ClientSession(read, write) as session:
                 await session.initialize()
                 yield session
 
+    async def _call_tool(self, tool_name: str, tool_args: dict | None, retry_on_disconnect: bool = False):
+        if self._session_pool is not None:
+            return await self._session_pool.call_tool(tool_name, tool_args, retry_on_disconnect=retry_on_disconnect)
+
+        async with self.connect_to_sse_server() as session:
+            return await session.call_tool(tool_name, tool_args)
+
 
 class MCPBuilder(MCPSSEClient):
     """
-    Builder class used to connect to an MCP Server and generate ToolClients
+    Builder class used to connect to an MCP Server and generate ToolClients. All builders for the same server url in the
+    process, and the ToolClients they generate, share a single pool of persistent sessions. The builder releases the
+    pool when its async context exits, and the pool is closed once the last builder has released it.
 
     Args:
         url (str): The url of the MCP server
+        max_sessions (int): The maximum number of concurrently open sessions to the server
+        health_check_interval (float): Seconds after which an idle session is pinged before it is reused
     """
 
-    def __init__(self, url):
-        super().__init__(url)
+    def __init__(self, url, max_sessions: int = 4, health_check_interval: float = 30.0):
+        super().__init__(url,
+                         session_pool=MCPSessionPool.acquire_shared(url,
+                                                                    max_sessions=max_sessions,
+                                                                    health_check_interval=health_check_interval))
         self._tools = None
+        self._released = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    async def aclose(self):
+        """
+        Release the shared session pool, closing its sessions if no other builder for the server uses it.
+        """
+        if self._released:
+            return
+
+        self._released = True
+        await self._session_pool.release_shared()
 
     @mcp_exception_handler
     async def get_tools(self):
@@ -156,7 +454,12 @@ class MCPBuilder(MCPSSEClient):
             response = await session.list_tools()
 
         return {
-            tool.name: MCPToolClient(self.url, tool.name, tool.description, tool_input_schema=tool.inputSchema)
+            tool.name:
+                MCPToolClient(self.url,
+                              tool.name,
+                              tool.description,
+                              tool_input_schema=tool.inputSchema,
+                              session_pool=self._session_pool)
             for tool in response.tools
         }
 
@@ -185,9 +488,7 @@ class MCPBuilder(MCPSSEClient):
 
     @mcp_exception_handler
     async def call_tool(self, tool_name: str, tool_args: dict | None):
-        async with self.connect_to_sse_server() as session:
-            result = await session.call_tool(tool_name, tool_args)
-            return result
+        return await self._call_tool(tool_name, tool_args)
 
 
 class MCPToolClient(MCPSSEClient):
@@ -199,10 +500,21 @@ class MCPToolClient(MCPSSEClient):
         tool_name (str): The name of the tool to wrap
         tool_description (str): The description of the tool provided by the MCP server.
         tool_input_schema (dict): The input schema for the tool.
+        session_pool (MCPSessionPool | None): Pool of persistent sessions to use, typically shared with the MCPBuilder
+            which created the tool client.
+        retry_on_disconnect (bool): Retry a call on a new session when the connection drops after the request was
+            sent. Only enable for idempotent tools, since the server may already have executed the call.
     """
 
-    def __init__(self, url: str, tool_name: str, tool_description: str | None, tool_input_schema: dict | None = None):
-        super().__init__(url)
+    def __init__(self,
+                 url: str,
+                 tool_name: str,
+                 tool_description: str | None,
+                 tool_input_schema: dict | None = None,
+                 session_pool: MCPSessionPool | None = None,
+                 retry_on_disconnect: bool = False):
+        super().__init__(url, session_pool=session_pool)
+        self.retry_on_disconnect = retry_on_disconnect
         self._tool_name = tool_name
         self._tool_description = tool_description
         self._input_schema = model_from_mcp_schema(self._tool_name, tool_input_schema) if tool_input_schema else None
@@ -242,8 +554,7 @@ class MCPToolClient(MCPSSEClient):
         Args:
             tool_args (dict[str, Any]): A dictionary of key value pairs to serve as inputs for the MCP tool.
         """
-        async with self.connect_to_sse_server() as session:
-            result = await session.call_tool(self._tool_name, tool_args)
+        result = await self._call_tool(self._tool_name, tool_args, retry_on_disconnect=self.retry_on_disconnect)
 
         output = []
         for res in result.content:
@@ -45,6 +45,16 @@ class MCPToolConfig(FunctionBaseConfig, name="mcp_tool_wrapper"):
         If true, the tool will return the exception message if the tool call fails.
         If false, raise the exception.
         """)
+    max_sessions: int = Field(default=4,
+                              ge=1,
+                              description="The maximum number of persistent sessions to keep open to the MCP server.")
+    health_check_interval: float = Field(
+        default=30.0, gt=0, description="Number of seconds after which an idle session is pinged before it is reused.")
+    retry_on_disconnect: bool = Field(default=False,
+                                      description="""
+        If true, a call is retried on a new session when the connection to the MCP server drops after the call was
+        sent. Only enable for idempotent tools, since the server may already have executed the call.
+        """)
 
 
 @register_function(config_type=MCPToolConfig)
@@ -56,41 +66,43 @@ async def mcp_tool(config: MCPToolConfig, builder: Builder):  # pylint: disable=
     from aiq.tool.mcp.mcp_client import MCPBuilder
     from aiq.tool.mcp.mcp_client import MCPToolClient
 
-    client = MCPBuilder(url=str(config.url))
-
-    tool: MCPToolClient = await client.get_tool(config.mcp_tool_name)
-    if config.description:
-        tool.set_description(description=config.description)
+    async with MCPBuilder(url=str(config.url),
+                          max_sessions=config.max_sessions,
+                          health_check_interval=config.health_check_interval) as client:
+        tool: MCPToolClient = await client.get_tool(config.mcp_tool_name)
+        if config.description:
+            tool.set_description(description=config.description)
+        tool.retry_on_disconnect = config.retry_on_disconnect
 
-    logger.info("Configured to use tool: %s from MCP server at %s", tool.name, str(config.url))
+        logger.info("Configured to use tool: %s from MCP server at %s", tool.name, str(config.url))
 
-    def _convert_from_str(input_str: str) -> tool.input_schema:
-        return tool.input_schema.model_validate_json(input_str)
+        def _convert_from_str(input_str: str) -> tool.input_schema:
+            return tool.input_schema.model_validate_json(input_str)
 
-    async def _response_fn(tool_input: BaseModel | None = None, **kwargs) -> str:
-        # Run the tool, catching any errors and sending to agent for correction
-        try:
-            if tool_input:
-                args = tool_input.model_dump()
-                return await tool.acall(args)
-
-            _ = tool.input_schema.model_validate(kwargs)
-            filtered_kwargs = {k: v for k, v in kwargs.items() if v is not None}
-            return await tool.acall(filtered_kwargs)
-        except Exception as e:
-            if config.return_exception:
+        async def _response_fn(tool_input: BaseModel | None = None, **kwargs) -> str:
+            # Run the tool, catching any errors and sending to agent for correction
+            try:
                 if tool_input:
-                    logger.warning("Error calling tool %s with serialized input: %s",
-                                   tool.name,
-                                   tool_input.model_dump(),
-                                   exc_info=True)
-                else:
-                    logger.warning("Error calling tool %s with input: %s", tool.name, kwargs, exc_info=True)
-                return str(e)
-            # If the tool call fails, raise the exception.
-            raise
-
-    yield FunctionInfo.create(single_fn=_response_fn,
-                              description=tool.description,
-                              input_schema=tool.input_schema,
-                              converters=[_convert_from_str])
+                    args = tool_input.model_dump()
+                    return await tool.acall(args)
+
+                _ = tool.input_schema.model_validate(kwargs)
+                filtered_kwargs = {k: v for k, v in kwargs.items() if v is not None}
+                return await tool.acall(filtered_kwargs)
+            except Exception as e:
+                if config.return_exception:
+                    if tool_input:
+                        logger.warning("Error calling tool %s with serialized input: %s",
+                                       tool.name,
+                                       tool_input.model_dump(),
+                                       exc_info=True)
+                    else:
+                        logger.warning("Error calling tool %s with input: %s", tool.name, kwargs, exc_info=True)
+                    return str(e)
+                # If the tool call fails, raise the exception.
+                raise
+
+        yield FunctionInfo.create(single_fn=_response_fn,
+                                  description=tool.description,
+                                  input_schema=tool.input_schema,
+                                  converters=[_convert_from_str])
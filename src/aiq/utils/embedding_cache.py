@@ -0,0 +1,331 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import contextvars
+import dataclasses
+import functools
+import hashlib
+import logging
+import typing
+from array import array
+from collections.abc import Awaitable
+from collections.abc import Callable
+
+from pydantic import BaseModel
+
+from aiq.builder.framework_enum import LLMFrameworkEnum
+from aiq.data_models.embedding_cache_mixin import EmbeddingCacheConfig
+from aiq.utils.response_cache import ResponseCacheBackend
+from aiq.utils.response_cache import build_cache_backend
+from aiq.utils.response_cache import compute_cache_key
+
+if typing.TYPE_CHECKING:
+    from aiq.builder.builder import Builder
+
+logger = logging.getLogger(__name__)
+
+Vector = list[float]
+AsyncEmbedFn = Callable[[list[str]], Awaitable[list[Vector]]]
+SyncEmbedFn = Callable[[list[str]], list[Vector]]
+
+# Set while a patched method runs so clients whose methods call each other are only looked up once
+_IN_CACHED_CALL: contextvars.ContextVar[bool] = contextvars.ContextVar("_IN_CACHED_CALL", default=False)
+
+
+@dataclasses.dataclass(frozen=True)
+class EmbedderMethods:
+    """Names of the embedding methods of a framework client."""
+    query: str
+    documents: str
+    aquery: str
+    adocuments: str
+
+
+DEFAULT_EMBEDDER_METHODS: dict[LLMFrameworkEnum, EmbedderMethods] = {
+    LLMFrameworkEnum.LANGCHAIN:
+        EmbedderMethods(query="embed_query",
+                        documents="embed_documents",
+                        aquery="aembed_query",
+                        adocuments="aembed_documents"),
+    LLMFrameworkEnum.LLAMA_INDEX:
+        EmbedderMethods(query="get_query_embedding",
+                        documents="get_text_embedding_batch",
+                        aquery="aget_query_embedding",
+                        adocuments="aget_text_embedding_batch"),
+}
+
+
+def _check_vectors(texts: list[str], vectors: list[Vector]) -> list[Vector]:
+    if len(vectors) != len(texts):
+        raise ValueError(f"The embedder returned {len(vectors)} vectors for {len(texts)} texts")
+    return vectors
+
+
+class EmbeddingBatcher:
+    """
+    Coalesces texts submitted by concurrent callers into batched embedding requests.
+
+    Texts are collected for up to ``batch_window`` seconds, or until ``max_batch_size`` texts are pending, and then
+    embedded with a single call to ``embed_batch``. A text which is already pending or being embedded is not requested
+    again.
+    """
+
+    def __init__(self, embed_batch: AsyncEmbedFn, batch_window: float = 0.005, max_batch_size: int = 64):
+        self._embed_batch = embed_batch
+        self._batch_window = batch_window
+        self._max_batch_size = max_batch_size
+        self._pending: list[tuple[str, asyncio.Future]] = []
+        self._in_flight: dict[str, asyncio.Future] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+        self.num_requests = 0
+
+    async def submit(self, texts: list[str]) -> list[Vector]:
+        if not texts:
+            return []
+
+        loop = asyncio.get_running_loop()
+        futures = []
+        for text in texts:
+            future = self._in_flight.get(text)
+            if future is None:
+                future = loop.create_future()
+                self._in_flight[text] = future
+                self._pending.append((text, future))
+            futures.append(future)
+
+        if len(self._pending) >= self._max_batch_size or self._batch_window == 0:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._batch_window, self._flush)
+
+        # Futures are shared between callers, so one caller being cancelled must not cancel them
+        return list(await asyncio.gather(*(asyncio.shield(f) for f in futures)))
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        pending, self._pending = self._pending, []
+        for i in range(0, len(pending), self._max_batch_size):
+            task = asyncio.create_task(self._run(pending[i:i + self._max_batch_size]))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: list[tuple[str, asyncio.Future]]) -> None:
+        self.num_requests += 1
+
+        try:
+            texts = [text for text, _ in batch]
+            vectors = _check_vectors(texts, await self._embed_batch(texts))
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+                # Mark the exception as retrieved in case all callers were cancelled
+                future.exception()
+        else:
+            for (_, future), vector in zip(batch, vectors):
+                future.set_result(vector)
+        finally:
+            for text, future in batch:
+                # Never leave a caller waiting, whatever interrupted the batch
+                if not future.done():
+                    future.cancel()
+                self._in_flight.pop(text, None)
+
+
+class EmbeddingCache:
+    """Caches embedding vectors keyed on a hash of the embedder configuration and the embedded text."""
+
+    def __init__(self, backend: ResponseCacheBackend, model_config: BaseModel):
+        self._backend = backend
+        self._config_key = compute_cache_key(model_config, "embed", {})
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def backend(self) -> ResponseCacheBackend:
+        return self._backend
+
+    async def aclose(self) -> None:
+        await self._backend.aclose()
+
+    def _key_for(self, text: str, kind: str) -> str:
+        return hashlib.sha256(f"{self._config_key}\0{kind}\0{text}".encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _encode(vector: Vector) -> bytes:
+        return array("d", vector).tobytes()
+
+    @staticmethod
+    def _decode(raw: bytes) -> Vector:
+        return array("d", raw).tolist()
+
+    def _collect(self, texts: list[str], cached: list[bytes | None]) -> tuple[list[Vector | None], list[str]]:
+        vectors = [None if raw is None else self._decode(raw) for raw in cached]
+        missing = list(dict.fromkeys(text for text, vector in zip(texts, vectors) if vector is None))
+        self.hits += len(texts) - sum(1 for v in vectors if v is None)
+        self.misses += len(missing)
+        return vectors, missing
+
+    async def aembed(self, texts: list[str], kind: str, embed: AsyncEmbedFn) -> list[Vector]:
+        """
+        Return the vectors of *texts*, calling *embed* once for the texts which are not cached.
+
+        Args:
+            texts (list[str]): The texts to embed.
+            kind (str): Either ``query`` or ``document``. Part of the key since models may embed them differently.
+            embed (AsyncEmbedFn): Computes the vectors of the texts which are not cached.
+
+        Returns:
+            list[Vector]: One vector per text.
+        """
+        keys = [self._key_for(text, kind) for text in texts]
+        vectors, missing = self._collect(texts, list(await asyncio.gather(*(self._backend.aget(k) for k in keys))))
+
+        if missing:
+            computed = dict(zip(missing, _check_vectors(missing, await embed(missing))))
+            await asyncio.gather(*(self._backend.aset(self._key_for(text, kind), self._encode(vector))
+                                   for text, vector in computed.items()))
+            vectors = [computed[text] if vector is None else vector for text, vector in zip(texts, vectors)]
+
+        return typing.cast(list[Vector], vectors)
+
+    def embed(self, texts: list[str], kind: str, embed: SyncEmbedFn) -> list[Vector]:
+        """Synchronous version of `aembed`. Passes through to *embed* if the backend is asynchronous only."""
+        if not self._backend.supports_sync:
+            return embed(texts)
+
+        vectors, missing = self._collect(texts, [self._backend.get(self._key_for(text, kind)) for text in texts])
+
+        if missing:
+            computed = dict(zip(missing, _check_vectors(missing, embed(missing))))
+            for text, vector in computed.items():
+                self._backend.set(self._key_for(text, kind), self._encode(vector))
+            vectors = [computed[text] if vector is None else vector for text, vector in zip(texts, vectors)]
+
+        return typing.cast(list[Vector], vectors)
+
+
+def patch_with_embedding_cache(obj: typing.Any,
+                               cache: EmbeddingCache,
+                               methods: EmbedderMethods,
+                               *,
+                               batch_window: float = 0.005,
+                               max_batch_size: int = 64,
+                               batch_queries: bool = False) -> typing.Any:
+    """
+    Patch the embedding methods of *obj* instance-locally to look up vectors in *cache* and coalesce concurrent
+    asynchronous requests into batched document requests.
+
+    Queries are only coalesced when *batch_queries* is set, since some models embed queries and documents differently.
+    Otherwise queries are cached separately and sent one at a time. Calls with additional arguments bypass the cache.
+    """
+    aquery = getattr(obj, methods.aquery)
+    adocuments = getattr(obj, methods.adocuments)
+    query = getattr(obj, methods.query)
+    documents = getattr(obj, methods.documents)
+
+    batcher = EmbeddingBatcher(adocuments, batch_window=batch_window, max_batch_size=max_batch_size)
+    query_kind = "document" if batch_queries else "query"
+
+    async def _embed_queries(texts: list[str]) -> list[Vector]:
+        return list(await asyncio.gather(*(aquery(text) for text in texts)))
+
+    @functools.wraps(adocuments)
+    async def _adocuments(texts, *args, **kwargs):
+        if args or kwargs or _IN_CACHED_CALL.get():
+            return await adocuments(texts, *args, **kwargs)
+        token = _IN_CACHED_CALL.set(True)
+        try:
+            return await cache.aembed(list(texts), "document", batcher.submit)
+        finally:
+            _IN_CACHED_CALL.reset(token)
+
+    @functools.wraps(aquery)
+    async def _aquery(text, *args, **kwargs):
+        if args or kwargs or _IN_CACHED_CALL.get():
+            return await aquery(text, *args, **kwargs)
+        token = _IN_CACHED_CALL.set(True)
+        try:
+            return (await cache.aembed([text], query_kind, batcher.submit if batch_queries else _embed_queries))[0]
+        finally:
+            _IN_CACHED_CALL.reset(token)
+
+    @functools.wraps(documents)
+    def _documents(texts, *args, **kwargs):
+        if args or kwargs or _IN_CACHED_CALL.get():
+            return documents(texts, *args, **kwargs)
+        token = _IN_CACHED_CALL.set(True)
+        try:
+            return cache.embed(list(texts), "document", documents)
+        finally:
+            _IN_CACHED_CALL.reset(token)
+
+    @functools.wraps(query)
+    def _query(text, *args, **kwargs):
+        if args or kwargs or _IN_CACHED_CALL.get():
+            return query(text, *args, **kwargs)
+        embed = documents if batch_queries else lambda texts: [query(t) for t in texts]
+        token = _IN_CACHED_CALL.set(True)
+        try:
+            return cache.embed([text], query_kind, embed)[0]
+        finally:
+            _IN_CACHED_CALL.reset(token)
+
+    for name, wrapped in ((methods.aquery, _aquery), (methods.adocuments, _adocuments), (methods.query, _query),
+                          (methods.documents, _documents)):
+        try:
+            object.__setattr__(obj, name, wrapped)
+        except Exception as exc:
+            logger.warning("Cannot patch method %s.%s with an embedding cache: %s", type(obj).__name__, name, exc)
+
+    return obj
+
+
+async def build_embedding_cache(config: EmbeddingCacheConfig, model_config: BaseModel,
+                                builder: "Builder") -> EmbeddingCache:
+    """Create the embedding cache described by *config* for an embedder configured with *model_config*."""
+    return EmbeddingCache(await build_cache_backend(config, builder), model_config)
+
+
+def patch_embedder(obj: typing.Any,
+                   cache: EmbeddingCache,
+                   config: EmbeddingCacheConfig,
+                   wrapper_type: LLMFrameworkEnum | str) -> typing.Any:
+    """Apply *cache* to an embedder client of the given framework, if the framework is supported."""
+    try:
+        methods = DEFAULT_EMBEDDER_METHODS.get(LLMFrameworkEnum(wrapper_type))
+    except ValueError:
+        methods = None
+
+    if methods is None or not all(callable(getattr(obj, name, None)) for name in dataclasses.astuple(methods)):
+        logger.warning("The embedding cache does not support %s clients of type %s, not caching",
+                       wrapper_type,
+                       type(obj).__name__)
+        return obj
+
+    return patch_with_embedding_cache(obj,
+                                      cache,
+                                      methods,
+                                      batch_window=config.batch_window,
+                                      max_batch_size=config.max_batch_size,
+                                      batch_queries=config.batch_queries)
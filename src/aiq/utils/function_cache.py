@@ -0,0 +1,152 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import time
+import typing
+from collections.abc import Awaitable
+from collections.abc import Callable
+
+from aiq.data_models.function import FunctionBaseConfig
+from aiq.data_models.function_cache_mixin import FunctionCacheConfig
+from aiq.utils.intermediate_step_utils import report_custom_step
+from aiq.utils.response_cache import CacheEntry
+from aiq.utils.response_cache import InMemoryResponseCacheBackend
+from aiq.utils.response_cache import ResponseCacheBackend
+from aiq.utils.response_cache import build_cache_backend
+from aiq.utils.response_cache import compute_cache_key
+from aiq.utils.response_cache import decode_cache_entry
+from aiq.utils.response_cache import encode_cache_entry
+
+if typing.TYPE_CHECKING:
+    from aiq.builder.builder import Builder
+
+logger = logging.getLogger(__name__)
+
+_T = typing.TypeVar("_T")
+
+CACHE_STEP_NAME = "function_cache"
+
+
+class FunctionCache:
+    """
+    Memoizes the results of a function's `ainvoke` calls.
+
+    Calls are keyed on a hash of the function configuration, the function name and the canonical JSON of the converted
+    input. With the ``process`` scope results are stored in *backend* and shared between workflow runs. With the
+    ``request`` scope every workflow run gets its own in-memory backend, so results are only reused within the run;
+    calls made outside of a workflow run are not cached.
+
+    Hits are reported as ``function_cache`` custom steps carrying ``cached``, the ``function_name`` and the
+    ``saved_latency`` of the original call. The tool step
+    around the call is still emitted by the framework callback handlers, so hits are not counted as additional tool
+    calls.
+    """
+
+    def __init__(self,
+                 config: FunctionCacheConfig,
+                 function_config: FunctionBaseConfig,
+                 name: str,
+                 backend: ResponseCacheBackend | None = None):
+        if config.scope == "process" and backend is None:
+            raise ValueError("A backend is required for the `process` scope")
+
+        self._config = config
+        self._function_config = function_config
+        self._name = name
+        self._backend = backend
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def scope(self) -> str:
+        return self._config.scope
+
+    async def aclose(self) -> None:
+        if self._backend is not None:
+            await self._backend.aclose()
+
+    def key_for(self, value: typing.Any) -> str:
+        return compute_cache_key(self._function_config, f"{self._name}.ainvoke", {"input": value})
+
+    def _get_backend(self) -> ResponseCacheBackend | None:
+        if self._config.scope == "process":
+            return self._backend
+
+        from aiq.builder.context import AIQContextState
+
+        backends = AIQContextState.get().function_cache_backends.get()
+        if backends is None:
+            return None
+
+        backend = backends.get(self._name)
+        if backend is None:
+            backend = InMemoryResponseCacheBackend(max_entries=self._config.max_entries, ttl=self._config.ttl)
+            backends[self._name] = backend
+
+        return backend
+
+    def _report_hit(self, key: str, entry: CacheEntry) -> None:
+        metadata = {
+            "cached": True,
+            "function_name": self._name,
+            "cache_key": key,
+            "cache_scope": self._config.scope,
+            "saved_latency": entry.latency
+        }
+
+        report_custom_step(CACHE_STEP_NAME, metadata)
+
+    async def ainvoke(self, value: typing.Any, fn: Callable[[typing.Any], Awaitable[_T]]) -> _T:
+        """
+        Return the cached result for *value*, calling *fn* with *value* and caching its result on a miss.
+
+        Args:
+            value (typing.Any): The converted input of the function.
+            fn (Callable[[typing.Any], Awaitable[_T]]): Computes the result of the function.
+
+        Returns:
+            _T: The result of *fn* for *value*.
+        """
+        backend = self._get_backend()
+        if backend is None:
+            return await fn(value)
+
+        key = self.key_for(value)
+        entry = decode_cache_entry(await backend.aget(key))
+        if entry is not None:
+            self.hits += 1
+            self._report_hit(key, entry)
+            return entry.response
+
+        self.misses += 1
+        start = time.perf_counter()
+        result = await fn(value)
+
+        encoded = encode_cache_entry(CacheEntry(result, time.perf_counter() - start))
+        if encoded is not None:
+            await backend.aset(key, encoded)
+
+        return result
+
+
+async def build_function_cache(config: FunctionCacheConfig,
+                               function_config: FunctionBaseConfig,
+                               builder: "Builder",
+                               name: str) -> FunctionCache:
+    """Create the cache described by *config* for the function *name* configured with *function_config*."""
+    backend = await build_cache_backend(config, builder) if config.scope == "process" else None
+
+    return FunctionCache(config, function_config, name=name, backend=backend)
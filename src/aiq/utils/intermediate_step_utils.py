@@ -0,0 +1,48 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import typing
+
+from aiq.data_models.intermediate_step import IntermediateStepPayload
+from aiq.data_models.intermediate_step import IntermediateStepType
+from aiq.data_models.intermediate_step import TraceMetadata
+
+logger = logging.getLogger(__name__)
+
+
+def report_custom_step(name: str, metadata: dict[str, typing.Any]) -> None:
+    """
+    Report an event of the current workflow run, such as a cache lookup or a wait for a limit, as a
+    `CUSTOM_START`/`CUSTOM_END` intermediate step pair with the given name, carrying *metadata* on both steps.
+
+    Failures to report are logged and otherwise ignored, so reporting never fails the operation being reported.
+    """
+    try:
+        from aiq.builder.context import AIQContext
+
+        step_manager = AIQContext.get().intermediate_step_manager
+        start = IntermediateStepPayload(event_type=IntermediateStepType.CUSTOM_START,
+                                        name=name,
+                                        metadata=TraceMetadata(provided_metadata=metadata))
+        step_manager.push_intermediate_step(start)
+        step_manager.push_intermediate_step(
+            IntermediateStepPayload(UUID=start.UUID,
+                                    event_type=IntermediateStepType.CUSTOM_END,
+                                    span_event_timestamp=start.event_timestamp,
+                                    name=name,
+                                    metadata=TraceMetadata(provided_metadata=metadata)))
+    except Exception:
+        logger.debug("Unable to report %s step", name, exc_info=True)
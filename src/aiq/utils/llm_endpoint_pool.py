@@ -0,0 +1,458 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import contextlib
+import contextvars
+import dataclasses
+import functools
+import inspect
+import logging
+import os
+import time
+import typing
+from collections import deque
+from collections.abc import AsyncIterator
+
+from pydantic import BaseModel
+from pydantic import computed_field
+
+from aiq.builder.framework_enum import LLMFrameworkEnum
+from aiq.data_models.concurrency_limit_mixin import ConcurrencyLimitConfig
+from aiq.data_models.concurrency_limit_mixin import ConcurrencyLimitMixin
+from aiq.data_models.llm import LLMBaseConfig
+from aiq.data_models.rate_limit_mixin import RateLimitConfig
+from aiq.data_models.rate_limit_mixin import RateLimitMixin
+from aiq.data_models.rate_limit_mixin import RequestPriority
+from aiq.utils.exception_handlers.automatic_retries import _code_matches
+from aiq.utils.exception_handlers.automatic_retries import _extract_status_code
+from aiq.utils.intermediate_step_utils import report_custom_step
+from aiq.utils.llm_rate_limiter import RateLimiter
+from aiq.utils.llm_rate_limiter import RateLimitMetrics
+from aiq.utils.llm_rate_limiter import get_request_priority
+from aiq.utils.llm_rate_limiter import patch_with_limiter
+from aiq.utils.response_cache import DEFAULT_CACHED_METHODS
+
+if typing.TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+QUEUE_STEP_NAME = "llm_concurrency_limit"
+
+
+@dataclasses.dataclass
+class _RequestSlot:
+    """A slot held by a request, shared with the HTTP hooks of the request through `_current_slot`."""
+    limiter: "AdaptiveConcurrencyLimiter"
+    epoch: int
+    overloaded: bool = False
+
+
+_current_slot: contextvars.ContextVar[_RequestSlot | None] = contextvars.ContextVar("aiq_llm_endpoint_slot",
+                                                                                    default=None)
+
+
+class ConcurrencyLimitMetrics(BaseModel):
+    """Snapshot of the state and history of an endpoint's concurrency limit."""
+    endpoint: str
+    limit: int
+    in_flight: int
+    queue_depth: int
+    max_queue_depth: int
+    requests: int
+    queued_requests: int
+    overloads: int
+    total_wait_time: float
+    max_wait_time: float
+
+    @computed_field
+    @property
+    def mean_wait_time(self) -> float:
+        return self.total_wait_time / self.requests if self.requests else 0.0
+
+
+class LLMEndpointMetrics(BaseModel):
+    """The concurrency and rate limit metrics of a model endpoint."""
+    endpoint: str
+    concurrency_limit: ConcurrencyLimitMetrics | None = None
+    rate_limit: RateLimitMetrics | None = None
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Limits the number of concurrent requests to a model endpoint.
+
+    Requests which exceed the limit wait in order of their `RequestPriority`, then in order of arrival, so interactive
+    requests overtake queued batch requests. When the limit is adaptive, a successful request
+    raises it by ``increase_step / limit`` (so by ``increase_step`` per limit's worth of requests) up to
+    ``max_in_flight`` and an overload response multiplies it by ``decrease_factor`` down to ``min_in_flight``. Overloads
+    reported by requests which started before the last decrease do not lower the limit again, so a burst of rejected
+    requests only halves the limit once.
+
+    Waiting for a slot is reported as an ``llm_concurrency_limit`` custom step with the wait time, the queue depth and
+    the priority of the request.
+    """
+
+    def __init__(self, config: ConcurrencyLimitConfig, endpoint: str):
+        self._config = config
+        self._endpoint = endpoint
+        self._limit = float(config.initial_in_flight or config.max_in_flight)
+        self._in_flight = 0
+        # Waiting requests of each priority, highest priority first
+        self._waiters: dict[RequestPriority, deque[asyncio.Future]] = {
+            priority: deque()
+            for priority in sorted(RequestPriority, key=lambda p: p.rank)
+        }
+        self._epoch = 0
+
+        self._requests = 0
+        self._queued_requests = 0
+        self._overloads = 0
+        self._max_queue_depth = 0
+        self._total_wait_time = 0.0
+        self._max_wait_time = 0.0
+
+    @property
+    def config(self) -> ConcurrencyLimitConfig:
+        return self._config
+
+    @property
+    def endpoint(self) -> str:
+        return self._endpoint
+
+    @property
+    def limit(self) -> int:
+        return max(self._config.min_in_flight, int(self._limit))
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(len(waiters) for waiters in self._waiters.values())
+
+    def metrics(self) -> ConcurrencyLimitMetrics:
+        return ConcurrencyLimitMetrics(endpoint=self._endpoint,
+                                       limit=self.limit,
+                                       in_flight=self._in_flight,
+                                       queue_depth=self.queue_depth,
+                                       max_queue_depth=self._max_queue_depth,
+                                       requests=self._requests,
+                                       queued_requests=self._queued_requests,
+                                       overloads=self._overloads,
+                                       total_wait_time=self._total_wait_time,
+                                       max_wait_time=self._max_wait_time)
+
+    def is_overload_status(self, code: int) -> bool:
+        return any(_code_matches(code, pattern) for pattern in self._config.overload_status_codes)
+
+    def is_overload_error(self, exc: BaseException) -> bool:
+        code = _extract_status_code(exc)
+        return code is not None and self.is_overload_status(code)
+
+    def _wake(self) -> None:
+        for waiters in self._waiters.values():
+            while waiters and self._in_flight < self.limit:
+                waiter = waiters.popleft()
+                if not waiter.done():
+                    self._in_flight += 1
+                    waiter.set_result(None)
+
+    async def acquire(self) -> _RequestSlot:
+        """Wait for a free slot. The slot must be returned with `release`."""
+        priority = get_request_priority()
+        start = time.perf_counter()
+        queue_depth = self.queue_depth
+
+        if queue_depth or self._in_flight >= self.limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters[priority].append(waiter)
+            self._max_queue_depth = max(self._max_queue_depth, queue_depth + 1)
+            try:
+                await waiter
+            except BaseException:
+                if waiter.done() and not waiter.cancelled():
+                    # The slot was handed over after the request had been cancelled
+                    self._in_flight -= 1
+                    self._wake()
+                else:
+                    with contextlib.suppress(ValueError):
+                        self._waiters[priority].remove(waiter)
+                raise
+
+            wait_time = time.perf_counter() - start
+            self._queued_requests += 1
+            self._total_wait_time += wait_time
+            self._max_wait_time = max(self._max_wait_time, wait_time)
+            report_custom_step(
+                QUEUE_STEP_NAME, {
+                    "endpoint": self._endpoint,
+                    "wait_time": wait_time,
+                    "queue_depth": queue_depth,
+                    "limit": self.limit,
+                    "priority": priority.value
+                })
+        else:
+            self._in_flight += 1
+
+        self._requests += 1
+        return _RequestSlot(limiter=self, epoch=self._epoch)
+
+    def release(self, slot: _RequestSlot, success: bool) -> None:
+        """Return the slot of a finished request, raising the limit if it succeeded without an overload."""
+        self._in_flight -= 1
+
+        if success and not slot.overloaded and self._config.adaptive:
+            self._limit = min(float(self._config.max_in_flight), self._limit + self._config.increase_step / self._limit)
+
+        self._wake()
+
+    def on_overload(self, slot: _RequestSlot | None = None) -> None:
+        """
+        Record an overload response. When *slot* is not given, for example for requests which do not hold a slot, the
+        overload is counted without changing the limit.
+        """
+        self._overloads += 1
+
+        if slot is None:
+            return
+
+        slot.overloaded = True
+        if not self._config.adaptive or slot.epoch != self._epoch:
+            return
+
+        self._limit = max(float(self._config.min_in_flight), self._limit * self._config.decrease_factor)
+        self._epoch += 1
+        logger.debug("Lowered the concurrency limit of %s to %d", self._endpoint, self.limit)
+
+    @contextlib.asynccontextmanager
+    async def slot(self) -> AsyncIterator[_RequestSlot]:
+        """
+        Hold a slot for the duration of the context. Nested calls from the same request, for example a streaming method
+        which falls back to the non-streaming one, reuse the slot of the outer call.
+        """
+        current = _current_slot.get()
+        if current is not None and current.limiter is self:
+            yield current
+            return
+
+        slot = await self.acquire()
+        token = _current_slot.set(slot)
+        success = False
+        try:
+            yield slot
+            success = True
+        except Exception as e:
+            # Overload responses seen by the shared HTTP client were already recorded
+            if not slot.overloaded and self.is_overload_error(e):
+                self.on_overload(slot)
+            raise
+        finally:
+            # Async generators may be finalized in a different context
+            with contextlib.suppress(ValueError):
+                _current_slot.reset(token)
+            self.release(slot, success)
+
+    def wrap(self, fn: typing.Callable) -> typing.Callable:
+        """
+        Wrap a bound client method so each call holds a slot until it returns or, for streaming methods, until the
+        stream is exhausted. Synchronous methods are returned unchanged.
+        """
+        if inspect.iscoroutinefunction(fn):
+
+            async def _call_async(*args, **kwargs):
+                async with self.slot():
+                    return await fn(*args, **kwargs)
+
+            return functools.wraps(fn)(_call_async)
+
+        if inspect.isasyncgenfunction(fn):
+
+            async def _agen(*args, **kwargs):
+                async with self.slot():
+                    async for chunk in fn(*args, **kwargs):
+                        yield chunk
+
+            return functools.wraps(fn)(_agen)
+
+        return fn
+
+
+def patch_with_concurrency_limit(obj: typing.Any, limiter: AdaptiveConcurrencyLimiter,
+                                 methods: typing.Iterable[str]) -> typing.Any:
+    """
+    Patch *obj* instance-locally so calls to the given asynchronous methods hold a slot of *limiter*.
+
+    Methods which were already patched on the instance, for example with automatic retries, are wrapped as they are so
+    that the retries of a request reuse its slot.
+    """
+    return patch_with_limiter(obj, limiter.wrap, methods, "concurrency limit")
+
+
+def limited_methods(config: ConcurrencyLimitConfig | RateLimitConfig,
+                    wrapper_type: LLMFrameworkEnum | str) -> tuple[str, ...]:
+    """Return the methods to limit for a client of the given framework."""
+    if config.methods is not None:
+        return tuple(config.methods)
+
+    try:
+        return DEFAULT_CACHED_METHODS.get(LLMFrameworkEnum(wrapper_type), ())
+    except ValueError:
+        return ()
+
+
+def default_base_url(config: LLMBaseConfig) -> str | None:
+    """
+    Return the URL the clients of an LLM without a `base_url` send requests to, following the defaults of the provider
+    SDKs, or None if the type of the LLM is not known.
+    """
+    llm_type = config.static_type()
+
+    if llm_type == "nim":
+        return os.getenv("NVIDIA_BASE_URL", "https://integrate.api.nvidia.com/v1")
+
+    if llm_type == "openai":
+        return os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1")
+
+    if llm_type == "aws_bedrock":
+        region = getattr(config, "region_name", None)
+        if not region or region == "None":
+            region = os.getenv("AWS_REGION") or os.getenv("AWS_DEFAULT_REGION") or "us-east-1"
+        return f"https://bedrock-runtime.{region}.amazonaws.com"
+
+    return None
+
+
+class LLMEndpointPool:
+    """
+    Concurrency limiters, rate limiters and HTTP clients shared by the LLMs of a workflow which send requests to the
+    same endpoint.
+
+    An endpoint is identified by the type of the LLM and its `base_url`, or the default URL of its provider when the
+    `base_url` is not set. The limits of the first LLM added for an endpoint apply to all of them.
+    """
+
+    def __init__(self):
+        self._limiters: dict[str, AdaptiveConcurrencyLimiter] = {}
+        self._rate_limiters: dict[str, RateLimiter] = {}
+        self._http_clients: dict[tuple[str, bool], "httpx.Client | httpx.AsyncClient"] = {}
+
+    @staticmethod
+    def endpoint_key(config: LLMBaseConfig) -> str:
+        base_url = getattr(config, "base_url", None) or default_base_url(config) or "default"
+        return f"{config.static_type()}:{base_url.rstrip('/')}"
+
+    def get_limiter(self, config: LLMBaseConfig) -> AdaptiveConcurrencyLimiter | None:
+        """Return the limiter of the endpoint of *config*, or None if *config* does not set a concurrency limit."""
+        if not isinstance(config, ConcurrencyLimitMixin) or config.concurrency_limit is None:
+            return None
+
+        key = self.endpoint_key(config)
+        limiter = self._limiters.get(key)
+        if limiter is None:
+            limiter = AdaptiveConcurrencyLimiter(config.concurrency_limit, endpoint=key)
+            self._limiters[key] = limiter
+        elif limiter.config != config.concurrency_limit:
+            logger.warning("LLMs sharing the endpoint %s have different concurrency limits, using the first one", key)
+
+        return limiter
+
+    def get_rate_limiter(self, config: LLMBaseConfig) -> RateLimiter | None:
+        """Return the rate limiter of the endpoint of *config*, or None if *config* does not set a rate limit."""
+        if not isinstance(config, RateLimitMixin) or config.rate_limit is None:
+            return None
+
+        key = self.endpoint_key(config)
+        rate_limiter = self._rate_limiters.get(key)
+        if rate_limiter is None:
+            rate_limiter = RateLimiter(config.rate_limit, endpoint=key)
+            self._rate_limiters[key] = rate_limiter
+        elif rate_limiter.config != config.rate_limit:
+            logger.warning("LLMs sharing the endpoint %s have different rate limits, using the first one", key)
+
+        return rate_limiter
+
+    def get_http_client(self, config: LLMBaseConfig, asynchronous: bool = True) -> "httpx.Client | httpx.AsyncClient":
+        """
+        Return the HTTP client shared by the LLMs of the endpoint of *config*, sized to its concurrency limit.
+
+        Responses received by the asynchronous client are checked for overload status codes before any retries of the
+        framework client, so the limit reacts to rejected requests which are eventually retried successfully.
+        """
+        import httpx
+
+        key = (self.endpoint_key(config), asynchronous)
+        client = self._http_clients.get(key)
+        if client is not None:
+            return client
+
+        limiter = self.get_limiter(config)
+        if limiter is not None:
+            max_in_flight = limiter.config.max_in_flight
+            limits = httpx.Limits(max_connections=max_in_flight, max_keepalive_connections=max_in_flight)
+        else:
+            limits = httpx.Limits()
+
+        # The framework clients pass a timeout with each request, this only applies to requests without one
+        timeout = httpx.Timeout(600.0, connect=5.0)
+
+        if asynchronous:
+            event_hooks = {}
+            if limiter is not None:
+
+                async def _check_response(response: "httpx.Response"):
+                    if limiter.is_overload_status(response.status_code):
+                        slot = _current_slot.get()
+                        limiter.on_overload(slot if slot is not None and slot.limiter is limiter else None)
+
+                event_hooks["response"] = [_check_response]
+
+            client = httpx.AsyncClient(limits=limits, timeout=timeout, event_hooks=event_hooks)
+        else:
+            client = httpx.Client(limits=limits, timeout=timeout)
+
+        self._http_clients[key] = client
+        return client
+
+    def metrics(self) -> list[ConcurrencyLimitMetrics]:
+        return [limiter.metrics() for limiter in self._limiters.values()]
+
+    def rate_limit_metrics(self) -> list[RateLimitMetrics]:
+        return [rate_limiter.metrics() for rate_limiter in self._rate_limiters.values()]
+
+    def endpoint_metrics(self) -> list[LLMEndpointMetrics]:
+        """Return the concurrency and rate limit metrics of every endpoint with a limit."""
+        return [
+            LLMEndpointMetrics(endpoint=key,
+                               concurrency_limit=self._limiters[key].metrics() if key in self._limiters else None,
+                               rate_limit=self._rate_limiters[key].metrics() if key in self._rate_limiters else None)
+            for key in dict.fromkeys([*self._limiters, *self._rate_limiters])
+        ]
+
+    async def aclose(self) -> None:
+        for metrics in self.endpoint_metrics():
+            logger.info("Metrics of LLM endpoint %s: %s", metrics.endpoint, metrics.model_dump(exclude={"endpoint"}))
+
+        for (_, asynchronous), client in self._http_clients.items():
+            if asynchronous:
+                await client.aclose()
+            else:
+                client.close()
+
+        self._http_clients.clear()
+        self._limiters.clear()
+        self._rate_limiters.clear()
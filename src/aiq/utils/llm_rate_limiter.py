@@ -0,0 +1,372 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import contextlib
+import contextvars
+import functools
+import heapq
+import inspect
+import itertools
+import logging
+import time
+import typing
+from collections.abc import Iterator
+
+from pydantic import BaseModel
+from pydantic import computed_field
+
+from aiq.data_models.rate_limit_mixin import RateLimitConfig
+from aiq.data_models.rate_limit_mixin import RequestPriority
+from aiq.utils.intermediate_step_utils import report_custom_step
+from aiq.utils.response_cache import IGNORED_ARGUMENTS
+from aiq.utils.response_cache import extract_token_usage
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_STEP_NAME = "llm_rate_limit"
+
+_request_priority: contextvars.ContextVar[RequestPriority] = contextvars.ContextVar("aiq_llm_request_priority",
+                                                                                   default=RequestPriority.NORMAL)
+
+# The rate limiter of the request being sent in the current context, so that nested calls are not limited again
+_current_rate_limiter: contextvars.ContextVar["RateLimiter | None"] = contextvars.ContextVar("aiq_llm_rate_limiter",
+                                                                                             default=None)
+
+
+def get_request_priority() -> RequestPriority:
+    """Return the priority of the model requests made in the current context."""
+    return _request_priority.get()
+
+
+@contextlib.contextmanager
+def llm_request_priority(priority: RequestPriority | str) -> Iterator[None]:
+    """Set the priority of the model requests made within the context, including by tasks started in it."""
+    token = _request_priority.set(RequestPriority(priority))
+    try:
+        yield
+    finally:
+        _request_priority.reset(token)
+
+
+class TokenBucket:
+    """
+    A bucket holding up to `capacity` units which refills at `refill_rate` units per second.
+
+    The level may drop below zero when a request turns out to cost more than was reserved for it, delaying later
+    requests until the debt is refilled.
+    """
+
+    def __init__(self, capacity: float, refill_rate: float):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self._level = capacity
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._level = min(self.capacity, self._level + (now - self._updated) * self.refill_rate)
+        self._updated = now
+
+    @property
+    def level(self) -> float:
+        self._refill()
+        return self._level
+
+    def time_until(self, amount: float) -> float:
+        """Seconds until *amount* units are available. Amounts above the capacity wait for a full bucket."""
+        return max(0.0, (min(amount, self.capacity) - self.level) / self.refill_rate)
+
+    def consume(self, amount: float) -> None:
+        """Take *amount* units from the bucket, or return them if *amount* is negative."""
+        self._refill()
+        self._level = min(self.capacity, self._level - amount)
+
+
+def _text_length(value: typing.Any) -> int:
+    if isinstance(value, str):
+        return len(value)
+    if isinstance(value, dict):
+        return sum(_text_length(v) for k, v in value.items() if k not in IGNORED_ARGUMENTS)
+    if isinstance(value, (list, tuple)):
+        return sum(_text_length(v) for v in value)
+
+    # Chat messages of the supported frameworks
+    content = getattr(value, "content", None)
+    if content is not None:
+        return _text_length(content)
+
+    # LangChain prompt values
+    to_string = getattr(value, "to_string", None)
+    if callable(to_string):
+        try:
+            return len(to_string())
+        except Exception:
+            return 0
+
+    return 0
+
+
+def estimate_prompt_tokens(args: tuple, kwargs: dict[str, typing.Any], chars_per_token: float = 4.0) -> int:
+    """Estimate the prompt tokens of a model request from the length of the text in its arguments."""
+    return round(_text_length([list(args), kwargs]) / chars_per_token)
+
+
+class RateLimitMetrics(BaseModel):
+    """Snapshot of the history of an endpoint's rate limit."""
+    endpoint: str
+    requests: int
+    queued_requests: int
+    queue_depth: int
+    estimated_tokens: int
+    reported_tokens: int
+    total_wait_time: float
+    max_wait_time: float
+
+    @computed_field
+    @property
+    def mean_wait_time(self) -> float:
+        return self.total_wait_time / self.requests if self.requests else 0.0
+
+
+class RateLimiter:
+    """
+    Limits the requests and tokens per minute sent to a model endpoint.
+
+    Requests which cannot be sent yet wait in order of their `RequestPriority`, then in order of arrival, so
+    interactive requests overtake queued batch requests. Before a request is sent, its prompt tokens plus
+    ``estimated_completion_tokens`` are taken from the token bucket. Once the response reports its token usage the
+    difference to the estimate is taken from or returned to the bucket.
+
+    Requests held back by the limit produce an ``llm_rate_limit`` custom step with their wait time, the queue depth
+    and their priority.
+    """
+
+    def __init__(self, config: RateLimitConfig, endpoint: str):
+        self._config = config
+        self._endpoint = endpoint
+
+        self._request_bucket = None
+        if config.requests_per_minute is not None:
+            self._request_bucket = TokenBucket(config.requests_per_minute, config.requests_per_minute / 60.0)
+
+        self._token_bucket = None
+        if config.tokens_per_minute is not None:
+            self._token_bucket = TokenBucket(config.tokens_per_minute, config.tokens_per_minute / 60.0)
+
+        # Heap of (priority rank, arrival number) of the waiting requests
+        self._queue: list[tuple[int, int]] = []
+        self._arrivals = itertools.count()
+        self._condition = asyncio.Condition()
+
+        self._requests = 0
+        self._queued_requests = 0
+        self._estimated_tokens = 0
+        self._reported_tokens = 0
+        self._total_wait_time = 0.0
+        self._max_wait_time = 0.0
+
+    @property
+    def config(self) -> RateLimitConfig:
+        return self._config
+
+    @property
+    def endpoint(self) -> str:
+        return self._endpoint
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._queue)
+
+    def metrics(self) -> RateLimitMetrics:
+        return RateLimitMetrics(endpoint=self._endpoint,
+                                requests=self._requests,
+                                queued_requests=self._queued_requests,
+                                queue_depth=self.queue_depth,
+                                estimated_tokens=self._estimated_tokens,
+                                reported_tokens=self._reported_tokens,
+                                total_wait_time=self._total_wait_time,
+                                max_wait_time=self._max_wait_time)
+
+    def _time_until(self, tokens: int) -> float:
+        delay = 0.0
+        if self._request_bucket is not None:
+            delay = self._request_bucket.time_until(1)
+        if self._token_bucket is not None:
+            delay = max(delay, self._token_bucket.time_until(tokens))
+        return delay
+
+    def _consume(self, tokens: int) -> None:
+        if self._request_bucket is not None:
+            self._request_bucket.consume(1)
+        if self._token_bucket is not None:
+            self._token_bucket.consume(tokens)
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait until a request estimated to use *tokens* tokens can be sent and take them from the buckets."""
+        priority = get_request_priority()
+        start = time.perf_counter()
+
+        async with self._condition:
+            entry = (priority.rank, next(self._arrivals))
+            heapq.heappush(self._queue, entry)
+            queue_depth = len(self._queue) - 1
+            waited = False
+
+            try:
+                while True:
+                    if self._queue[0] == entry:
+                        delay = self._time_until(tokens)
+                        if delay <= 0:
+                            break
+                    else:
+                        delay = None
+
+                    waited = True
+                    # Woken early when the queue changes, for example when a request with a higher priority arrives
+                    with contextlib.suppress(asyncio.TimeoutError):
+                        await asyncio.wait_for(self._condition.wait(), timeout=delay)
+            except BaseException:
+                self._queue.remove(entry)
+                heapq.heapify(self._queue)
+                self._condition.notify_all()
+                raise
+
+            heapq.heappop(self._queue)
+            self._consume(tokens)
+            self._condition.notify_all()
+
+        self._requests += 1
+        self._estimated_tokens += tokens
+
+        if waited:
+            wait_time = time.perf_counter() - start
+            self._queued_requests += 1
+            self._total_wait_time += wait_time
+            self._max_wait_time = max(self._max_wait_time, wait_time)
+            report_custom_step(
+                RATE_LIMIT_STEP_NAME, {
+                    "endpoint": self._endpoint,
+                    "wait_time": wait_time,
+                    "queue_depth": queue_depth,
+                    "priority": priority.value,
+                    "estimated_tokens": tokens
+                })
+
+    def reconcile(self, estimated_tokens: int, response: typing.Any) -> None:
+        """Correct the tokens taken for a request with the token usage reported in its response."""
+        usage = extract_token_usage(response)
+        if usage is None or not usage.total_tokens:
+            return
+
+        self._reported_tokens += usage.total_tokens
+        if self._token_bucket is not None:
+            self._token_bucket.consume(usage.total_tokens - estimated_tokens)
+
+    def estimate_tokens(self, args: tuple, kwargs: dict[str, typing.Any]) -> int:
+        prompt_tokens = estimate_prompt_tokens(args, kwargs, chars_per_token=self._config.chars_per_token)
+        return prompt_tokens + self._config.estimated_completion_tokens
+
+    def _is_nested_call(self) -> bool:
+        return _current_rate_limiter.get() is self
+
+    @contextlib.contextmanager
+    def _sending(self) -> Iterator[None]:
+        token = _current_rate_limiter.set(self)
+        try:
+            yield
+        finally:
+            # Async generators may be finalized in a different context
+            with contextlib.suppress(ValueError):
+                _current_rate_limiter.reset(token)
+
+    def wrap(self, fn: typing.Callable) -> typing.Callable:
+        """
+        Wrap a bound client method so each call waits for the rate limit before it is sent. Nested calls from the same
+        request, for example a streaming method which falls back to the non-streaming one, are covered by the tokens
+        of the outer call. Synchronous methods are returned unchanged.
+        """
+        if inspect.iscoroutinefunction(fn):
+
+            async def _call_async(*args, **kwargs):
+                if self._is_nested_call():
+                    return await fn(*args, **kwargs)
+
+                tokens = self.estimate_tokens(args, kwargs)
+                await self.acquire(tokens)
+                with self._sending():
+                    response = await fn(*args, **kwargs)
+                self.reconcile(tokens, response)
+                return response
+
+            return functools.wraps(fn)(_call_async)
+
+        if inspect.isasyncgenfunction(fn):
+
+            async def _agen(*args, **kwargs):
+                if self._is_nested_call():
+                    async for chunk in fn(*args, **kwargs):
+                        yield chunk
+                    return
+
+                tokens = self.estimate_tokens(args, kwargs)
+                await self.acquire(tokens)
+                # Streams usually report their token usage in the last chunk
+                usage_chunks = []
+                with self._sending():
+                    async for chunk in fn(*args, **kwargs):
+                        if extract_token_usage(chunk) is not None:
+                            usage_chunks.append(chunk)
+                        yield chunk
+                self.reconcile(tokens, usage_chunks)
+
+            return functools.wraps(fn)(_agen)
+
+        return fn
+
+
+def patch_with_limiter(obj: typing.Any,
+                       wrap: typing.Callable[[typing.Callable], typing.Callable],
+                       methods: typing.Iterable[str],
+                       limit_name: str) -> typing.Any:
+    """
+    Patch *obj* instance-locally, replacing each of the given methods with the result of *wrap*. Methods which are
+    missing or which *wrap* returns unchanged are skipped. *limit_name* describes the limit in log messages.
+    """
+    for name in methods:
+        fn = getattr(obj, name, None)
+        if fn is None or not callable(fn):
+            logger.debug("Not applying the %s to %s.%s: no such method", limit_name, type(obj).__name__, name)
+            continue
+
+        wrapped = wrap(fn)
+        if wrapped is fn:
+            logger.debug("Not applying the %s to synchronous method %s.%s", limit_name, type(obj).__name__, name)
+            continue
+
+        try:
+            object.__setattr__(obj, name, wrapped)
+        except Exception as exc:
+            logger.warning("Cannot patch method %s.%s with a %s: %s", type(obj).__name__, name, limit_name, exc)
+
+    return obj
+
+
+def patch_with_rate_limit(obj: typing.Any, limiter: RateLimiter, methods: typing.Iterable[str]) -> typing.Any:
+    """
+    Patch *obj* instance-locally so calls to the given asynchronous methods wait for the rate limit of *limiter*.
+    """
+    return patch_with_limiter(obj, limiter.wrap, methods, "rate limit")
+
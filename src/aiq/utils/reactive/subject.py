@@ -34,7 +34,8 @@ class Subject(Observable[T], Observer[T], SubjectBase[T]):
     A Subject is both an Observer (receives events) and an Observable (sends events).
     - Maintains a list of ObserverBase[T].
     - No internal buffering or replay; events are only delivered to current subscribers.
-    - Thread-safe via a lock.
+    - Thread-safe. Subscribing and unsubscribing replace the observer tuple under a lock (copy-on-write), so emitting
+      only reads the current tuple and does not need to take the lock.
 
     Once on_error or on_complete is called, the Subject is closed.
     """
@@ -44,7 +45,7 @@ class Subject(Observable[T], Observer[T], SubjectBase[T]):
         self._lock = threading.RLock()
         self._closed = False
         self._error: Exception | None = None
-        self._observers: list[Observer[T]] = []
+        self._observers: tuple[Observer[T], ...] = ()
         self._disposed = False
 
     # ==========================================================================
@@ -60,9 +61,16 @@ class Subject(Observable[T], Observer[T], SubjectBase[T]):
                 # Already disposed => no subscription
                 return Subscription(self, None)
 
-            self._observers.append(observer)
+            self._observers = self._observers + (observer, )
             return Subscription(self, observer)
 
+    @property
+    def has_observers(self) -> bool:
+        """
+        Whether any observer is subscribed. Producers can check this to skip building items nobody receives.
+        """
+        return len(self._observers) > 0
+
     # ==========================================================================
     # ObserverBase[T] - for producers
     # ==========================================================================
@@ -71,26 +79,21 @@ class Subject(Observable[T], Observer[T], SubjectBase[T]):
         Called by producers to emit an item. Delivers synchronously to each observer.
         If closed or disposed, do nothing.
         """
-        with self._lock:
-            if self._closed or self._disposed:
-                return
-            # Copy the current observers to avoid mutation issues
-            current_observers = list(self._observers)
+        if self._closed or self._disposed:
+            return
 
-        # Deliver outside the lock
-        for obs in current_observers:
+        # The tuple is never mutated, so iterating the current reference is safe without the lock
+        for obs in self._observers:
             obs.on_next(value)
 
     def on_error(self, exc: Exception) -> None:
         """
         Called by producers to signal an error. Notifies all observers.
         """
-        with self._lock:
-            if self._closed or self._disposed:
-                return
-            current_obs = list(self._observers)
+        if self._closed or self._disposed:
+            return
 
-        for obs in current_obs:
+        for obs in self._observers:
             obs.on_error(exc)
 
     def on_complete(self) -> None:
@@ -101,7 +104,7 @@ class Subject(Observable[T], Observer[T], SubjectBase[T]):
         with self._lock:
             if self._closed or self._disposed:
                 return
-            current_observers = list(self._observers)
+            current_observers = self._observers
             self.dispose()
 
         for obs in current_observers:
@@ -113,7 +116,9 @@ class Subject(Observable[T], Observer[T], SubjectBase[T]):
     def _unsubscribe_observer(self, observer: Observer[T]) -> None:
         with self._lock:
             if not self._disposed and observer in self._observers:
-                self._observers.remove(observer)
+                observers = list(self._observers)
+                observers.remove(observer)
+                self._observers = tuple(observers)
 
     # ==========================================================================
     # Disposal
@@ -126,6 +131,6 @@ class Subject(Observable[T], Observer[T], SubjectBase[T]):
         with self._lock:
             if not self._disposed:
                 self._disposed = True
-                self._observers.clear()
+                self._observers = ()
                 self._closed = True
                 self._error = None
@@ -0,0 +1,660 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import dataclasses
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import os
+import sqlite3
+import sys
+import threading
+import time
+import typing
+from abc import ABC
+from abc import abstractmethod
+from collections import OrderedDict
+
+from pydantic import BaseModel
+
+from aiq.builder.framework_enum import LLMFrameworkEnum
+from aiq.data_models.object_store import NoSuchKeyError
+from aiq.data_models.response_cache_mixin import CacheBackendConfig
+from aiq.data_models.response_cache_mixin import ResponseCacheConfig
+from aiq.object_store.interfaces import ObjectStore
+from aiq.object_store.models import ObjectStoreItem
+from aiq.profiler.callbacks.token_usage_base_model import TokenUsageBaseModel
+from aiq.utils.intermediate_step_utils import report_custom_step
+
+if typing.TYPE_CHECKING:
+    from aiq.builder.builder import Builder
+
+logger = logging.getLogger(__name__)
+
+# Request methods of the framework clients returned by `Builder.get_llm`
+DEFAULT_CACHED_METHODS: dict[LLMFrameworkEnum, tuple[str, ...]] = {
+    LLMFrameworkEnum.LANGCHAIN: ("invoke", "ainvoke", "stream", "astream"),
+    LLMFrameworkEnum.LLAMA_INDEX: ("chat", "achat", "complete", "acomplete"),
+    LLMFrameworkEnum.CREWAI: ("call", ),
+    LLMFrameworkEnum.SEMANTIC_KERNEL: ("get_chat_message_contents", ),
+}
+
+# Arguments which carry callbacks and tracing state and do not change the response
+IGNORED_ARGUMENTS = frozenset({"config", "callbacks", "run_manager", "run_id", "tags", "metadata"})
+
+# Configuration fields which do not change the response
+IGNORED_CONFIG_FIELDS = frozenset({"api_key", "response_cache"})
+
+# Attributes of framework clients which change the response. They are part of the key in case a client was created or
+# modified with parameters which differ from the model configuration.
+CLIENT_PARAMETERS = ("model", "model_name", "temperature", "top_p", "top_k", "max_tokens", "seed", "stop")
+
+CACHE_STEP_NAME = "response_cache"
+
+
+@dataclasses.dataclass
+class CacheEntry:
+    """A cached response along with the cost of originally producing it."""
+    response: typing.Any
+    latency: float
+    token_usage: TokenUsageBaseModel | None = None
+    created_at: float = dataclasses.field(default_factory=time.time)
+
+
+class ResponseCacheBackend(ABC):
+    """Storage of serialized cache entries keyed by request hash."""
+
+    @abstractmethod
+    async def aget(self, key: str) -> bytes | None:
+        pass
+
+    @abstractmethod
+    async def aset(self, key: str, value: bytes) -> None:
+        pass
+
+    def get(self, key: str) -> bytes | None:
+        """Synchronous lookup. Backends which can only be accessed asynchronously raise `NotImplementedError`."""
+        raise NotImplementedError(f"{type(self).__name__} does not support synchronous access")
+
+    def set(self, key: str, value: bytes) -> None:
+        raise NotImplementedError(f"{type(self).__name__} does not support synchronous access")
+
+    @property
+    def supports_sync(self) -> bool:
+        return False
+
+    async def aclose(self) -> None:
+        pass
+
+
+class InMemoryResponseCacheBackend(ResponseCacheBackend):
+    """Least recently used cache held in process memory."""
+
+    def __init__(self, max_entries: int = 1024, ttl: float | None = None):
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def supports_sync(self) -> bool:
+        return True
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            stored_at, value = item
+            if self._ttl is not None and time.time() - stored_at > self._ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes) -> None:
+        with self._lock:
+            self._entries[key] = (time.time(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    async def aget(self, key: str) -> bytes | None:
+        return self.get(key)
+
+    async def aset(self, key: str, value: bytes) -> None:
+        self.set(key, value)
+
+
+class SQLiteResponseCacheBackend(ResponseCacheBackend):
+    """Least recently used cache persisted to a SQLite database, shared between runs."""
+
+    def __init__(self, path: str, max_entries: int = 1024, ttl: float | None = None):
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._lock = threading.Lock()
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("CREATE TABLE IF NOT EXISTS response_cache "
+                               "(key TEXT PRIMARY KEY, value BLOB NOT NULL, stored_at REAL NOT NULL, "
+                               "accessed_at REAL NOT NULL)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS response_cache_accessed_at "
+                               "ON response_cache (accessed_at)")
+
+    @property
+    def supports_sync(self) -> bool:
+        return True
+
+    def get(self, key: str) -> bytes | None:
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT value, stored_at FROM response_cache WHERE key = ?", (key, )).fetchone()
+            if row is None:
+                return None
+            value, stored_at = row
+            if self._ttl is not None and now - stored_at > self._ttl:
+                self._conn.execute("DELETE FROM response_cache WHERE key = ?", (key, ))
+                return None
+            self._conn.execute("UPDATE response_cache SET accessed_at = ? WHERE key = ?", (now, key))
+            return value
+
+    def set(self, key: str, value: bytes) -> None:
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO response_cache VALUES (?, ?, ?, ?)", (key, value, now, now))
+            self._conn.execute(
+                "DELETE FROM response_cache WHERE key IN "
+                "(SELECT key FROM response_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)", (self._max_entries, ))
+
+    async def aget(self, key: str) -> bytes | None:
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: str, value: bytes) -> None:
+        await asyncio.to_thread(self.set, key, value)
+
+    async def aclose(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class ObjectStoreResponseCacheBackend(ResponseCacheBackend):
+    """Cache stored in an object store. Entry eviction is left to the object store."""
+
+    def __init__(self, object_store: ObjectStore, key_prefix: str = "response_cache/", ttl: float | None = None):
+        self._object_store = object_store
+        self._key_prefix = key_prefix
+        self._ttl = ttl
+
+    async def aget(self, key: str) -> bytes | None:
+        try:
+            item = await self._object_store.get_object(self._key_prefix + key)
+        except NoSuchKeyError:
+            return None
+
+        stored_at = float((item.metadata or {}).get("stored_at", 0.0))
+        if self._ttl is not None and time.time() - stored_at > self._ttl:
+            return None
+
+        return item.data
+
+    async def aset(self, key: str, value: bytes) -> None:
+        item = ObjectStoreItem(data=value,
+                               content_type="application/octet-stream",
+                               metadata={"stored_at": str(time.time())})
+        await self._object_store.upsert_object(self._key_prefix + key, item)
+
+
+def _to_json_value(value: typing.Any) -> typing.Any:
+    """Convert a cached value into a JSON serializable structure, recording the class of pydantic models."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, BaseModel):
+        model_type = type(value)
+        return {
+            "__model__": f"{model_type.__module__}:{model_type.__qualname__}",
+            "data": json.loads(value.model_dump_json(round_trip=True))
+        }
+    if isinstance(value, (list, tuple)):
+        return [_to_json_value(v) for v in value]
+    if isinstance(value, dict) and all(isinstance(k, str) for k in value):
+        return {"__dict__": {k: _to_json_value(v) for k, v in value.items()}}
+    raise TypeError(f"Values of type {type(value).__name__} cannot be cached")
+
+
+def _resolve_model_type(path: str) -> type[BaseModel]:
+    """
+    Look up the class of a cached pydantic model. Only classes of modules which are already imported are resolved, so
+    reading an entry never imports code.
+    """
+    module_name, _, qualname = path.partition(":")
+    module = sys.modules.get(module_name)
+    if module is None:
+        raise ValueError(f"Module `{module_name}` of a cached value is not imported")
+
+    model_type: typing.Any = module
+    for part in qualname.split("."):
+        model_type = getattr(model_type, part)
+
+    if not isinstance(model_type, type) or not issubclass(model_type, BaseModel):
+        raise TypeError(f"`{path}` is not a pydantic model")
+
+    return model_type
+
+
+def _from_json_value(value: typing.Any) -> typing.Any:
+    """Inverse of `_to_json_value`."""
+    if isinstance(value, list):
+        return [_from_json_value(v) for v in value]
+    if isinstance(value, dict):
+        if "__model__" in value:
+            return _resolve_model_type(value["__model__"]).model_validate(value["data"])
+        return {k: _from_json_value(v) for k, v in value["__dict__"].items()}
+    return value
+
+
+def decode_cache_entry(raw: bytes | None) -> CacheEntry | None:
+    """Deserialize an entry read from a cache backend, discarding entries which cannot be read."""
+    if raw is None:
+        return None
+    try:
+        data = json.loads(raw)
+        token_usage = data.get("token_usage")
+        return CacheEntry(response=_from_json_value(data["response"]),
+                          latency=data["latency"],
+                          token_usage=TokenUsageBaseModel.model_validate(token_usage) if token_usage else None,
+                          created_at=data["created_at"])
+    except Exception:
+        logger.warning("Discarding unreadable cache entry", exc_info=True)
+        return None
+
+
+def encode_cache_entry(entry: CacheEntry) -> bytes | None:
+    """
+    Serialize an entry for a cache backend as JSON. Responses may be JSON values, pydantic models, or lists and string
+    keyed dictionaries of those. Returns `None` if the cached value cannot be serialized.
+    """
+    try:
+        return json.dumps({
+            "response": _to_json_value(entry.response),
+            "latency": entry.latency,
+            "token_usage": entry.token_usage.model_dump() if entry.token_usage else None,
+            "created_at": entry.created_at,
+        }).encode("utf-8")
+    except Exception as e:
+        logger.debug("Value of type %s cannot be cached: %s", type(entry.response).__name__, e)
+        return None
+
+
+def _to_canonical(value: typing.Any) -> typing.Any:
+    """Convert *value* into a JSON serializable structure which is identical for equal requests."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, BaseModel):
+        try:
+            return {"__type__": type(value).__qualname__, **_to_canonical(value.model_dump(mode="json"))}
+        except Exception:
+            return repr(value)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return _to_canonical(dataclasses.asdict(value))
+    if isinstance(value, dict):
+        return {str(k): _to_canonical(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_canonical(v) for v in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted((_to_canonical(v) for v in value), key=repr)
+    if isinstance(value, bytes):
+        return value.hex()
+    if callable(value) and hasattr(value, "__qualname__"):
+        return f"{getattr(value, '__module__', '')}.{value.__qualname__}"
+    return repr(value)
+
+
+def compute_cache_key(model_config: BaseModel | dict[str, typing.Any],
+                      method_name: str,
+                      arguments: dict[str, typing.Any],
+                      client_parameters: dict[str, typing.Any] | None = None) -> str:
+    """
+    Compute a stable hash of a model request.
+
+    Args:
+        model_config (BaseModel | dict[str, typing.Any]): The configuration of the model, including sampling
+            parameters. Every field except credentials and cache settings is part of the key.
+        method_name (str): The client method being called.
+        arguments (dict[str, typing.Any]): The arguments of the call, for example messages and tool schemas.
+        client_parameters (dict[str, typing.Any] | None): The type and sampling parameters of the client the call is
+            made on, see `get_client_parameters`.
+
+    Returns:
+        str: A hex encoded SHA-256 digest.
+    """
+    if isinstance(model_config, BaseModel):
+        model_config = {
+            "__type__": getattr(type(model_config), "full_type", type(model_config).__qualname__),
+            **model_config.model_dump(mode="json", exclude=set(IGNORED_CONFIG_FIELDS))
+        }
+
+    payload = {"config": model_config, "method": method_name, "arguments": arguments}
+    if client_parameters is not None:
+        payload["client"] = client_parameters
+    serialized = json.dumps(_to_canonical(payload), sort_keys=True, separators=(",", ":"), default=repr)
+
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def get_client_parameters(client: typing.Any) -> dict[str, typing.Any]:
+    """Return the type of a framework client and the values of its `CLIENT_PARAMETERS` attributes."""
+    parameters: dict[str, typing.Any] = {"__type__": f"{type(client).__module__}.{type(client).__qualname__}"}
+    for name in CLIENT_PARAMETERS:
+        try:
+            value = getattr(client, name)
+        except Exception:
+            continue
+        if value is None or isinstance(value, (bool, int, float, str, list, tuple)):
+            parameters[name] = value
+
+    return parameters
+
+
+def extract_token_usage(response: typing.Any) -> TokenUsageBaseModel | None:
+    """Return the token usage reported in a framework response, if any."""
+    if isinstance(response, (list, tuple)):
+        usages = [u for u in (extract_token_usage(r) for r in response) if u is not None]
+        if not usages:
+            return None
+        return TokenUsageBaseModel(prompt_tokens=sum(u.prompt_tokens for u in usages),
+                                   completion_tokens=sum(u.completion_tokens for u in usages),
+                                   total_tokens=sum(u.total_tokens for u in usages))
+
+    # LangChain messages
+    usage_metadata = getattr(response, "usage_metadata", None)
+    if isinstance(usage_metadata, dict):
+        return TokenUsageBaseModel(prompt_tokens=usage_metadata.get("input_tokens", 0),
+                                   completion_tokens=usage_metadata.get("output_tokens", 0),
+                                   total_tokens=usage_metadata.get("total_tokens", 0))
+
+    # OpenAI compatible responses, possibly wrapped in a `raw` attribute
+    for candidate in (response, getattr(response, "raw", None)):
+        usage = candidate.get("usage") if isinstance(candidate, dict) else getattr(candidate, "usage", None)
+        if usage is None:
+            continue
+        if not isinstance(usage, dict):
+            usage = {k: getattr(usage, k, 0) for k in ("prompt_tokens", "completion_tokens", "total_tokens")}
+        try:
+            return TokenUsageBaseModel(prompt_tokens=usage.get("prompt_tokens") or 0,
+                                       completion_tokens=usage.get("completion_tokens") or 0,
+                                       total_tokens=usage.get("total_tokens") or 0)
+        except Exception:
+            return None
+
+    return None
+
+
+class ResponseCache:
+    """
+    Caches the responses of model client methods.
+
+    Requests are keyed on a hash of the model configuration, the type and sampling parameters of the client, the method
+    name and the call arguments (messages, tool schemas, sampling parameters). Lookups show up in the trace as
+    ``response_cache`` custom steps with ``cache_hit`` and, for hits, the latency and token usage that the cached
+    response originally cost.
+    """
+
+    def __init__(self, backend: ResponseCacheBackend, model_config: BaseModel, name: str | None = None):
+        self._backend = backend
+        self._model_config = model_config
+        self._name = name
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def backend(self) -> ResponseCacheBackend:
+        return self._backend
+
+    async def aclose(self) -> None:
+        await self._backend.aclose()
+
+    def _key_for(self,
+                 method_name: str,
+                 signature: inspect.Signature | None,
+                 client: typing.Any,
+                 args: tuple,
+                 kwargs: dict[str, typing.Any]) -> str:
+        arguments: dict[str, typing.Any]
+        try:
+            if signature is None:
+                raise TypeError("No signature")
+            arguments = dict(signature.bind(*args, **kwargs).arguments)
+        except TypeError:
+            arguments = {"args": list(args), **kwargs}
+
+        for param_name, value in list(arguments.items()):
+            if param_name in IGNORED_ARGUMENTS:
+                del arguments[param_name]
+            elif signature is not None and param_name in signature.parameters and signature.parameters[
+                    param_name].kind == inspect.Parameter.VAR_KEYWORD:
+                del arguments[param_name]
+                arguments.update({k: v for k, v in value.items() if k not in IGNORED_ARGUMENTS})
+
+        client_parameters = get_client_parameters(client) if client is not None else None
+
+        return compute_cache_key(self._model_config, method_name, arguments, client_parameters)
+
+    @staticmethod
+    def _decode(raw: bytes | None) -> CacheEntry | None:
+        return decode_cache_entry(raw)
+
+    @staticmethod
+    def _encode(entry: CacheEntry) -> bytes | None:
+        return encode_cache_entry(entry)
+
+    def _report(self, key: str, method_name: str, entry: CacheEntry | None, latency: float | None = None) -> None:
+        if entry is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+        metadata: dict[str, typing.Any] = {
+            "cache_hit": entry is not None, "cache_key": key, "method": method_name, "llm_name": self._name
+        }
+        if entry is not None:
+            metadata["saved_latency"] = entry.latency
+            metadata["saved_token_usage"] = entry.token_usage.model_dump() if entry.token_usage else None
+        elif latency is not None:
+            metadata["latency"] = latency
+
+        report_custom_step(CACHE_STEP_NAME, metadata)
+
+    def wrap(self, method_name: str, fn: typing.Callable, client: typing.Any = None) -> typing.Callable:
+        """
+        Wrap a bound client method so identical calls are answered from the cache.
+
+        Args:
+            method_name (str): The name of the method, part of the cache key.
+            fn (typing.Callable): The bound method to wrap.
+            client (typing.Any): The client *fn* is bound to. Its type and sampling parameters are part of the key.
+
+        Returns:
+            typing.Callable: A function with the same calling convention as *fn*.
+        """
+        try:
+            signature = inspect.signature(fn)
+        except (TypeError, ValueError):
+            signature = None
+
+        if inspect.iscoroutinefunction(fn):
+
+            async def _call_async(*args, **kwargs):
+                key = self._key_for(method_name, signature, client, args, kwargs)
+                entry = self._decode(await self._backend.aget(key))
+                if entry is not None:
+                    self._report(key, method_name, entry)
+                    return entry.response
+
+                start = time.perf_counter()
+                response = await fn(*args, **kwargs)
+                latency = time.perf_counter() - start
+                self._report(key, method_name, None, latency)
+
+                encoded = self._encode(CacheEntry(response, latency, extract_token_usage(response)))
+                if encoded is not None:
+                    await self._backend.aset(key, encoded)
+                return response
+
+            return functools.wraps(fn)(_call_async)
+
+        if inspect.isasyncgenfunction(fn):
+
+            async def _agen(*args, **kwargs):
+                key = self._key_for(method_name, signature, client, args, kwargs)
+                entry = self._decode(await self._backend.aget(key))
+                if entry is not None:
+                    self._report(key, method_name, entry)
+                    for chunk in entry.response:
+                        yield chunk
+                    return
+
+                start = time.perf_counter()
+                chunks = []
+                async for chunk in fn(*args, **kwargs):
+                    chunks.append(chunk)
+                    yield chunk
+                latency = time.perf_counter() - start
+                self._report(key, method_name, None, latency)
+
+                encoded = self._encode(CacheEntry(chunks, latency, extract_token_usage(chunks)))
+                if encoded is not None:
+                    await self._backend.aset(key, encoded)
+
+            return functools.wraps(fn)(_agen)
+
+        if not self._backend.supports_sync:
+            logger.warning("Not caching synchronous method `%s`: %s can only be accessed asynchronously",
+                           method_name,
+                           type(self._backend).__name__)
+            return fn
+
+        if inspect.isgeneratorfunction(fn):
+
+            def _gen(*args, **kwargs):
+                key = self._key_for(method_name, signature, client, args, kwargs)
+                entry = self._decode(self._backend.get(key))
+                if entry is not None:
+                    self._report(key, method_name, entry)
+                    yield from entry.response
+                    return
+
+                start = time.perf_counter()
+                chunks = []
+                for chunk in fn(*args, **kwargs):
+                    chunks.append(chunk)
+                    yield chunk
+                latency = time.perf_counter() - start
+                self._report(key, method_name, None, latency)
+
+                encoded = self._encode(CacheEntry(chunks, latency, extract_token_usage(chunks)))
+                if encoded is not None:
+                    self._backend.set(key, encoded)
+
+            return functools.wraps(fn)(_gen)
+
+        def _call_sync(*args, **kwargs):
+            key = self._key_for(method_name, signature, client, args, kwargs)
+            entry = self._decode(self._backend.get(key))
+            if entry is not None:
+                self._report(key, method_name, entry)
+                return entry.response
+
+            start = time.perf_counter()
+            response = fn(*args, **kwargs)
+            latency = time.perf_counter() - start
+            self._report(key, method_name, None, latency)
+
+            encoded = self._encode(CacheEntry(response, latency, extract_token_usage(response)))
+            if encoded is not None:
+                self._backend.set(key, encoded)
+            return response
+
+        return functools.wraps(fn)(_call_sync)
+
+
+def patch_with_cache(obj: typing.Any, cache: ResponseCache, methods: typing.Iterable[str]) -> typing.Any:
+    """
+    Patch *obj* instance-locally so the given methods are answered from *cache* for repeated requests.
+
+    Methods which were already patched on the instance, for example with automatic retries, are wrapped as they are so
+    that only cache misses reach the retry logic.
+    """
+    for name in methods:
+        fn = getattr(obj, name, None)
+        if fn is None or not callable(fn):
+            logger.debug("Not caching %s.%s: no such method", type(obj).__name__, name)
+            continue
+
+        wrapped = cache.wrap(name, fn, client=obj)
+        if wrapped is fn:
+            continue
+
+        try:
+            object.__setattr__(obj, name, wrapped)
+        except Exception as exc:
+            logger.warning("Cannot patch method %s.%s with a response cache: %s", type(obj).__name__, name, exc)
+
+    return obj
+
+
+async def build_cache_backend(config: CacheBackendConfig, builder: "Builder") -> ResponseCacheBackend:
+    """Create the storage described by *config*."""
+    match config.backend:
+        case "memory":
+            return InMemoryResponseCacheBackend(max_entries=config.max_entries, ttl=config.ttl)
+        case "sqlite":
+            return SQLiteResponseCacheBackend(config.sqlite_path, max_entries=config.max_entries, ttl=config.ttl)
+        case "object_store":
+            assert config.object_store is not None
+            object_store = await builder.get_object_store_client(config.object_store)
+            return ObjectStoreResponseCacheBackend(object_store, key_prefix=config.key_prefix, ttl=config.ttl)
+        case _:
+            raise ValueError(f"Unknown cache backend `{config.backend}`")
+
+
+async def build_response_cache(config: ResponseCacheConfig,
+                               model_config: BaseModel,
+                               builder: "Builder",
+                               name: str | None = None) -> ResponseCache:
+    """Create the response cache described by *config* for a model configured with *model_config*."""
+    backend = await build_cache_backend(config, builder)
+
+    return ResponseCache(backend, model_config, name=name)
+
+
+def cached_methods(config: ResponseCacheConfig, wrapper_type: LLMFrameworkEnum | str) -> tuple[str, ...]:
+    """Return the methods to cache for a client of the given framework."""
+    if config.methods is not None:
+        return tuple(config.methods)
+
+    try:
+        return DEFAULT_CACHED_METHODS.get(LLMFrameworkEnum(wrapper_type), ())
+    except ValueError:
+        return ()
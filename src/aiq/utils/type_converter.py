@@ -17,6 +17,7 @@ import logging
 import typing
 from collections import OrderedDict
 from collections.abc import Callable
+from functools import lru_cache
 from io import TextIOWrapper
 
 from aiq.utils.type_utils import DecomposedType
@@ -30,6 +31,35 @@ class ConvertException(Exception):
     pass
 
 
+@lru_cache(maxsize=1024)
+def _decompose_hashable(to_type: type) -> DecomposedType:
+    return DecomposedType(to_type)
+
+
+def _decompose(to_type: type) -> DecomposedType:
+    """
+    Returns a shared DecomposedType for `to_type` so that its lazily computed properties are only computed once.
+    """
+    try:
+        return _decompose_hashable(to_type)
+    except TypeError:
+        # Some annotations (i.e. Annotated with unhashable metadata) cannot be cached
+        return DecomposedType(to_type)
+
+
+class _ConversionChain:
+    """
+    The converters of an indirect conversion together with the type each of them produced. A chain is only reusable
+    if the search which found it never depended on a converter rejecting a value.
+    """
+
+    __slots__ = ("steps", "cacheable")
+
+    def __init__(self):
+        self.steps: list[tuple[Callable, type]] = []
+        self.cacheable = True
+
+
 class TypeConverter:
     _global_initialized = False
 
@@ -43,6 +73,13 @@ class TypeConverter:
         self._converters: OrderedDict[type, OrderedDict[type, Callable]] = OrderedDict()
         self._indirect_warnings_shown: set[tuple[type, type]] = set()
 
+        # Resolved conversion plans of this converter's registry, keyed by (source type, target type). Both are
+        # cleared whenever a converter is added.
+        # dict[(from_type, target_root_type), list[converter]]: candidate direct converters in registration order
+        self._direct_plans: dict[tuple[type, type], list[Callable]] = {}
+        # dict[(from_type, to_type), list[(converter, produced_type)]]: the chain found by the DFS
+        self._indirect_plans: dict[tuple[type, typing.Any], list[tuple[Callable, type]]] = {}
+
         for converter in converters:
             self.add_converter(converter)
 
@@ -70,11 +107,14 @@ class TypeConverter:
         self._converters.setdefault(to_type, OrderedDict())[from_type] = converter
         # to do(MDD): If needed, sort by specificity here.
 
+        self._direct_plans.clear()
+        self._indirect_plans.clear()
+
     def _convert(self, data, to_type: type[_T]) -> _T | None:
         """
         Attempts to convert `data` into `to_type`. Returns None if no path is found.
         """
-        decomposed = DecomposedType(to_type)
+        decomposed = _decompose(to_type)
 
         # 1) If data is already correct type, return it
         if to_type is None or decomposed.is_instance((data, to_type)):
@@ -130,15 +170,11 @@ class TypeConverter:
         If no match here, we forward to parent's direct conversion
         for recursion up the chain.
         """
-        for convert_to_type, to_type_converters in self._converters.items():
-            # e.g. if Derived is a subclass of Base, this is valid
-            if issubclass(DecomposedType(convert_to_type).root, target_root_type):
-                for convert_from_type, from_type_converter in to_type_converters.items():
-                    if isinstance(data, DecomposedType(convert_from_type).root):
-                        try:
-                            return from_type_converter(data)
-                        except ConvertException:
-                            pass
+        for from_type_converter in self._get_direct_plan(type(data), target_root_type):
+            try:
+                return from_type_converter(data)
+            except ConvertException:
+                pass
 
         # If we can't convert directly here, try parent
         if self._parent is not None:
@@ -146,6 +182,28 @@ class TypeConverter:
 
         return None
 
+    def _get_direct_plan(self, source_type: type, target_root_type: type) -> list[Callable]:
+        """
+        Returns the converters of *this* registry which can directly convert an instance of `source_type` into
+        `target_root_type`, in the order they should be tried. The result only depends on the types, so it is resolved
+        once per pair.
+        """
+        key = (source_type, target_root_type)
+        plan = self._direct_plans.get(key)
+        if plan is not None:
+            return plan
+
+        plan = []
+        for convert_to_type, to_type_converters in self._converters.items():
+            # e.g. if Derived is a subclass of Base, this is valid
+            if issubclass(_decompose(convert_to_type).root, target_root_type):
+                for convert_from_type, from_type_converter in to_type_converters.items():
+                    if issubclass(source_type, _decompose(convert_from_type).root):
+                        plan.append(from_type_converter)
+
+        self._direct_plans[key] = plan
+        return plan
+
     # -------------------------------------------------
     # INTERNAL INDIRECT CONVERSION (with parent fallback)
     # -------------------------------------------------
@@ -154,8 +212,14 @@ class TypeConverter:
         Attempt indirect conversion (DFS) in *this* converter.
         If no success, fallback to parent's indirect attempt.
         """
-        visited = set()
-        final = self._try_indirect_conversion(data, to_type, visited)
+        final = self._try_indirect_plan(data, to_type)
+        if final is None:
+            visited = set()
+            chain = _ConversionChain()
+            final = self._try_indirect_conversion(data, to_type, visited, chain)
+            if final is not None and chain.cacheable:
+                self._indirect_plans[(type(data), to_type)] = chain.steps
+
         if final is not None:
             # Warn once if found a chain
             self._maybe_warn_indirect(type(data), to_type)
@@ -170,10 +234,35 @@ class TypeConverter:
 
         return None
 
-    def _try_indirect_conversion(self, data: typing.Any, to_type: type[_T], visited: set[type]) -> _T | None:
+    def _try_indirect_plan(self, data: typing.Any, to_type: type[_T]) -> _T | None:
+        """
+        Replays the chain the DFS found for a value of the same type. The DFS only branches on types, so as long as
+        every converter produces the same type as before it would take the same path. Returns None if a converter
+        rejects the value or produces a different type, in which case the caller runs the DFS.
+        """
+        chain = self._indirect_plans.get((type(data), to_type))
+        if chain is None:
+            return None
+
+        try:
+            for converter, produced_type in chain:
+                data = converter(data)
+                if type(data) is not produced_type:
+                    return None
+        except ConvertException:
+            return None
+
+        return data
+
+    def _try_indirect_conversion(self,
+                                 data: typing.Any,
+                                 to_type: type[_T],
+                                 visited: set[type],
+                                 chain: _ConversionChain | None = None) -> _T | None:
         """
         DFS attempt to find a chain of conversions from type(data) to to_type,
-        ignoring parent. If not found, returns None.
+        ignoring parent. If not found, returns None. If `chain` is given, it
+        receives the steps of the chain which was found.
         """
         # 1) If data is already correct type
         if isinstance(data, to_type):
@@ -191,14 +280,19 @@ class TypeConverter:
                 if isinstance(data, convert_from_type):
                     try:
                         next_data = from_type_converter(data)
+                        if chain is not None:
+                            chain.steps.append((from_type_converter, type(next_data)))
                         if isinstance(next_data, to_type):
                             return next_data
                         # else keep going
-                        deeper = self._try_indirect_conversion(next_data, to_type, visited)
+                        deeper = self._try_indirect_conversion(next_data, to_type, visited, chain)
                         if deeper is not None:
                             return deeper
+                        if chain is not None:
+                            chain.steps.pop()
                     except ConvertException:
-                        pass
+                        if chain is not None:
+                            chain.cacheable = False
 
         return None
 
@@ -288,3 +288,140 @@ def test_validate_solver_prompt_no_input():
 def test_validate_solver_prompt():
     mock_prompt = 'solve the problem'
     assert ReWOOAgentGraph.validate_solver_prompt(mock_prompt)
+
+
+def test_get_step_dependencies():
+    steps = [
+        _create_step_info("step1", "#E1", "mock_tool_A", "arg1"),
+        _create_step_info("step2", "#E2", "mock_tool_B", {"query": "arg2"}),
+        _create_step_info("step3", "#E3", "mock_tool_A", {
+            "query": "#E1", "other": "#E2"
+        }),
+        _create_step_info("step4", "#E4", "mock_tool_B", "Use #E3 and #E5"),
+        _create_step_info("step5", "#E5", "mock_tool_A", "arg5"),
+    ]
+    # references to placeholders of later steps are not dependencies, matching the sequential executor
+    assert ReWOOAgentGraph._get_step_dependencies(steps) == {
+        "#E1": set(), "#E2": set(), "#E3": {"#E1", "#E2"}, "#E4": {"#E3"}, "#E5": set()
+    }
+
+
+def test_get_step_dependencies_matches_whole_placeholders():
+    steps = [_create_step_info(f"step{i}", f"#E{i}", "mock_tool_A", f"arg{i}") for i in range(1, 11)]
+    steps.append(_create_step_info("step11", "#E11", "mock_tool_B", "Use #E10"))
+    # A step referencing its own placeholder, or reusing the placeholder of an earlier step, does not depend on itself
+    steps.append(_create_step_info("step12", "#E12", "mock_tool_B", "Use #E12"))
+    steps.append(_create_step_info("step13", "#E1", "mock_tool_B", "Use #E1 and #E2"))
+
+    dependencies = ReWOOAgentGraph._get_step_dependencies(steps)
+    assert dependencies["#E11"] == {"#E10"}
+    assert dependencies["#E12"] == set()
+    assert dependencies["#E1"] == {"#E2"}
+
+
+def test_get_step_dependencies_uses_plan_placeholders():
+    steps = [
+        _create_step_info("step1", "$Evidence1", "mock_tool_A", "arg1"),
+        _create_step_info("step2", "E2", "mock_tool_B", "arg2"),
+        _create_step_info("step3", "[E3]", "mock_tool_A", "Use $Evidence1, E2 and E20"),
+        _create_step_info("step4", "#E4", "mock_tool_B", {"query": "[E3]", "other": "$Evidence10"}),
+    ]
+
+    assert ReWOOAgentGraph._get_step_dependencies(steps) == {
+        "$Evidence1": set(), "E2": set(), "[E3]": {"$Evidence1", "E2"}, "#E4": {"[E3]"}
+    }
+
+
+async def test_executor_node_parallel_execution_unresolvable_dependencies(mock_llm, mock_tool):
+    agent = ReWOOAgentGraph(llm=mock_llm,
+                            planner_prompt=rewoo_planner_prompt,
+                            solver_prompt=rewoo_solver_prompt,
+                            tools=[mock_tool('mock_tool_A')],
+                            parallel_execution=True)
+    mock_state = ReWOOGraphState(task=HumanMessage(content="This is a task"),
+                                 plan=AIMessage(content="This is the plan"),
+                                 steps=AIMessage(content=[
+                                     _create_step_info("step1", "#E1", "mock_tool_A", "#E2"),
+                                     _create_step_info("step2", "#E2", "mock_tool_A", "#E1"),
+                                 ]),
+                                 intermediate_results={})
+
+    with patch.object(agent, "_get_step_dependencies", return_value={"#E1": {"#E2"}, "#E2": {"#E1"}}):
+        with pytest.raises(RuntimeError, match="never resolved"):
+            await agent.executor_node(mock_state)
+
+
+def test_rewoo_init_invalid_max_concurrent_tool_calls(mock_llm, mock_tool):
+    with pytest.raises(ValueError):
+        ReWOOAgentGraph(llm=mock_llm,
+                        planner_prompt=rewoo_planner_prompt,
+                        solver_prompt=rewoo_solver_prompt,
+                        tools=[mock_tool('mock_tool_A')],
+                        parallel_execution=True,
+                        max_concurrent_tool_calls=0)
+
+
+@pytest.mark.parametrize("max_concurrent_tool_calls", [1, 2, 4])
+async def test_executor_node_parallel_execution(mock_llm, mock_tool, max_concurrent_tool_calls: int):
+    import asyncio
+
+    tools = [mock_tool('mock_tool_A'), mock_tool('mock_tool_B')]
+    agent = ReWOOAgentGraph(llm=mock_llm,
+                            planner_prompt=rewoo_planner_prompt,
+                            solver_prompt=rewoo_solver_prompt,
+                            tools=tools,
+                            parallel_execution=True,
+                            max_concurrent_tool_calls=max_concurrent_tool_calls)
+
+    in_flight = 0
+    max_in_flight = 0
+    call_order = []
+
+    async def _call_tool(tool, tool_input, config=None, max_retries=3):  # pylint: disable=unused-argument
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        call_order.append(tool_input)
+        return f"result of {tool_input}"
+
+    mock_state = ReWOOGraphState(task=HumanMessage(content="This is a task"),
+                                 plan=AIMessage(content="This is the plan"),
+                                 steps=AIMessage(content=[
+                                     _create_step_info("step1", "#E1", "mock_tool_A", "a"),
+                                     _create_step_info("step2", "#E2", "mock_tool_B", "b"),
+                                     _create_step_info("step3", "#E3", "mock_tool_A", "c"),
+                                     _create_step_info("step4", "#E4", "mock_tool_B", "d"),
+                                     _create_step_info("step5", "#E5", "mock_tool_A", "#E1 + #E4"),
+                                 ]),
+                                 intermediate_results={})
+
+    with patch.object(agent, "_call_tool", side_effect=_call_tool):
+        state = await agent.executor_node(mock_state)
+
+    # all steps are executed in a single hop of the executor node
+    assert await agent.conditional_edge(mock_state) == AgentDecision.END
+    assert list(state["intermediate_results"].keys()) == ["#E1", "#E2", "#E3", "#E4", "#E5"]
+    assert state["intermediate_results"]["#E5"].content == "result of result of a + result of d"
+    assert call_order[-1] == "result of a + result of d"
+    assert max_in_flight == min(4, max_concurrent_tool_calls)
+
+
+async def test_executor_node_parallel_execution_resumes_partial_results(mock_llm, mock_tool):
+    agent = ReWOOAgentGraph(llm=mock_llm,
+                            planner_prompt=rewoo_planner_prompt,
+                            solver_prompt=rewoo_solver_prompt,
+                            tools=[mock_tool('mock_tool_A'), mock_tool('mock_tool_B')],
+                            parallel_execution=True)
+    mock_state = ReWOOGraphState(
+        task=HumanMessage(content="This is a task"),
+        plan=AIMessage(content="This is the plan"),
+        steps=AIMessage(content=[
+            _create_step_info("step1", "#E1", "mock_tool_A", "arg1"),
+            _create_step_info("step2", "#E2", "mock_tool_B", "Use #E1"),
+        ]),
+        intermediate_results={"#E1": ToolMessage(content="result1", tool_call_id="mock_tool_A")})
+    state = await agent.executor_node(mock_state)
+    assert state["intermediate_results"]["#E1"].content == "result1"
+    assert "Use result1" in str(state["intermediate_results"]["#E2"].content)
@@ -13,10 +13,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+
 import pytest
+from langchain_core.callbacks import AsyncCallbackManagerForToolRun
 from langchain_core.messages import AIMessage
 from langchain_core.messages import HumanMessage
 from langchain_core.messages import ToolMessage
+from langchain_core.tools import BaseTool
 from langgraph.graph.graph import CompiledGraph
 from langgraph.prebuilt import ToolNode
 
@@ -24,6 +28,10 @@ from aiq.agent.base import AgentDecision
 from aiq.agent.tool_calling_agent.agent import ToolCallAgentGraph
 from aiq.agent.tool_calling_agent.agent import ToolCallAgentGraphState
 from aiq.agent.tool_calling_agent.register import ToolCallAgentWorkflowConfig
+from aiq.agent.tool_executor import ToolCallExecutor
+from aiq.builder.context import AIQContext
+from aiq.data_models.intermediate_step import IntermediateStep
+from aiq.data_models.intermediate_step import IntermediateStepType
 
 
 async def test_state_schema():
@@ -141,3 +149,143 @@ async def test_graph(mock_tool_graph):
     response = response.messages[-1]  # pylint: disable=unsubscriptable-object
     assert isinstance(response, AIMessage)
     assert response.content == 'mock query'
+
+
+class _SlowTool(BaseTool):
+    name: str = "slow"
+    description: str = "test tool that sleeps for the requested number of seconds"
+    calls: int = 0
+    in_flight: int = 0
+    max_in_flight: int = 0
+
+    async def _arun(self,
+                    delay: float = 0.0,
+                    *args,
+                    run_manager: AsyncCallbackManagerForToolRun | None = None,
+                    **kwargs):  # pylint: disable=arguments-differ
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            self.in_flight -= 1
+        return f"slept {delay}"
+
+    def _run(self, *args, **kwargs):
+        raise NotImplementedError
+
+
+def _tool_call(call_id: str, delay: float, name: str = "slow") -> dict:
+    return {"name": name, "args": {"delay": delay}, "id": call_id, "type": "tool_call"}
+
+
+def _executor(tool: BaseTool, **kwargs) -> ToolCallExecutor:
+    return ToolCallExecutor(ToolNode([tool], handle_tool_errors=True), **kwargs)
+
+
+async def test_tool_executor_runs_calls_concurrently():
+    tool = _SlowTool()
+    executor = _executor(tool)
+    responses = await executor.execute([_tool_call("1", 0.2), _tool_call("2", 0.1), _tool_call("3", 0.0)])
+
+    assert tool.max_in_flight == 3
+    assert [response.tool_call_id for response in responses] == ["1", "2", "3"]
+    assert [response.content for response in responses] == ["slept 0.2", "slept 0.1", "slept 0.0"]
+
+
+async def test_tool_executor_max_concurrency():
+    tool = _SlowTool()
+    executor = _executor(tool, max_concurrency=2)
+    await executor.execute([_tool_call(str(i), 0.05 + i * 0.01) for i in range(5)])
+
+    assert tool.calls == 5
+    assert tool.max_in_flight == 2
+
+
+async def test_tool_executor_timeout():
+    tool = _SlowTool()
+    executor = _executor(tool, timeout=5.0, tool_timeouts={"slow": 0.05})
+    responses = await executor.execute([_tool_call("1", 1.0), _tool_call("2", 0.0)])
+
+    assert responses[0].status == "error"
+    assert responses[0].tool_call_id == "1"
+    assert "did not respond within 0.05 seconds" in responses[0].content
+    assert responses[1].content == "slept 0.0"
+
+    executor = _executor(tool, timeout=0.05, handle_tool_errors=False)
+    with pytest.raises(asyncio.TimeoutError):
+        await executor.execute([_tool_call("1", 1.0)])
+
+
+async def test_tool_executor_awaits_cancelled_calls():
+    tool = _SlowTool()
+    other = _SlowTool(name="other")
+    executor = ToolCallExecutor(ToolNode([tool, other]), tool_timeouts={"other": 0.05}, handle_tool_errors=False)
+
+    # The timeout of one call cancels the others, which must have stopped when the error is raised
+    with pytest.raises(asyncio.TimeoutError):
+        await executor.execute([_tool_call("1", 1.0), _tool_call("2", 1.0, name="other")])
+    assert tool.in_flight == 0
+
+
+async def test_tool_executor_deduplicates_calls():
+    tool = _SlowTool()
+    executor = _executor(tool, deduplicate=True)
+    results = {}
+    responses = await executor.execute([_tool_call("1", 0.0), _tool_call("2", 0.0)], results=results)
+
+    assert tool.calls == 1
+    assert [response.tool_call_id for response in responses] == ["1", "2"]
+    assert responses[0].content == responses[1].content
+
+    # Identical calls later in the same run reuse the earlier result
+    responses = await executor.execute([_tool_call("3", 0.0), _tool_call("4", 0.01)], results=results)
+    assert tool.calls == 2
+    assert [response.tool_call_id for response in responses] == ["3", "4"]
+
+    # Calls are not deduplicated by default
+    executor = _executor(tool)
+    await executor.execute([_tool_call("5", 0.0), _tool_call("6", 0.0)], results=results)
+    assert tool.calls == 4
+
+
+async def test_tool_executor_does_not_cache_errors():
+    tool = _SlowTool()
+    executor = _executor(tool)
+    results = {}
+    responses = await executor.execute([_tool_call("1", 0.0, name="missing")], results=results)
+
+    assert responses[0].status == "error"
+    assert not results
+
+
+async def test_tool_executor_reports_intermediate_steps():
+    steps: list[IntermediateStep] = []
+    subscription = AIQContext.get().intermediate_step_manager.subscribe(steps.append)
+
+    try:
+        executor = _executor(_SlowTool(), max_concurrency=1, deduplicate=True)
+        await executor.execute([_tool_call("1", 0.05), _tool_call("2", 0.0), _tool_call("3", 0.05)])
+    finally:
+        subscription.unsubscribe()
+
+    ends = [s for s in steps if s.event_type == IntermediateStepType.CUSTOM_END and s.name == "tool_execution"]
+    metadata = {end.metadata.provided_metadata["tool_call_id"]: end.metadata.provided_metadata for end in ends}
+    assert set(metadata) == {"1", "2", "3"}
+    assert metadata["1"]["run_time"] > 0
+    assert metadata["2"]["queue_time"] > 0
+    assert metadata["3"]["deduplicated"]
+
+
+async def test_tool_node_parallel_tool_calls(mock_llm):
+    tool = _SlowTool()
+    agent = ToolCallAgentGraph(llm=mock_llm, tools=[tool], detailed_logs=False, tool_call_timeout=0.05)
+    message = AIMessage(content='', tool_calls=[_tool_call("1", 0.0), _tool_call("2", 1.0), _tool_call("3", 0.0)])
+    mock_state = ToolCallAgentGraphState(messages=[HumanMessage(content='hello, world!'), message])
+
+    response = await agent.tool_node(mock_state)
+    tool_messages = response.messages[2:]
+    assert [m.tool_call_id for m in tool_messages] == ["1", "2", "3"]
+    assert tool_messages[1].status == "error"
+    assert tool.calls == 3
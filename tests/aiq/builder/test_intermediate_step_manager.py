@@ -16,11 +16,14 @@
 import asyncio
 import contextvars
 import functools
+import logging
 import threading
+import time
 import uuid
 
 import pytest
 
+from aiq.builder import intermediate_step_manager as intermediate_step_manager_module
 from aiq.builder.context import AIQContext
 from aiq.builder.context import AIQContextState
 from aiq.builder.intermediate_step_manager import IntermediateStepManager
@@ -28,6 +31,9 @@ from aiq.builder.intermediate_step_manager import IntermediateStepPayload
 from aiq.data_models.intermediate_step import IntermediateStep
 from aiq.data_models.intermediate_step import IntermediateStepType
 from aiq.data_models.invocation_node import InvocationNode
+from aiq.utils.reactive.subject import Subject
+
+logger = logging.getLogger(__name__)
 
 # --------------------------------------------------------------------------- #
 # Minimal stubs so the tests do not need the whole aiq code-base
@@ -295,3 +301,67 @@ async def test_async_with_task_end(mgr: IntermediateStepManager, output_steps: l
         assert child == actual.name
         assert parent is None or parent == actual.parent_id
         assert etype == actual.event_type
+
+
+def test_no_subscribers_skips_step_construction(ctx_state: AIQContextState, monkeypatch: pytest.MonkeyPatch):
+    mgr = IntermediateStepManager(context_state=ctx_state)
+    ctx_state.event_stream.set(Subject())
+
+    def _fail(**kwargs):
+        raise AssertionError("IntermediateStep should not be built without subscribers")
+
+    monkeypatch.setattr(intermediate_step_manager_module, "IntermediateStep", _fail)
+
+    assert not mgr.has_subscribers
+
+    start = _payload()
+    mgr.push_intermediate_step(start)
+    assert ctx_state.active_span_id_stack.get()[-1] == start.UUID
+
+    mgr.push_intermediate_step(_payload(step_id=start.UUID, etype=IntermediateStepType.LLM_NEW_TOKEN))
+    mgr.push_intermediate_step(_payload(step_id=start.UUID, etype=IntermediateStepType.LLM_END))
+    assert ctx_state.active_span_id_stack.get() == ["root"]
+
+
+def test_subscribers_added_mid_span_receive_end(ctx_state: AIQContextState):
+    mgr = IntermediateStepManager(context_state=ctx_state)
+    ctx_state.event_stream.set(Subject())
+
+    start = _payload()
+    mgr.push_intermediate_step(start)
+
+    received: list[IntermediateStep] = []
+    mgr.subscribe(received.append)
+    assert mgr.has_subscribers
+
+    mgr.push_intermediate_step(_payload(step_id=start.UUID, etype=IntermediateStepType.LLM_END))
+
+    assert [s.event_type for s in received] == [IntermediateStepType.LLM_END]
+    assert received[0].parent_id == "root"
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+@pytest.mark.parametrize("num_subscribers", [0, 1, 5])
+def test_push_intermediate_step_benchmark(ctx_state: AIQContextState, num_subscribers: int):
+    """Measure events/sec through the manager for a LLM span streaming tokens."""
+    num_spans = 2000
+    num_chunks = 8
+
+    mgr = IntermediateStepManager(context_state=ctx_state)
+    ctx_state.event_stream.set(Subject())
+    for _ in range(num_subscribers):
+        mgr.subscribe(lambda step: None)
+
+    start_time = time.perf_counter()
+    for _ in range(num_spans):
+        start = _payload()
+        mgr.push_intermediate_step(start)
+        for _ in range(num_chunks):
+            mgr.push_intermediate_step(_payload(step_id=start.UUID, etype=IntermediateStepType.LLM_NEW_TOKEN))
+        mgr.push_intermediate_step(_payload(step_id=start.UUID, etype=IntermediateStepType.LLM_END))
+    elapsed = time.perf_counter() - start_time
+
+    logger.info("push_intermediate_step with %d subscribers: %.0f events/s",
+                num_subscribers,
+                num_spans * (num_chunks + 2) / elapsed)
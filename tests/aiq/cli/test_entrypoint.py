@@ -0,0 +1,115 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import subprocess
+import sys
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from aiq.cli.cli_utils.lazy_group import LazyCommand
+from aiq.cli.cli_utils.lazy_group import LazyGroup
+
+# Cumulative import time budget of the `aiq` entry point in microseconds. Importing the entry point should only cost
+# importing click, around 50ms on a typical machine, the budget leaves plenty of room for slow CI runners.
+IMPORT_TIME_BUDGET_US = 500_000
+
+# Packages which are only needed by the subcommands and must not be imported to parse the command line
+HEAVY_PACKAGES = ("aiq.cli.commands", "aiq.data_models", "aiq.eval", "aiq.profiler", "aiq.runtime", "langchain_core",
+                  "nest_asyncio", "pandas", "pydantic")
+
+
+def _import_times(args: list[str]) -> dict[str, int]:
+    """Run the CLI with `python -X importtime` and return the cumulative import time of each module."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-m", "aiq.cli.main", *args],
+                            capture_output=True,
+                            text=True,
+                            check=False)
+    assert result.returncode == 0, result.stderr
+
+    # Lines are formatted as `import time: <self us> | <cumulative us> | <indented module name>`
+    import_times = {}
+    for line in result.stderr.splitlines():
+        if (not line.startswith("import time:")):
+            continue
+
+        _, cumulative, module_name = line.removeprefix("import time:").split("|")
+        if (cumulative.strip().isdigit()):
+            import_times[module_name.strip()] = int(cumulative)
+
+    return import_times
+
+
+@pytest.mark.parametrize("args", [["--version"], ["--help"]], ids=["version", "help"])
+def test_import_time_budget(args: list[str]):
+    import_times = _import_times(args)
+
+    assert "aiq.cli.entrypoint" in import_times
+
+    heavy_imports = [
+        module_name for module_name in import_times
+        if any(module_name == package or module_name.startswith(f"{package}.") for package in HEAVY_PACKAGES)
+    ]
+    assert not heavy_imports, f"`aiq {' '.join(args)}` imported {heavy_imports}"
+
+    assert import_times["aiq.cli.entrypoint"] < IMPORT_TIME_BUDGET_US
+
+
+def test_help_lists_commands_without_importing():
+    from aiq.cli.entrypoint import LAZY_COMMANDS
+    from aiq.cli.entrypoint import cli
+
+    result = CliRunner().invoke(cli, ["--help"], terminal_width=200)
+    assert result.exit_code == 0, result.output
+
+    for name, lazy_command in LAZY_COMMANDS.items():
+        assert name in result.output
+        assert lazy_command.short_help in result.output
+
+
+def test_lazy_group_imports_on_first_use():
+    group = LazyGroup(name="test", lazy_commands={"hello": LazyCommand("click.testing:CliRunner", "Say hello.")})
+
+    # Listing the commands does not resolve them
+    assert group.list_commands(click.Context(group)) == ["hello"]
+    assert "hello" not in group.commands
+
+    # The resolved object is cached on the group
+    assert group.get_command(click.Context(group), "hello") is CliRunner
+    assert group.commands["hello"] is CliRunner
+
+    assert group.get_command(click.Context(group), "unknown") is None
+
+
+def test_lazy_group_alias():
+    inner = click.Group(name="inner")
+
+    @inner.command(name="console")
+    def console_command():
+        click.echo("console")
+
+    module = type(sys)("_lazy_group_test_module")
+    module.inner = inner
+
+    group = LazyGroup(name="test",
+                      lazy_commands={"run": LazyCommand("_lazy_group_test_module:inner", "Run it.", "console")})
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setitem(sys.modules, "_lazy_group_test_module", module)
+        result = CliRunner().invoke(group, ["run"])
+
+    assert result.exit_code == 0, result.output
+    assert result.output == "console\n"
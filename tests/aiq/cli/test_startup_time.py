@@ -0,0 +1,80 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+import pytest
+
+logger = logging.getLogger(__name__)
+
+_CONFIG = """
+general:
+  use_uvloop: false
+
+workflow:
+  _type: test_echo
+"""
+
+
+def _run_cli(args: list[str], env: dict[str, str]) -> tuple[float, str]:
+    start_time = time.perf_counter()
+    result = subprocess.run([sys.executable, "-m", "aiq.cli.main", *args],
+                            env=env,
+                            capture_output=True,
+                            text=True,
+                            check=False)
+    elapsed = time.perf_counter() - start_time
+
+    assert result.returncode == 0, result.stderr
+    return elapsed, result.stdout + result.stderr
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+def test_cli_startup_time_benchmark(tmp_path):
+    """Measure the startup time of `aiq --help`, `aiq validate` and `aiq run` with and without lazy plugin loading."""
+    config_file = tmp_path / "config.yml"
+    config_file.write_text(_CONFIG, encoding="utf-8")
+
+    commands = {
+        "help": ["--help"],
+        "validate": ["validate", "--config_file", str(config_file)],
+        "run": ["run", "--config_file", str(config_file), "--input", "startup benchmark"],
+    }
+
+    timings: dict[tuple[str, bool], float] = {}
+    for lazy in (False, True):
+        env = {**os.environ, "AIQ_CACHE_DIR": str(tmp_path / "cache"), "AIQ_LAZY_PLUGIN_LOADING": str(int(lazy))}
+
+        # The first lazy run generates the plugin manifest
+        _run_cli(commands["validate"], env)
+
+        for name, args in commands.items():
+            runs = [_run_cli(args, env) for _ in range(3)]
+            timings[(name, lazy)] = statistics.median(elapsed for elapsed, _ in runs)
+
+            if name == "run":
+                assert "startup benchmark" in runs[0][1]
+
+    assert (tmp_path / "cache" / "plugin_manifest.json").exists()
+
+    for name in commands:
+        logger.info("aiq %s: %.2f s eager, %.2f s lazy", name, timings[(name, False)], timings[(name, True)])
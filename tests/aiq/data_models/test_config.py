@@ -13,13 +13,21 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import logging
 import re
+import time
+import types
 from io import StringIO
 
 import pytest
+from pydantic import ValidationError
 
 from _utils.configs import WorkflowTestConfig
+from aiq.cli.type_registry import TypeRegistry
 from aiq.data_models.config import AIQConfig
+from aiq.data_models.function import FunctionBaseConfig
+
+logger = logging.getLogger(__name__)
 
 
 # Make a fixture which auto registers the test workflow
@@ -56,3 +64,112 @@ def test_invalid_config_path():
                 }
             }
         })
+
+
+def _register_function_types(registry: TypeRegistry, num_types: int) -> list[type[FunctionBaseConfig]]:
+    from aiq.cli.register_workflow import register_function
+
+    config_types = [
+        types.new_class(f"GeneratedFunctionConfig{i}", (FunctionBaseConfig, ), {"name": f"generated_function_{i}"},
+                        lambda ns: ns.update(__module__=__name__)) for i in range(num_types)
+    ]
+
+    with registry.pause_registration_changed_hooks():
+        for config_type in config_types:
+
+            async def build_fn(_: FunctionBaseConfig, __):
+                yield lambda: None
+
+            register_function(config_type=config_type)(build_fn)
+
+    return config_types
+
+
+def _make_config_dict(num_functions: int) -> dict:
+    return {
+        'functions': {
+            f'function_{i}': {
+                '_type': f'generated_function_{i}'
+            }
+            for i in range(num_functions)
+        },
+        'workflow': {
+            '_type': 'test_workflow', 'llm_name': 'test', 'functions': ['function_0'], 'prompt': 'test'
+        },
+    }
+
+
+def test_validate_narrowed_matches_full_schema(registry: TypeRegistry):
+    _register_function_types(registry, 5)
+    config_dict = _make_config_dict(2)
+
+    narrowed_config = AIQConfig.validate_narrowed(**config_dict)
+
+    assert type(narrowed_config) is AIQConfig  # pylint: disable=unidiomatic-typecheck
+    assert narrowed_config == AIQConfig.model_validate(config_dict)
+    assert narrowed_config.model_fields_set == {'functions', 'workflow'}
+    assert isinstance(narrowed_config.workflow, WorkflowTestConfig)
+
+
+def test_validate_narrowed_unknown_type(registry: TypeRegistry):
+    _register_function_types(registry, 5)
+    config_dict = _make_config_dict(1)
+    config_dict['functions']['unknown'] = {'_type': 'not_registered'}
+
+    with pytest.raises(ValidationError, match="not_registered") as full_error:
+        AIQConfig.model_validate(config_dict)
+
+    with pytest.raises(ValidationError, match="not_registered") as narrowed_error:
+        AIQConfig.validate_narrowed(**config_dict)
+
+    assert str(narrowed_error.value) == str(full_error.value)
+    assert "_ignore" not in str(narrowed_error.value)
+
+
+def test_registration_key(registry: TypeRegistry):
+    registration_key = registry.get_registration_key()
+    assert registry.get_registration_key() == registration_key
+
+    _register_function_types(registry, 1)
+    assert registry.get_registration_key() != registration_key
+
+    # Registering types rebuilt the schema, rebuilding again is a no-op
+    assert AIQConfig.rebuild_annotations() is False
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+@pytest.mark.parametrize("num_types", [10, 200])
+def test_config_load_benchmark(registry: TypeRegistry, num_types: int):
+    """Measure the cost of rebuilding the schema and validating a config with many registered component types."""
+    _register_function_types(registry, num_types)
+    config_dict = _make_config_dict(10)
+
+    start_time = time.perf_counter()
+    AIQConfig.model_rebuild(force=True)
+    rebuild_elapsed = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    registry._registration_changed()  # pylint: disable=protected-access
+    unchanged_rebuild_elapsed = time.perf_counter() - start_time
+
+    num_iterations = 100
+
+    start_time = time.perf_counter()
+    for _ in range(num_iterations):
+        AIQConfig.model_validate(config_dict)
+    full_elapsed = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    for _ in range(num_iterations):
+        AIQConfig.validate_narrowed(**config_dict)
+    narrowed_elapsed = time.perf_counter() - start_time
+
+    logger.info(
+        "%d registered types: schema rebuild %.2f ms, unchanged registry rebuild %.2f ms, "
+        "full schema %.2f ms/config, narrowed schema %.2f ms/config",
+        num_types,
+        rebuild_elapsed * 1e3,
+        unchanged_rebuild_elapsed * 1e3,
+        full_elapsed / num_iterations * 1e3,
+        narrowed_elapsed / num_iterations * 1e3)
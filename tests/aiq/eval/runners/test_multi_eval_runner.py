@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import copy
 from pathlib import Path
 from unittest.mock import AsyncMock
@@ -20,6 +21,8 @@ from unittest.mock import patch
 
 import pytest
 
+from aiq.data_models.concurrency_limit_mixin import ConcurrencyLimitConfig
+from aiq.data_models.config import AIQConfig
 from aiq.eval.config import EvaluationRunConfig
 from aiq.eval.evaluator.evaluator_model import EvalInput
 from aiq.eval.evaluator.evaluator_model import EvalInputItem
@@ -27,6 +30,8 @@ from aiq.eval.evaluator.evaluator_model import EvalOutput
 from aiq.eval.evaluator.evaluator_model import EvalOutputItem
 from aiq.eval.runners.config import MultiEvaluationRunConfig
 from aiq.eval.runners.multi_eval_runner import MultiEvaluationRunner
+from aiq.eval.runners.run_cache import EvaluationRunCache
+from aiq.llm.nim_llm import NIMModelConfig
 from aiq.profiler.data_models import ProfilerResults
 
 
@@ -132,3 +137,71 @@ async def test_run_all_partial_failure(multi_eval_config, mock_evaluation_run_ou
         # Verify only the first result was stored before the exception
         assert len(runner.evaluation_run_outputs) == 1
         assert "concurrency_1" in runner.evaluation_run_outputs
+
+
+async def test_run_all_parallel_remote(base_eval_run_config, mock_evaluation_run_output):
+    """Remote evaluations run in parallel up to max_parallel_runs, local evaluations run first one at a time."""
+    configs = {}
+    for i in range(4):
+        config = copy.deepcopy(base_eval_run_config)
+        config.endpoint = "http://localhost:8000"
+        configs[f"remote_{i}"] = config
+    configs["local"] = copy.deepcopy(base_eval_run_config)
+
+    config = MultiEvaluationRunConfig(configs=configs, max_parallel_runs=2)
+    completed = []
+    runner = MultiEvaluationRunner(config, on_run_complete=lambda id, output: completed.append(id))
+
+    running = 0
+    max_running = 0
+
+    async def run_single(id, config):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return mock_evaluation_run_output
+
+    with patch.object(runner, "run_single_evaluation", side_effect=run_single):
+        result = await runner.run_all()
+
+    assert max_running == 2
+    assert completed[0] == "local"
+    assert set(completed) == set(configs)
+    # Outputs keep the order of the configs
+    assert list(result.keys()) == list(configs.keys())
+
+
+async def test_run_all_shares_run_cache(multi_eval_config, mock_evaluation_run_output):
+    """All evaluations of a run share one run cache, which is closed at the end of the run."""
+    runner = MultiEvaluationRunner(multi_eval_config)
+    run_caches = []
+
+    async def run_single(id, config):
+        run_caches.append(runner._run_cache)
+        return mock_evaluation_run_output
+
+    with patch.object(runner, "run_single_evaluation", side_effect=run_single):
+        await runner.run_all()
+
+    assert len(run_caches) == 3
+    assert run_caches[0] is not None
+    assert all(run_cache is run_caches[0] for run_cache in run_caches)
+    assert runner._run_cache is None
+
+
+def test_builder_key_includes_excluded_fields():
+    """Configs differing only in fields excluded from serialization, like the mixin fields, get different builders."""
+    base = AIQConfig(llms={"llm": NIMModelConfig(model_name="model")})
+    retries = AIQConfig(llms={"llm": NIMModelConfig(model_name="model", num_retries=7)})
+    limited = AIQConfig(
+        llms={"llm": NIMModelConfig(model_name="model", concurrency_limit=ConcurrencyLimitConfig(max_in_flight=3))})
+
+    keys = {EvaluationRunCache.get_builder_key(config) for config in (base, retries, limited)}
+    assert len(keys) == 3
+
+    # The passes of a concurrency sweep still share a builder
+    sweep = base.model_copy(deep=True)
+    sweep.eval.general.max_concurrency = 9
+    assert EvaluationRunCache.get_builder_key(sweep) == EvaluationRunCache.get_builder_key(base)
@@ -39,6 +39,8 @@ from aiq.data_models.intermediate_step import IntermediateStepPayload
 from aiq.data_models.intermediate_step import IntermediateStepType
 from aiq.data_models.intermediate_step import StreamEventData
 from aiq.data_models.invocation_node import InvocationNode
+from aiq.data_models.profiler import ProfilerConfig
+from aiq.data_models.profiler import StreamingConfig
 from aiq.eval.evaluate import EvaluationRun
 from aiq.eval.evaluate import EvaluationRunConfig
 from aiq.eval.evaluator.evaluator_model import EvalInput
@@ -216,6 +218,24 @@ async def test_run_workflow_local_success(evaluation_run, session_manager, gener
     assert not evaluation_run.workflow_interrupted
 
 
+async def test_run_workflow_local_streaming_profiler(evaluation_run, session_manager, tmp_path):
+    """Test that each item is added to a streaming profiler as soon as its workflow completes."""
+    evaluation_run.eval_config.general.output_dir = tmp_path
+    evaluation_run.eval_config.general.profiler = ProfilerConfig(base_metrics=True,
+                                                                 streaming=StreamingConfig(enable=True))
+
+    with patch("aiq.profiler.profile_runner.ProfilerRunner.add_request") as mock_add_request, \
+         patch("aiq.profiler.profile_runner.ProfilerRunner.run",
+               AsyncMock(return_value=ProfilerResults())) as mock_run:
+        await evaluation_run.run_workflow_local(session_manager)
+        item = evaluation_run.eval_input.eval_input_items[0]
+        mock_add_request.assert_called_once_with(item.trajectory)
+
+        # The profiler only gets the items which were not added yet
+        await evaluation_run.profile_workflow()
+        mock_run.assert_awaited_once_with([])
+
+
 async def test_run_workflow_local_errors(evaluation_run, session_manager):
     """Test workflow with no 'single output' fails gracefully."""
 
@@ -472,6 +492,37 @@ def test_write_output_handles_none_output(evaluation_run, eval_input):
             pytest.fail("write_output should not access .output without a None check")
 
 
+async def test_run_and_evaluate_closes_streaming_profiler(evaluation_run, default_eval_config, mock_evaluator):
+    """Test that a streaming profiler opened for completed items is closed when the evaluation fails."""
+    evaluation_run.config.skip_workflow = True
+    mock_aiq_config = AIQConfig()
+    mock_aiq_config.eval = default_eval_config
+
+    mock_dataset_handler = MagicMock()
+    mock_dataset_handler.get_eval_input_from_dataset.return_value = evaluation_run.eval_input
+
+    mock_eval_workflow = MagicMock()
+    mock_eval_workflow.get_evaluator.return_value = mock_evaluator
+
+    @asynccontextmanager
+    async def mock_eval_builder(config):
+        yield mock_eval_workflow
+
+    evaluation_run.profiler_runner = MagicMock()
+
+    with patch("aiq.runtime.loader.load_config", MagicMock(return_value=mock_aiq_config)), \
+         patch("aiq.builder.eval_builder.WorkflowEvalBuilder.from_config", side_effect=mock_eval_builder), \
+         patch("aiq.eval.evaluate.DatasetHandler", return_value=mock_dataset_handler), \
+         patch.object(evaluation_run, "run_evaluators", AsyncMock(side_effect=RuntimeError("evaluator failed"))), \
+         patch.object(evaluation_run, "profile_workflow", AsyncMock()) as mock_profile_workflow:
+
+        with pytest.raises(RuntimeError, match="evaluator failed"):
+            await evaluation_run.run_and_evaluate()
+
+    evaluation_run.profiler_runner.close.assert_called_once_with()
+    mock_profile_workflow.assert_not_awaited()
+
+
 @pytest.mark.parametrize("skip_workflow", [True, False])
 async def test_run_and_evaluate(evaluation_run, default_eval_config, session_manager, mock_evaluator, skip_workflow):
     """
@@ -550,6 +601,26 @@ async def test_run_and_evaluate(evaluation_run, default_eval_config, session_man
         mock_uploader.upload_directory.assert_awaited_once()
 
 
+async def test_build_eval_workflow_without_run_cache(evaluation_run):
+    """Test that build_eval_workflow builds the workflow with WorkflowEvalBuilder when there is no run cache."""
+    assert evaluation_run.run_cache is None
+
+    mock_config = MagicMock()
+    mock_eval_workflow = MagicMock()
+
+    @asynccontextmanager
+    async def mock_eval_builder(config):
+        assert config is mock_config
+        yield mock_eval_workflow
+
+    with patch("aiq.builder.eval_builder.WorkflowEvalBuilder.from_config",
+               side_effect=mock_eval_builder) as mock_from_config:
+        async with evaluation_run.build_eval_workflow(mock_config) as eval_workflow:
+            assert eval_workflow is mock_eval_workflow
+
+    mock_from_config.assert_called_once_with(config=mock_config)
+
+
 def test_append_job_id_to_output_dir(default_eval_config):
     """Test that append_job_id_to_output_dir generates UUID when enabled."""
     # Test case 1: Feature enabled, no job_id provided
@@ -0,0 +1,183 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=redefined-outer-name  # pytest fixtures
+
+import asyncio
+from datetime import UTC
+from datetime import datetime
+from datetime import timedelta
+
+import pytest
+from pydantic import BaseModel
+
+from aiq.front_ends.fastapi.job_store import InMemoryJobStoreBackend
+from aiq.front_ends.fastapi.job_store import JobStatus
+from aiq.front_ends.fastapi.job_store import JobStore
+from aiq.front_ends.fastapi.job_store import JobStoreBackend
+from aiq.front_ends.fastapi.job_store import RedisJobStoreBackend
+from aiq.front_ends.fastapi.job_store import SQLiteJobStoreBackend
+from aiq.object_store.in_memory_object_store import InMemoryObjectStore
+
+
+class _Output(BaseModel):
+    value: str
+
+
+@pytest.fixture(params=["memory", "sqlite", "redis"])
+async def backend(request, tmp_path):
+    if request.param == "memory":
+        backend: JobStoreBackend = InMemoryJobStoreBackend()
+    elif request.param == "sqlite":
+        backend = SQLiteJobStoreBackend(str(tmp_path / "jobs.db"))
+    else:
+        fakeredis = pytest.importorskip("fakeredis")
+        backend = RedisJobStoreBackend(fakeredis.FakeAsyncRedis())
+
+    yield backend
+    await backend.aclose()
+
+
+async def test_job_lifecycle(backend: JobStoreBackend):
+    store = JobStore(backend)
+
+    job_id = await store.create_job(config_file="config.yml")
+    assert (await store.get_job(job_id)).status == JobStatus.SUBMITTED
+
+    await store.update_status(job_id, "running")
+    await store.update_status(job_id, "success", output=_Output(value="done"))
+
+    job = await store.get_job(job_id)
+    assert job.status == JobStatus.SUCCESS
+    assert job.config_file == "config.yml"
+    assert job.output.model_dump() == {"value": "done"}
+
+    with pytest.raises(ValueError):
+        await store.update_status("missing", "running")
+
+
+async def test_status_and_creation_indexes(backend: JobStoreBackend):
+    store = JobStore(backend)
+
+    for i in range(5):
+        await store.create_job(job_id=f"job-{i}")
+    await store.update_status("job-1", "failure", error="failed")
+    await store.update_status("job-3", "failure", error="failed")
+
+    assert [job.job_id for job in await store.get_jobs_by_status("failure")] == ["job-1", "job-3"]
+    assert [job.job_id for job in await store.get_jobs_by_status("submitted")] == ["job-0", "job-2", "job-4"]
+    assert [job.job_id for job in await store.get_all_jobs()] == [f"job-{i}" for i in range(5)]
+    assert (await store.get_last_job()).job_id == "job-4"
+
+    # Jobs are listed by creation regardless of the order of their status changes
+    await store.update_status("job-3", "success")
+    await store.update_status("job-1", "success")
+    assert [job.job_id for job in await store.get_jobs_by_status("success")] == ["job-1", "job-3"]
+
+    await backend.delete("default", ["job-4"])
+    assert (await store.get_last_job()).job_id == "job-3"
+
+
+async def test_concurrent_status_updates(backend: JobStoreBackend):
+    store = JobStore(backend)
+    job_ids = [await store.create_job(job_id=f"job-{i}") for i in range(5)]
+
+    await asyncio.gather(*(store.update_status(job_id, status)
+                           for job_id in job_ids
+                           for status in ("running", "success")))
+
+    running = {job.job_id for job in await store.get_jobs_by_status("running")}
+    success = {job.job_id for job in await store.get_jobs_by_status("success")}
+    # Every job is in the index of exactly one status
+    assert not running & success
+    assert running | success == set(job_ids)
+
+
+async def test_namespaces_share_a_backend(backend: JobStoreBackend):
+    evaluate, generate = JobStore(backend, namespace="evaluate"), JobStore(backend, namespace="generate")
+
+    await evaluate.create_job(job_id="job")
+
+    assert await generate.get_job("job") is None
+    assert not await generate.get_all_jobs()
+    assert await generate.get_last_job() is None
+
+
+async def test_outputs_are_shared_between_workers(backend: JobStoreBackend):
+    worker_1, worker_2 = JobStore(backend), JobStore(backend)
+
+    job_id = await worker_1.create_job()
+    await worker_1.update_status(job_id, "success", output=_Output(value="done"))
+
+    assert (await worker_2.get_job(job_id)).output.model_dump() == {"value": "done"}
+
+
+async def test_outputs_in_memory_are_capped():
+    store = JobStore(max_outputs_in_memory=2)
+
+    for i in range(5):
+        await store.create_job(job_id=f"job-{i}")
+        await store.update_status(f"job-{i}", "success", output=_Output(value=str(i)))
+
+    assert list(store._outputs) == ["job-3", "job-4"]
+
+    # Evicted outputs are read back from the backend
+    job = await store.get_job("job-0")
+    assert job.output.model_dump() == {"value": "0"}
+    assert list(store._outputs) == ["job-4", "job-0"]
+
+
+async def test_outputs_spill_to_object_store():
+    object_store = InMemoryObjectStore()
+    backend = InMemoryJobStoreBackend()
+    store = JobStore(backend, namespace="generate", output_store=object_store, max_outputs_in_memory=0)
+
+    job_id = await store.create_job()
+    await store.update_status(job_id, "success", output=_Output(value="done"))
+
+    assert await backend.get_output("generate", job_id) is None
+    item = await object_store.get_object(f"aiq/jobs/generate/{job_id}.json")
+    assert item.content_type == "application/json"
+    assert (await store.get_job(job_id)).output.model_dump() == {"value": "done"}
+
+
+async def test_cleanup_expired_jobs(backend: JobStoreBackend, tmp_path):
+    object_store = InMemoryObjectStore()
+    store = JobStore(backend, output_store=object_store)
+    output_dir = tmp_path / "output"
+    output_dir.mkdir()
+
+    for i in range(3):
+        await store.create_job(job_id=f"job-{i}")
+    await store.create_job(job_id="active")
+
+    await store.update_status("job-0", "success", output_path=str(output_dir), output=_Output(value="0"))
+    await store.update_status("job-1", "failure", error="failed")
+    await store.update_status("job-2", "success", output=_Output(value="2"))
+
+    # Expire job-0 and job-1, job-2 is the most recently finished job and is kept regardless
+    for job_id in ("job-0", "job-1", "job-2"):
+        job = await backend.get("default", job_id)
+        job.updated_at = datetime.now(UTC) - timedelta(seconds=job.expiry_seconds + 1)
+        if job_id == "job-2":
+            job.updated_at += timedelta(seconds=0.5)
+        await backend.put("default", job)
+
+    await store.cleanup_expired_jobs()
+
+    assert sorted(job.job_id for job in await store.get_all_jobs()) == ["active", "job-2"]
+    assert not output_dir.exists()
+    assert "job-0" not in store._outputs
+    assert (await store.get_job("job-2")).output.model_dump() == {"value": "2"}
@@ -14,6 +14,9 @@
 # limitations under the License.
 
 # pylint: disable=redefined-outer-name, invalid-name
+import logging
+import time
+
 import pytest
 
 from aiq.data_models.api_server import AIQResponseIntermediateStep
@@ -26,6 +29,8 @@ from aiq.data_models.step_adaptor import StepAdaptorConfig
 from aiq.data_models.step_adaptor import StepAdaptorMode
 from aiq.front_ends.fastapi.step_adaptor import StepAdaptor
 
+logger = logging.getLogger(__name__)
+
 
 @pytest.fixture
 def default_config():
@@ -526,3 +531,75 @@ def test_function_events_in_custom_mode(step_adaptor_custom, make_intermediate_s
     # Steps should still be added to history
     assert step_adaptor_custom._history[-2] is step_start
     assert step_adaptor_custom._history[-1] is step_end
+
+
+def _token_step(chunk: str, UUID: str = "llm-run") -> IntermediateStep:
+    return IntermediateStep(parent_id="root",
+                            function_ancestry=InvocationNode(parent_id="abc", function_id="def", function_name="xyz"),
+                            payload=IntermediateStepPayload(event_type=IntermediateStepType.LLM_NEW_TOKEN,
+                                                            name="test_llm",
+                                                            data=StreamEventData(chunk=chunk),
+                                                            UUID=UUID))
+
+
+def test_llm_tokens_accumulate(step_adaptor_default, make_intermediate_step):
+    """Every token event carries the input and the escaped output so far."""
+    step_adaptor_default.process(
+        make_intermediate_step(event_type=IntermediateStepType.LLM_START, data_input="<q>", UUID="llm-run"))
+
+    chunks = ["a < b", " & ", "c > d"]
+    results = [step_adaptor_default.process(_token_step(chunk)) for chunk in chunks]
+
+    assert results[-1].payload == ("**Input:**\n```python\n&lt;q&gt;\n```\n\n"
+                                   "**Output:**\na &lt; b &amp; c &gt; d")
+    assert all(result.id == "llm-run" for result in results)
+
+
+def test_llm_token_deltas(make_intermediate_step):
+    adaptor = StepAdaptor(StepAdaptorConfig(llm_token_deltas=True))
+    adaptor.process(make_intermediate_step(event_type=IntermediateStepType.LLM_START, data_input="q", UUID="llm-run"))
+
+    results = [adaptor.process(_token_step(chunk)) for chunk in ["a <", "", " b"]]
+
+    assert results[0].payload == "a &lt;"
+    assert results[1] is None
+    assert results[2].payload == " b"
+
+    # Nothing is accumulated when only the deltas are sent
+    assert not adaptor._llm_outputs
+
+
+def test_closed_steps_are_released(step_adaptor_default, make_intermediate_step):
+    for event_type in (IntermediateStepType.LLM_START, IntermediateStepType.TOOL_START):
+        step_adaptor_default.process(make_intermediate_step(event_type=event_type, data_input="q", UUID="run"))
+    step_adaptor_default.process(_token_step("a", UUID="run"))
+
+    assert step_adaptor_default._open_steps and step_adaptor_default._llm_outputs
+
+    for event_type in (IntermediateStepType.LLM_END, IntermediateStepType.TOOL_END):
+        assert step_adaptor_default.process(
+            make_intermediate_step(event_type=event_type, data_output="done", UUID="run")) is not None
+
+    assert not step_adaptor_default._open_steps
+    assert not step_adaptor_default._llm_outputs
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+@pytest.mark.parametrize("llm_token_deltas", [False, True])
+def test_llm_token_streaming_benchmark(make_intermediate_step, llm_token_deltas: bool):
+    """Measure the cost of streaming 10k tokens of one LLM call through the adaptor."""
+    num_tokens = 10_000
+
+    adaptor = StepAdaptor(StepAdaptorConfig(llm_token_deltas=llm_token_deltas))
+    adaptor.process(
+        make_intermediate_step(event_type=IntermediateStepType.LLM_START, data_input="prompt", UUID="llm-run"))
+    tokens = [_token_step(f" token{i}") for i in range(num_tokens)]
+
+    start_time = time.perf_counter()
+    for token in tokens:
+        adaptor.process(token)
+    elapsed = time.perf_counter() - start_time
+
+    logger.info("StepAdaptor with llm_token_deltas=%s: %.1f us/token", llm_token_deltas, elapsed / num_tokens * 1e6)
+    assert elapsed < 10.0
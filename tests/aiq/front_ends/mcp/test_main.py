@@ -13,30 +13,25 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import sys
+from unittest.mock import ANY
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
+import click
 
-@patch("aiq.cli.entrypoint.cli.add_command")
-def test_mcp_command_registration(mock_add_command):
-    """Test the CLI command registration mechanism for MCP."""
-    from aiq.cli.entrypoint import start_command
 
-    # Create a mock module to simulate main.py
-    mock_main_module = MagicMock()
+def test_mcp_command_registration():
+    """Test that the mcp alias is resolved from the MCP front end of the start command."""
+    from aiq.cli.commands.start import start_command
+    from aiq.cli.entrypoint import cli
 
     # Create a mock command that would be returned by get_command
-    mock_command = MagicMock(name="mcp_command")
+    mock_command = MagicMock(spec=click.Command, name="mcp_command", hidden=False)
 
-    # Patch the get_command method to return our mock command
-    with patch.object(start_command, 'get_command', return_value=mock_command):
-        # Mock sys.modules to include our mock module
-        with patch.dict(sys.modules, {'aiq.front_ends.mcp.main': mock_main_module}):
-            # Import the module which would register the command
-            # Since we're mocking the module, we'll call the registration code directly
-            from aiq.cli.entrypoint import cli
-            cli.add_command(mock_command, name="mcp")
+    # Restore the commands of the group, the resolved alias is cached in them
+    with patch.dict(cli.commands), patch.object(start_command, 'get_command',
+                                                return_value=mock_command) as mock_get_command:
+        assert cli.get_command(click.Context(cli), "mcp") is mock_command
+        assert cli.commands["mcp"] is mock_command
 
-    # Verify that add_command was called with the correct arguments
-    mock_add_command.assert_called_with(mock_command, name="mcp")
+    mock_get_command.assert_called_once_with(ANY, "mcp")
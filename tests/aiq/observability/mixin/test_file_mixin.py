@@ -22,7 +22,10 @@ import aiofiles
 import pytest
 
 from aiq.observability.mixin.file_mixin import FileExportMixin
+from aiq.observability.mixin.file_mode import FileCompression
 from aiq.observability.mixin.file_mode import FileMode
+from aiq.observability.mixin.file_mode import FileRecordFormat
+from aiq.observability.utils.file_records import iter_records
 
 
 class TestFileExportMixin:
@@ -685,3 +688,159 @@ class TestFileExportMixinRolling:
         # Should have cleaned up to only 1 file (the newest)
         rolled_files = list(temp_dir.glob("cleanup_init_*.log"))
         assert len(rolled_files) <= 1
+
+
+class TestFileExportMixinBuffered:
+    """Test suite for the buffered writer of FileExportMixin."""
+
+    @pytest.fixture
+    def temp_dir(self, tmp_path):
+        """Create a temporary directory for buffered tests."""
+        return tmp_path / "buffered_test_dir"
+
+    @pytest.fixture
+    def mock_superclass(self):
+        """Mock superclass for testing mixin."""
+
+        class MockSuperclass:
+
+            def __init__(self, *args, **kwargs):
+                pass
+
+        return MockSuperclass
+
+    @pytest.fixture
+    def file_mixin_class(self, mock_superclass):
+        """Create a concrete class that uses FileExportMixin."""
+
+        class TestFileExporter(FileExportMixin, mock_superclass):
+            pass
+
+        return TestFileExporter
+
+    async def test_records_are_buffered_until_flush(self, file_mixin_class, temp_dir):
+        """Test that records are only written once the buffer is flushed."""
+        output_path = temp_dir / "buffered.log"
+
+        exporter = file_mixin_class(output_path=output_path, project="test", buffered=True, flush_interval=60)
+
+        await exporter.export_processed("first")
+        await exporter.export_processed(["second", "third"])
+        assert not output_path.exists()
+
+        await exporter.flush()
+        assert output_path.read_text() == "first\nsecond\nthird\n"
+
+        # The handle stays open between flushes
+        await exporter.export_processed("fourth")
+        await exporter.close()
+        assert output_path.read_text() == "first\nsecond\nthird\nfourth\n"
+
+    async def test_flush_when_buffer_size_reached(self, file_mixin_class, temp_dir):
+        """Test that a full buffer is flushed without waiting for the flush interval."""
+        output_path = temp_dir / "size.log"
+
+        exporter = file_mixin_class(output_path=output_path,
+                                    project="test",
+                                    buffered=True,
+                                    buffer_size=10,
+                                    flush_interval=60)
+
+        await exporter.export_processed("short")
+        assert not output_path.exists()
+
+        await exporter.export_processed("long enough")
+        assert output_path.read_text() == "short\nlong enough\n"
+
+        await exporter.close()
+
+    async def test_flush_after_interval(self, file_mixin_class, temp_dir):
+        """Test that buffered records are flushed once the flush interval has elapsed."""
+        output_path = temp_dir / "interval.log"
+
+        exporter = file_mixin_class(output_path=output_path, project="test", buffered=True, flush_interval=0.01)
+
+        await exporter.export_processed("delayed")
+        await asyncio.sleep(0.1)
+        assert output_path.read_text() == "delayed\n"
+
+        await exporter.close()
+
+    async def test_length_prefixed_records(self, file_mixin_class, temp_dir):
+        """Test that length prefixed records, including ones with newlines, are read back unchanged."""
+        output_path = temp_dir / "records.bin"
+        records = ["plain", "with\nnewline", "", "unicode \u2713"]
+
+        exporter = file_mixin_class(output_path=output_path,
+                                    project="test",
+                                    buffered=True,
+                                    record_format=FileRecordFormat.LENGTH_PREFIXED)
+
+        await exporter.export_processed(records)
+        await exporter.close()
+
+        assert list(iter_records(output_path, FileRecordFormat.LENGTH_PREFIXED)) == records
+
+    def test_length_prefixed_requires_buffered(self, file_mixin_class, temp_dir):
+        """Test that the length prefixed format is rejected without the buffered writer."""
+        with pytest.raises(ValueError, match="requires the buffered writer"):
+            file_mixin_class(output_path=temp_dir / "invalid.bin",
+                             project="test",
+                             record_format=FileRecordFormat.LENGTH_PREFIXED)
+
+    async def test_rolled_files_are_compressed(self, file_mixin_class, temp_dir):
+        """Test that rolled files are gzip compressed and can be read back."""
+        output_path = temp_dir / "compressed.log"
+
+        exporter = file_mixin_class(output_path=output_path,
+                                    project="test",
+                                    enable_rolling=True,
+                                    max_file_size=10,
+                                    buffered=True,
+                                    buffer_size=1,
+                                    compression=FileCompression.GZIP)
+
+        await exporter.export_processed("first message")
+        await exporter.export_processed("second message")
+        await exporter.close()
+
+        rolled_files = list(temp_dir.glob("compressed_*.log.gz"))
+        assert len(rolled_files) == 1
+        assert list(iter_records(rolled_files[0])) == ["first message"]
+        assert list(iter_records(output_path)) == ["second message"]
+
+    async def test_cleanup_includes_uncompressed_rolled_files(self, file_mixin_class, temp_dir):
+        """Test that rolled files from runs without compression are cleaned up once compression is enabled."""
+        temp_dir.mkdir(parents=True, exist_ok=True)
+        (temp_dir / "mixed_20240101_120000_123456.log").write_text("old1")
+        (temp_dir / "mixed_20240101_120001_123456.log").write_text("old2")
+        (temp_dir / "mixed_20240101_120002_123456.log.gz").write_bytes(b"old3")
+
+        file_mixin_class(output_path=temp_dir / "mixed.log",
+                         project="test",
+                         enable_rolling=True,
+                         max_files=1,
+                         cleanup_on_init=True,
+                         compression=FileCompression.GZIP)
+
+        assert len(list(temp_dir.glob("mixed_*"))) == 1
+
+    async def test_records_are_kept_when_write_fails(self, file_mixin_class, temp_dir, monkeypatch):
+        """Test that buffered records are not dropped when writing them fails."""
+        output_path = temp_dir / "retry.log"
+
+        exporter = file_mixin_class(output_path=output_path, project="test", buffered=True, flush_interval=60)
+        await exporter.export_processed("kept")
+
+        def failing_write(path, data):
+            raise OSError("disk full")
+
+        with monkeypatch.context() as m:
+            m.setattr(exporter._record_buffer, "write", failing_write)
+            with pytest.raises(OSError):
+                await exporter.flush()
+
+        await exporter.export_processed("next")
+        await exporter.close()
+
+        assert output_path.read_text() == "kept\nnext\n"
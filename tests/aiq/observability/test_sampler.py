@@ -0,0 +1,161 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from aiq.data_models.intermediate_step import IntermediateStep
+from aiq.data_models.intermediate_step import IntermediateStepPayload
+from aiq.data_models.intermediate_step import IntermediateStepType
+from aiq.data_models.intermediate_step import StreamEventData
+from aiq.data_models.invocation_node import InvocationNode
+from aiq.data_models.span import Span
+from aiq.data_models.telemetry_exporter import TelemetryExporterBaseConfig
+from aiq.data_models.telemetry_exporter import TelemetrySamplingConfig
+from aiq.observability.exporter.span_exporter import SpanExporter
+from aiq.observability.sampler import TraceSampler
+
+
+def _step(uuid: str, event_type: IntermediateStepType, parent_id: str = "root", **kwargs) -> IntermediateStep:
+    return IntermediateStep(parent_id=parent_id,
+                            function_ancestry=InvocationNode(function_id="func", function_name="func"),
+                            payload=IntermediateStepPayload(UUID=uuid, event_type=event_type, **kwargs))
+
+
+def _trace(root: str, duration: float = 1.0, output=None) -> list[IntermediateStep]:
+    """A workflow with an LLM call which streams two tokens and a tool call."""
+    return [
+        _step(root, IntermediateStepType.WORKFLOW_START),
+        _step(f"{root}-llm", IntermediateStepType.LLM_START, parent_id=root),
+        _step(f"{root}-llm", IntermediateStepType.LLM_NEW_TOKEN, parent_id=root),
+        _step(f"{root}-llm", IntermediateStepType.LLM_NEW_TOKEN, parent_id=root),
+        _step(f"{root}-llm", IntermediateStepType.LLM_END, parent_id=root),
+        _step(f"{root}-tool", IntermediateStepType.TOOL_START, parent_id=root),
+        _step(f"{root}-tool",
+              IntermediateStepType.TOOL_END,
+              parent_id=root,
+              event_timestamp=100.0 + duration,
+              span_event_timestamp=100.0,
+              data=StreamEventData(output=output)),
+        _step(root, IntermediateStepType.WORKFLOW_END),
+    ]
+
+
+def _run(sampler: TraceSampler, events: list[IntermediateStep]) -> list[IntermediateStep]:
+    return [exported for event in events for exported in sampler.sample(event)]
+
+
+def _find_trace(sampler: TraceSampler, sampled: bool) -> str:
+    return next(f"trace-{i}" for i in range(1000) if sampler.is_sampled(f"trace-{i}") == sampled)
+
+
+class _SpanExporter(SpanExporter[Span, Span]):
+
+    def __init__(self):
+        super().__init__()
+        self.exported_spans: list[Span] = []
+
+    async def export_processed(self, item: Span) -> None:
+        self.exported_spans.append(item)
+
+
+def test_from_config():
+    assert TraceSampler.from_config(TelemetryExporterBaseConfig()) is None
+    assert TraceSampler.from_config(TelemetryExporterBaseConfig(sampling=TelemetrySamplingConfig())) is None
+    assert TraceSampler.from_config(TelemetryExporterBaseConfig(sampling=TelemetrySamplingConfig(ratio=0.5)))
+    assert TraceSampler.from_config(TelemetryExporterBaseConfig(exclude_event_types=["LLM_NEW_TOKEN"]))
+
+
+def test_head_sampling_is_deterministic_per_trace():
+    sampler = TraceSampler(ratio=0.3, keep_errors=False)
+    traces = [f"trace-{i}" for i in range(2000)]
+
+    decisions = [sampler.is_sampled(t) for t in traces]
+
+    assert decisions == [sampler.clone().is_sampled(t) for t in traces]
+    assert 0.25 < sum(decisions) / len(traces) < 0.35
+
+
+def test_head_sampling_keeps_whole_traces():
+    sampler = TraceSampler(ratio=0.5, keep_errors=False)
+    kept, dropped = _find_trace(sampler, True), _find_trace(sampler, False)
+
+    events = _trace(kept)
+
+    assert _run(sampler, events) == events
+    assert not _run(sampler, _trace(dropped))
+    assert not sampler._root_of and not sampler._sampled and not sampler._pending
+
+
+@pytest.mark.parametrize("output, duration, exported", [(None, 1.0, False), (ValueError("failed"), 1.0, True),
+                                                        (None, 10.0, True)],
+                         ids=["unremarkable", "error", "slow"])
+def test_tail_sampling(output, duration: float, exported: bool):
+    sampler = TraceSampler(ratio=0.0, keep_errors=True, latency_threshold=5.0)
+
+    events = _trace("trace", duration=duration, output=output)
+    result = _run(sampler, events)
+
+    assert result == (events if exported else [])
+    assert not sampler._pending
+
+
+def test_excluded_event_types_are_dropped():
+    sampler = TraceSampler(exclude_event_types={IntermediateStepType.LLM_NEW_TOKEN})
+
+    result = _run(sampler, _trace("trace"))
+
+    assert [e.event_type for e in result] == [
+        IntermediateStepType.WORKFLOW_START,
+        IntermediateStepType.LLM_START,
+        IntermediateStepType.LLM_END,
+        IntermediateStepType.TOOL_START,
+        IntermediateStepType.TOOL_END,
+        IntermediateStepType.WORKFLOW_END,
+    ]
+
+
+def test_children_of_excluded_steps_are_reparented():
+    sampler = TraceSampler(exclude_event_types={IntermediateStepType.WORKFLOW_START})
+
+    result = _run(sampler, _trace("trace"))
+
+    assert {e.event_type
+            for e in result}.isdisjoint({IntermediateStepType.WORKFLOW_START, IntermediateStepType.WORKFLOW_END})
+    assert {e.parent_id for e in result} == {"root"}
+
+
+async def test_span_exporter_applies_sampler():
+    exporter = _SpanExporter()
+    exporter.set_sampler(TraceSampler(ratio=0.5, keep_errors=True))
+    kept = _find_trace(exporter._sampler, True)
+    dropped, failed = [f"trace-{i}" for i in range(1000) if not exporter._sampler.is_sampled(f"trace-{i}")][:2]
+
+    async with exporter.start():
+        for event in _trace(kept) + _trace(dropped) + _trace(failed, output=RuntimeError("failed")):
+            exporter.export(event)
+        await exporter._wait_for_tasks()
+
+    # Three spans per exported trace, none for the unsampled trace which did not fail
+    assert len(exporter.exported_spans) == 6
+    assert not exporter._outstanding_spans
+
+
+def test_isolated_instances_get_their_own_sampler():
+    exporter = _SpanExporter()
+    exporter.set_sampler(TraceSampler(ratio=0.0))
+
+    isolated = exporter.create_isolated_instance(exporter._context_state)
+
+    assert isolated._sampler is not None and isolated._sampler is not exporter._sampler
@@ -0,0 +1,74 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from aiq.observability.mixin.file_mode import FileCompression
+from aiq.observability.mixin.file_mode import FileRecordFormat
+from aiq.observability.utils import file_records
+from aiq.observability.utils.file_records import compress_file
+from aiq.observability.utils.file_records import encode_records
+from aiq.observability.utils.file_records import iter_records
+
+
+@pytest.mark.parametrize("record_format", list(FileRecordFormat))
+def test_encode_and_iter_records(tmp_path, record_format: FileRecordFormat):
+    """Test that encoded records are read back unchanged."""
+    records = ["first", "second record", "unicode ✓"]
+    path = tmp_path / "records"
+    path.write_bytes(encode_records(records, record_format))
+
+    assert list(iter_records(path, record_format)) == records
+
+
+@pytest.mark.parametrize("record_format", list(FileRecordFormat))
+def test_iter_records_across_read_chunks(tmp_path, monkeypatch, record_format: FileRecordFormat):
+    """Test that records split across read chunks are reassembled."""
+    monkeypatch.setattr(file_records, "_READ_CHUNK_SIZE", 3)
+
+    records = [f"record {i}" for i in range(10)]
+    path = tmp_path / "records"
+    path.write_bytes(encode_records(records, record_format))
+
+    assert list(iter_records(path, record_format)) == records
+
+
+def test_iter_records_ignores_truncated_record(tmp_path):
+    """Test that a record truncated by a crash is skipped."""
+    path = tmp_path / "records"
+    path.write_bytes(encode_records(["complete", "truncated"], FileRecordFormat.LENGTH_PREFIXED)[:-2])
+
+    assert list(iter_records(path, FileRecordFormat.LENGTH_PREFIXED)) == ["complete"]
+
+
+def test_compress_file_gzip(tmp_path):
+    """Test that a compressed file replaces the original file and can be read back."""
+    path = tmp_path / "records.log"
+    path.write_bytes(encode_records(["a", "b"], FileRecordFormat.TEXT))
+
+    compressed_path = compress_file(path, FileCompression.GZIP)
+
+    assert compressed_path == tmp_path / "records.log.gz"
+    assert not path.exists()
+    assert list(iter_records(compressed_path)) == ["a", "b"]
+
+
+def test_compress_file_none(tmp_path):
+    """Test that no compression leaves the file untouched."""
+    path = tmp_path / "records.log"
+    path.write_text("a\n")
+
+    assert compress_file(path, FileCompression.NONE) == path
+    assert path.read_text() == "a\n"
@@ -127,3 +127,54 @@ async def test_calc_runner(latencies, runtimes):
             assert output.calc_data[concurrency].gpu_estimates.gpu_estimate_by_wf_runtime is None
         else:
             assert output.calc_data[concurrency].gpu_estimates.gpu_estimate_by_wf_runtime is not None
+
+
+async def test_calc_runner_resume(tmp_path):
+    config = make_config(offline_mode=False, concurrencies=[1, 2, 3])
+    config.output_dir = tmp_path
+    config.resume = True
+    runner = CalcRunner(config)
+
+    # Concurrency 1 completed and concurrency 2 was interrupted in a previous run
+    for concurrency, interrupted in ((1, False), (2, True)):
+        concurrency_dir = tmp_path / "online" / f"concurrency_{concurrency}"
+        concurrency_dir.mkdir(parents=True)
+        metrics = make_sizing_metrics(10 * concurrency, 100 * concurrency, interrupted=interrupted)
+        (concurrency_dir / "sizing_metrics.json").write_text(metrics.model_dump_json())
+
+    def make_output(concurrency):
+        return SimpleNamespace(
+            profiler_results=SimpleNamespace(llm_latency_ci=SimpleNamespace(p95=10 * concurrency),
+                                             workflow_runtime_metrics=SimpleNamespace(p95=100 * concurrency)),
+            usage_stats=SimpleNamespace(total_runtime=110 * concurrency, usage_stats_items={}),
+            workflow_interrupted=False)
+
+    evaluation_run_outputs = {2: make_output(2), 3: make_output(3)}
+
+    with patch("aiq.profiler.calc.calc_runner.MultiEvaluationRunner") as mock_runner:
+        mock_instance = mock_runner.return_value
+        mock_instance.run_all = AsyncMock(return_value=evaluation_run_outputs)
+        output = await runner.run_online()
+
+    # Only the missing and interrupted concurrencies are run again
+    multi_eval_config = mock_runner.call_args[0][0]
+    assert set(multi_eval_config.configs.keys()) == {2, 3}
+
+    assert list(output.calc_data.keys()) == [1, 2, 3]
+    assert output.calc_data[1].sizing_metrics.llm_latency_p95 == 10
+    assert output.calc_data[2].sizing_metrics.alerts.workflow_interrupted is False
+
+
+def test_calc_runner_writes_concurrency_metrics(tmp_path):
+    config = make_config(offline_mode=False)
+    config.output_dir = tmp_path
+    runner = CalcRunner(config)
+
+    eval_output = SimpleNamespace(profiler_results=SimpleNamespace(llm_latency_ci=SimpleNamespace(p95=1.5),
+                                                                   workflow_runtime_metrics=SimpleNamespace(p95=4.0)),
+                                  usage_stats=SimpleNamespace(total_runtime=8.0, usage_stats_items={}),
+                                  workflow_interrupted=False)
+    runner._write_concurrency_metrics(4, eval_output)
+
+    assert runner._read_concurrency_metrics(4).workflow_runtime_p95 == 4.0
+    assert runner._read_concurrency_metrics(8) is None
@@ -13,6 +13,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import logging
+import random
+import time
+
 import pytest
 
 from aiq.builder.framework_enum import LLMFrameworkEnum
@@ -21,9 +25,13 @@ from aiq.data_models.intermediate_step import IntermediateStepPayload
 from aiq.data_models.intermediate_step import IntermediateStepType
 from aiq.data_models.intermediate_step import StreamEventData
 from aiq.data_models.invocation_node import InvocationNode
+from aiq.profiler.inference_optimization.prompt_caching import build_prefix_tree
+from aiq.profiler.inference_optimization.prompt_caching import collect_prefixes_iterative
 from aiq.profiler.inference_optimization.prompt_caching import get_common_prefixes
 from aiq.profiler.intermediate_property_adapter import IntermediatePropertyAdaptor
 
+logger = logging.getLogger(__name__)
+
 ###############################################################################
 # Fixtures
 ###############################################################################
@@ -64,6 +72,31 @@ def minimal_valid_df_fixture():
     return [[IntermediatePropertyAdaptor.from_intermediate_step(step) for step in steps] for steps in events]
 
 
+@pytest.fixture(name="synthetic_prompt_steps")
+def synthetic_prompt_steps_fixture():
+    """
+    Provide a corpus of long prompts sharing system prompts of different lengths, similar to the prompts of an agent
+    with a few tools.
+    """
+    rng = random.Random(42)
+    system_prompts = [f"You are agent {i}. " + "Follow the instructions carefully. " * (200 + 50 * i) for i in range(4)]
+
+    steps = []
+    for i in range(2000):
+        question = "".join(rng.choice("abcdefghijklmnopqrstuvwxyz ") for _ in range(rng.randint(500, 2000)))
+        prompt = system_prompts[i % len(system_prompts)] + question
+        steps.append(
+            IntermediateStep(parent_id="root",
+                             function_ancestry=InvocationNode(function_name="agent", function_id="test-agent"),
+                             payload=IntermediateStepPayload(event_type=IntermediateStepType.LLM_START,
+                                                             framework=LLMFrameworkEnum.LANGCHAIN,
+                                                             event_timestamp=float(i),
+                                                             name="llama-3",
+                                                             data=StreamEventData(input=prompt))))
+
+    return [[IntermediatePropertyAdaptor.from_intermediate_step(step) for step in steps]], system_prompts
+
+
 ###############################################################################
 # Tests
 ###############################################################################
@@ -108,3 +141,41 @@ def test_get_common_prefixes_min_call_percentage(minimal_valid_df):
         for pfx_obj in v.prefix_info:
             # calls_percentage >= 0.6
             assert pfx_obj.calls_percentage >= 0.6, "Expected calls_percentage >= 0.6"
+
+
+def test_prefix_tree_counts():
+    """The tree only has nodes where the strings branch or end."""
+    root = build_prefix_tree(["abcd", "abce", "ab", "xyz"])
+
+    assert root.count == 4
+    ab = root.children["a"]
+    assert (ab.prefix, ab.count) == ("ab", 3)
+    abc = ab.children["c"]
+    assert (abc.prefix, abc.count) == ("abc", 2)
+    assert sorted(child.prefix for child in abc.children.values()) == ["abcd", "abce"]
+    assert root.children["x"].prefix == "xyz"
+
+
+def test_collect_longest_prefixes():
+    """Only the longest prefixes meeting the threshold are collected."""
+    texts = ["abcd", "abce", "ab", "xyz"]
+    results = collect_prefixes_iterative(build_prefix_tree(texts), total_calls=len(texts), min_call_percentage=0.5)
+
+    assert results == [{'prefix': "abc", 'prefix_length': 3, 'calls_count': 2, 'calls_percentage': 0.5}]
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+def test_get_common_prefixes_benchmark(synthetic_prompt_steps):
+    """Measure the prefix analysis of 2000 prompts of 7-18k characters."""
+    all_steps, system_prompts = synthetic_prompt_steps
+
+    start_time = time.perf_counter()
+    result = get_common_prefixes(all_steps, min_call_percentage=0.2)
+    elapsed = time.perf_counter() - start_time
+
+    logger.info("get_common_prefixes: %.2f s for %d prompts", elapsed, len(all_steps[0]))
+
+    # Each system prompt is shared by a quarter of the calls
+    prefixes = {pfx.prefix for pfx in result.root["llama-3"].prefix_info}
+    assert prefixes == set(system_prompts)
@@ -13,6 +13,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import logging
+import random
+import time
+
 import pytest
 
 from aiq.builder.framework_enum import LLMFrameworkEnum
@@ -23,8 +27,11 @@ from aiq.data_models.invocation_node import InvocationNode
 from aiq.profiler.inference_optimization.bottleneck_analysis.nested_stack_analysis import analyze_calls_and_build_result
 from aiq.profiler.inference_optimization.bottleneck_analysis.nested_stack_analysis import build_call_tree_for_example
 from aiq.profiler.inference_optimization.bottleneck_analysis.nested_stack_analysis import build_call_tree_per_example
+from aiq.profiler.inference_optimization.bottleneck_analysis.nested_stack_analysis import build_concurrency_timeline
+from aiq.profiler.inference_optimization.bottleneck_analysis.nested_stack_analysis import compute_midpoint_concurrency
 from aiq.profiler.inference_optimization.bottleneck_analysis.nested_stack_analysis import compute_time_based_concurrency
 from aiq.profiler.inference_optimization.bottleneck_analysis.nested_stack_analysis import find_midpoint_concurrency
+from aiq.profiler.inference_optimization.bottleneck_analysis.nested_stack_analysis import flatten_call_trees
 from aiq.profiler.inference_optimization.bottleneck_analysis.nested_stack_analysis import multi_example_call_profiling
 from aiq.profiler.inference_optimization.data_models import CallNode
 from aiq.profiler.inference_optimization.data_models import ConcurrencyDistribution
@@ -32,6 +39,8 @@ from aiq.profiler.inference_optimization.data_models import NestedCallProfilingR
 from aiq.profiler.intermediate_property_adapter import IntermediatePropertyAdaptor
 from aiq.profiler.utils import create_standardized_dataframe
 
+logger = logging.getLogger(__name__)
+
 #############################################################
 # Test Data Setup
 #############################################################
@@ -179,6 +188,159 @@ def test_compute_time_based_concurrency_basic(minimal_valid_df):
     assert isinstance(distribution.timeline_segments, list)
 
 
+def _reference_time_based_concurrency(roots: list[CallNode]) -> ConcurrencyDistribution:
+    """
+    The event list implementation `compute_time_based_concurrency` replaced, kept to check that the sweep-line
+    implementation gives the same results.
+    """
+    all_nodes = []
+
+    def dfs(n: CallNode):
+        all_nodes.append(n)
+        for c in n.children:
+            dfs(c)
+
+    for r in roots:
+        dfs(r)
+
+    if not all_nodes:
+        return ConcurrencyDistribution(timeline_segments=[], p50=0, p90=0, p95=0, p99=0)
+
+    events = []
+    for n in all_nodes:
+        if n.start_time > n.end_time:
+            continue
+        events.append((n.start_time, +1))
+        events.append((n.end_time, -1))
+
+    events.sort(key=lambda x: x[0])
+    timeline_segments = []
+    curr_concurrency = 0
+    prev_time = events[0][0]
+    for t, delta in events:
+        if t > prev_time:
+            timeline_segments.append((prev_time, t, curr_concurrency))
+        curr_concurrency += delta
+        prev_time = t
+
+    total_time = 0.0
+    concurrency_durations: dict[int, float] = {}
+    for (seg_start, seg_end, c_val) in timeline_segments:
+        length = seg_end - seg_start
+        if length <= 0:
+            continue
+        total_time += length
+        concurrency_durations[c_val] = concurrency_durations.get(c_val, 0) + length
+
+    if total_time <= 0:
+        return ConcurrencyDistribution(timeline_segments=timeline_segments, p50=0, p90=0, p95=0, p99=0)
+
+    sorted_levels = sorted(concurrency_durations.items(), key=lambda x: x[0])
+
+    def concurrency_at_percentile(p: float) -> float:
+        threshold = total_time * (p / 100.0)
+        accum = 0.0
+        last_c = 0
+        for c_val, c_dur in sorted_levels:
+            accum += c_dur
+            if accum >= threshold:
+                return float(c_val)
+            last_c = c_val
+        return float(last_c)
+
+    return ConcurrencyDistribution(timeline_segments=timeline_segments,
+                                   p50=concurrency_at_percentile(50),
+                                   p90=concurrency_at_percentile(90),
+                                   p95=concurrency_at_percentile(95),
+                                   p99=concurrency_at_percentile(99))
+
+
+def _make_call_node(rng: random.Random, uuid: str, start_time: float, end_time: float, depth: int) -> CallNode:
+    node = CallNode(uuid=uuid,
+                    operation_type="TOOL" if depth else "LLM",
+                    operation_name=f"op-{depth}",
+                    start_time=start_time,
+                    end_time=end_time,
+                    duration=end_time - start_time)
+
+    if depth < 3:
+        for i in range(rng.randint(0, 3)):
+            # Quantized times produce ties between calls, a few children are zero-length or end before they start
+            child_start = round(rng.uniform(start_time, end_time), 1)
+            child_end = child_start + rng.choice([0.0, -0.1, round(rng.uniform(0, end_time - child_start), 1)])
+            node.children.append(_make_call_node(rng, f"{uuid}.{i}", child_start, child_end, depth + 1))
+
+    return node
+
+
+def _make_call_forest(seed: int, num_examples: int) -> list[CallNode]:
+    rng = random.Random(seed)
+    roots = []
+    for ex in range(num_examples):
+        # Examples overlap in time, as they do when they run concurrently
+        start_time = round(rng.uniform(0, num_examples), 1)
+        roots.append(_make_call_node(rng, f"ex{ex}", start_time, start_time + round(rng.uniform(0.5, 5.0), 1), 0))
+
+    return roots
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_compute_time_based_concurrency_matches_reference(seed: int):
+    """The sweep-line implementation gives exactly the segments, percentiles and midpoints of the event list one."""
+    roots = _make_call_forest(seed, num_examples=1 + seed * 5)
+
+    expected = _reference_time_based_concurrency(roots)
+    assert compute_time_based_concurrency(roots) == expected
+
+    all_nodes = flatten_call_trees(roots)
+    boundaries, levels = build_concurrency_timeline(all_nodes)
+    expected_midpoints = [find_midpoint_concurrency(node, expected.timeline_segments) for node in all_nodes]
+    assert compute_midpoint_concurrency(all_nodes, boundaries, levels).tolist() == expected_midpoints
+
+
+def test_flatten_call_trees_pre_order(minimal_valid_df):
+    """Nodes are flattened in the order of a recursive depth-first traversal."""
+    roots = build_call_tree_per_example(minimal_valid_df)
+
+    expected = []
+
+    def dfs(n: CallNode):
+        expected.append(n)
+        for c in n.children:
+            dfs(c)
+
+    for r in roots:
+        dfs(r)
+
+    assert [n.uuid for n in flatten_call_trees(roots)] == [n.uuid for n in expected]
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+def test_compute_time_based_concurrency_benchmark():
+    """Compare the sweep-line implementation against the event list one on a large forest."""
+    roots = _make_call_forest(seed=0, num_examples=5_000)
+    all_nodes = flatten_call_trees(roots)
+
+    start_time = time.perf_counter()
+    expected = _reference_time_based_concurrency(roots)
+    expected_midpoints = [find_midpoint_concurrency(node, expected.timeline_segments) for node in all_nodes]
+    reference_elapsed = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    boundaries, levels = build_concurrency_timeline(all_nodes)
+    distribution = compute_time_based_concurrency(roots)
+    midpoints = compute_midpoint_concurrency(all_nodes, boundaries, levels)
+    elapsed = time.perf_counter() - start_time
+
+    logger.info("Concurrency of %d calls: sweep-line %.3fs, event list %.3fs",
+                len(all_nodes),
+                elapsed,
+                reference_elapsed)
+    assert distribution == expected
+    assert midpoints.tolist() == expected_midpoints
+
+
 #############################################################
 # find_midpoint_concurrency
 #############################################################
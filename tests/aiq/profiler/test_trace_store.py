@@ -0,0 +1,255 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+
+import pandas as pd
+import pytest
+
+from aiq.builder.framework_enum import LLMFrameworkEnum
+from aiq.data_models.intermediate_step import IntermediateStep
+from aiq.data_models.intermediate_step import IntermediateStepPayload
+from aiq.data_models.intermediate_step import IntermediateStepType as WorkflowEventEnum
+from aiq.data_models.intermediate_step import StreamEventData
+from aiq.data_models.intermediate_step import UsageInfo
+from aiq.data_models.invocation_node import InvocationNode
+from aiq.data_models.profiler import BottleneckConfig
+from aiq.data_models.profiler import PromptCachingConfig
+from aiq.data_models.profiler import ProfilerConfig
+from aiq.data_models.profiler import StreamingConfig
+from aiq.profiler.callbacks.token_usage_base_model import TokenUsageBaseModel
+from aiq.profiler.inference_optimization.bottleneck_analysis.simple_stack_analysis import profile_workflow_bottlenecks
+from aiq.profiler.inference_optimization.bottleneck_analysis.simple_stack_analysis import \
+    profile_workflow_bottlenecks_from_chunks
+from aiq.profiler.inference_optimization.llm_metrics import LLMMetrics
+from aiq.profiler.inference_optimization.prompt_caching import get_common_prefixes
+from aiq.profiler.inference_optimization.prompt_caching import get_common_prefixes_from_chunks
+from aiq.profiler.inference_optimization.token_uniqueness import compute_inter_query_token_uniqueness_by_llm
+from aiq.profiler.inference_optimization.token_uniqueness import \
+    compute_inter_query_token_uniqueness_by_llm_from_chunks
+from aiq.profiler.inference_optimization.workflow_runtimes import compute_workflow_runtime_metrics
+from aiq.profiler.inference_optimization.workflow_runtimes import compute_workflow_runtime_metrics_from_chunks
+from aiq.profiler.intermediate_property_adapter import IntermediatePropertyAdaptor
+from aiq.profiler.profile_runner import ProfilerRunner
+from aiq.profiler.trace_store import ProfilerTraceStore
+from aiq.profiler.utils import create_standardized_dataframe
+
+pytest.importorskip("pyarrow")
+
+
+def _make_step(event_type: WorkflowEventEnum,
+               timestamp: float,
+               uuid: str,
+               name: str,
+               function_name: str,
+               text_input: str | None = None,
+               completion_tokens: int = 0) -> IntermediateStep:
+    return IntermediateStep(parent_id="root",
+                            function_ancestry=InvocationNode(function_name=function_name, function_id=function_name),
+                            payload=IntermediateStepPayload(
+                                event_type=event_type,
+                                event_timestamp=timestamp,
+                                framework=LLMFrameworkEnum.LANGCHAIN,
+                                UUID=uuid,
+                                name=name,
+                                data=StreamEventData(input=text_input),
+                                usage_info=UsageInfo(token_usage=TokenUsageBaseModel(
+                                    completion_tokens=completion_tokens))))
+
+
+def _make_run(num_examples: int) -> list[list[IntermediateStep]]:
+    """
+    Every example makes a few LLM calls sharing a system prompt and one tool call. Example 3 has no steps.
+    """
+    all_steps = []
+    for ex in range(num_examples):
+        steps = []
+        if ex != 3:
+            base = ex * 10.0 + (ex % 4) * 0.25
+            llm_name = "llama-3" if ex % 2 else "mixtral"
+            for call in range(3):
+                start = base + call * 2.0
+                uuid = f"llm-{ex}-{call}"
+                prompt = f"You are a helpful assistant. Question {ex} step {call} about topic {ex % 3}"
+                steps.append(
+                    _make_step(WorkflowEventEnum.LLM_START, start, uuid, llm_name, "agent", text_input=prompt))
+                steps.append(
+                    _make_step(WorkflowEventEnum.LLM_END, start + 1.0 + call * 0.1, uuid, llm_name, "agent",
+                               completion_tokens=10 + call))
+
+            tool_uuid = f"tool-{ex}"
+            steps.append(_make_step(WorkflowEventEnum.TOOL_START, base + 6.5, tool_uuid, "search", "search"))
+            steps.append(_make_step(WorkflowEventEnum.TOOL_END, base + 7.0 + ex * 0.01, tool_uuid, "search", "search"))
+
+        all_steps.append([IntermediatePropertyAdaptor.from_intermediate_step(step) for step in steps])
+
+    return all_steps
+
+
+@pytest.fixture(name="run_steps")
+def run_steps_fixture() -> list[list[IntermediateStep]]:
+    return _make_run(num_examples=7)
+
+
+@pytest.fixture(name="trace_store")
+def trace_store_fixture(tmp_path, run_steps: list[list[IntermediateStep]]) -> ProfilerTraceStore:
+    with ProfilerTraceStore(tmp_path / "trace.parquet", examples_per_chunk=2) as store:
+        for steps in run_steps:
+            store.append(steps)
+
+    return store
+
+
+def test_chunks_hold_complete_examples(trace_store: ProfilerTraceStore):
+    assert trace_store.num_examples == 7
+
+    chunks = list(trace_store.iter_chunks())
+    # Examples 0-1, 2-3 and 4-5 are flushed together, example 6 when the store is closed
+    assert [sorted(chunk["example_number"].unique()) for chunk in chunks] == [[0, 1], [2], [4, 5], [6]]
+
+
+def test_chunks_match_standardized_dataframe(trace_store: ProfilerTraceStore, run_steps: list[list[IntermediateStep]]):
+    expected_df = create_standardized_dataframe(run_steps)
+    expected_df["event_type"] = expected_df["event_type"].map(lambda event_type: event_type.value)
+
+    stored_df = pd.concat(trace_store.iter_chunks(), ignore_index=True)
+    pd.testing.assert_frame_equal(stored_df, expected_df, check_dtype=False)
+
+
+def test_read_columns(trace_store: ProfilerTraceStore):
+    chunk = next(trace_store.iter_chunks(columns=["example_number", "event_timestamp"]))
+    assert list(chunk.columns) == ["example_number", "event_timestamp"]
+
+
+def test_read_before_close(tmp_path, run_steps: list[list[IntermediateStep]]):
+    store = ProfilerTraceStore(tmp_path / "trace.parquet")
+    store.append(run_steps[0])
+
+    with pytest.raises(RuntimeError):
+        next(store.iter_chunks())
+
+    store.close()
+    with pytest.raises(RuntimeError):
+        store.append(run_steps[1])
+
+
+def test_empty_store(tmp_path):
+    with ProfilerTraceStore(tmp_path / "trace.parquet") as store:
+        store.append([])
+
+    assert store.num_examples == 1
+    assert not list(store.iter_chunks())
+
+
+def test_chunked_analyses_match(trace_store: ProfilerTraceStore, run_steps: list[list[IntermediateStep]]):
+    assert (compute_workflow_runtime_metrics_from_chunks(trace_store.iter_chunks()) == compute_workflow_runtime_metrics(
+        run_steps))
+    assert (compute_inter_query_token_uniqueness_by_llm_from_chunks(
+        trace_store.iter_chunks()).model_dump() == compute_inter_query_token_uniqueness_by_llm(run_steps).model_dump())
+    assert (profile_workflow_bottlenecks_from_chunks(
+        trace_store.iter_chunks()).model_dump() == profile_workflow_bottlenecks(run_steps).model_dump())
+    assert (get_common_prefixes_from_chunks(trace_store.iter_chunks(), 0.5).model_dump() == get_common_prefixes(
+        run_steps, 0.5).model_dump())
+
+
+def test_chunked_llm_metrics_match(trace_store: ProfilerTraceStore, run_steps: list[list[IntermediateStep]]):
+    expected_df = LLMMetrics.compute_profiling_metrics(run_steps).reset_index(drop=True)
+    chunked_df = pd.concat([LLMMetrics.compute_profiling_metrics_from_df(chunk) for chunk in trace_store.iter_chunks()],
+                           ignore_index=True)
+
+    nova_columns = [column for column in expected_df.columns if column.startswith("NOVA-")]
+    assert len(nova_columns) == 6
+    pd.testing.assert_frame_equal(chunked_df[nova_columns], expected_df[nova_columns], check_dtype=False)
+
+
+async def test_streaming_runner_matches(tmp_path, run_steps: list[list[IntermediateStep]]):
+    profiler_config = ProfilerConfig(base_metrics=True,
+                                     token_uniqueness_forecast=True,
+                                     compute_llm_metrics=True,
+                                     prompt_caching_prefixes=PromptCachingConfig(enable=True),
+                                     bottleneck_analysis=BottleneckConfig(enable_simple_stack=True))
+    streaming_config = profiler_config.model_copy(
+        update={"streaming": StreamingConfig(enable=True, examples_per_chunk=2)})
+
+    in_memory_dir = tmp_path / "in_memory"
+    streaming_dir = tmp_path / "streaming"
+    expected = await ProfilerRunner(profiler_config, in_memory_dir).run(run_steps)
+    results = await ProfilerRunner(streaming_config, streaming_dir).run(run_steps)
+
+    assert results == expected
+    assert os.path.exists(streaming_dir / "standardized_data_all.parquet")
+
+    for file_name in ("all_requests_profiler_traces.json",
+                      "inference_optimization.json",
+                      "workflow_profiling_report.txt",
+                      "workflow_profiling_metrics.json"):
+        with open(in_memory_dir / file_name, encoding="utf-8") as expected_file, \
+                open(streaming_dir / file_name, encoding="utf-8") as f:
+            assert f.read() == expected_file.read(), file_name
+
+    with open(streaming_dir / "all_requests_profiler_traces.json", encoding="utf-8") as f:
+        assert len(json.load(f)) == len(run_steps)
+
+    pd.testing.assert_frame_equal(pd.read_csv(streaming_dir / "standardized_data_all.csv"),
+                                  pd.read_csv(in_memory_dir / "standardized_data_all.csv"))
+
+
+async def test_streaming_runner_add_request(tmp_path, run_steps: list[list[IntermediateStep]]):
+    profiler_config = ProfilerConfig(base_metrics=True,
+                                     streaming=StreamingConfig(enable=True, examples_per_chunk=2))
+
+    expected = await ProfilerRunner(profiler_config, tmp_path / "run").run(run_steps)
+
+    runner = ProfilerRunner(profiler_config, tmp_path / "add_request")
+    for steps in run_steps[:-1]:
+        runner.add_request(steps)
+    results = await runner.run(run_steps[-1:])
+
+    assert results == expected
+    with open(tmp_path / "add_request" / "all_requests_profiler_traces.json", encoding="utf-8") as f:
+        assert [request["request_number"] for request in json.load(f)] == list(range(len(run_steps)))
+
+
+async def test_streaming_runner_without_output(tmp_path, run_steps: list[list[IntermediateStep]]):
+    profiler_config = ProfilerConfig(base_metrics=True, streaming=StreamingConfig(enable=True))
+
+    runner = ProfilerRunner(profiler_config, tmp_path, write_output=False)
+    for steps in run_steps:
+        runner.add_request(steps)
+    store_path = runner._trace_store.path
+    results = await runner.run([])
+
+    assert results.workflow_runtime_metrics is not None
+    assert not os.path.exists(tmp_path / "standardized_data_all.parquet")
+    assert not os.path.exists(tmp_path / "all_requests_profiler_traces.json")
+    assert not store_path.exists()
+
+
+def test_streaming_runner_close(tmp_path, run_steps: list[list[IntermediateStep]]):
+    profiler_config = ProfilerConfig(base_metrics=True, streaming=StreamingConfig(enable=True))
+
+    runner = ProfilerRunner(profiler_config, tmp_path, write_output=False)
+    runner.add_request(run_steps[0])
+    store_path = runner._trace_store.path
+    runner.close()
+
+    assert not store_path.exists()
+    assert runner._trace_store is None
+
+
+def test_add_request_requires_streaming(tmp_path, run_steps: list[list[IntermediateStep]]):
+    with pytest.raises(RuntimeError):
+        ProfilerRunner(ProfilerConfig(), tmp_path).add_request(run_steps[0])
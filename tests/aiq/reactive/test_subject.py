@@ -84,3 +84,33 @@ def test_subject_late_subscriber_after_dispose():
     sub.subscribe(Observer(on_next=items.append))
     sub.on_next("ignored")
     assert not items
+
+
+def test_subject_unsubscribe_during_emit():
+    sub = Subject[str]()
+    items1, items2 = [], []
+
+    def _on_next(value: str):
+        items1.append(value)
+        subscription1.unsubscribe()
+
+    subscription1 = sub.subscribe(Observer(on_next=_on_next))
+    sub.subscribe(Observer(on_next=items2.append))
+    assert sub.has_observers
+
+    # The observers of an emission are fixed when it starts
+    sub.on_next("a")
+    sub.on_next("b")
+    assert items1 == ["a"]
+    assert items2 == ["a", "b"]
+
+
+def test_subject_has_observers():
+    sub = Subject[str]()
+    assert not sub.has_observers
+
+    subscription = sub.subscribe(Observer())
+    assert sub.has_observers
+
+    subscription.unsubscribe()
+    assert not sub.has_observers
@@ -0,0 +1,253 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import dataclasses
+import typing
+from collections.abc import Callable
+
+import pytest
+
+from _utils.configs import EmbedderProviderTestConfig
+from _utils.configs import FunctionTestConfig
+from _utils.configs import LLMProviderTestConfig
+from aiq.cli.type_registry import GlobalTypeRegistry
+from aiq.cli.type_registry import RegisteredEmbedderProviderInfo
+from aiq.cli.type_registry import RegisteredFunctionInfo
+from aiq.cli.type_registry import RegisteredLLMClientInfo
+from aiq.cli.type_registry import RegisteredLLMProviderInfo
+from aiq.cli.type_registry import RegisteredToolWrapper
+from aiq.data_models.component import AIQComponentEnum
+from aiq.data_models.discovery_metadata import DiscoveryMetadata
+from aiq.runtime import loader
+from aiq.runtime.plugin_manifest import PluginManifest
+from aiq.runtime.plugin_manifest import compute_fingerprint
+from aiq.runtime.plugin_manifest import get_manifest_path
+from aiq.runtime.plugin_manifest import get_referenced_types
+from aiq.runtime.plugin_manifest import snapshot_registry
+
+
+def _build_fn(*args):
+    pass
+
+
+def _register_function():
+    GlobalTypeRegistry.get().register_function(
+        RegisteredFunctionInfo(full_type="test/test_function",
+                               config_type=FunctionTestConfig,
+                               build_fn=_build_fn,
+                               framework_wrappers=["langchain"]))
+
+
+def _register_llm():
+    GlobalTypeRegistry.get().register_llm_provider(
+        RegisteredLLMProviderInfo(full_type="test/test_llm", config_type=LLMProviderTestConfig, build_fn=_build_fn))
+
+
+def _register_langchain():
+    registry = GlobalTypeRegistry.get()
+    registry.register_llm_client(
+        RegisteredLLMClientInfo(full_type="test/test_llm",
+                                config_type=LLMProviderTestConfig,
+                                llm_framework="langchain",
+                                build_fn=_build_fn))
+    registry.register_tool_wrapper(
+        RegisteredToolWrapper(llm_framework="langchain", build_fn=_build_fn, discovery_metadata=DiscoveryMetadata()))
+
+
+def _register_other():
+    GlobalTypeRegistry.get().register_embedder_provider(
+        RegisteredEmbedderProviderInfo(full_type="test/test_embedding",
+                                       config_type=EmbedderProviderTestConfig,
+                                       build_fn=_build_fn))
+    GlobalTypeRegistry.get().register_tool_wrapper(
+        RegisteredToolWrapper(llm_framework="other", build_fn=_build_fn, discovery_metadata=DiscoveryMetadata()))
+
+
+@dataclasses.dataclass
+class _FakeEntryPoint:
+    name: str
+    register_fn: Callable[[], None]
+    group: str = "aiq.components"
+    version: str = "1.0"
+    loads: int = 0
+
+    @property
+    def value(self) -> str:
+        return f"fake.{self.name}"
+
+    @property
+    def module(self) -> str:
+        return self.value
+
+    @property
+    def dist(self) -> typing.Any:
+        return dataclasses.make_dataclass("Dist", ["name", "version"])(self.name, self.version)
+
+    def load(self):
+        self.loads += 1
+        self.register_fn()
+
+
+@pytest.fixture(name="entry_points")
+def entry_points_fixture(monkeypatch: pytest.MonkeyPatch, tmp_path) -> list[_FakeEntryPoint]:
+    entry_points = [
+        _FakeEntryPoint("function", _register_function),
+        _FakeEntryPoint("llm", _register_llm),
+        _FakeEntryPoint("langchain", _register_langchain),
+        _FakeEntryPoint("other", _register_other),
+    ]
+
+    monkeypatch.setenv("AIQ_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("AIQ_LAZY_PLUGIN_LOADING", "1")
+    monkeypatch.setattr(loader, "_entry_point_registrations", {})
+    monkeypatch.setattr(loader, "discover_entrypoints", lambda plugin_type: list(entry_points))
+
+    return entry_points
+
+
+_CONFIG = {
+    "general": {
+        "telemetry": {
+            "tracing": {
+                "phoenix": {
+                    "_type": "phoenix"
+                }
+            }
+        }
+    },
+    "functions": {
+        "fn": {
+            "_type": "test_function"
+        }
+    },
+    "llms": {
+        "llm": {
+            "_type": "test/test_llm"
+        }
+    },
+    "workflow": {
+        "_type": "react_agent"
+    },
+    "eval": {
+        "evaluators": {
+            "rag": {
+                "_type": "ragas"
+            }
+        }
+    },
+}
+
+
+def test_get_referenced_types():
+    assert get_referenced_types(_CONFIG) == {
+        AIQComponentEnum.FUNCTION: {"test_function", "react_agent"},
+        AIQComponentEnum.LLM_PROVIDER: {"test/test_llm"},
+        AIQComponentEnum.EVALUATOR: {"ragas"},
+        AIQComponentEnum.TRACING: {"phoenix"},
+    }
+
+
+def test_manifest_from_registrations():
+    with GlobalTypeRegistry.push() as registry:
+        before = snapshot_registry(registry)
+        _register_other()
+        other_registrations = snapshot_registry(registry) - before
+
+        before = snapshot_registry(registry)
+        _register_function()
+        function_registrations = snapshot_registry(registry) - before
+
+    manifest = PluginManifest.from_registrations(
+        "abc", {
+            "aiq.components:other": other_registrations, "aiq.components:function": function_registrations
+        })
+
+    assert manifest.get_entry_points(AIQComponentEnum.FUNCTION, "test_function") == ["aiq.components:function"]
+    assert manifest.get_entry_points(AIQComponentEnum.FUNCTION, "test/test_function") == ["aiq.components:function"]
+    assert manifest.get_entry_points(AIQComponentEnum.FUNCTION, "unknown") == []
+    assert manifest.get_entry_points(AIQComponentEnum.EMBEDDER_PROVIDER, "test_embedding") == ["aiq.components:other"]
+    assert manifest.get_framework_entry_points("other") == ["aiq.components:other"]
+
+
+def test_manifest_load_and_save(tmp_path):
+    path = tmp_path / "manifest.json"
+    assert PluginManifest.load(path, "abc") is None
+
+    manifest = PluginManifest(fingerprint="abc", frameworks={"langchain": ["aiq.components:langchain"]})
+    manifest.save(path)
+
+    assert PluginManifest.load(path, "abc") == manifest
+    assert PluginManifest.load(path, "def") is None
+
+    path.write_text("not json", encoding="utf-8")
+    assert PluginManifest.load(path, "abc") is None
+
+
+def test_fingerprint_tracks_installed_plugins():
+    entry_points = [_FakeEntryPoint("a", _build_fn), _FakeEntryPoint("b", _build_fn)]
+    fingerprint = compute_fingerprint(entry_points)
+
+    assert compute_fingerprint(reversed(entry_points)) == fingerprint
+    assert compute_fingerprint(entry_points[:1]) != fingerprint
+    assert compute_fingerprint([entry_points[0], dataclasses.replace(entry_points[1], version="2.0")]) != fingerprint
+
+
+def test_lazy_loading(entry_points: list[_FakeEntryPoint]):
+    config = {"functions": {"fn": {"_type": "test_function"}}, "llms": {"llm": {"_type": "test_llm"}}}
+
+    # Without a manifest every plugin is loaded and the manifest is written
+    with GlobalTypeRegistry.push():
+        loader.discover_and_register_config_plugins(config)
+
+    assert [entry_point.loads for entry_point in entry_points] == [1, 1, 1, 1]
+    assert get_manifest_path().exists()
+
+    loader._entry_point_registrations.clear()  # pylint: disable=protected-access
+
+    with GlobalTypeRegistry.push() as registry:
+        loader.discover_and_register_config_plugins(config)
+
+        # The plugins providing the referenced components and the framework used by the function are loaded
+        assert [entry_point.loads for entry_point in entry_points] == [2, 2, 2, 1]
+
+        # The remaining plugins are loaded the first time a lookup fails
+        assert registry.get_tool_wrapper("other").llm_framework == "other"
+        assert [entry_point.loads for entry_point in entry_points] == [2, 2, 2, 2]
+
+        with pytest.raises(KeyError):
+            registry.get_tool_wrapper("missing")
+
+
+def test_lazy_loading_unknown_type(entry_points: list[_FakeEntryPoint]):
+    with GlobalTypeRegistry.push():
+        loader.discover_and_register_plugins(loader.PluginTypes.CONFIG_OBJECT)
+
+    loader._entry_point_registrations.clear()  # pylint: disable=protected-access
+
+    with GlobalTypeRegistry.push():
+        loader.discover_and_register_config_plugins({"functions": {"fn": {"_type": "unknown"}}})
+
+    assert [entry_point.loads for entry_point in entry_points] == [2, 2, 2, 2]
+
+
+def test_lazy_loading_disabled_by_default(entry_points: list[_FakeEntryPoint], monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.delenv("AIQ_LAZY_PLUGIN_LOADING")
+
+    with GlobalTypeRegistry.push():
+        loader.discover_and_register_config_plugins({"functions": {"fn": {"_type": "test_function"}}})
+
+    assert [entry_point.loads for entry_point in entry_points] == [1, 1, 1, 1]
+    assert not get_manifest_path().exists()
@@ -13,15 +13,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import json
 import logging
+import time
+from unittest.mock import patch
 from urllib.parse import urljoin
 
+import httpx
 import pytest
-import requests
 from pytest_httpserver import HTTPServer
+from werkzeug import Response
 
 from aiq.tool.code_execution import code_sandbox
+from aiq.tool.code_execution.local_sandbox.local_sandbox_server import CodeExecutionStatus
+from aiq.tool.code_execution.local_sandbox.local_sandbox_server import SandboxWorkerPool
 from aiq.tool.code_execution.local_sandbox.local_sandbox_server import do_execute
+from aiq.tool.code_execution.local_sandbox.local_sandbox_server import execute_python_in_process
 
 logger = logging.getLogger(__name__)
 
@@ -55,7 +63,7 @@ async def test_bad_response(httpserver: HTTPServer):
     client = code_sandbox.get_sandbox("local", uri="http://localhost:9999")
 
     # Test that connection error is raised when the service is unavailable
-    with pytest.raises(requests.exceptions.ConnectionError):
+    with pytest.raises(httpx.ConnectError):
         _ = await client.execute_code(generated_code='print("Hello World")')
 
     # Test for JSON parsing error
@@ -75,6 +83,61 @@ async def test_bad_response(httpserver: HTTPServer):
     assert resp.get("stderr").startswith("Unknown error")
 
 
+async def test_execute_code_does_not_block_event_loop(httpserver: HTTPServer):
+
+    def _slow_handler(request):  # pylint: disable=unused-argument
+        time.sleep(0.5)
+        return Response(json.dumps({
+            "process_status": "completed", "stdout": "done", "stderr": ""
+        }),
+                        mimetype="application/json")
+
+    httpserver.expect_request("/execute", method="POST").respond_with_handler(_slow_handler)
+    client = code_sandbox.get_sandbox("local", uri=httpserver.url_for("/execute"))
+
+    num_ticks = 0
+
+    async def _ticker():
+        nonlocal num_ticks
+        while True:
+            await asyncio.sleep(0.01)
+            num_ticks += 1
+
+    ticker = asyncio.create_task(_ticker())
+    try:
+        resp = await client.execute_code(generated_code='print("done")')
+    finally:
+        ticker.cancel()
+        await client.aclose()
+
+    assert resp["stdout"] == "done"
+    # Other coroutines keep running while the sandbox executes the code
+    assert num_ticks >= 20
+
+
+async def test_execute_code_timeout(httpserver: HTTPServer):
+
+    def _slow_handler(request):  # pylint: disable=unused-argument
+        time.sleep(1)
+        return Response(json.dumps({
+            "process_status": "completed", "stdout": "", "stderr": ""
+        }),
+                        mimetype="application/json")
+
+    httpserver.expect_request("/execute", method="POST").respond_with_handler(_slow_handler)
+    client = code_sandbox.get_sandbox("local", uri=httpserver.url_for("/execute"))
+
+    resp = await client.execute_code(generated_code='print("done")', timeout_seconds=0.2)
+    assert resp == {"process_status": "timeout", "stdout": "", "stderr": "Timed out\n"}
+
+    # A 502 from the sandbox is reported as a timeout
+    httpserver.clear()
+    httpserver.expect_request("/execute", method="POST").respond_with_data("Bad Gateway", status=502)
+    resp = await client.execute_code(generated_code='print("done")')
+    assert resp == {"process_status": "timeout", "stdout": "", "stderr": "Timed out\n"}
+    await client.aclose()
+
+
 async def test_code_gen(httpserver: HTTPServer):
 
     client = code_sandbox.get_sandbox("local", uri=httpserver.url_for("/execute"))
@@ -116,3 +179,112 @@ print(5+5)
     assert resp.get("process_status") == "completed"
     assert resp.get("stdout").rstrip() == "10"
     assert resp.get("stderr") == ""
+
+
+@pytest.fixture(name="worker_pool")
+def worker_pool_fixture():
+    pool = SandboxWorkerPool(num_workers=2, max_tasks_per_worker=3)
+    yield pool
+    pool.shutdown()
+
+
+def test_worker_pool_reuses_workers(worker_pool: SandboxWorkerPool):
+    pids = set()
+    for _ in range(2):
+        result = worker_pool.execute("import os; print(os.getpid())", timeout=10)
+        assert result.process_status == CodeExecutionStatus.COMPLETED
+        pids.add(int(result.stdout))
+
+    # Globals do not leak between snippets executed by the same worker
+    worker_pool.execute("leaked = 1", timeout=10)
+    result = worker_pool.execute("print(leaked)", timeout=10)
+    assert result.process_status == CodeExecutionStatus.ERROR
+    assert "NameError" in result.stderr
+
+    assert len(pids) <= 2
+
+
+def test_worker_pool_recycles_workers():
+    pool = SandboxWorkerPool(num_workers=1, max_tasks_per_worker=2)
+    try:
+        pids = [int(pool.execute("import os; print(os.getpid())", timeout=10).stdout) for _ in range(4)]
+    finally:
+        pool.shutdown()
+
+    assert pids[0] == pids[1]
+    assert pids[2] == pids[3]
+    assert pids[0] != pids[2]
+
+
+def test_worker_pool_timeout_and_crash(worker_pool: SandboxWorkerPool):
+    result = worker_pool.execute("import time; time.sleep(5)", timeout=1)
+    assert result.process_status == CodeExecutionStatus.TIMEOUT
+    assert result.stderr.rstrip() == "Timed out"
+
+    result = worker_pool.execute("import os; os._exit(1)", timeout=10)
+    assert result.process_status == CodeExecutionStatus.ERROR
+    assert result.stderr.rstrip() == "Process exited unexpectedly"
+
+    # The pool replaces the killed workers
+    for _ in range(4):
+        result = worker_pool.execute("print(5+5)", timeout=10)
+        assert result.process_status == CodeExecutionStatus.COMPLETED
+        assert result.stdout.rstrip() == "10"
+
+
+def test_worker_pool_restarts_workers_which_failed_to_start():
+    pool = SandboxWorkerPool(num_workers=1, max_tasks_per_worker=1)
+    try:
+        with patch("aiq.tool.code_execution.local_sandbox.local_sandbox_server.SandboxWorker",
+                   side_effect=OSError("no more processes")):
+            result = pool.execute("print(5+5)", timeout=10)
+            assert result.stdout.rstrip() == "10"
+
+            # The replacement of the recycled worker failed, its slot stays in the pool
+            result = pool.execute("print(5+5)", timeout=10)
+            assert result.process_status == CodeExecutionStatus.ERROR
+            assert result.stderr.rstrip() == "Failed to start sandbox worker"
+
+        result = pool.execute("print(5+5)", timeout=10)
+        assert result.process_status == CodeExecutionStatus.COMPLETED
+        assert result.stdout.rstrip() == "10"
+    finally:
+        pool.shutdown()
+
+
+def test_worker_pool_acquire_timeout():
+    pool = SandboxWorkerPool(num_workers=1, acquire_timeout=0.1)
+    worker = pool._idle_workers.get()
+    try:
+        result = pool.execute("print(5+5)", timeout=10)
+        assert result.process_status == CodeExecutionStatus.ERROR
+        assert result.stderr.rstrip() == "No sandbox worker available"
+    finally:
+        pool._idle_workers.put(worker)
+        pool.shutdown()
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+def test_worker_pool_throughput_benchmark():
+    num_snippets = 100
+    snippet = "print(sum(range(1000)))"
+
+    def _run(execute_fn) -> float:
+        start = time.perf_counter()
+        for _ in range(num_snippets):
+            assert execute_fn(snippet, 10).stdout.rstrip() == "499500"
+        return num_snippets / (time.perf_counter() - start)
+
+    process_throughput = _run(execute_python_in_process)
+
+    pool = SandboxWorkerPool(num_workers=1, max_tasks_per_worker=50)
+    try:
+        pool_throughput = _run(pool.execute)
+    finally:
+        pool.shutdown()
+
+    logger.info("Sandbox throughput, per-request process: %.1f snippets/s, worker pool: %.1f snippets/s",
+                process_throughput,
+                pool_throughput)
+    assert pool_throughput > process_throughput
@@ -13,12 +13,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+from contextlib import asynccontextmanager
 from typing import get_args
+from unittest.mock import patch
 
 import pytest
+from mcp.types import CallToolResult
+from mcp.types import TextContent
 from pydantic import ValidationError
 from pytest_httpserver import HTTPServer
 
+from aiq.tool.mcp.mcp_client import MCPBuilder
+from aiq.tool.mcp.mcp_client import MCPSessionPool
+from aiq.tool.mcp.mcp_client import MCPToolClient
 from aiq.tool.mcp.mcp_client import model_from_mcp_schema
 
 
@@ -180,3 +188,188 @@ def test_schema_missing_required_fields_raises(sample_schema):
     errors = exc_info.value.errors()
     missing_fields = {e['loc'][0] for e in errors if e['type'] == 'missing'}
     assert 'required_int_field' in missing_fields
+
+
+class _FakeClientSession:
+
+    def __init__(self, server: "_FakeMCPServer"):
+        self._server = server
+        self.closed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        self.closed = True
+
+    async def initialize(self):
+        self._server.num_initialized += 1
+
+    async def send_ping(self):
+        self._server.num_pings += 1
+        if self._server.fail_ping:
+            raise ConnectionError("ping failed")
+
+    async def call_tool(self, tool_name: str, tool_args: dict | None):
+        self._server.in_flight += 1
+        self._server.max_in_flight = max(self._server.max_in_flight, self._server.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if self._server.drop_next_call:
+                self._server.drop_next_call = False
+                self._server.connections[-1].set()
+                await asyncio.sleep(0.01)
+                raise ConnectionError("connection dropped")
+            return CallToolResult(content=[TextContent(type="text", text=f"{tool_name}: {tool_args}")])
+        finally:
+            self._server.in_flight -= 1
+
+
+class _FakeMCPServer:
+
+    def __init__(self):
+        self.num_initialized = 0
+        self.num_pings = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.fail_ping = False
+        self.drop_next_call = False
+        self.connections: list[asyncio.Event] = []
+
+    @asynccontextmanager
+    async def sse_client(self, url: str):  # pylint: disable=unused-argument
+        dropped = asyncio.Event()
+        self.connections.append(dropped)
+
+        async def _wait_for_drop():
+            await dropped.wait()
+            raise ConnectionError("connection dropped")
+
+        # Mimic the SSE client whose task group is torn down when the connection drops
+        async with asyncio.TaskGroup() as tg:
+            watcher = tg.create_task(_wait_for_drop())
+            yield None, None
+            watcher.cancel()
+
+
+@pytest.fixture(name="fake_mcp_server")
+def fake_mcp_server_fixture():
+    server = _FakeMCPServer()
+    with patch("aiq.tool.mcp.mcp_client.sse_client", server.sse_client), \
+         patch("aiq.tool.mcp.mcp_client.ClientSession", lambda read, write: _FakeClientSession(server)):
+        yield server
+
+
+async def test_session_pool_reuses_sessions(fake_mcp_server: _FakeMCPServer):
+    pool = MCPSessionPool("http://localhost:8080/sse", max_sessions=2)
+    try:
+        for i in range(5):
+            result = await pool.call_tool("tool", {"i": i})
+            assert result.content[0].text == f"tool: {{'i': {i}}}"
+
+        assert fake_mcp_server.num_initialized == 1
+        assert pool.num_sessions == 1
+    finally:
+        await pool.aclose()
+
+    assert pool.num_sessions == 0
+
+
+async def test_session_pool_max_sessions(fake_mcp_server: _FakeMCPServer):
+    pool = MCPSessionPool("http://localhost:8080/sse", max_sessions=3)
+    try:
+        await asyncio.gather(*(pool.call_tool("tool", {"i": i}) for i in range(20)))
+
+        assert fake_mcp_server.max_in_flight == 3
+        assert fake_mcp_server.num_initialized == 3
+    finally:
+        await pool.aclose()
+
+    with pytest.raises(RuntimeError):
+        await pool.call_tool("tool", {})
+
+
+async def test_session_pool_health_check(fake_mcp_server: _FakeMCPServer):
+    pool = MCPSessionPool("http://localhost:8080/sse", max_sessions=1, health_check_interval=0.0)
+    try:
+        await pool.call_tool("tool", {})
+        await pool.call_tool("tool", {})
+        assert fake_mcp_server.num_pings == 1
+        assert fake_mcp_server.num_initialized == 1
+
+        # A failing health check replaces the session
+        fake_mcp_server.fail_ping = True
+        await pool.call_tool("tool", {})
+        assert fake_mcp_server.num_initialized == 2
+        assert pool.num_sessions == 1
+    finally:
+        await pool.aclose()
+
+
+async def test_session_pool_does_not_retry_dropped_call_by_default(fake_mcp_server: _FakeMCPServer):
+    pool = MCPSessionPool("http://localhost:8080/sse", max_sessions=1)
+    try:
+        await pool.call_tool("tool", {})
+        fake_mcp_server.drop_next_call = True
+        with pytest.raises(ConnectionError):
+            await pool.call_tool("tool", {})
+        assert pool.num_sessions == 0
+
+        # The dead session was discarded, the next call opens a new one
+        await pool.call_tool("tool", {})
+        assert fake_mcp_server.num_initialized == 2
+    finally:
+        await pool.aclose()
+
+
+async def test_session_pool_reconnects_on_dropped_connection(fake_mcp_server: _FakeMCPServer):
+    pool = MCPSessionPool("http://localhost:8080/sse", max_sessions=1)
+    try:
+        await pool.call_tool("tool", {})
+        fake_mcp_server.drop_next_call = True
+        result = await pool.call_tool("tool", {"retry": True}, retry_on_disconnect=True)
+        assert result.content[0].text == "tool: {'retry': True}"
+        assert fake_mcp_server.num_initialized == 2
+        assert pool.num_sessions == 1
+    finally:
+        await pool.aclose()
+
+
+async def test_mcp_builder_shares_session_pool(fake_mcp_server: _FakeMCPServer):
+    async with MCPBuilder("http://localhost:8080/sse") as builder:
+        tool_a = MCPToolClient(builder.url, "tool_a", None, session_pool=builder._session_pool)
+        tool_b = MCPToolClient(builder.url, "tool_b", None, session_pool=builder._session_pool)
+        assert await tool_a.acall({}) == "tool_a: {}"
+        assert await tool_b.acall({}) == "tool_b: {}"
+        await builder.call_tool("tool_a", {})
+
+        assert fake_mcp_server.num_initialized == 1
+
+    assert builder._session_pool.num_sessions == 0
+
+
+async def test_mcp_builders_share_session_pool_per_url(fake_mcp_server: _FakeMCPServer):
+    builder_a = MCPBuilder("http://localhost:8080/sse", max_sessions=1)
+    builder_b = MCPBuilder("http://localhost:8080/sse", max_sessions=2)
+    other = MCPBuilder("http://localhost:8081/sse")
+    try:
+        assert builder_a._session_pool is builder_b._session_pool
+        assert builder_a._session_pool is not other._session_pool
+        assert builder_a._session_pool.max_sessions == 2
+
+        await builder_a.call_tool("tool_a", {})
+        await builder_b.call_tool("tool_b", {})
+        assert fake_mcp_server.num_initialized == 1
+
+        # Closing one builder keeps the sessions used by the other
+        await builder_a.aclose()
+        await builder_a.aclose()
+        await builder_b.call_tool("tool_b", {})
+        assert fake_mcp_server.num_initialized == 1
+    finally:
+        await builder_b.aclose()
+        await other.aclose()
+
+    assert builder_b._session_pool.num_sessions == 0
+    async with MCPBuilder("http://localhost:8080/sse") as builder:
+        assert builder._session_pool is not builder_b._session_pool
@@ -14,6 +14,8 @@
 # limitations under the License.
 
 # pylint: disable=redefined-outer-name
+import logging
+import time
 from io import BytesIO
 from io import TextIOWrapper
 
@@ -23,6 +25,8 @@ from aiq.utils.type_converter import ConvertException
 from aiq.utils.type_converter import GlobalTypeConverter
 from aiq.utils.type_converter import TypeConverter
 
+logger = logging.getLogger(__name__)
+
 
 # --------------------------------------------------------------------
 # Example classes to test inheritance-based conversions
@@ -459,3 +463,86 @@ def test_try_convert_preserves_object_identity():
     original_dict = {"key": "value"}
     result = converter.try_convert(original_dict, list)
     assert result is original_dict  # Same object, not a copy
+
+
+# --------------------------------------------------------------------
+# Conversion plan cache
+# --------------------------------------------------------------------
+
+
+def test_add_converter_invalidates_plans(basic_converter):
+    """Plans resolved before a converter is added must not hide the new converter."""
+    with pytest.raises(ValueError):
+        basic_converter.convert(1.5, list)
+
+    def convert_float_to_list(f: float) -> list:
+        return [f]
+
+    basic_converter.add_converter(convert_float_to_list)
+    assert basic_converter.convert(1.5, list) == [1.5]
+
+
+def test_register_converter_invalidates_child_fallback():
+    """Converters registered globally after a child converter was used are visible through the fallback."""
+
+    class Marker:
+        pass
+
+    child = TypeConverter([])
+    with pytest.raises(ValueError):
+        child.convert(Marker(), bytes)
+
+    def convert_marker_to_bytes(m: Marker) -> bytes:
+        return b"marker"
+
+    GlobalTypeConverter.register_converter(convert_marker_to_bytes)
+    assert child.convert(Marker(), bytes) == b"marker"
+
+
+def test_indirect_plan_matches_search(basic_converter):
+    """Replaying a cached chain gives the same result as searching for it again."""
+    assert basic_converter.convert({"value": "1.5"}, float) == 1.5
+    assert basic_converter.convert({"value": "2"}, float) == 2.0
+    assert basic_converter.convert({"value": "3.25"}, float) == 3.25
+
+
+def test_indirect_plan_rejected_value_falls_back(inheritance_converter):
+    """A value rejected by a cached chain falls back to the search without evicting the chain."""
+    assert inheritance_converter.convert({"value": "1234"}, float) == 1234.0
+    with pytest.raises(ValueError):
+        inheritance_converter.convert({"value": "not-a-number"}, float)
+    assert inheritance_converter.convert({"value": "12.5"}, float) == 12.5
+
+
+def _time_conversions(converter: TypeConverter, data, to_type: type, num_iterations: int) -> float:
+    start_time = time.perf_counter()
+    for _ in range(num_iterations):
+        converter.convert(data, to_type)
+    return time.perf_counter() - start_time
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+def test_direct_conversion_benchmark(inheritance_converter):
+    """Measure the steady state cost of a direct conversion."""
+    num_iterations = 100_000
+    elapsed = _time_conversions(inheritance_converter, "123", int, num_iterations)
+    logger.info("Direct conversion: %.2f us/conversion", elapsed / num_iterations * 1e6)
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+def test_indirect_conversion_benchmark(inheritance_converter):
+    """Measure the steady state cost of a multi-hop indirect conversion."""
+    num_iterations = 100_000
+    elapsed = _time_conversions(inheritance_converter, Base(), Derived, num_iterations)
+    logger.info("Indirect conversion: %.2f us/conversion", elapsed / num_iterations * 1e6)
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+def test_parent_fallback_conversion_benchmark(child_converter):
+    """Measure the steady state cost of a conversion only the parent can do."""
+    num_iterations = 100_000
+    elapsed = _time_conversions(child_converter, "true", bool, num_iterations)
+    logger.info("Parent fallback conversion: %.2f us/conversion", elapsed / num_iterations * 1e6)
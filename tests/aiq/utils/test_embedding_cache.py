@@ -0,0 +1,198 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+
+import pytest
+from pydantic import BaseModel
+
+from aiq.builder.builder import Builder
+from aiq.builder.embedder import EmbedderProviderInfo
+from aiq.builder.workflow_builder import WorkflowBuilder
+from aiq.cli.register_workflow import register_embedder_client
+from aiq.cli.register_workflow import register_embedder_provider
+from aiq.data_models.embedder import EmbedderBaseConfig
+from aiq.data_models.embedding_cache_mixin import EmbeddingCacheConfig
+from aiq.data_models.embedding_cache_mixin import EmbeddingCacheMixin
+from aiq.utils.embedding_cache import DEFAULT_EMBEDDER_METHODS
+from aiq.utils.embedding_cache import EmbeddingCache
+from aiq.utils.embedding_cache import patch_with_embedding_cache
+from aiq.utils.response_cache import InMemoryResponseCacheBackend
+from aiq.utils.response_cache import SQLiteResponseCacheBackend
+
+
+class _ModelConfig(BaseModel):
+    model_name: str = "test-embedder"
+
+
+class _FakeEmbeddings:
+    """Mimics the LangChain `Embeddings` interface and records every request."""
+
+    def __init__(self, fail: bool = False):
+        self.document_requests: list[list[str]] = []
+        self.query_requests: list[str] = []
+        self.fail = fail
+
+    @staticmethod
+    def _vector(text: str, kind: float) -> list[float]:
+        return [float(len(text)), kind]
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.document_requests.append(list(texts))
+        return [self._vector(t, 0.0) for t in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        self.query_requests.append(text)
+        return self._vector(text, 1.0)
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        await asyncio.sleep(0)
+        if self.fail:
+            raise RuntimeError("embedding failed")
+        return self.embed_documents(texts)
+
+    async def aembed_query(self, text: str) -> list[float]:
+        await asyncio.sleep(0)
+        return self.embed_query(text)
+
+
+def _patched(backend=None, **kwargs):
+    cache = EmbeddingCache(backend or InMemoryResponseCacheBackend(), _ModelConfig())
+    client = patch_with_embedding_cache(_FakeEmbeddings(fail=kwargs.pop("fail", False)),
+                                        cache,
+                                        DEFAULT_EMBEDDER_METHODS["langchain"],
+                                        **kwargs)
+    return client, cache
+
+
+async def test_concurrent_queries_are_batched():
+    client, _ = _patched(batch_queries=True)
+
+    texts = [f"text {i}" for i in range(20)]
+    vectors = await asyncio.gather(*(client.aembed_query(t) for t in texts))
+
+    assert vectors == [[float(len(t)), 0.0] for t in texts]
+    assert client.document_requests == [texts]
+    assert not client.query_requests
+
+
+async def test_batches_are_split_and_deduplicated():
+    client, _ = _patched(batch_queries=True, max_batch_size=8)
+
+    texts = [f"text {i % 10}" for i in range(20)]
+    await asyncio.gather(*(client.aembed_query(t) for t in texts))
+
+    assert all(len(batch) <= 8 for batch in client.document_requests)
+    assert sorted(sum(client.document_requests, [])) == sorted(set(texts))
+
+
+async def test_queries_use_query_embedding_by_default():
+    client, cache = _patched()
+
+    assert await client.aembed_query("hello") == [5.0, 1.0]
+    assert await client.aembed_query("hello") == [5.0, 1.0]
+
+    # Queries and documents are cached separately
+    assert await client.aembed_documents(["hello"]) == [[5.0, 0.0]]
+    assert client.query_requests == ["hello"]
+    assert client.document_requests == [["hello"]]
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+async def test_documents_only_embed_missing_texts():
+    client, _ = _patched()
+
+    await client.aembed_documents(["a", "bb"])
+    vectors = await client.aembed_documents(["bb", "ccc", "a", "ccc"])
+
+    assert vectors == [[2.0, 0.0], [3.0, 0.0], [1.0, 0.0], [3.0, 0.0]]
+    assert client.document_requests == [["a", "bb"], ["ccc"]]
+
+
+async def test_errors_are_propagated_to_every_caller():
+    client, _ = _patched(fail=True)
+
+    results = await asyncio.gather(client.aembed_documents(["a"]),
+                                   client.aembed_documents(["b"]),
+                                   return_exceptions=True)
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+async def test_short_batch_results_fail_every_caller():
+
+    class _ShortEmbeddings(_FakeEmbeddings):
+
+        async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+            return (await super().aembed_documents(texts))[:-1]
+
+    cache = EmbeddingCache(InMemoryResponseCacheBackend(), _ModelConfig())
+    client = patch_with_embedding_cache(_ShortEmbeddings(),
+                                        cache,
+                                        DEFAULT_EMBEDDER_METHODS["langchain"],
+                                        batch_queries=True)
+
+    results = await asyncio.wait_for(asyncio.gather(*(client.aembed_query(t) for t in ["a", "b", "c"]),
+                                                    return_exceptions=True),
+                                     timeout=1)
+
+    assert all(isinstance(r, ValueError) for r in results)
+
+
+def test_sync_methods_are_cached():
+    client, _ = _patched()
+
+    assert client.embed_documents(["a", "b"]) == client.embed_documents(["b", "a"])[::-1]
+    assert client.embed_query("a") == client.embed_query("a")
+    assert client.document_requests == [["a", "b"]]
+    assert client.query_requests == ["a"]
+
+
+async def test_persistent_backend(tmp_path):
+    path = str(tmp_path / "embeddings.db")
+
+    client, cache = _patched(SQLiteResponseCacheBackend(path))
+    first = await client.aembed_documents(["hello", "world"])
+    await cache.aclose()
+
+    client, cache = _patched(SQLiteResponseCacheBackend(path))
+    assert await client.aembed_documents(["hello", "world"]) == first
+    assert not client.document_requests
+    await cache.aclose()
+
+
+class _CachedEmbedderConfig(EmbedderBaseConfig, EmbeddingCacheMixin, name="test_cached_embedder"):
+    model_name: str = "test-embedder"
+
+
+@pytest.mark.parametrize("embedding_cache", [None, EmbeddingCacheConfig()])
+async def test_builder_applies_cache(embedding_cache: EmbeddingCacheConfig | None):
+
+    @register_embedder_provider(config_type=_CachedEmbedderConfig)
+    async def provider(config: _CachedEmbedderConfig, b: Builder):
+        yield EmbedderProviderInfo(config=config, description="A test provider.")
+
+    @register_embedder_client(config_type=_CachedEmbedderConfig, wrapper_type="langchain")
+    async def client(config: _CachedEmbedderConfig, b: Builder):
+        yield _FakeEmbeddings()
+
+    async with WorkflowBuilder() as builder:
+        await builder.add_embedder("embedder", _CachedEmbedderConfig(embedding_cache=embedding_cache))
+
+        embedder = await builder.get_embedder("embedder", wrapper_type="langchain")
+        await embedder.aembed_documents(["a"])
+        await embedder.aembed_documents(["a"])
+
+        assert len(embedder.document_requests) == (1 if embedding_cache else 2)
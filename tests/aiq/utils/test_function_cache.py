@@ -0,0 +1,144 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+
+import pytest
+
+from aiq.builder.builder import Builder
+from aiq.builder.context import AIQContext
+from aiq.builder.context import AIQContextState
+from aiq.builder.function_info import FunctionInfo
+from aiq.builder.workflow_builder import WorkflowBuilder
+from aiq.cli.register_workflow import register_function
+from aiq.data_models.function import FunctionBaseConfig
+from aiq.data_models.function_cache_mixin import FunctionCacheConfig
+from aiq.data_models.intermediate_step import IntermediateStep
+from aiq.data_models.intermediate_step import IntermediateStepType
+
+
+class _LookupConfig(FunctionBaseConfig, name="test_cached_lookup"):
+    prefix: str = "result"
+
+
+_calls: list[tuple[str, int]] = []
+
+
+@pytest.fixture(scope="module", autouse=True)
+async def _register_lookup_fn():
+
+    @register_function(config_type=_LookupConfig)
+    async def register(config: _LookupConfig, b: Builder):
+
+        async def _lookup(query: str, top_k: int) -> str:
+            _calls.append((query, top_k))
+            return f"{config.prefix}: {query} {top_k}"
+
+        yield FunctionInfo.from_fn(_lookup, description="Looks up a query")
+
+
+@pytest.fixture(autouse=True)
+def _reset_calls():
+    _calls.clear()
+
+
+async def test_process_scope():
+    config = _LookupConfig(function_cache=FunctionCacheConfig(scope="process"))
+
+    async with WorkflowBuilder() as builder:
+        fn = await builder.add_function(name="lookup", config=config)
+
+        assert await fn.acall_invoke(query="a", top_k=2) == "result: a 2"
+        # The key is computed from the converted input, so the order of the arguments does not matter
+        assert await fn.ainvoke({"top_k": 2, "query": "a"}) == "result: a 2"
+        assert await fn.acall_invoke(query="a", top_k=3) == "result: a 3"
+
+        assert _calls == [("a", 2), ("a", 3)]
+        assert (fn.cache.hits, fn.cache.misses) == (1, 2)
+
+
+async def test_request_scope():
+    config = _LookupConfig(function_cache=FunctionCacheConfig(scope="request"))
+    context_state = AIQContextState.get()
+
+    async with WorkflowBuilder() as builder:
+        fn = await builder.add_function(name="lookup", config=config)
+
+        # Outside of a workflow run the function is always called
+        await fn.acall_invoke(query="a", top_k=1)
+        await fn.acall_invoke(query="a", top_k=1)
+        assert len(_calls) == 2
+
+        for _ in range(2):
+            token = context_state.function_cache_backends.set({})
+            try:
+                await fn.acall_invoke(query="a", top_k=1)
+                await fn.acall_invoke(query="a", top_k=1)
+            finally:
+                context_state.function_cache_backends.reset(token)
+
+        # Each run calls the function once
+        assert len(_calls) == 4
+
+
+async def test_not_cached_by_default():
+    async with WorkflowBuilder() as builder:
+        fn = await builder.add_function(name="lookup", config=_LookupConfig())
+
+        assert fn.cache is None
+        await fn.acall_invoke(query="a", top_k=1)
+        await fn.acall_invoke(query="a", top_k=1)
+        assert len(_calls) == 2
+
+
+async def test_reports_cache_hits():
+    config = _LookupConfig(function_cache=FunctionCacheConfig())
+    steps: list[IntermediateStep] = []
+    subscription = AIQContext.get().intermediate_step_manager.subscribe(steps.append)
+
+    try:
+        async with WorkflowBuilder() as builder:
+            fn = await builder.add_function(name="lookup", config=config)
+            await fn.acall_invoke(query="a", top_k=1)
+            await fn.acall_invoke(query="a", top_k=1)
+    finally:
+        subscription.unsubscribe()
+
+    # Hits do not add tool steps, the framework callback handlers already report the tool call
+    assert not [s for s in steps if s.event_type in (IntermediateStepType.TOOL_START, IntermediateStepType.TOOL_END)]
+
+    cache_steps = [s for s in steps if s.name == "function_cache"]
+    assert [s.event_type for s in cache_steps] == [IntermediateStepType.CUSTOM_START, IntermediateStepType.CUSTOM_END]
+    metadata = cache_steps[1].metadata.provided_metadata
+    assert metadata["cached"]
+    assert metadata["function_name"] == "lookup"
+    assert metadata["saved_latency"] >= 0
+
+
+async def test_entries_are_stored_as_json(tmp_path):
+    config = _LookupConfig(
+        function_cache=FunctionCacheConfig(backend="sqlite", sqlite_path=str(tmp_path / "function_cache.db")))
+
+    async with WorkflowBuilder() as builder:
+        fn = await builder.add_function(name="lookup", config=config)
+        await fn.acall_invoke(query="a", top_k=1)
+
+        raw = await fn.cache._backend.aget(fn.cache.key_for(fn.input_schema(query="a", top_k=1)))
+        assert json.loads(raw)["response"] == "result: a 1"
+
+
+def test_request_scope_requires_memory_backend():
+    with pytest.raises(ValueError):
+        FunctionCacheConfig(scope="request", backend="sqlite")
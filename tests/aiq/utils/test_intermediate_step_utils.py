@@ -0,0 +1,43 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest.mock import patch
+
+from aiq.builder.context import AIQContext
+from aiq.builder.intermediate_step_manager import IntermediateStepManager
+from aiq.data_models.intermediate_step import IntermediateStep
+from aiq.data_models.intermediate_step import IntermediateStepType
+from aiq.utils.intermediate_step_utils import report_custom_step
+
+
+def test_report_custom_step():
+    steps: list[IntermediateStep] = []
+    subscription = AIQContext.get().intermediate_step_manager.subscribe(steps.append)
+
+    try:
+        report_custom_step("test_step", {"wait_time": 1.5})
+    finally:
+        subscription.unsubscribe()
+
+    assert [s.event_type for s in steps] == [IntermediateStepType.CUSTOM_START, IntermediateStepType.CUSTOM_END]
+    assert all(s.name == "test_step" for s in steps)
+    assert steps[0].UUID == steps[1].UUID
+    assert steps[1].span_event_timestamp == steps[0].event_timestamp
+    assert all(s.metadata.provided_metadata == {"wait_time": 1.5} for s in steps)
+
+
+def test_report_custom_step_ignores_errors():
+    with patch.object(IntermediateStepManager, "push_intermediate_step", side_effect=RuntimeError("broken")):
+        report_custom_step("test_step", {})
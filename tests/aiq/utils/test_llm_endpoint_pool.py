@@ -0,0 +1,288 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+
+import httpx
+import pytest
+
+from aiq.builder.builder import Builder
+from aiq.builder.context import AIQContext
+from aiq.builder.llm import LLMProviderInfo
+from aiq.builder.workflow_builder import WorkflowBuilder
+from aiq.cli.register_workflow import register_llm_client
+from aiq.cli.register_workflow import register_llm_provider
+from aiq.data_models.concurrency_limit_mixin import ConcurrencyLimitConfig
+from aiq.data_models.concurrency_limit_mixin import ConcurrencyLimitMixin
+from aiq.data_models.intermediate_step import IntermediateStep
+from aiq.data_models.intermediate_step import IntermediateStepType
+from aiq.data_models.llm import LLMBaseConfig
+from aiq.data_models.rate_limit_mixin import RequestPriority
+from aiq.llm.nim_llm import NIMModelConfig
+from aiq.llm.openai_llm import OpenAIModelConfig
+from aiq.profiler.inference_optimization.llm_endpoint_waits import compute_llm_endpoint_waits
+from aiq.utils.llm_endpoint_pool import AdaptiveConcurrencyLimiter
+from aiq.utils.llm_endpoint_pool import LLMEndpointPool
+from aiq.utils.llm_endpoint_pool import patch_with_concurrency_limit
+from aiq.utils.llm_rate_limiter import llm_request_priority
+
+
+class _StatusError(Exception):
+
+    def __init__(self, status_code: int):
+        super().__init__(f"status {status_code}")
+        self.status_code = status_code
+
+
+class _FakeClient:
+
+    def __init__(self, delay: float = 0.01):
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.fail_with: int | None = None
+
+    async def ainvoke(self, messages, **kwargs):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.fail_with is not None:
+                raise _StatusError(self.fail_with)
+            return f"reply to {messages}"
+        finally:
+            self.in_flight -= 1
+
+    async def astream(self, messages, **kwargs):
+        for token in ("a", "b", "c"):
+            await asyncio.sleep(0)
+            yield token
+
+    def invoke(self, messages, **kwargs):
+        return f"reply to {messages}"
+
+
+class _LimitedLLMConfig(LLMBaseConfig, ConcurrencyLimitMixin, name="test_limited_llm"):
+    model_name: str = "test-model"
+    base_url: str | None = None
+
+
+def _limiter(**kwargs) -> AdaptiveConcurrencyLimiter:
+    return AdaptiveConcurrencyLimiter(ConcurrencyLimitConfig(**kwargs), endpoint="test")
+
+
+async def test_limits_in_flight_requests():
+    limiter = _limiter(max_in_flight=3, adaptive=False)
+    client = patch_with_concurrency_limit(_FakeClient(), limiter, ["ainvoke", "astream", "invoke"])
+
+    results = await asyncio.gather(*(client.ainvoke(i) for i in range(10)))
+    assert results == [f"reply to {i}" for i in range(10)]
+    assert client.max_in_flight == 3
+
+    assert [token async for token in client.astream("hello")] == ["a", "b", "c"]
+
+    # Synchronous methods are not limited
+    assert client.invoke("hello") == "reply to hello"
+
+    metrics = limiter.metrics()
+    assert metrics.requests == 11
+    assert metrics.queued_requests == 7
+    assert metrics.max_queue_depth == 7
+    assert metrics.in_flight == 0 and metrics.queue_depth == 0
+    assert metrics.max_wait_time >= metrics.mean_wait_time > 0
+
+
+async def test_cancelled_waiter_releases_queue():
+    limiter = _limiter(max_in_flight=1, adaptive=False)
+    first = await limiter.acquire()
+
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    assert limiter.queue_depth == 1
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert limiter.queue_depth == 0
+
+    limiter.release(first, success=True)
+    assert limiter.in_flight == 0
+
+    second = await asyncio.wait_for(limiter.acquire(), timeout=1)
+    limiter.release(second, success=True)
+
+
+async def test_admits_waiters_by_priority():
+    limiter = _limiter(max_in_flight=1, adaptive=False)
+    first = await limiter.acquire()
+    order = []
+
+    async def _request(name: str, priority: RequestPriority):
+        with llm_request_priority(priority):
+            slot = await limiter.acquire()
+        order.append(name)
+        limiter.release(slot, success=True)
+
+    tasks = [asyncio.create_task(_request(f"batch-{i}", RequestPriority.BATCH)) for i in range(2)]
+    await asyncio.sleep(0)
+    tasks.append(asyncio.create_task(_request("interactive", RequestPriority.INTERACTIVE)))
+    await asyncio.sleep(0)
+    assert limiter.queue_depth == 3
+
+    limiter.release(first, success=True)
+    await asyncio.gather(*tasks)
+    assert order == ["interactive", "batch-0", "batch-1"]
+
+
+async def test_adaptive_limit():
+    limiter = _limiter(max_in_flight=8, min_in_flight=2, decrease_factor=0.5)
+    client = patch_with_concurrency_limit(_FakeClient(), limiter, ["ainvoke"])
+    client.fail_with = 503
+
+    # The rejected requests of a burst only halve the limit once
+    results = await asyncio.gather(*(client.ainvoke(i) for i in range(8)), return_exceptions=True)
+    assert all(isinstance(r, _StatusError) for r in results)
+    assert limiter.limit == 4
+    assert limiter.metrics().overloads == 8
+
+    for _ in range(2):
+        with pytest.raises(_StatusError):
+            await client.ainvoke("hello")
+    assert limiter.limit == 2
+
+    # Errors which do not signal an overload leave the limit unchanged
+    client.fail_with = 400
+    with pytest.raises(_StatusError):
+        await client.ainvoke("hello")
+    assert limiter.limit == 2
+
+    # Successful requests raise the limit by about one per limit's worth of requests
+    client.fail_with = None
+    for _ in range(6):
+        await client.ainvoke("hello")
+    assert limiter.limit == 4
+
+    for _ in range(100):
+        await client.ainvoke("hello")
+    assert limiter.limit == 8
+
+
+async def test_nested_calls_reuse_slot():
+    limiter = _limiter(max_in_flight=1)
+
+    class _Client(_FakeClient):
+
+        async def astream(self, messages, **kwargs):
+            # Falls back to the non-streaming method, as LangChain does for models without streaming support
+            yield await self.ainvoke(messages)
+
+    client = patch_with_concurrency_limit(_Client(), limiter, ["ainvoke", "astream"])
+    chunks = await asyncio.wait_for(_collect(client.astream("hello")), timeout=1)
+    assert chunks == ["reply to hello"]
+    assert limiter.metrics().requests == 1
+
+
+async def _collect(stream) -> list:
+    return [chunk async for chunk in stream]
+
+
+async def test_reports_wait_as_intermediate_step():
+    steps: list[IntermediateStep] = []
+    subscription = AIQContext.get().intermediate_step_manager.subscribe(steps.append)
+
+    try:
+        limiter = _limiter(max_in_flight=1)
+        client = patch_with_concurrency_limit(_FakeClient(), limiter, ["ainvoke"])
+        await asyncio.gather(client.ainvoke("a"), client.ainvoke("b"))
+    finally:
+        subscription.unsubscribe()
+
+    ends = [s for s in steps if s.event_type == IntermediateStepType.CUSTOM_END and s.name == "llm_concurrency_limit"]
+    assert len(ends) == 1
+    assert ends[0].metadata.provided_metadata["wait_time"] > 0
+    assert ends[0].metadata.provided_metadata["endpoint"] == "test"
+
+    waits = compute_llm_endpoint_waits([steps]).to_dict()["test"]
+    assert waits.concurrency_limit_waits == 1
+    assert waits.max_wait_time == waits.mean_wait_time > 0
+    assert compute_llm_endpoint_waits([[]]) is None
+
+
+def test_endpoint_key_resolves_default_url(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.delenv("OPENAI_BASE_URL", raising=False)
+
+    assert LLMEndpointPool.endpoint_key(OpenAIModelConfig(model_name="a")) == "openai:https://api.openai.com/v1"
+    assert LLMEndpointPool.endpoint_key(OpenAIModelConfig(
+        model_name="b", base_url="https://api.openai.com/v1/")) == "openai:https://api.openai.com/v1"
+    assert LLMEndpointPool.endpoint_key(NIMModelConfig(model_name="a")) != LLMEndpointPool.endpoint_key(
+        NIMModelConfig(model_name="a", base_url="http://localhost:8000/v1"))
+
+
+async def test_http_client_reports_overloads():
+    pool = LLMEndpointPool()
+    config = _LimitedLLMConfig(concurrency_limit=ConcurrencyLimitConfig(max_in_flight=4))
+    limiter = pool.get_limiter(config)
+
+    http_client = pool.get_http_client(config)
+    assert http_client is pool.get_http_client(_LimitedLLMConfig(concurrency_limit=ConcurrencyLimitConfig()))
+    assert http_client is not pool.get_http_client(config, asynchronous=False)
+
+    http_client._transport = httpx.MockTransport(lambda request: httpx.Response(429))
+
+    # A rejected request which is retried successfully still lowers the limit
+    async with limiter.slot():
+        response = await http_client.get("http://localhost/v1/models")
+        assert response.status_code == 429
+
+    assert limiter.limit == 2
+    await pool.aclose()
+
+
+async def test_builder_shares_limit_per_endpoint():
+
+    @register_llm_provider(config_type=_LimitedLLMConfig)
+    async def provider(config: _LimitedLLMConfig, b: Builder):
+        yield LLMProviderInfo(config=config, description="A test provider.")
+
+    @register_llm_client(config_type=_LimitedLLMConfig, wrapper_type="langchain")
+    async def client(config: _LimitedLLMConfig, b: Builder):
+        yield _FakeClient()
+
+    limit = ConcurrencyLimitConfig(max_in_flight=2, adaptive=False)
+    async with WorkflowBuilder() as builder:
+        await builder.add_llm("planner", _LimitedLLMConfig(base_url="http://nim:8000/v1", concurrency_limit=limit))
+        await builder.add_llm("scorer",
+                              _LimitedLLMConfig(model_name="other",
+                                                base_url="http://nim:8000/v1",
+                                                concurrency_limit=limit))
+        await builder.add_llm("unlimited", _LimitedLLMConfig(base_url="http://nim:8000/v1"))
+
+        planner = await builder.get_llm("planner", wrapper_type="langchain")
+        scorer = await builder.get_llm("scorer", wrapper_type="langchain")
+        unlimited = await builder.get_llm("unlimited", wrapper_type="langchain")
+
+        await asyncio.gather(*(llm.ainvoke(i) for i in range(4) for llm in (planner, scorer)))
+        assert max(planner.max_in_flight, scorer.max_in_flight) <= 2
+
+        await asyncio.gather(*(unlimited.ainvoke(i) for i in range(4)))
+        assert unlimited.max_in_flight == 4
+
+        [metrics] = builder.get_llm_endpoint_metrics()
+        assert metrics.endpoint == "test_limited_llm:http://nim:8000/v1"
+        assert metrics.concurrency_limit.requests == 8
+        assert metrics.rate_limit is None
+
+        assert builder.get_llm_http_client(builder.get_llm_config("unlimited")) is None
+        assert builder.get_llm_http_client(builder.get_llm_config("planner")) is not None
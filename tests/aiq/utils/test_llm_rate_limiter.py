@@ -0,0 +1,226 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import time
+
+import pytest
+
+from aiq.builder.builder import Builder
+from aiq.builder.llm import LLMProviderInfo
+from aiq.builder.workflow_builder import WorkflowBuilder
+from aiq.cli.register_workflow import register_llm_client
+from aiq.cli.register_workflow import register_llm_provider
+from aiq.data_models.llm import LLMBaseConfig
+from aiq.data_models.rate_limit_mixin import RateLimitConfig
+from aiq.data_models.rate_limit_mixin import RateLimitMixin
+from aiq.data_models.rate_limit_mixin import RequestPriority
+from aiq.utils.llm_rate_limiter import RateLimiter
+from aiq.utils.llm_rate_limiter import TokenBucket
+from aiq.utils.llm_rate_limiter import estimate_prompt_tokens
+from aiq.utils.llm_rate_limiter import get_request_priority
+from aiq.utils.llm_rate_limiter import llm_request_priority
+from aiq.utils.llm_rate_limiter import patch_with_rate_limit
+
+
+class _Message:
+
+    def __init__(self, content: str):
+        self.content = content
+
+
+class _Response:
+
+    def __init__(self, total_tokens: int):
+        self.content = "reply"
+        self.usage_metadata = {"input_tokens": total_tokens - 1, "output_tokens": 1, "total_tokens": total_tokens}
+
+
+class _FakeClient:
+
+    def __init__(self, total_tokens: int = 100):
+        self.total_tokens = total_tokens
+        self.order: list[str] = []
+
+    async def ainvoke(self, messages, config=None, **kwargs):
+        self.order.append(messages)
+        return _Response(self.total_tokens)
+
+    async def astream(self, messages, config=None, **kwargs):
+        yield "a"
+        yield _Response(self.total_tokens)
+
+    def invoke(self, messages, config=None, **kwargs):
+        return _Response(self.total_tokens)
+
+
+class _RateLimitedLLMConfig(LLMBaseConfig, RateLimitMixin, name="test_rate_limited_llm"):
+    model_name: str = "test-model"
+
+
+def test_token_bucket(monkeypatch: pytest.MonkeyPatch):
+    now = [100.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+
+    bucket = TokenBucket(capacity=60, refill_rate=1.0)
+    assert bucket.time_until(60) == 0
+
+    bucket.consume(50)
+    assert bucket.time_until(20) == pytest.approx(10.0)
+
+    now[0] += 5
+    assert bucket.level == pytest.approx(15.0)
+
+    # Requests larger than the bucket wait for a full bucket
+    assert bucket.time_until(1000) == pytest.approx(45.0)
+
+    # Under-estimated requests put the bucket into debt, over-estimated ones are refunded
+    bucket.consume(30)
+    assert bucket.level == pytest.approx(-15.0)
+    bucket.consume(-100)
+    assert bucket.level == 60
+
+
+def test_estimate_prompt_tokens():
+    assert estimate_prompt_tokens(("x" * 40, ), {}) == 10
+    assert estimate_prompt_tokens(([_Message("x" * 20), {"role": "user", "content": "y" * 16}], ), {}) == 10
+    assert estimate_prompt_tokens((), {"messages": ["x" * 10], "config": {"tags": ["z" * 100]}}, chars_per_token=2) == 5
+
+
+def test_requires_a_limit():
+    with pytest.raises(ValueError):
+        RateLimitConfig()
+
+
+async def test_reconciles_reported_usage():
+    limiter = RateLimiter(RateLimitConfig(tokens_per_minute=6000, estimated_completion_tokens=10), endpoint="test")
+    client = patch_with_rate_limit(_FakeClient(total_tokens=100), limiter, ["ainvoke", "astream", "invoke"])
+
+    await client.ainvoke("x" * 40)
+    assert [chunk async for chunk in client.astream("x" * 40)][0] == "a"
+
+    metrics = limiter.metrics()
+    assert metrics.requests == 2
+    assert metrics.estimated_tokens == 40
+    assert metrics.reported_tokens == 200
+    assert limiter._token_bucket.level == pytest.approx(5800, abs=10)
+
+    # Synchronous methods are not limited
+    client.invoke("hello")
+    assert limiter.metrics().requests == 2
+
+
+async def test_nested_calls_are_limited_once():
+    limiter = RateLimiter(RateLimitConfig(requests_per_minute=1), endpoint="test")
+
+    class _Client(_FakeClient):
+
+        async def astream(self, messages, config=None, **kwargs):
+            # Falls back to the non-streaming method, as LangChain does for models without streaming support
+            yield await self.ainvoke(messages)
+
+    client = patch_with_rate_limit(_Client(total_tokens=100), limiter, ["ainvoke", "astream"])
+    chunks = await asyncio.wait_for(_collect(client.astream("hello")), timeout=1)
+
+    assert len(chunks) == 1
+    metrics = limiter.metrics()
+    assert metrics.requests == 1
+    assert metrics.queued_requests == 0
+    assert metrics.reported_tokens == 100
+
+
+async def _collect(stream) -> list:
+    return [chunk async for chunk in stream]
+
+
+async def test_waits_for_request_rate():
+    limiter = RateLimiter(RateLimitConfig(requests_per_minute=1200), endpoint="test")
+    limiter._request_bucket.consume(limiter._request_bucket.capacity)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(limiter.acquire(1) for _ in range(3)))
+
+    # 20 requests per second
+    assert time.perf_counter() - start >= 0.14
+    metrics = limiter.metrics()
+    assert metrics.queued_requests == 3
+    assert metrics.max_wait_time >= metrics.mean_wait_time > 0
+
+
+async def test_interactive_requests_overtake_batch_requests():
+    limiter = RateLimiter(RateLimitConfig(requests_per_minute=1200), endpoint="test")
+    limiter._request_bucket.consume(limiter._request_bucket.capacity)
+    client = patch_with_rate_limit(_FakeClient(), limiter, ["ainvoke"])
+
+    async def _invoke(name: str, priority: RequestPriority):
+        with llm_request_priority(priority):
+            await client.ainvoke(name)
+
+    batch = [asyncio.create_task(_invoke(f"batch-{i}", RequestPriority.BATCH)) for i in range(3)]
+    await asyncio.sleep(0)
+    interactive = asyncio.create_task(_invoke("interactive", RequestPriority.INTERACTIVE))
+
+    await asyncio.gather(*batch, interactive)
+    assert client.order == ["interactive", "batch-0", "batch-1", "batch-2"]
+
+
+async def test_cancelled_request_leaves_queue():
+    limiter = RateLimiter(RateLimitConfig(requests_per_minute=1200), endpoint="test")
+    limiter._request_bucket.consume(limiter._request_bucket.capacity)
+
+    waiter = asyncio.create_task(limiter.acquire(1))
+    await asyncio.sleep(0)
+    assert limiter.queue_depth == 1
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert limiter.queue_depth == 0
+
+    await asyncio.wait_for(limiter.acquire(1), timeout=1)
+
+
+def test_request_priority_context():
+    assert get_request_priority() == RequestPriority.NORMAL
+    with llm_request_priority("batch"):
+        assert get_request_priority() == RequestPriority.BATCH
+        with llm_request_priority(RequestPriority.INTERACTIVE):
+            assert get_request_priority() == RequestPriority.INTERACTIVE
+        assert get_request_priority() == RequestPriority.BATCH
+    assert get_request_priority() == RequestPriority.NORMAL
+
+
+async def test_builder_applies_rate_limit():
+
+    @register_llm_provider(config_type=_RateLimitedLLMConfig)
+    async def provider(config: _RateLimitedLLMConfig, b: Builder):
+        yield LLMProviderInfo(config=config, description="A test provider.")
+
+    @register_llm_client(config_type=_RateLimitedLLMConfig, wrapper_type="langchain")
+    async def client(config: _RateLimitedLLMConfig, b: Builder):
+        yield _FakeClient()
+
+    async with WorkflowBuilder() as builder:
+        await builder.add_llm("limited", _RateLimitedLLMConfig(rate_limit=RateLimitConfig(requests_per_minute=100)))
+        await builder.add_llm("unlimited", _RateLimitedLLMConfig(model_name="other"))
+
+        limited = await builder.get_llm("limited", wrapper_type="langchain")
+        unlimited = await builder.get_llm("unlimited", wrapper_type="langchain")
+        await limited.ainvoke("hello")
+        await unlimited.ainvoke("hello")
+
+        [metrics] = builder.llm_endpoint_pool.rate_limit_metrics()
+        assert metrics.endpoint == "test_rate_limited_llm:default"
+        assert metrics.requests == 1
@@ -0,0 +1,303 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import time
+
+import pytest
+from pydantic import BaseModel
+
+from aiq.builder.builder import Builder
+from aiq.builder.context import AIQContext
+from aiq.builder.llm import LLMProviderInfo
+from aiq.builder.workflow_builder import WorkflowBuilder
+from aiq.cli.register_workflow import register_llm_client
+from aiq.cli.register_workflow import register_llm_provider
+from aiq.data_models.intermediate_step import IntermediateStep
+from aiq.data_models.intermediate_step import IntermediateStepType
+from aiq.data_models.llm import LLMBaseConfig
+from aiq.data_models.response_cache_mixin import ResponseCacheConfig
+from aiq.data_models.response_cache_mixin import ResponseCacheMixin
+from aiq.object_store.in_memory_object_store import InMemoryObjectStore
+from aiq.profiler.inference_optimization.response_cache import compute_response_cache_savings
+from aiq.utils.response_cache import CacheEntry
+from aiq.utils.response_cache import InMemoryResponseCacheBackend
+from aiq.utils.response_cache import ObjectStoreResponseCacheBackend
+from aiq.utils.response_cache import ResponseCache
+from aiq.utils.response_cache import SQLiteResponseCacheBackend
+from aiq.utils.response_cache import compute_cache_key
+from aiq.utils.response_cache import decode_cache_entry
+from aiq.utils.response_cache import encode_cache_entry
+from aiq.utils.response_cache import patch_with_cache
+
+
+class _ModelConfig(BaseModel):
+    model_name: str = "test-model"
+    temperature: float = 0.0
+    api_key: str | None = None
+
+
+class _Response(BaseModel):
+    content: str
+    usage_metadata: dict[str, int] | None = None
+
+
+class _FakeClient:
+
+    def __init__(self, temperature: float = 0.0):
+        self.calls = 0
+        self.temperature = temperature
+
+    def _respond(self, messages) -> _Response:
+        self.calls += 1
+        return _Response(content=f"reply {self.calls} to {messages}",
+                         usage_metadata={
+                             "input_tokens": 10, "output_tokens": 5, "total_tokens": 15
+                         })
+
+    def invoke(self, messages, config=None, **kwargs):
+        return self._respond(messages)
+
+    async def ainvoke(self, messages, config=None, **kwargs):
+        return self._respond(messages)
+
+    async def astream(self, messages, config=None, **kwargs):
+        self.calls += 1
+        for token in ("a", "b", "c"):
+            yield token
+
+
+def _patched_client(backend=None, model_config=None, client=None):
+    if backend is None:
+        backend = InMemoryResponseCacheBackend()
+
+    cache = ResponseCache(backend, model_config or _ModelConfig(), name="llm")
+    client = patch_with_cache(client or _FakeClient(), cache, ["invoke", "ainvoke", "astream"])
+    return client, cache
+
+
+def test_cache_key_is_canonical():
+    config = _ModelConfig()
+
+    assert compute_cache_key(config, "ainvoke", {"a": 1, "b": [1, 2]}) == \
+        compute_cache_key(config, "ainvoke", {"b": (1, 2), "a": 1})
+    assert compute_cache_key(config, "ainvoke", {"a": 1}) != compute_cache_key(config, "invoke", {"a": 1})
+    assert compute_cache_key(config, "ainvoke", {"a": 1}) != compute_cache_key(_ModelConfig(temperature=0.5),
+                                                                               "ainvoke", {"a": 1})
+
+    # Credentials do not change the response and should not invalidate the cache
+    assert compute_cache_key(config, "ainvoke", {"a": 1}) == compute_cache_key(_ModelConfig(api_key="secret"),
+                                                                               "ainvoke", {"a": 1})
+
+
+async def test_model_and_client_parameters_are_part_of_the_key():
+    backend = InMemoryResponseCacheBackend()
+
+    client, _ = _patched_client(backend)
+    await client.ainvoke("hello")
+
+    # LLMs sharing a backend only share responses when their configurations and clients are identical
+    for model_config, fake_client in ((_ModelConfig(temperature=0.7), None), (_ModelConfig(model_name="other"), None),
+                                      (None, _FakeClient(temperature=0.7))):
+        other_client, _ = _patched_client(backend, model_config, fake_client)
+        await other_client.ainvoke("hello")
+        assert other_client.calls == 1
+
+    same_client, _ = _patched_client(backend)
+    await same_client.ainvoke("hello")
+    assert same_client.calls == 0
+
+
+def test_entries_are_stored_as_json():
+    entry = CacheEntry([_Response(content="a"), {"b": [1, 2]}], 0.5)
+    raw = encode_cache_entry(entry)
+
+    assert isinstance(json.loads(raw), dict)
+    decoded = decode_cache_entry(raw)
+    assert decoded.response == entry.response
+    assert decoded.latency == 0.5
+
+    # Values which cannot be represented as JSON are not cached
+    assert encode_cache_entry(CacheEntry(object(), 0.5)) is None
+    assert encode_cache_entry(CacheEntry({1: "a"}, 0.5)) is None
+
+
+def test_entries_never_import_modules():
+    raw = json.dumps({
+        "response": {
+            "__model__": "not_imported_module:Model", "data": {}
+        }, "latency": 0.5, "token_usage": None, "created_at": 0.0
+    }).encode("utf-8")
+    assert decode_cache_entry(raw) is None
+
+    # Classes which are not pydantic models are refused
+    raw = raw.replace(b"not_imported_module:Model", b"os:system")
+    assert decode_cache_entry(raw) is None
+
+
+async def test_async_hit_and_miss():
+    client, cache = _patched_client()
+
+    first = await client.ainvoke("hello")
+    second = await client.ainvoke("hello", config={"callbacks": [object()]})
+    other = await client.ainvoke("goodbye")
+
+    assert first == second
+    assert other != first
+    assert client.calls == 2
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    # Tool schemas and sampling parameters are part of the key
+    await client.ainvoke("hello", tools=[{"name": "search"}])
+    assert client.calls == 3
+
+
+def test_sync_hit():
+    client, cache = _patched_client()
+
+    assert client.invoke("hello") == client.invoke("hello")
+    assert client.calls == 1
+    assert cache.hits == 1
+
+
+async def test_stream_replay():
+    client, _ = _patched_client()
+
+    assert [c async for c in client.astream("hello")] == ["a", "b", "c"]
+    assert [c async for c in client.astream("hello")] == ["a", "b", "c"]
+    assert client.calls == 1
+
+
+def test_memory_backend_lru_and_ttl(monkeypatch: pytest.MonkeyPatch):
+    backend = InMemoryResponseCacheBackend(max_entries=2, ttl=10)
+
+    backend.set("a", b"1")
+    backend.set("b", b"2")
+    assert backend.get("a") == b"1"
+    backend.set("c", b"3")
+
+    # "b" was the least recently used entry
+    assert backend.get("b") is None
+    assert backend.get("a") == b"1"
+    assert backend.get("c") == b"3"
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 11)
+    assert backend.get("a") is None
+    assert len(backend) == 1
+
+
+async def test_sqlite_backend_persists(tmp_path):
+    path = str(tmp_path / "cache" / "responses.db")
+
+    client, cache = _patched_client(SQLiteResponseCacheBackend(path))
+    first = await client.ainvoke("hello")
+    await cache.aclose()
+
+    client, cache = _patched_client(SQLiteResponseCacheBackend(path))
+    assert await client.ainvoke("hello") == first
+    assert client.calls == 0
+    await cache.aclose()
+
+
+def test_sqlite_backend_evicts_least_recently_used(tmp_path):
+    backend = SQLiteResponseCacheBackend(str(tmp_path / "responses.db"), max_entries=2)
+
+    backend.set("a", b"1")
+    time.sleep(0.01)
+    backend.set("b", b"2")
+    time.sleep(0.01)
+    assert backend.get("a") == b"1"
+    time.sleep(0.01)
+    backend.set("c", b"3")
+
+    assert backend.get("b") is None
+    assert backend.get("a") == b"1"
+
+
+async def test_object_store_backend():
+    store = InMemoryObjectStore()
+    client, _ = _patched_client(ObjectStoreResponseCacheBackend(store, key_prefix="llm/"))
+
+    first = await client.ainvoke("hello")
+    assert await client.ainvoke("hello") == first
+    assert client.calls == 1
+
+    # Synchronous methods are left untouched since the object store is asynchronous
+    client.invoke("hello")
+    client.invoke("hello")
+    assert client.calls == 3
+
+
+async def test_reports_intermediate_steps():
+    steps: list[IntermediateStep] = []
+    subscription = AIQContext.get().intermediate_step_manager.subscribe(steps.append)
+
+    try:
+        client, _ = _patched_client()
+        await client.ainvoke("hello")
+        await client.ainvoke("hello")
+    finally:
+        subscription.unsubscribe()
+
+    ends = [s for s in steps if s.event_type == IntermediateStepType.CUSTOM_END and s.name == "response_cache"]
+    assert [s.metadata.provided_metadata["cache_hit"] for s in ends] == [False, True]
+
+    hit = ends[1].metadata.provided_metadata
+    assert hit["saved_token_usage"] == {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15}
+    assert hit["saved_latency"] >= 0
+
+    # The profiler reports the tokens and latency saved by each LLM
+    savings = compute_response_cache_savings([steps]).to_dict()["llm"]
+    assert (savings.hits, savings.misses, savings.hit_rate) == (1, 1, 0.5)
+    assert (savings.saved_prompt_tokens, savings.saved_completion_tokens, savings.saved_total_tokens) == (10, 5, 15)
+    assert savings.saved_latency == hit["saved_latency"]
+
+    assert compute_response_cache_savings([[]]) is None
+
+
+class _CachedLLMConfig(LLMBaseConfig, ResponseCacheMixin, name="test_cached_llm"):
+    model_name: str = "test-model"
+
+
+async def test_builder_applies_cache():
+
+    @register_llm_provider(config_type=_CachedLLMConfig)
+    async def provider(config: _CachedLLMConfig, b: Builder):
+        yield LLMProviderInfo(config=config, description="A test provider.")
+
+    @register_llm_client(config_type=_CachedLLMConfig, wrapper_type="langchain")
+    async def client(config: _CachedLLMConfig, b: Builder):
+        yield _FakeClient()
+
+    async with WorkflowBuilder() as builder:
+        await builder.add_llm("cached", _CachedLLMConfig(response_cache=ResponseCacheConfig()))
+        await builder.add_llm("uncached", _CachedLLMConfig())
+
+        # Clients requested separately share the cache of their LLM
+        llm_a = await builder.get_llm("cached", wrapper_type="langchain")
+        llm_b = await builder.get_llm("cached", wrapper_type="langchain")
+        assert await llm_a.ainvoke("hello") == await llm_b.ainvoke("hello")
+        assert llm_b.calls == 0
+
+        uncached = await builder.get_llm("uncached", wrapper_type="langchain")
+        await uncached.ainvoke("hello")
+        await uncached.ainvoke("hello")
+        assert uncached.calls == 2
+
+
+def test_object_store_backend_requires_reference():
+    with pytest.raises(ValueError):
+        ResponseCacheConfig(backend="object_store")